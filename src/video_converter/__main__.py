@@ -25,6 +25,7 @@ from video_converter import __version__
 from video_converter.automation import ServiceManager, ServiceState
 from video_converter.converters.factory import ConverterFactory
 from video_converter.core.config import DEFAULT_CONFIG_FILE, Config
+from video_converter.core.history import get_history
 from video_converter.core.logger import configure_logging
 from video_converter.core.orchestrator import Orchestrator, OrchestratorConfig
 from video_converter.core.types import ConversionMode, ConversionProgress
@@ -33,10 +34,10 @@ from video_converter.ui.progress import ProgressDisplayManager
 from video_converter.utils.constants import (
     BYTES_PER_GB,
     BYTES_PER_MB,
-    VIDEO_EXTENSIONS,
     bytes_to_human,
     format_duration,
 )
+from video_converter.utils.file_utils import ParallelVideoWalker, scan_video_files
 
 # Rich console for formatted output
 console = Console()
@@ -606,6 +607,11 @@ def convert(
     default=None,
     help="Photos mode: Maximum number of concurrent conversions (1-8, default: from config).",
 )
+@click.option(
+    "--reconvert",
+    is_flag=True,
+    help="Convert videos again even if the history records them as converted.",
+)
 @click.pass_context
 def run(
     ctx: click.Context,
@@ -628,6 +634,7 @@ def run(
     archive_album: str,
     confirm_delete: bool,
     max_concurrent: int | None,
+    reconvert: bool,
 ) -> None:
     """Run batch conversion on multiple videos.
 
@@ -676,6 +683,9 @@ def run(
 
         # Convert with concurrent processing (4 files at once)
         video-converter run --source photos --max-concurrent 4
+
+        # Convert again videos that were already converted
+        video-converter run --input-dir ~/Videos --reconvert
     """
     cli_ctx: CLIContext = ctx.obj
 
@@ -724,7 +734,7 @@ def run(
             _display_dry_run(h264_videos, output_dir)
             return
 
-        _run_batch_conversion(cli_ctx, h264_videos, output_dir)
+        _run_batch_conversion(cli_ctx, h264_videos, output_dir, reconvert=reconvert)
 
     elif source == "photos":
         # Validate reimport options
@@ -764,6 +774,7 @@ def run(
             keep_originals=keep_originals,
             archive_album=archive_album,
             max_concurrent=max_concurrent,
+            reconvert=reconvert,
         )
 
 
@@ -777,16 +788,7 @@ def _scan_for_videos(input_dir: Path, recursive: bool) -> list[Path]:
     Returns:
         List of video file paths.
     """
-    video_files: list[Path] = []
-
-    if recursive:
-        for ext in VIDEO_EXTENSIONS:
-            video_files.extend(input_dir.rglob(f"*{ext}"))
-    else:
-        for ext in VIDEO_EXTENSIONS:
-            video_files.extend(input_dir.glob(f"*{ext}"))
-
-    return sorted(video_files)
+    return sorted(video.path for video in scan_video_files(input_dir, recursive=recursive))
 
 
 def _display_dry_run(video_files: list[Path], output_dir: Path | None) -> None:
@@ -828,6 +830,7 @@ def _run_batch_conversion(
     cli_ctx: CLIContext,
     video_files: list[Path],
     output_dir: Path | None,
+    reconvert: bool = False,
 ) -> None:
     """Run batch conversion.
 
@@ -835,6 +838,7 @@ def _run_batch_conversion(
         cli_ctx: CLI context.
         video_files: List of video files to convert.
         output_dir: Output directory.
+        reconvert: Whether to convert files the history records as converted.
     """
     config = cli_ctx.config
 
@@ -856,6 +860,15 @@ def _run_batch_conversion(
         preserve_metadata=True,
         validate_output=config.processing.validate_quality,
         max_concurrent=config.processing.max_concurrent,
+        adaptive_concurrency=config.processing.adaptive_concurrency,
+        segment_encoding=config.processing.segment_encoding,
+        thread_budget=config.processing.thread_budget,
+        dedupe_inputs=config.processing.dedupe_inputs,
+        skip_converted=config.processing.skip_converted and not reconvert,
+        enable_pipeline=config.processing.pipeline,
+        pipeline_verify_concurrency=config.processing.pipeline_verify_concurrency,
+        pipeline_finalize_concurrency=config.processing.pipeline_finalize_concurrency,
+        pipeline_queue_size=config.processing.pipeline_queue_size,
         move_to_processed=config.paths.processed if config.processing.move_processed else None,
         move_to_failed=config.paths.failed if config.processing.move_failed else None,
         check_disk_space=config.processing.check_disk_space,
@@ -865,7 +878,11 @@ def _run_batch_conversion(
         vmaf_sample_interval=config.vmaf.sample_interval,
         vmaf_fail_action=config.vmaf.fail_action,
     )
-    orchestrator = Orchestrator(config=orch_config)
+    # Record every conversion so it counts in statistics and can be skipped next time
+    orchestrator = Orchestrator(
+        config=orch_config,
+        history=get_history(),
+    )
 
     # Progress display
     progress_manager = ProgressDisplayManager(quiet=cli_ctx.quiet, console=console)
@@ -1038,6 +1055,7 @@ def _run_photos_conversion(
     keep_originals: bool = False,
     archive_album: str = "Converted Originals",
     max_concurrent: int | None = None,
+    reconvert: bool = False,
 ) -> None:
     """Run conversion on Photos library videos.
 
@@ -1056,6 +1074,7 @@ def _run_photos_conversion(
         keep_originals: Whether to keep original videos alongside converted.
         archive_album: Album name for archiving originals.
         max_concurrent: Maximum number of concurrent conversions.
+        reconvert: Whether to convert videos the history records as converted.
     """
     from video_converter.extractors.photos_extractor import (
         PhotosAccessDeniedError,
@@ -1065,11 +1084,12 @@ def _run_photos_conversion(
         PhotosConversionOptions,
         PhotosSourceHandler,
     )
+    from video_converter.processors.probe_index import get_probe_index
     from video_converter.ui.panels import display_photos_permission_error
 
     # Initialize handler
     try:
-        with PhotosSourceHandler() as handler:
+        with PhotosSourceHandler(probe_index=get_probe_index()) as handler:
             # Check permissions
             if not handler.check_permissions():
                 error_msg = handler.get_permission_error()
@@ -1128,6 +1148,7 @@ def _run_photos_conversion(
                 keep_originals=keep_originals,
                 archive_album=archive_album,
                 max_concurrent=max_concurrent,
+                reconvert=reconvert,
             )
     except PhotosLibraryNotFoundError:
         display_photos_permission_error(
@@ -1204,6 +1225,7 @@ def _run_photos_batch_conversion(
     keep_originals: bool = False,
     archive_album: str = "Converted Originals",
     max_concurrent: int | None = None,
+    reconvert: bool = False,
 ) -> None:
     """Run batch conversion for Photos library videos using Orchestrator.
 
@@ -1224,6 +1246,7 @@ def _run_photos_batch_conversion(
         keep_originals: Whether to keep original videos alongside converted.
         archive_album: Album name for archiving originals.
         max_concurrent: Maximum number of concurrent conversions.
+        reconvert: Whether to convert videos the history records as converted.
     """
     import time
     from dataclasses import dataclass
@@ -1268,6 +1291,15 @@ def _run_photos_batch_conversion(
         preserve_timestamps=True,
         validate_output=config.processing.validate_quality,
         max_concurrent=effective_max_concurrent,
+        adaptive_concurrency=config.processing.adaptive_concurrency,
+        segment_encoding=config.processing.segment_encoding,
+        thread_budget=config.processing.thread_budget,
+        dedupe_inputs=config.processing.dedupe_inputs,
+        skip_converted=config.processing.skip_converted and not reconvert,
+        enable_pipeline=config.processing.pipeline,
+        pipeline_verify_concurrency=config.processing.pipeline_verify_concurrency,
+        pipeline_finalize_concurrency=config.processing.pipeline_finalize_concurrency,
+        pipeline_queue_size=config.processing.pipeline_queue_size,
         enable_retry=True,
         move_to_processed=config.paths.processed if config.processing.move_processed else None,
         move_to_failed=config.paths.failed if config.processing.move_failed else None,
@@ -1279,7 +1311,11 @@ def _run_photos_batch_conversion(
         vmaf_sample_interval=config.vmaf.sample_interval,
         vmaf_fail_action=config.vmaf.fail_action,
     )
-    orchestrator = Orchestrator(config=orch_config, enable_session_persistence=True)
+    orchestrator = Orchestrator(
+        config=orch_config,
+        enable_session_persistence=True,
+        history=get_history(),
+    )
 
     # Calculate total size
     total_size = sum(v.size for v in candidates)
@@ -1794,9 +1830,10 @@ def clean(ctx: click.Context, output_dir: Path | None, confirm: bool) -> None:
 @main.command()
 @click.option(
     "--path",
+    "paths",
     type=click.Path(exists=True, path_type=Path),
-    default=None,
-    help="Directory to scan (default: home directory).",
+    multiple=True,
+    help="Directory to scan; repeat to scan several (default: home directory).",
 )
 @click.option(
     "--min-size",
@@ -1811,7 +1848,7 @@ def clean(ctx: click.Context, output_dir: Path | None, confirm: bool) -> None:
     help="Maximum number of results to show.",
 )
 @click.pass_context
-def scan(ctx: click.Context, path: Path | None, min_size: int, limit: int | None) -> None:
+def scan(ctx: click.Context, paths: tuple[Path, ...], min_size: int, limit: int | None) -> None:
     """Scan for videos not in Photos library.
 
     Searches for video files on your system that are not registered in the
@@ -1826,26 +1863,34 @@ def scan(ctx: click.Context, path: Path | None, min_size: int, limit: int | None
         # Scan specific directory
         video-converter scan --path ~/Downloads
 
+        # Scan home directory and an external drive together
+        video-converter scan --path ~ --path /Volumes/Archive
+
         # Only show videos larger than 100MB
         video-converter scan --min-size 100
 
         # Limit results
         video-converter scan --limit 50
     """
+    import heapq
+    import time
     from collections import defaultdict
 
+    from rich.live import Live
+
     from video_converter.extractors.photos_extractor import (
         PhotosAccessDeniedError,
         PhotosLibrary,
     )
 
-    # Determine search path
-    search_path = path if path else Path.home()
+    # Determine search paths
+    search_paths = list(paths) if paths else [Path.home()]
     min_size_bytes = min_size * BYTES_PER_MB
 
     console.print()
     console.print("[bold]Scanning for videos not in Photos library...[/bold]")
-    console.print(f"[dim]Search path: {search_path}[/dim]")
+    for search_path in search_paths:
+        console.print(f"[dim]Search path: {search_path}[/dim]")
     console.print()
 
     # Directories to exclude from search
@@ -1864,9 +1909,9 @@ def scan(ctx: click.Context, path: Path | None, min_size: int, limit: int | None
 
     video_extensions = {".mp4", ".mov", ".mkv", ".m4v", ".avi", ".webm", ".mts", ".m2ts"}
 
-    # Step 1: Get Photos library video paths
+    # Step 1: Get Photos library video identities (device, inode)
     console.print("[cyan]Step 1/2: Loading Photos library...[/cyan]")
-    photos_paths: set[str] = set()
+    photos_ids: set[tuple[int, int]] = set()
 
     try:
         library = PhotosLibrary()
@@ -1874,9 +1919,12 @@ def scan(ctx: click.Context, path: Path | None, min_size: int, limit: int | None
             videos = library.get_videos()
             for video in videos:
                 if video.path:
-                    # Normalize path for comparison
-                    photos_paths.add(str(video.path.resolve()))
-            console.print(f"[green]✓ Found {len(photos_paths)} videos in Photos library[/green]")
+                    try:
+                        video_stat = video.path.stat()
+                    except OSError:
+                        continue
+                    photos_ids.add((video_stat.st_dev, video_stat.st_ino))
+            console.print(f"[green]✓ Found {len(photos_ids)} videos in Photos library[/green]")
         else:
             console.print("[yellow]⚠ Cannot access Photos library. Showing all videos.[/yellow]")
     except PhotosAccessDeniedError:
@@ -1889,94 +1937,63 @@ def scan(ctx: click.Context, path: Path | None, min_size: int, limit: int | None
     console.print("[cyan]Step 2/2: Scanning filesystem...[/cyan]")
 
     found_videos: list[tuple[Path, int]] = []
-    seen_resolved_paths: set[str] = set()  # Track resolved paths to avoid duplicates
-    scanned_dirs = 0
-    skipped_dirs = 0
-    permission_errors = 0
-    os_errors = 0
-
-    def should_exclude(dir_path: Path) -> bool:
-        """Check if directory should be excluded."""
-        return dir_path.name in exclude_dirs or dir_path.name.startswith(".")
-
-    def normalize_macos_path(path_str: str) -> str:
-        """Normalize macOS firmlink paths to canonical form.
-
-        macOS uses firmlinks where /System/Volumes/Data is the actual data volume
-        and paths like /Volumes are firmlinks to /System/Volumes/Data/Volumes.
-        This function normalizes these paths to avoid duplicates.
-        """
-        # Remove /System/Volumes/Data prefix if present
-        if path_str.startswith("/System/Volumes/Data/"):
-            return path_str[len("/System/Volumes/Data") :]
-        return path_str
-
-    try:
-        for item in search_path.rglob("*"):
-            try:
-                # Skip excluded directories
-                if item.is_dir():
-                    if should_exclude(item):
-                        skipped_dirs += 1
-                        continue
-                    scanned_dirs += 1
-                    continue
-
-                # Check if it's a video file
-                if not item.is_file():
-                    continue
-
-                if item.suffix.lower() not in video_extensions:
-                    continue
-
-                # Check if any parent is excluded
-                if any(should_exclude(p) for p in item.parents):
-                    continue
-
-                file_size = item.stat().st_size
-
-                # Skip small files
-                if file_size < min_size_bytes:
-                    continue
-
-                # Resolve symlinks and normalize macOS firmlinks
-                resolved_path = str(item.resolve())
-                normalized_path = normalize_macos_path(resolved_path)
+    # Running [count, size] per directory, updated as each video is found
+    dir_totals: dict[Path, list[int]] = defaultdict(lambda: [0, 0])
+    walker = ParallelVideoWalker(
+        extensions=video_extensions,
+        exclude_dirs=exclude_dirs,
+        skip_hidden_dirs=True,
+        min_size=min_size_bytes,
+    )
 
-                # Skip if already seen (handles symlink and firmlink duplicates)
-                if normalized_path in seen_resolved_paths:
-                    continue
-                seen_resolved_paths.add(normalized_path)
+    def render_progress() -> Table:
+        """Render the locations found so far, largest first."""
+        table = Table(
+            title="Scanning...",
+            caption=(
+                f"{len(found_videos)} videos found, "
+                f"{walker.stats.scanned_dirs} directories scanned"
+            ),
+        )
+        table.add_column("Location", style="cyan", no_wrap=False)
+        table.add_column("Files", style="green", justify="right")
+        table.add_column("Size", style="yellow", justify="right")
+        largest = heapq.nlargest(10, dir_totals.items(), key=lambda x: x[1][1])
+        for dir_path, (count, size) in largest:
+            table.add_row(str(dir_path), str(count), bytes_to_human(size))
+        return table
 
-                # Check if already in Photos (also normalize Photos paths)
-                if normalized_path in photos_paths or resolved_path in photos_paths:
+    try:
+        with Live(render_progress(), console=console, refresh_per_second=4, transient=True) as live:
+            last_update = 0.0
+            for video in walker.walk(search_paths):
+                assert video.stat is not None
+                # Skip videos already in Photos (matched by device and inode)
+                if (video.stat.st_dev, video.stat.st_ino) in photos_ids:
                     continue
 
-                # Store normalized path to avoid duplicates in output
-                found_videos.append((Path(normalized_path), file_size))
-
-                # Progress indicator every 100 videos
-                if len(found_videos) % 100 == 0:
-                    console.print(f"[dim]Found {len(found_videos)} videos so far...[/dim]")
+                found_videos.append((video.path, video.stat.st_size))
+                totals = dir_totals[video.path.parent]
+                totals[0] += 1
+                totals[1] += video.stat.st_size
 
-            except PermissionError:
-                permission_errors += 1
-                continue
-            except OSError:
-                # Handle other OS errors (e.g., broken symlinks, I/O errors)
-                os_errors += 1
-                continue
+                now = time.monotonic()
+                if now - last_update >= 0.25:
+                    live.update(render_progress())
+                    last_update = now
 
     except KeyboardInterrupt:
         console.print("[yellow]Scan interrupted by user[/yellow]")
 
-    if permission_errors > 0:
+    if walker.stats.permission_errors > 0:
         console.print(
-            f"[yellow]⚠ {permission_errors} items could not be accessed (permission denied)[/yellow]"
+            f"[yellow]⚠ {walker.stats.permission_errors} items could not be accessed "
+            "(permission denied)[/yellow]"
         )
-    if os_errors > 0:
+    if walker.stats.os_errors > 0:
         console.print(
-            f"[yellow]⚠ {os_errors} items could not be read (broken symlinks or I/O errors)[/yellow]"
+            f"[yellow]⚠ {walker.stats.os_errors} items could not be read "
+            "(broken symlinks or I/O errors)[/yellow]"
         )
 
     if not found_videos:
@@ -2119,7 +2136,7 @@ def stats(ctx: click.Context, period: str, output_json: bool, detailed: bool) ->
 
     # Display formatted statistics
     if detailed:
-        records = history.get_records_by_period(stats_period)
+        records = history.get_recent_records(stats_period)
         console.print(reporter.format_detailed(history_stats, records))
     else:
         console.print(reporter.format_summary(history_stats))
@@ -2197,10 +2214,10 @@ def stats_export(
     }
     stats_period = period_map.get(period, StatsPeriod.ALL)
 
-    # Get statistics and records
+    # Get statistics; records are streamed into the file during export
     history = get_history()
     history_stats = history.get_statistics(stats_period)
-    records = history.get_records_by_period(stats_period) if include_records else None
+    records = history.iter_records(stats_period) if include_records else None
 
     reporter = StatisticsReporter()
 
@@ -2210,15 +2227,15 @@ def stats_export(
 
     # Export
     if output_format == "json":
-        reporter.export_json(history_stats, output, records)
+        record_count = reporter.export_json(history_stats, output, records)
     else:
-        reporter.export_csv(history_stats, output, records)
+        record_count = reporter.export_csv(history_stats, output, records)
 
     console.print(f"[green]✓ Statistics exported to {output}[/green]")
     console.print(f"  Period: {period}")
     console.print(f"  Videos: {history_stats.total_converted}")
-    if include_records and records:
-        console.print(f"  Records: {len(records)}")
+    if record_count:
+        console.print(f"  Records: {record_count}")
 
 
 @main.command()
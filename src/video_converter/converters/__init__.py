@@ -18,6 +18,11 @@ from video_converter.converters.progress import (
     ProgressParser,
     create_simple_callback,
 )
+from video_converter.converters.segmented import (
+    Segment,
+    SegmentedConverter,
+    plan_segments,
+)
 from video_converter.converters.software import SoftwareConverter
 
 __all__ = [
@@ -29,7 +34,10 @@ __all__ = [
     "ProgressInfo",
     "ProgressMonitor",
     "ProgressParser",
+    "Segment",
+    "SegmentedConverter",
     "SoftwareConverter",
     "create_simple_callback",
     "get_converter",
+    "plan_segments",
 ]
@@ -26,8 +26,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -49,6 +51,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds between FFmpeg progress updates (-stats_period)
+DEFAULT_STATS_PERIOD = 0.5
+
+# Number of trailing FFmpeg stderr lines kept for error reporting
+DEFAULT_STDERR_TAIL_LINES = 200
+
 
 class ConversionError(Exception):
     """Exception raised when video conversion fails."""
@@ -68,8 +76,16 @@ class BaseConverter(ABC):
     This class defines the interface that all video converters must implement.
     It provides common functionality for command execution and progress tracking.
 
+    Progress is read from FFmpeg's machine-readable ``-progress`` output
+    on stdout, while stderr is kept only as a bounded tail of
+    diagnostics, so memory use per job does not grow with encode length.
+
     Attributes:
         mode: The conversion mode (hardware or software).
+        stats_period: Seconds between FFmpeg progress updates, or None
+            to use FFmpeg's default.
+        stderr_tail_lines: Number of trailing stderr lines kept for
+            error messages.
     """
 
     def __init__(self, mode: ConversionMode) -> None:
@@ -79,6 +95,8 @@ class BaseConverter(ABC):
             mode: The conversion mode to use.
         """
         self.mode = mode
+        self.stats_period: float | None = DEFAULT_STATS_PERIOD
+        self.stderr_tail_lines = DEFAULT_STDERR_TAIL_LINES
         self._command_runner = CommandRunner()
         self._ffprobe_runner = FFprobeRunner(self._command_runner)
         self._cancelled = False
@@ -115,6 +133,44 @@ class BaseConverter(ABC):
         """
         ...
 
+    def _with_progress_output(self, command: list[str]) -> list[str]:
+        """Make FFmpeg report progress as key=value pairs on stdout.
+
+        The interactive status line on stderr is disabled, leaving stderr
+        for warnings and errors only. Commands that already request
+        progress output are returned unchanged.
+
+        Args:
+            command: FFmpeg command built by build_command().
+
+        Returns:
+            Command with the progress options added after the executable.
+        """
+        if not command or "-progress" in command:
+            return command
+        options = ["-nostats", "-progress", "pipe:1"]
+        if self.stats_period is not None:
+            options.extend(["-stats_period", f"{self.stats_period:g}"])
+        return [command[0], *options, *command[1:]]
+
+    @staticmethod
+    def _apply_cpu_affinity(pid: int, cpus: tuple[int, ...] | None) -> None:
+        """Pin an encoder process to a set of CPUs.
+
+        Threads the process creates afterwards inherit the affinity. Does
+        nothing on platforms without CPU affinity support.
+
+        Args:
+            pid: Process ID of the encoder.
+            cpus: CPUs to pin the process to, or None for no pinning.
+        """
+        if not cpus or not hasattr(os, "sched_setaffinity"):
+            return
+        try:
+            os.sched_setaffinity(pid, cpus)
+        except OSError as e:
+            logger.debug(f"Could not set CPU affinity for process {pid}: {e}")
+
     def _get_video_duration(self, path: Path) -> float:
         """Get video duration in seconds using ffprobe.
 
@@ -167,6 +223,7 @@ class BaseConverter(ABC):
             return ConversionResult(
                 success=False,
                 request=request,
+                encoder=self.encoder_name,
                 error_message=f"Encoder '{self.encoder_name}' is not available",
                 started_at=started_at,
                 completed_at=datetime.now(),
@@ -179,48 +236,38 @@ class BaseConverter(ABC):
             return ConversionResult(
                 success=False,
                 request=request,
+                encoder=self.encoder_name,
                 error_message=f"Cannot read input file: {e}",
                 started_at=started_at,
                 completed_at=datetime.now(),
             )
 
-        # Get video duration for progress calculation
-        video_duration = self._get_video_duration(request.input_path)
+        # Get video duration for progress calculation, reusing the
+        # discovery analysis when the request carries one
+        if request.codec_info is not None and request.codec_info.duration > 0:
+            video_duration = request.codec_info.duration
+        else:
+            video_duration = self._get_video_duration(request.input_path)
         progress_parser = ProgressParser(total_duration=video_duration)
 
         # Ensure output directory exists
         request.output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Build and execute command
-        command = self.build_command(request)
+        command = self._with_progress_output(self.build_command(request))
         logger.info(f"Starting conversion: {request.input_path.name}")
         logger.debug(f"Command: {' '.join(command)}")
 
-        stderr_output = []
+        stderr_tail: deque[str] = deque(maxlen=max(1, self.stderr_tail_lines))
         last_speed = 0.0
 
-        try:
-            # Create subprocess with stderr streaming
-            self._current_process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            # Read stderr line by line for progress updates
-            while True:
-                if self._current_process.stderr is None:
-                    break
-
-                line = await self._current_process.stderr.readline()
-                if not line:
-                    break
-
+        async def read_progress(stream: asyncio.StreamReader) -> None:
+            nonlocal last_speed
+            async for line in stream:
                 line_str = line.decode("utf-8", errors="replace")
-                stderr_output.append(line_str)
 
-                # Parse progress from FFmpeg output
-                if progress_info := progress_parser.parse_line(line_str):
+                # Parse progress from FFmpeg's key=value output
+                if progress_info := progress_parser.parse_progress(line_str):
                     last_speed = progress_info.speed
                     # Call detailed progress callback with ProgressInfo
                     if on_progress_info:
@@ -232,6 +279,28 @@ class BaseConverter(ABC):
                     if on_progress and video_duration > 0:
                         on_progress(progress_info.percentage / 100.0)
 
+        async def read_stderr(stream: asyncio.StreamReader) -> None:
+            async for line in stream:
+                stderr_tail.append(line.decode("utf-8", errors="replace"))
+
+        try:
+            # Create subprocess with progress and stderr streaming
+            self._current_process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            self._apply_cpu_affinity(self._current_process.pid, request.cpu_affinity)
+
+            # Read progress from stdout while draining stderr into the tail
+            process = self._current_process
+            readers = []
+            if process.stdout is not None:
+                readers.append(read_progress(process.stdout))
+            if process.stderr is not None:
+                readers.append(read_stderr(process.stderr))
+            await asyncio.gather(*readers)
+
             # Wait for process to complete
             await self._current_process.wait()
 
@@ -242,6 +311,7 @@ class BaseConverter(ABC):
                 return ConversionResult(
                     success=False,
                     request=request,
+                    encoder=self.encoder_name,
                     original_size=original_size,
                     error_message="Conversion cancelled",
                     started_at=started_at,
@@ -249,13 +319,14 @@ class BaseConverter(ABC):
                 )
 
             if self._current_process.returncode != 0:
-                error_msg = "".join(stderr_output).strip()
+                error_msg = "".join(stderr_tail).strip()
                 # Clean up partial output
                 if request.output_path.exists():
                     request.output_path.unlink()
                 return ConversionResult(
                     success=False,
                     request=request,
+                    encoder=self.encoder_name,
                     original_size=original_size,
                     error_message=f"FFmpeg failed: {error_msg[-500:]}",
                     started_at=started_at,
@@ -267,6 +338,7 @@ class BaseConverter(ABC):
                 return ConversionResult(
                     success=False,
                     request=request,
+                    encoder=self.encoder_name,
                     original_size=original_size,
                     error_message="Output file was not created",
                     started_at=started_at,
@@ -296,6 +368,7 @@ class BaseConverter(ABC):
             return ConversionResult(
                 success=True,
                 request=request,
+                encoder=self.encoder_name,
                 original_size=original_size,
                 converted_size=converted_size,
                 duration_seconds=duration,
@@ -308,6 +381,7 @@ class BaseConverter(ABC):
             return ConversionResult(
                 success=False,
                 request=request,
+                encoder=self.encoder_name,
                 original_size=original_size,
                 error_message=f"FFmpeg not found: {e}",
                 started_at=started_at,
@@ -321,6 +395,7 @@ class BaseConverter(ABC):
             return ConversionResult(
                 success=False,
                 request=request,
+                encoder=self.encoder_name,
                 original_size=original_size,
                 error_message=str(e),
                 started_at=started_at,
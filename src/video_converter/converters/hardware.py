@@ -110,27 +110,36 @@ class HardwareConverter(BaseConverter):
             "ffmpeg",
             "-hide_banner",
             "-y",  # Overwrite output
-            "-i",
-            str(request.input_path),
-            # Video encoding
-            "-c:v",
-            self.encoder_name,
-            "-q:v",
-            str(quality),
-            "-tag:v",
-            "hvc1",  # Compatibility tag for Apple devices
-            # Audio handling
-            "-c:a",
-            request.audio_mode,
-            # Metadata handling
-            "-map_metadata",
-            "0",  # Copy all metadata
-            "-movflags",
-            "+faststart+use_metadata_tags",  # Enable streaming and preserve metadata tags
-            # Output
-            str(request.output_path),
         ]
 
+        # Limit decoder threads to the job's thread budget
+        if request.threads:
+            command.extend(["-threads", str(request.threads)])
+
+        command.extend(
+            [
+                "-i",
+                str(request.input_path),
+                # Video encoding
+                "-c:v",
+                self.encoder_name,
+                "-q:v",
+                str(quality),
+                "-tag:v",
+                "hvc1",  # Compatibility tag for Apple devices
+                # Audio handling
+                "-c:a",
+                request.audio_mode,
+                # Metadata handling
+                "-map_metadata",
+                "0",  # Copy all metadata
+                "-movflags",
+                "+faststart+use_metadata_tags",  # Enable streaming and preserve metadata tags
+                # Output
+                str(request.output_path),
+            ]
+        )
+
         return command
 
 
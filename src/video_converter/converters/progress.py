@@ -123,10 +123,12 @@ class ProgressInfo:
 
 
 class ProgressParser:
-    """Parser for FFmpeg stderr progress output.
+    """Parser for FFmpeg progress output.
 
-    This parser extracts real-time progress information from FFmpeg's stderr,
-    converting it into ProgressInfo objects for further processing.
+    This parser extracts real-time progress information from FFmpeg,
+    converting it into ProgressInfo objects for further processing. It
+    understands both the human-readable stderr status line (parse_line)
+    and the key=value blocks written by ``-progress`` (parse_progress).
 
     Attributes:
         total_duration: Total video duration in seconds.
@@ -150,6 +152,7 @@ class ProgressParser:
         """
         self.total_duration = max(0.0, total_duration)
         self._last_info: ProgressInfo | None = None
+        self._pending: ProgressInfo | None = None
 
     def parse_line(self, line: str) -> ProgressInfo | None:
         """Parse a single line of FFmpeg stderr output.
@@ -201,6 +204,58 @@ class ProgressParser:
         self._last_info = info
         return info
 
+    def parse_progress(self, line: str) -> ProgressInfo | None:
+        """Parse a single line of FFmpeg ``-progress`` output.
+
+        FFmpeg writes one ``key=value`` pair per line and ends every
+        update with a ``progress=continue`` or ``progress=end`` line.
+        Values are collected until that terminating line, so each line
+        is handled with a single split and no pattern matching.
+
+        Args:
+            line: A line from FFmpeg's progress output.
+
+        Returns:
+            ProgressInfo object when an update is complete, None otherwise.
+        """
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return None
+
+        info = self._pending
+        if info is None:
+            info = self._pending = ProgressInfo(total_time=self.total_duration)
+
+        if key == "progress":
+            self._pending = None
+            self._last_info = info
+            return info
+
+        value = value.strip()
+        if not value or value == "N/A":
+            return None
+
+        try:
+            if key == "frame":
+                info.frame = int(value)
+            elif key == "fps":
+                info.fps = float(value)
+            elif key in ("out_time_us", "out_time_ms"):
+                # out_time_ms is in microseconds as well (FFmpeg quirk)
+                info.current_time = max(0, int(value)) / 1_000_000
+            elif key == "total_size":
+                info.current_size = int(value)
+            elif key == "bitrate":
+                info.bitrate = float(value.removesuffix("kbits/s"))
+            elif key == "speed":
+                info.speed = float(value.removesuffix("x"))
+            elif key.startswith("stream_") and key.endswith("_q"):
+                info.quality = float(value)
+        except ValueError:
+            logger.debug(f"Ignoring malformed progress value: {key}={value}")
+
+        return None
+
     @property
     def last_info(self) -> ProgressInfo | None:
         """Get the most recently parsed progress info.
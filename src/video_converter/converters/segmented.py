@@ -0,0 +1,515 @@
+"""Segment-parallel encoding of a single long video.
+
+A single FFmpeg/libx265 process stops scaling well before all cores are
+busy, so a long clip can keep a batch running long after every other
+file is done. This module splits such an input at keyframes into
+chunks, encodes the chunks concurrently with the wrapped converter's
+own command builder, and losslessly concatenates the encoded chunks.
+
+Chunks are encoded without audio. The concatenation step takes the
+audio and metadata from the original input, so the output matches an
+unsegmented encode. Each chunk is retried independently, and all
+temporary chunk files are removed when the conversion ends.
+
+SDS Reference: SDS-V01-006
+SRS Reference: SRS-604 (Concurrent Processing Support)
+
+Example:
+    >>> from video_converter.converters.segmented import SegmentedConverter
+    >>> from video_converter.converters.software import SoftwareConverter
+    >>>
+    >>> converter = SegmentedConverter(SoftwareConverter(), segments=4)
+    >>> result = await converter.convert(request)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import dataclasses
+import logging
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from video_converter.converters.base import BaseConverter
+from video_converter.converters.progress import ProgressInfo
+from video_converter.core.types import ConversionRequest, ConversionResult
+from video_converter.utils.constants import (
+    DEFAULT_MAX_SEGMENTS,
+    DEFAULT_SEGMENT_MIN_DURATION,
+    MIN_SEGMENT_DURATION,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Encoding attempts per chunk before the whole conversion fails
+DEFAULT_SEGMENT_ATTEMPTS = 2
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A time range of the input encoded as one chunk.
+
+    Attributes:
+        index: Position of the chunk in the output.
+        start: Start time in seconds (a keyframe of the input).
+        end: End time in seconds, or None for the end of the input.
+    """
+
+    index: int
+    start: float
+    end: float | None = None
+
+    def duration(self, total_duration: float) -> float:
+        """Get the length of the segment.
+
+        Args:
+            total_duration: Duration of the whole input in seconds.
+
+        Returns:
+            Segment length in seconds.
+        """
+        end = total_duration if self.end is None else self.end
+        return max(0.0, end - self.start)
+
+
+def plan_segments(
+    duration: float,
+    keyframes: list[float],
+    count: int,
+    min_duration: float = MIN_SEGMENT_DURATION,
+) -> list[Segment]:
+    """Split an input into chunks that start on keyframes.
+
+    Boundaries are placed at the keyframes nearest to an even split.
+    Boundaries that would produce a chunk shorter than min_duration
+    are dropped, so fewer chunks than requested may be returned.
+
+    Args:
+        duration: Duration of the input in seconds.
+        keyframes: Sorted keyframe timestamps of the input in seconds.
+        count: Requested number of chunks.
+        min_duration: Shortest chunk length in seconds.
+
+    Returns:
+        Segments in output order. A single open-ended segment means the
+        input should not be split.
+    """
+    count = min(count, int(duration // min_duration)) if min_duration > 0 else count
+    candidates = [k for k in keyframes if 0.0 < k < duration]
+    if count < 2 or not candidates:
+        return [Segment(index=0, start=0.0)]
+
+    boundaries = [0.0]
+    for i in range(1, count):
+        target = duration * i / count
+        pos = bisect.bisect_left(candidates, target)
+        nearby = candidates[max(0, pos - 1) : pos + 1]
+        nearest = min(nearby, key=lambda k: abs(k - target))
+        if nearest - boundaries[-1] >= min_duration and duration - nearest >= min_duration:
+            boundaries.append(nearest)
+
+    segments = [
+        Segment(index=i, start=start, end=end)
+        for i, (start, end) in enumerate(zip(boundaries, boundaries[1:], strict=False))
+    ]
+    segments.append(Segment(index=len(boundaries) - 1, start=boundaries[-1]))
+    return segments
+
+
+def segment_command(command: list[str], segment: Segment) -> list[str]:
+    """Restrict an FFmpeg conversion command to one segment.
+
+    Adds input seeking before the first input and drops audio, which
+    is taken from the original during concatenation.
+
+    Args:
+        command: Command built by a converter for the whole input.
+        segment: The segment to encode.
+
+    Returns:
+        The command for the segment.
+    """
+    result: list[str] = []
+    args = iter(command)
+    seeked = False
+    for arg in args:
+        if arg == "-i" and not seeked:
+            result.extend(["-ss", f"{segment.start:.6f}"])
+            if segment.end is not None:
+                result.extend(["-t", f"{segment.end - segment.start:.6f}"])
+            seeked = True
+        elif arg == "-c:a":
+            next(args, None)
+            result.append("-an")
+            continue
+        result.append(arg)
+    return result
+
+
+def split_thread_budget(
+    request: ConversionRequest, index: int, count: int
+) -> dict[str, int | tuple[int, ...] | None]:
+    """Divide a request's thread budget among its concurrent chunks.
+
+    Args:
+        request: The conversion request for the whole input.
+        index: Index of the chunk.
+        count: Number of chunks encoded at once.
+
+    Returns:
+        The chunk's ``threads`` and ``cpu_affinity`` request fields.
+    """
+    if not request.threads:
+        return {"threads": None, "cpu_affinity": None}
+
+    threads = max(1, request.threads // count)
+    cpus = request.cpu_affinity
+    if cpus and len(cpus) >= threads * count:
+        cpus = cpus[index * threads : (index + 1) * threads]
+    return {"threads": threads, "cpu_affinity": cpus}
+
+
+class _SegmentConverter(BaseConverter):
+    """Converter that encodes one segment with another converter's command."""
+
+    def __init__(self, converter: BaseConverter, segment: Segment, duration: float) -> None:
+        """Initialize the segment converter.
+
+        Args:
+            converter: Converter whose command builder is used.
+            segment: The segment to encode.
+            duration: Length of the segment in seconds.
+        """
+        super().__init__(converter.mode)
+        self.stats_period = converter.stats_period
+        self.stderr_tail_lines = converter.stderr_tail_lines
+        self._converter = converter
+        self.segment = segment
+        self._duration = duration
+
+    @property
+    def encoder_name(self) -> str:
+        """Get the encoder name of the wrapped converter."""
+        return self._converter.encoder_name
+
+    def is_available(self) -> bool:
+        """Check if the wrapped converter is available."""
+        return self._converter.is_available()
+
+    def build_command(self, request: ConversionRequest) -> list[str]:
+        """Build the wrapped converter's command restricted to the segment."""
+        return segment_command(self._converter.build_command(request), self.segment)
+
+    def _get_video_duration(self, path: Path) -> float:
+        """Get the segment length used for progress."""
+        return self._duration
+
+
+class SegmentedConverter(BaseConverter):
+    """Encodes long inputs as keyframe-aligned chunks in parallel.
+
+    Inputs too short to split, or whose keyframes cannot be read, are
+    passed to the wrapped converter unchanged.
+
+    Attributes:
+        converter: The converter used for each chunk.
+        segments: Maximum number of chunks encoded at once.
+        min_input_duration: Shortest input in seconds that is split.
+        min_segment_duration: Shortest chunk length in seconds.
+        max_attempts: Encoding attempts per chunk.
+    """
+
+    def __init__(
+        self,
+        converter: BaseConverter,
+        segments: int = DEFAULT_MAX_SEGMENTS,
+        *,
+        min_input_duration: float = DEFAULT_SEGMENT_MIN_DURATION,
+        min_segment_duration: float = MIN_SEGMENT_DURATION,
+        max_attempts: int = DEFAULT_SEGMENT_ATTEMPTS,
+    ) -> None:
+        """Initialize the segmented converter.
+
+        Args:
+            converter: The converter used for each chunk.
+            segments: Maximum number of chunks encoded at once.
+            min_input_duration: Shortest input in seconds that is split.
+            min_segment_duration: Shortest chunk length in seconds.
+            max_attempts: Encoding attempts per chunk.
+        """
+        super().__init__(converter.mode)
+        self.converter = converter
+        self.segments = max(1, segments)
+        self.min_input_duration = min_input_duration
+        self.min_segment_duration = min_segment_duration
+        self.max_attempts = max(1, max_attempts)
+        self._active: list[BaseConverter] = []
+
+    @property
+    def encoder_name(self) -> str:
+        """Get the encoder name of the wrapped converter."""
+        return self.converter.encoder_name
+
+    def is_available(self) -> bool:
+        """Check if the wrapped converter is available."""
+        return self.converter.is_available()
+
+    def build_command(self, request: ConversionRequest) -> list[str]:
+        """Build the wrapped converter's command for the whole input."""
+        return self.converter.build_command(request)
+
+    def build_concat_command(
+        self,
+        request: ConversionRequest,
+        list_path: Path,
+    ) -> list[str]:
+        """Build the FFmpeg command that joins the encoded chunks.
+
+        Video is stream-copied from the chunks, and audio and metadata
+        are taken from the original input.
+
+        Args:
+            request: The conversion request.
+            list_path: Concat demuxer file listing the chunks in order.
+
+        Returns:
+            FFmpeg command arguments.
+        """
+        return [
+            "ffmpeg",
+            "-hide_banner",
+            "-y",  # Overwrite output
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            "-i",
+            str(request.input_path),
+            "-map",
+            "0:v:0",
+            "-map",
+            "1:a?",
+            "-c:v",
+            "copy",
+            "-c:a",
+            request.audio_mode,
+            "-tag:v",
+            "hvc1",  # Compatibility tag for Apple devices
+            "-map_metadata",
+            "1",  # Copy all metadata from the original
+            "-movflags",
+            "+faststart+use_metadata_tags",
+            str(request.output_path),
+        ]
+
+    async def _plan(self, request: ConversionRequest) -> tuple[float, list[Segment]]:
+        """Read the input's duration and keyframes and plan its chunks.
+
+        Args:
+            request: The conversion request.
+
+        Returns:
+            Tuple of (duration, segments).
+        """
+        if request.codec_info is not None and request.codec_info.duration > 0:
+            duration = request.codec_info.duration
+        else:
+            duration = self._get_video_duration(request.input_path)
+
+        if (
+            self.segments < 2
+            or duration < self.min_input_duration
+            or duration < 2 * self.min_segment_duration
+        ):
+            return duration, [Segment(index=0, start=0.0)]
+
+        try:
+            keyframes = await self._ffprobe_runner.keyframe_times_async(request.input_path)
+        except Exception as e:
+            logger.warning(f"Cannot read keyframes of {request.input_path.name}: {e}")
+            keyframes = []
+
+        return duration, plan_segments(
+            duration, keyframes, self.segments, self.min_segment_duration
+        )
+
+    async def convert(
+        self,
+        request: ConversionRequest,
+        on_progress: Callable[[float], None] | None = None,
+        on_progress_info: Callable[[ProgressInfo], None] | None = None,
+    ) -> ConversionResult:
+        """Convert a video file, splitting it into chunks if it is long enough.
+
+        Args:
+            request: The conversion request.
+            on_progress: Optional callback for simple progress updates (0.0-1.0).
+            on_progress_info: Optional callback for combined progress of all
+                chunks.
+
+        Returns:
+            ConversionResult with success status and statistics.
+        """
+        self._cancelled = False
+        duration, segments = await self._plan(request)
+        if len(segments) < 2:
+            self._active = [self.converter]
+            try:
+                return await self.converter.convert(request, on_progress, on_progress_info)
+            finally:
+                self._active = []
+
+        started_at = datetime.now()
+        start_time = time.perf_counter()
+        try:
+            original_size = request.input_path.stat().st_size
+        except OSError as e:
+            return ConversionResult(
+                success=False,
+                request=request,
+                encoder=self.encoder_name,
+                error_message=f"Cannot read input file: {e}",
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+        work_dir = request.output_path.parent / f".{request.output_path.stem}.segments"
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(
+            f"Encoding {request.input_path.name} in {len(segments)} segments "
+            f"with {self.encoder_name}"
+        )
+
+        chunk_progress: dict[int, ProgressInfo] = {}
+
+        def report_progress() -> None:
+            combined = ProgressInfo(
+                frame=sum(p.frame for p in chunk_progress.values()),
+                fps=sum(p.fps for p in chunk_progress.values()),
+                current_time=sum(p.current_time for p in chunk_progress.values()),
+                total_time=duration,
+                current_size=sum(p.current_size for p in chunk_progress.values()),
+                speed=sum(p.speed for p in chunk_progress.values()),
+            )
+            if on_progress_info:
+                try:
+                    on_progress_info(combined)
+                except Exception:
+                    pass  # Swallow callback errors
+            if on_progress and duration > 0:
+                on_progress(combined.percentage / 100.0)
+
+        async def encode_chunk(segment: Segment) -> ConversionResult:
+            chunk = _SegmentConverter(self.converter, segment, segment.duration(duration))
+            chunk_request = dataclasses.replace(
+                request,
+                output_path=work_dir / f"segment_{segment.index:03d}.mp4",
+                codec_info=None,
+                **split_thread_budget(request, segment.index, len(segments)),
+            )
+
+            def on_chunk_progress(info: ProgressInfo) -> None:
+                chunk_progress[segment.index] = info
+                report_progress()
+
+            self._active.append(chunk)
+            try:
+                for attempt in range(1, self.max_attempts + 1):
+                    result = await chunk.convert(chunk_request, on_progress_info=on_chunk_progress)
+                    if result.success or self._cancelled:
+                        return result
+                    logger.warning(
+                        f"Segment {segment.index} of {request.input_path.name} failed "
+                        f"(attempt {attempt}/{self.max_attempts}): {result.error_message}"
+                    )
+                return result
+            finally:
+                self._active.remove(chunk)
+
+        def failure(message: str) -> ConversionResult:
+            return ConversionResult(
+                success=False,
+                request=request,
+                encoder=self.encoder_name,
+                original_size=original_size,
+                error_message=message,
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+
+        tasks: list[asyncio.Task[ConversionResult]] = []
+        try:
+            tasks = [asyncio.create_task(encode_chunk(segment)) for segment in segments]
+            for finished in asyncio.as_completed(tasks):
+                chunk_result = await finished
+                if not chunk_result.success:
+                    # Stop the remaining chunks, the output cannot be assembled
+                    self.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    if chunk_result.error_message == "Conversion cancelled":
+                        return failure("Conversion cancelled")
+                    return failure(f"Segment encode failed: {chunk_result.error_message}")
+
+            list_path = work_dir / "segments.txt"
+            list_path.write_text(
+                "".join(
+                    "file '{}'\n".format(
+                        str(work_dir / f"segment_{s.index:03d}.mp4").replace("'", "'\\''")
+                    )
+                    for s in segments
+                ),
+                encoding="utf-8",
+            )
+            concat = await self._command_runner.run_async(
+                self.build_concat_command(request, list_path), timeout=None
+            )
+            if not concat.success or not request.output_path.exists():
+                if request.output_path.exists():
+                    request.output_path.unlink()
+                return failure(f"Segment concatenation failed: {concat.stderr.strip()[-500:]}")
+
+            converted_size = request.output_path.stat().st_size
+            elapsed = time.perf_counter() - start_time
+            if on_progress:
+                on_progress(1.0)
+
+            logger.info(
+                f"Segmented conversion complete: {request.input_path.name} "
+                f"({len(segments)} segments, {duration / elapsed:.1f}x speed)"
+            )
+            return ConversionResult(
+                success=True,
+                request=request,
+                encoder=self.encoder_name,
+                original_size=original_size,
+                converted_size=converted_size,
+                duration_seconds=elapsed,
+                speed_ratio=duration / elapsed if elapsed > 0 else 0.0,
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+        except Exception as e:
+            logger.exception(f"Segmented conversion error: {e}")
+            if request.output_path.exists():
+                request.output_path.unlink()
+            return failure(str(e))
+        finally:
+            for task in tasks:
+                task.cancel()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def cancel(self) -> None:
+        """Cancel the conversion and every running chunk."""
+        self._cancelled = True
+        for converter in list(self._active):
+            converter.cancel()
@@ -143,26 +143,46 @@ class SoftwareConverter(BaseConverter):
             "ffmpeg",
             "-hide_banner",
             "-y",  # Overwrite output
-            "-i",
-            str(request.input_path),
-            # Video encoding
-            "-c:v",
-            encoder,
-            "-crf",
-            str(crf),
-            "-preset",
-            preset,
-            "-tag:v",
-            "hvc1",  # Compatibility tag for Apple devices
         ]
 
+        # Limit decoder threads to the job's thread budget
+        if request.threads:
+            command.extend(["-threads", str(request.threads)])
+
+        command.extend(
+            [
+                "-i",
+                str(request.input_path),
+                # Video encoding
+                "-c:v",
+                encoder,
+                "-crf",
+                str(crf),
+                "-preset",
+                preset,
+                "-tag:v",
+                "hvc1",  # Compatibility tag for Apple devices
+            ]
+        )
+
+        x265_params = []
+
+        # Size the x265 thread pool to the job's thread budget
+        if request.threads:
+            x265_params.append(
+                f"pools={request.threads}:frame-threads={x265_frame_threads(request.threads)}"
+            )
+
         # Add 10-bit encoding options
         if bit_depth == 10:
             command.extend(["-pix_fmt", "yuv420p10le"])
 
             # Add HDR parameters if enabled
             if request.hdr:
-                command.extend(["-x265-params", self.HDR_X265_PARAMS])
+                x265_params.append(self.HDR_X265_PARAMS)
+
+        if x265_params:
+            command.extend(["-x265-params", ":".join(x265_params)])
 
         # Audio handling
         command.extend(["-c:a", request.audio_mode])
@@ -183,6 +203,29 @@ class SoftwareConverter(BaseConverter):
         return command
 
 
+def x265_frame_threads(threads: int) -> int:
+    """Get the number of x265 frame threads for a thread budget.
+
+    Follows x265's own defaults for a machine with the given number of
+    cores, so a budgeted job behaves like x265 on a smaller machine.
+
+    Args:
+        threads: Number of threads available to the encode.
+
+    Returns:
+        Number of frames encoded in parallel.
+    """
+    if threads >= 32:
+        return 6
+    if threads >= 16:
+        return 5
+    if threads >= 8:
+        return 3
+    if threads >= 4:
+        return 2
+    return 1
+
+
 def create_software_converter() -> SoftwareConverter | None:
     """Factory function to create a software converter if available.
 
@@ -9,9 +9,13 @@ Note:
 """
 
 from video_converter.core.concurrent import (
+    AdaptiveConcurrencyController,
     AggregatedProgress,
+    ConcurrencyDecision,
     ConcurrentProcessor,
     JobProgress,
+    ProgressPublisher,
+    ResizableSemaphore,
     ResourceLevel,
     ResourceMonitor,
     ResourceStatus,
@@ -25,6 +29,11 @@ from video_converter.core.config import (
     PhotosConfig,
     ProcessingConfig,
 )
+from video_converter.core.encoder_pool import (
+    EncoderDispatcher,
+    EncoderPoolConfig,
+    EncoderSlotPool,
+)
 from video_converter.core.error_recovery import (
     DEFAULT_MIN_FREE_SPACE,
     ERROR_RECOVERY_MAPPING,
@@ -32,12 +41,18 @@ from video_converter.core.error_recovery import (
     ErrorRecoveryManager,
     FailureRecord,
 )
+from video_converter.core.fingerprint import (
+    Fingerprinter,
+    get_fingerprinter,
+    reset_fingerprinter,
+)
 from video_converter.core.history import (
     ConversionHistory,
     ConversionRecord,
     HistoryCorruptedError,
     HistoryError,
     HistoryStatistics,
+    SQLiteHistory,
     get_history,
     reset_history,
 )
@@ -49,13 +64,23 @@ from video_converter.core.logger import (
     get_logger,
     set_log_level,
 )
+from video_converter.core.scheduling import (
+    TaskCostModel,
+    TaskEstimate,
+    estimate_makespan,
+)
 from video_converter.core.session import (
+    JournalSync,
     SessionCorruptedError,
     SessionNotFoundError,
     SessionStateError,
     SessionStateManager,
     get_session_manager,
 )
+from video_converter.core.thread_budget import (
+    ThreadAllocation,
+    ThreadBudget,
+)
 from video_converter.core.types import (
     BatchStatus,
     CompleteCallback,
@@ -85,12 +110,20 @@ __all__ = [
     "PhotosConfig",
     "ProcessingConfig",
     # Concurrent
+    "AdaptiveConcurrencyController",
     "AggregatedProgress",
+    "ConcurrencyDecision",
     "ConcurrentProcessor",
     "JobProgress",
+    "ProgressPublisher",
+    "ResizableSemaphore",
     "ResourceLevel",
     "ResourceMonitor",
     "ResourceStatus",
+    # Encoder Pools
+    "EncoderDispatcher",
+    "EncoderPoolConfig",
+    "EncoderSlotPool",
     # Error Recovery
     "DEFAULT_MIN_FREE_SPACE",
     "DiskSpaceInfo",
@@ -99,6 +132,10 @@ __all__ = [
     "ErrorRecoveryManager",
     "FailureRecord",
     "RecoveryAction",
+    # Fingerprints
+    "Fingerprinter",
+    "get_fingerprinter",
+    "reset_fingerprinter",
     # History
     "ConversionHistory",
     "ConversionRecord",
@@ -107,6 +144,7 @@ __all__ = [
     "HistoryError",
     "HistoryStatistics",
     "reset_history",
+    "SQLiteHistory",
     # Logger
     "configure_logging",
     "get_log_dir",
@@ -114,8 +152,13 @@ __all__ = [
     "get_logger",
     "LogLevel",
     "set_log_level",
+    # Scheduling
+    "estimate_makespan",
+    "TaskCostModel",
+    "TaskEstimate",
     # Session
     "get_session_manager",
+    "JournalSync",
     "SessionCorruptedError",
     "SessionNotFoundError",
     "SessionState",
@@ -123,6 +166,9 @@ __all__ = [
     "SessionStateManager",
     "SessionStatus",
     "VideoEntry",
+    # Thread Budget
+    "ThreadAllocation",
+    "ThreadBudget",
     # Types
     "BatchStatus",
     "CompleteCallback",
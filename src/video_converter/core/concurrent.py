@@ -3,6 +3,16 @@
 This module implements concurrent video processing with configurable
 parallelism, resource management, and aggregated progress tracking.
 
+Batches can run in two ways: process_batch() starts a task per item and
+returns all results in order, while process_stream() runs a fixed pool
+of workers fed from a bounded queue and hands each result to a callback
+as soon as it is ready, so memory stays flat for very large batches.
+
+Aggregated progress is maintained incrementally (counts, summed job
+progress and the set of running jobs) so a progress update costs O(1)
+regardless of batch size, and it is delivered through a coalescing
+ProgressPublisher at a bounded rate.
+
 SDS Reference: SDS-C01-004
 SRS Reference: SRS-604 (Concurrent Processing Support)
 
@@ -26,7 +36,8 @@ import asyncio
 import logging
 import os
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -38,6 +49,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between aggregated progress callbacks
+DEFAULT_PROGRESS_INTERVAL = 0.1
+
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -68,6 +82,8 @@ class ResourceStatus:
         cpu_level: Categorized CPU level.
         memory_level: Categorized memory level.
         recommended_concurrency: Suggested concurrent job count.
+        load_percent: One-minute load average as a percentage of CPU count.
+        load_level: Categorized load level.
     """
 
     cpu_percent: float = 0.0
@@ -75,9 +91,34 @@ class ResourceStatus:
     cpu_level: ResourceLevel = ResourceLevel.NORMAL
     memory_level: ResourceLevel = ResourceLevel.NORMAL
     recommended_concurrency: int = 2
+    load_percent: float = 0.0
+    load_level: ResourceLevel = ResourceLevel.NORMAL
 
 
 @dataclass
+class ConcurrencyDecision:
+    """A concurrency limit change made by AdaptiveConcurrencyController.
+
+    Attributes:
+        timestamp: When the decision was made.
+        previous_limit: Concurrency limit before the decision.
+        new_limit: Concurrency limit after the decision.
+        cpu_percent: CPU utilization that led to the decision.
+        memory_percent: Memory utilization that led to the decision.
+        load_percent: Load average (percent of CPU count) at the decision.
+        reason: Short human-readable explanation.
+    """
+
+    timestamp: datetime
+    previous_limit: int
+    new_limit: int
+    cpu_percent: float
+    memory_percent: float
+    load_percent: float
+    reason: str
+
+
+@dataclass(slots=True)
 class JobProgress:
     """Progress information for a single concurrent job.
 
@@ -104,21 +145,27 @@ class AggregatedProgress:
 
     Attributes:
         total_jobs: Total number of jobs.
-        completed_jobs: Number of completed jobs.
+        completed_jobs: Number of finished jobs, including failed ones.
+        failed_jobs: Number of jobs that raised an exception.
         in_progress_jobs: Number of jobs currently running.
         pending_jobs: Number of pending jobs.
         overall_progress: Overall progress (0.0-1.0).
         job_progresses: Progress of individual jobs.
         current_files: Names of files currently being processed.
+        concurrency_limit: Number of jobs currently allowed to run at once.
+        last_decision: Most recent adaptive concurrency change, if any.
     """
 
     total_jobs: int = 0
     completed_jobs: int = 0
+    failed_jobs: int = 0
     in_progress_jobs: int = 0
     pending_jobs: int = 0
     overall_progress: float = 0.0
     job_progresses: list[JobProgress] = field(default_factory=list)
     current_files: list[str] = field(default_factory=list)
+    concurrency_limit: int = 0
+    last_decision: ConcurrencyDecision | None = None
 
 
 class ResourceMonitor:
@@ -133,6 +180,8 @@ class ResourceMonitor:
     CPU_CRITICAL_THRESHOLD = 95.0
     MEMORY_HIGH_THRESHOLD = 75.0
     MEMORY_CRITICAL_THRESHOLD = 90.0
+    LOAD_HIGH_THRESHOLD = 100.0
+    LOAD_CRITICAL_THRESHOLD = 150.0
 
     def __init__(self) -> None:
         """Initialize the resource monitor."""
@@ -171,7 +220,16 @@ class ResourceMonitor:
                 self.MEMORY_CRITICAL_THRESHOLD,
             )
 
-            recommended = self._calculate_recommended_concurrency(cpu_level, memory_level)
+            load_percent = self._get_load_percent()
+            load_level = self._categorize_level(
+                load_percent,
+                self.LOAD_HIGH_THRESHOLD,
+                self.LOAD_CRITICAL_THRESHOLD,
+            )
+
+            recommended = self._calculate_recommended_concurrency(
+                cpu_level, memory_level, load_level
+            )
 
             return ResourceStatus(
                 cpu_percent=cpu_percent,
@@ -179,11 +237,27 @@ class ResourceMonitor:
                 cpu_level=cpu_level,
                 memory_level=memory_level,
                 recommended_concurrency=recommended,
+                load_percent=load_percent,
+                load_level=load_level,
             )
         except Exception as e:
             logger.debug(f"Error getting resource status: {e}")
             return ResourceStatus()
 
+    def _get_load_percent(self) -> float:
+        """Get the one-minute load average relative to the CPU count.
+
+        Returns:
+            Load average as a percentage of available CPUs (100.0 means
+            every CPU has one runnable process), or 0.0 if unavailable.
+        """
+        try:
+            load_1min = os.getloadavg()[0]
+        except (AttributeError, OSError):
+            return 0.0
+        cpu_count = os.cpu_count() or 1
+        return load_1min / cpu_count * 100.0
+
     def _categorize_level(
         self, value: float, high_threshold: float, critical_threshold: float
     ) -> ResourceLevel:
@@ -206,13 +280,17 @@ class ResourceMonitor:
         return ResourceLevel.NORMAL
 
     def _calculate_recommended_concurrency(
-        self, cpu_level: ResourceLevel, memory_level: ResourceLevel
+        self,
+        cpu_level: ResourceLevel,
+        memory_level: ResourceLevel,
+        load_level: ResourceLevel = ResourceLevel.NORMAL,
     ) -> int:
         """Calculate recommended concurrent job count.
 
         Args:
             cpu_level: Current CPU utilization level.
             memory_level: Current memory utilization level.
+            load_level: Current load average level.
 
         Returns:
             Recommended number of concurrent jobs.
@@ -228,21 +306,310 @@ class ResourceMonitor:
         base_concurrency = min(cpu_count, 4)
 
         # Reduce based on resource levels
-        if cpu_level == ResourceLevel.CRITICAL or memory_level == ResourceLevel.CRITICAL:
+        levels = (cpu_level, memory_level, load_level)
+        if ResourceLevel.CRITICAL in levels:
             return 1
-        if cpu_level == ResourceLevel.HIGH or memory_level == ResourceLevel.HIGH:
+        if ResourceLevel.HIGH in levels:
             return max(1, base_concurrency // 2)
 
         return base_concurrency
 
 
+class ResizableSemaphore:
+    """An asyncio semaphore whose limit can be changed while in use.
+
+    Raising the limit immediately admits waiting tasks. Lowering it never
+    interrupts running holders; new acquirers simply wait until enough
+    holders have released to get below the new limit.
+
+    Attributes:
+        limit: Maximum number of concurrent holders.
+        active: Number of current holders.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the semaphore.
+
+        Args:
+            limit: Initial maximum number of concurrent holders (at least 1).
+        """
+        self._limit = max(1, limit)
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Get the number of current holders."""
+        return self._active
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the concurrency limit.
+
+        Args:
+            limit: New maximum number of concurrent holders (at least 1).
+        """
+        async with self._condition:
+            self._limit = max(1, limit)
+            self._condition.notify_all()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Release a slot and wake one waiting task."""
+        async with self._condition:
+            self._active = max(0, self._active - 1)
+            self._condition.notify()
+
+    async def __aenter__(self) -> ResizableSemaphore:
+        """Acquire a slot."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the slot."""
+        await self.release()
+
+
+class AdaptiveConcurrencyController:
+    """Periodically resizes a ResizableSemaphore from system load.
+
+    Every ``interval`` seconds the controller samples CPU, memory and
+    load average through ResourceMonitor. When resources are under
+    pressure the limit drops straight to the recommended value; when
+    they recover it grows by one job per interval, so a brief dip in
+    load does not immediately start several new encodes.
+
+    Attributes:
+        min_concurrent: Lower bound for the concurrency limit.
+        max_concurrent: Upper bound for the concurrency limit.
+        interval: Seconds between resource samples.
+        decisions: History of limit changes in this run.
+    """
+
+    def __init__(
+        self,
+        semaphore: ResizableSemaphore,
+        monitor: ResourceMonitor,
+        *,
+        min_concurrent: int = 1,
+        max_concurrent: int = 2,
+        interval: float = 10.0,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            semaphore: Semaphore whose limit is adjusted.
+            monitor: Source of resource measurements.
+            min_concurrent: Lower bound for the concurrency limit.
+            max_concurrent: Upper bound for the concurrency limit.
+            interval: Seconds between resource samples.
+        """
+        self.min_concurrent = max(1, min_concurrent)
+        self.max_concurrent = max(self.min_concurrent, max_concurrent)
+        self.interval = max(0.0, interval)
+        self.decisions: list[ConcurrencyDecision] = []
+        self._semaphore = semaphore
+        self._monitor = monitor
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def last_decision(self) -> ConcurrencyDecision | None:
+        """Get the most recent limit change."""
+        return self.decisions[-1] if self.decisions else None
+
+    def _target_limit(self, status: ResourceStatus) -> tuple[int, str]:
+        """Choose the next limit for a resource sample.
+
+        Args:
+            status: Current resource status.
+
+        Returns:
+            Tuple of (new limit, reason).
+        """
+        current = self._semaphore.limit
+        recommended = min(
+            self.max_concurrent, max(self.min_concurrent, status.recommended_concurrency)
+        )
+
+        if recommended < current:
+            return recommended, (
+                f"resources under pressure (cpu {status.cpu_level.value}, "
+                f"memory {status.memory_level.value}, load {status.load_level.value})"
+            )
+        if recommended > current:
+            return current + 1, "resources available"
+        return current, "unchanged"
+
+    async def evaluate(self) -> ConcurrencyDecision | None:
+        """Sample resources once and apply the resulting limit.
+
+        Returns:
+            The decision if the limit changed, otherwise None.
+        """
+        # cpu_percent() blocks for its sampling interval
+        status = await asyncio.to_thread(self._monitor.get_status)
+        previous = self._semaphore.limit
+        new_limit, reason = self._target_limit(status)
+        if new_limit == previous:
+            return None
+
+        await self._semaphore.set_limit(new_limit)
+        decision = ConcurrencyDecision(
+            timestamp=datetime.now(),
+            previous_limit=previous,
+            new_limit=new_limit,
+            cpu_percent=status.cpu_percent,
+            memory_percent=status.memory_percent,
+            load_percent=status.load_percent,
+            reason=reason,
+        )
+        self.decisions.append(decision)
+        logger.info(f"Concurrency limit {previous} -> {new_limit}: {reason}")
+        return decision
+
+    async def _run(self) -> None:
+        """Evaluate resources until stopped."""
+        while True:
+            started = time.monotonic()
+            try:
+                await self.evaluate()
+            except Exception as e:
+                logger.debug(f"Adaptive concurrency evaluation failed: {e}")
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def start(self) -> None:
+        """Start periodic evaluation on the running event loop."""
+        if self._task is None or self._task.done():
+            self.decisions = []
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic evaluation."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+class ProgressPublisher:
+    """Delivers progress snapshots to a callback at a bounded rate.
+
+    Updates arriving faster than ``min_interval`` are coalesced: the
+    first is delivered immediately, later ones only mark the publisher
+    dirty and a single trailing delivery is scheduled on the running
+    event loop. The snapshot is built when it is delivered, so skipped
+    updates cost nothing beyond the notification.
+
+    Attributes:
+        min_interval: Minimum seconds between deliveries.
+        published: Number of snapshots delivered.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[AggregatedProgress], None],
+        snapshot: Callable[[], AggregatedProgress],
+        min_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    ) -> None:
+        """Initialize the publisher.
+
+        Args:
+            callback: Function receiving each delivered snapshot.
+            snapshot: Function building the snapshot to deliver.
+            min_interval: Minimum seconds between deliveries.
+        """
+        self.min_interval = max(0.0, min_interval)
+        self.published = 0
+        self._callback = callback
+        self._snapshot = snapshot
+        self._last_delivery = float("-inf")
+        self._dirty = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._lock = threading.Lock()
+
+    def notify(self) -> None:
+        """Report that the published state changed."""
+        with self._lock:
+            wait = self._last_delivery + self.min_interval - time.monotonic()
+            if wait > 0:
+                self._dirty = True
+                if self._timer is None:
+                    self._schedule(wait)
+                return
+            self._last_delivery = time.monotonic()
+            self._dirty = False
+        self._deliver()
+
+    def flush(self) -> None:
+        """Deliver any coalesced update immediately."""
+        with self._lock:
+            self._cancel_timer()
+            if not self._dirty:
+                return
+            self._last_delivery = time.monotonic()
+            self._dirty = False
+        self._deliver()
+
+    def close(self) -> None:
+        """Drop any coalesced update and stop the trailing delivery."""
+        with self._lock:
+            self._cancel_timer()
+            self._dirty = False
+
+    def _schedule(self, delay: float) -> None:
+        """Schedule the trailing delivery on the running event loop.
+
+        Notifications from threads without a running loop stay pending
+        until the next notification or flush().
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(delay, self._on_timer)
+
+    def _cancel_timer(self) -> None:
+        """Cancel the trailing delivery, if scheduled."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        """Deliver the update coalesced since the last delivery."""
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _deliver(self) -> None:
+        """Build a snapshot and pass it to the callback."""
+        self.published += 1
+        try:
+            self._callback(self._snapshot())
+        except Exception as e:
+            logger.warning(f"Progress callback error: {e}")
+
+
 class ConcurrentProcessor:
     """Manages concurrent video processing with resource awareness.
 
     This class provides:
     - Configurable maximum concurrent jobs
     - Resource monitoring and adaptive concurrency
-    - Aggregated progress tracking
+    - Aggregated progress tracking with O(1) updates
     - Thread-safe job management
     """
 
@@ -251,26 +618,45 @@ class ConcurrentProcessor:
         max_concurrent: int = 2,
         enable_resource_monitoring: bool = True,
         adaptive_concurrency: bool = False,
+        min_concurrent: int = 1,
+        adaptive_interval: float = 10.0,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
     ) -> None:
         """Initialize the concurrent processor.
 
         Args:
             max_concurrent: Maximum number of concurrent jobs.
             enable_resource_monitoring: Whether to monitor system resources.
-            adaptive_concurrency: Whether to adjust concurrency based on resources.
+            adaptive_concurrency: Whether to keep adjusting concurrency from
+                system resources while a batch is running.
+            min_concurrent: Lower bound for adaptive concurrency.
+            adaptive_interval: Seconds between adaptive resource checks.
+            progress_interval: Minimum seconds between aggregated progress
+                callbacks.
         """
         self._max_concurrent = max(1, max_concurrent)
+        self._min_concurrent = max(1, min(min_concurrent, self._max_concurrent))
         self._enable_resource_monitoring = enable_resource_monitoring
         self._adaptive_concurrency = adaptive_concurrency
+        self._adaptive_interval = adaptive_interval
+        self._progress_interval = progress_interval
 
-        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore: ResizableSemaphore | None = None
+        self._controller: AdaptiveConcurrencyController | None = None
         self._resource_monitor = ResourceMonitor() if enable_resource_monitoring else None
         self._lock = threading.Lock()
 
         self._job_progresses: dict[int, JobProgress] = {}
         self._completed_count = 0
+        self._failed_count = 0
+        self._pending_count = 0
         self._total_jobs = 0
         self._cancelled = False
+        self._retain_jobs = True
+
+        # Running aggregates over in-progress jobs, keyed by job id
+        self._active_jobs: dict[int, JobProgress] = {}
+        self._active_progress = 0.0
 
     @property
     def max_concurrent(self) -> int:
@@ -282,6 +668,24 @@ class ConcurrentProcessor:
         """Set maximum concurrent job count."""
         self._max_concurrent = max(1, value)
 
+    @property
+    def concurrency_limit(self) -> int:
+        """Get the number of jobs currently allowed to run at once.
+
+        During an adaptive batch this follows the controller's decisions;
+        otherwise it is the configured maximum.
+        """
+        if self._semaphore is not None:
+            return self._semaphore.limit
+        return self._max_concurrent
+
+    @property
+    def concurrency_decisions(self) -> list[ConcurrencyDecision]:
+        """Get the adaptive concurrency changes made in the last batch."""
+        if self._controller is None:
+            return []
+        return list(self._controller.decisions)
+
     def get_resource_status(self) -> ResourceStatus | None:
         """Get current resource status.
 
@@ -295,32 +699,84 @@ class ConcurrentProcessor:
     def get_aggregated_progress(self) -> AggregatedProgress:
         """Get aggregated progress for all jobs.
 
+        Counts and overall progress come from running aggregates, so only
+        the list of job progresses is proportional to the batch size.
+
         Returns:
             AggregatedProgress with current state of all jobs.
         """
         with self._lock:
-            job_list = list(self._job_progresses.values())
-            in_progress = [j for j in job_list if j.status == "in_progress"]
-            pending = [j for j in job_list if j.status == "pending"]
+            active = list(self._active_jobs.values())
 
             # Calculate overall progress
             if self._total_jobs > 0:
-                completed_progress = self._completed_count
-                in_progress_sum = sum(j.progress for j in in_progress)
-                overall = (completed_progress + in_progress_sum) / self._total_jobs
+                overall = (self._completed_count + self._active_progress) / self._total_jobs
+                overall = min(1.0, max(0.0, overall))
             else:
                 overall = 0.0
 
             return AggregatedProgress(
                 total_jobs=self._total_jobs,
                 completed_jobs=self._completed_count,
-                in_progress_jobs=len(in_progress),
-                pending_jobs=len(pending),
+                failed_jobs=self._failed_count,
+                in_progress_jobs=len(active),
+                pending_jobs=self._pending_count,
                 overall_progress=overall,
-                job_progresses=job_list,
-                current_files=[j.input_path.name for j in in_progress],
+                job_progresses=list(self._job_progresses.values()),
+                current_files=[j.input_path.name for j in active],
+                concurrency_limit=self.concurrency_limit,
+                last_decision=self._controller.last_decision if self._controller else None,
             )
 
+    def _start_job(self, job_id: int) -> None:
+        """Mark a pending job as running. Caller must hold the lock."""
+        job = self._job_progresses.get(job_id)
+        if job is None or job.status != "pending":
+            return
+        job.status = "in_progress"
+        job.started_at = datetime.now()
+        self._pending_count -= 1
+        self._active_jobs[job_id] = job
+        self._active_progress += job.progress
+
+    def _update_job(self, job_id: int, progress: float) -> None:
+        """Record a running job's progress. Caller must hold the lock."""
+        job = self._active_jobs.get(job_id)
+        if job is None:
+            return
+        self._active_progress += progress - job.progress
+        job.progress = progress
+
+    def _finish_job(self, job_id: int, status: str, message: str = "") -> None:
+        """Mark a job as completed or failed. Caller must hold the lock."""
+        job = self._job_progresses.get(job_id)
+        if job is not None:
+            if self._active_jobs.pop(job_id, None) is not None:
+                self._active_progress -= job.progress
+            elif job.status == "pending":
+                self._pending_count -= 1
+            job.status = status
+            if status == "completed":
+                job.progress = 1.0
+            if message:
+                job.message = message
+        if not self._active_jobs:
+            # Drop floating-point drift accumulated over the batch
+            self._active_progress = 0.0
+        self._completed_count += 1
+        if status == "failed":
+            self._failed_count += 1
+
+    def _discard_job(self, job_id: int) -> None:
+        """Forget a finished job's progress entry when not retaining jobs."""
+        with self._lock:
+            if self._retain_jobs:
+                return
+            job = self._job_progresses.pop(job_id, None)
+            if job is not None and job.status == "pending":
+                # Cancelled before it started
+                self._pending_count -= 1
+
     def cancel(self) -> None:
         """Cancel all pending and running jobs."""
         self._cancelled = True
@@ -329,9 +785,14 @@ class ConcurrentProcessor:
         """Reset the processor state for a new batch."""
         with self._lock:
             self._job_progresses.clear()
+            self._active_jobs.clear()
+            self._active_progress = 0.0
             self._completed_count = 0
+            self._failed_count = 0
+            self._pending_count = 0
             self._total_jobs = 0
             self._cancelled = False
+            self._retain_jobs = True
 
     async def process_batch(
         self,
@@ -346,6 +807,8 @@ class ConcurrentProcessor:
             processor: Async function that processes an item.
                       Takes (item, progress_callback) and returns result.
             on_progress: Optional callback for aggregated progress updates.
+                Updates are coalesced to at most one per progress interval,
+                and the final state is always delivered.
 
         Returns:
             List of results in the same order as input items.
@@ -356,29 +819,36 @@ class ConcurrentProcessor:
         if not items:
             return []
 
-        # Determine effective concurrency
-        effective_concurrency = self._max_concurrent
-        if self._adaptive_concurrency and self._resource_monitor:
-            status = self._resource_monitor.get_status()
-            effective_concurrency = min(self._max_concurrent, status.recommended_concurrency)
-
-        self._semaphore = asyncio.Semaphore(effective_concurrency)
-
+        effective_concurrency = self._prepare_concurrency()
         logger.info(
             f"Starting batch processing: {len(items)} jobs, max concurrent: {effective_concurrency}"
+            + (" (adaptive)" if self._controller else "")
         )
 
+        publisher = None
+        if on_progress:
+            publisher = ProgressPublisher(
+                on_progress, self.get_aggregated_progress, self._progress_interval
+            )
+
         # Create tasks for all items
         tasks = []
         for i, item in enumerate(items):
             self._create_job_progress(i, item)
-            task = asyncio.create_task(
-                self._process_with_semaphore(i, item, processor, on_progress)
-            )
+            task = asyncio.create_task(self._process_with_semaphore(i, item, processor, publisher))
             tasks.append(task)
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all tasks to complete, resizing the limit meanwhile
+        if self._controller:
+            self._controller.start()
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if self._controller:
+                await self._controller.stop()
+            if publisher:
+                publisher.flush()
+                publisher.close()
 
         # Handle exceptions
         final_results: list[R | None] = []
@@ -391,6 +861,142 @@ class ConcurrentProcessor:
 
         return final_results
 
+    async def process_stream(
+        self,
+        items: Iterable[T] | AsyncIterable[T],
+        processor: Callable[[T, Callable[[float], None]], Awaitable[R]],
+        on_result: Callable[[T, R | None, BaseException | None], None],
+        on_progress: Callable[[AggregatedProgress], None] | None = None,
+        queue_size: int | None = None,
+    ) -> int:
+        """Process items on a fixed pool of workers as they are produced.
+
+        Unlike process_batch(), items are pulled lazily into a bounded
+        queue served by max_concurrent long-lived workers, progress is
+        only tracked for queued and running jobs, and results are handed
+        to on_result instead of being collected. Memory use therefore
+        does not grow with the number of items.
+
+        Args:
+            items: Items to process, consumed as workers become free.
+            processor: Async function that processes an item.
+                      Takes (item, progress_callback) and returns result.
+            on_result: Called with (item, result, error) when each item
+                finishes. result is None if the item raised error.
+            on_progress: Optional callback for aggregated progress updates.
+                total_jobs counts the items produced so far.
+            queue_size: Capacity of the queue feeding the workers.
+                Defaults to the number of workers.
+
+        Returns:
+            Number of items handed to on_result.
+        """
+        self.reset()
+        self._retain_jobs = False
+
+        effective_concurrency = self._prepare_concurrency()
+        workers = self._max_concurrent
+        logger.info(
+            f"Starting streaming batch: {workers} workers, max concurrent: {effective_concurrency}"
+            + (" (adaptive)" if self._controller else "")
+        )
+
+        publisher = None
+        if on_progress:
+            publisher = ProgressPublisher(
+                on_progress, self.get_aggregated_progress, self._progress_interval
+            )
+
+        queue: asyncio.Queue[tuple[int, T] | None] = asyncio.Queue(maxsize=queue_size or workers)
+        processed = 0
+
+        async def enqueue(job_id: int, item: T) -> None:
+            with self._lock:
+                self._total_jobs += 1
+            self._create_job_progress(job_id, item)
+            await queue.put((job_id, item))
+
+        async def produce() -> None:
+            job_id = 0
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    if self._cancelled:
+                        break
+                    await enqueue(job_id, item)
+                    job_id += 1
+            else:
+                for item in items:
+                    if self._cancelled:
+                        break
+                    await enqueue(job_id, item)
+                    job_id += 1
+
+            # One end marker per worker
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def work() -> None:
+            nonlocal processed
+            while (entry := await queue.get()) is not None:
+                job_id, item = entry
+                (outcome,) = await asyncio.gather(
+                    self._process_with_semaphore(job_id, item, processor, publisher),
+                    return_exceptions=True,
+                )
+                self._discard_job(job_id)
+                processed += 1
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Job {job_id} failed with exception: {outcome}")
+                    on_result(item, None, outcome)
+                else:
+                    on_result(item, outcome, None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(work()) for _ in range(workers))
+
+        # Wait for the queue to drain, resizing the limit meanwhile
+        if self._controller:
+            self._controller.start()
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self._controller:
+                await self._controller.stop()
+            if publisher:
+                publisher.flush()
+                publisher.close()
+
+        return processed
+
+    def _prepare_concurrency(self) -> int:
+        """Create the semaphore (and adaptive controller) for a batch.
+
+        Returns:
+            The initial concurrency limit.
+        """
+        # Determine initial concurrency; in adaptive mode a controller keeps
+        # resizing the limit for the rest of the batch
+        effective_concurrency = self._max_concurrent
+        self._semaphore = ResizableSemaphore(effective_concurrency)
+        self._controller = None
+        if self._adaptive_concurrency and self._resource_monitor:
+            status = self._resource_monitor.get_status()
+            effective_concurrency = max(
+                self._min_concurrent,
+                min(self._max_concurrent, status.recommended_concurrency),
+            )
+            self._semaphore = ResizableSemaphore(effective_concurrency)
+            self._controller = AdaptiveConcurrencyController(
+                self._semaphore,
+                self._resource_monitor,
+                min_concurrent=self._min_concurrent,
+                max_concurrent=self._max_concurrent,
+                interval=self._adaptive_interval,
+            )
+        return effective_concurrency
+
     def _create_job_progress(self, job_id: int, item: T) -> JobProgress:
         """Create a job progress entry.
 
@@ -417,6 +1023,7 @@ class ConcurrentProcessor:
 
         with self._lock:
             self._job_progresses[job_id] = progress
+            self._pending_count += 1
 
         return progress
 
@@ -425,7 +1032,7 @@ class ConcurrentProcessor:
         job_id: int,
         item: T,
         processor: Callable[[T, Callable[[float], None]], Awaitable[R]],
-        on_progress: Callable[[AggregatedProgress], None] | None,
+        publisher: ProgressPublisher | None,
     ) -> R:
         """Process an item with semaphore control.
 
@@ -433,7 +1040,7 @@ class ConcurrentProcessor:
             job_id: The job identifier.
             item: The item to process.
             processor: The processing function.
-            on_progress: Optional progress callback.
+            publisher: Optional publisher for aggregated progress.
 
         Returns:
             The processing result.
@@ -445,44 +1052,37 @@ class ConcurrentProcessor:
 
             # Update status to in_progress
             with self._lock:
-                if job_id in self._job_progresses:
-                    self._job_progresses[job_id].status = "in_progress"
-                    self._job_progresses[job_id].started_at = datetime.now()
+                self._start_job(job_id)
 
             # Emit progress update
-            if on_progress:
-                on_progress(self.get_aggregated_progress())
+            if publisher:
+                publisher.notify()
 
             try:
                 # Create progress callback for this job
                 def job_progress_callback(progress: float) -> None:
                     with self._lock:
-                        if job_id in self._job_progresses:
-                            self._job_progresses[job_id].progress = progress
-                    if on_progress:
-                        on_progress(self.get_aggregated_progress())
+                        self._update_job(job_id, progress)
+                    if publisher:
+                        publisher.notify()
 
                 # Process the item
                 result = await processor(item, job_progress_callback)
 
                 # Mark as completed
                 with self._lock:
-                    if job_id in self._job_progresses:
-                        self._job_progresses[job_id].status = "completed"
-                        self._job_progresses[job_id].progress = 1.0
-                    self._completed_count += 1
+                    self._finish_job(job_id, "completed")
 
                 # Emit final progress update
-                if on_progress:
-                    on_progress(self.get_aggregated_progress())
+                if publisher:
+                    publisher.notify()
 
                 return result
 
             except Exception as e:
                 # Mark as failed
                 with self._lock:
-                    if job_id in self._job_progresses:
-                        self._job_progresses[job_id].status = "failed"
-                        self._job_progresses[job_id].message = str(e)
-                    self._completed_count += 1
+                    self._finish_job(job_id, "failed", str(e))
+                if publisher:
+                    publisher.notify()
                 raise
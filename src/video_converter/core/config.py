@@ -214,6 +214,21 @@ class ProcessingConfig(BaseModel):
         move_failed: Whether to move failed files to paths.failed.
         check_disk_space: Whether to check disk space before processing.
         min_free_space_gb: Minimum free disk space in gigabytes.
+        adaptive_concurrency: Whether to adjust the number of parallel
+            conversions during a batch based on system load.
+        segment_encoding: Whether to split long videos into chunks that
+            are encoded in parallel when encoders would otherwise be idle.
+        thread_budget: Whether to divide CPU cores among concurrent
+            software encodes instead of letting each use the whole machine.
+        dedupe_inputs: Whether to encode only one of several byte-identical
+            input files and reuse its output for the others.
+        skip_converted: Whether to skip inputs whose content the conversion
+            history records as converted, while the recorded output exists.
+        pipeline: Whether to run encode, verify and finalize as separate
+            worker pools so encoders never wait on post-encode work.
+        pipeline_verify_concurrency: Worker count for the verify stage.
+        pipeline_finalize_concurrency: Worker count for the finalize stage.
+        pipeline_queue_size: Capacity of the queues between pipeline stages.
     """
 
     max_concurrent: int = Field(
@@ -227,6 +242,15 @@ class ProcessingConfig(BaseModel):
     move_failed: bool = False
     check_disk_space: bool = True
     min_free_space_gb: float = Field(default=DEFAULT_MIN_FREE_SPACE_GB, ge=0.1)
+    adaptive_concurrency: bool = False
+    segment_encoding: bool = False
+    thread_budget: bool = False
+    dedupe_inputs: bool = False
+    skip_converted: bool = True
+    pipeline: bool = False
+    pipeline_verify_concurrency: int = Field(default=2, ge=1)
+    pipeline_finalize_concurrency: int = Field(default=2, ge=1)
+    pipeline_queue_size: int = Field(default=2, ge=1)
 
 
 class NotificationConfig(BaseModel):
@@ -0,0 +1,196 @@
+"""Hybrid encoder dispatch across hardware and software slot pools.
+
+This module lets a single batch use several encoder backends at once.
+Each backend gets a pool with a fixed number of slots (for example two
+VideoToolbox sessions plus two libx265 jobs), and every task is routed
+to the first eligible pool with a free slot. A machine with a hardware
+encoder therefore also keeps its CPU cores busy, and a software batch
+can still use the hardware engine.
+
+Pools can optionally restrict which inputs they accept by resolution
+or bit depth, e.g. to keep 10-bit or 4K sources on the software
+encoder. Inputs without codec information are accepted by every pool.
+
+SDS Reference: SDS-C01-004
+SRS Reference: SRS-604 (Concurrent Processing Support)
+
+Example:
+    >>> dispatcher = EncoderDispatcher(
+    ...     [
+    ...         EncoderSlotPool("hardware", hw_converter, slots=2),
+    ...         EncoderSlotPool("software", sw_converter, slots=2, max_height=1080),
+    ...     ]
+    ... )
+    >>> async with dispatcher.acquire(codec_info) as pool:
+    ...     result = await pool.converter.convert(request)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from video_converter.core.types import ConversionMode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from video_converter.converters.base import BaseConverter
+    from video_converter.processors.codec_detector import CodecInfo
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EncoderPoolConfig:
+    """Configuration of one encoder pool for hybrid dispatch.
+
+    Attributes:
+        mode: Encoder backend used by the pool.
+        slots: Number of conversions the pool runs at once.
+        name: Pool name recorded on results. Defaults to the mode value.
+        max_height: Largest input height (in pixels) the pool accepts.
+        max_bit_depth: Highest input bit depth the pool accepts.
+    """
+
+    mode: ConversionMode
+    slots: int = 1
+    name: str | None = None
+    max_height: int | None = None
+    max_bit_depth: int | None = None
+
+
+@dataclass
+class EncoderSlotPool:
+    """A converter together with its slot limit and routing rules.
+
+    Attributes:
+        name: Pool name recorded on results.
+        converter: Converter used for jobs in this pool.
+        slots: Number of conversions the pool runs at once.
+        max_height: Largest input height (in pixels) the pool accepts.
+        max_bit_depth: Highest input bit depth the pool accepts.
+        active: Number of jobs currently running in the pool.
+        completed: Number of jobs the pool has finished.
+    """
+
+    name: str
+    converter: BaseConverter
+    slots: int = 1
+    max_height: int | None = None
+    max_bit_depth: int | None = None
+    active: int = 0
+    completed: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate pool settings."""
+        self.slots = max(1, self.slots)
+
+    @property
+    def has_free_slot(self) -> bool:
+        """Check if the pool can start another job."""
+        return self.active < self.slots
+
+    def accepts(self, codec_info: CodecInfo | None) -> bool:
+        """Check if the pool's routing rules allow an input.
+
+        Args:
+            codec_info: Codec analysis of the input, if known.
+
+        Returns:
+            True if the input may run in this pool.
+        """
+        if codec_info is None:
+            return True
+        if self.max_height is not None and codec_info.height > self.max_height:
+            return False
+        return not (
+            self.max_bit_depth is not None
+            and codec_info.bit_depth is not None
+            and codec_info.bit_depth > self.max_bit_depth
+        )
+
+
+class EncoderDispatcher:
+    """Routes conversions to the first encoder pool with a free slot.
+
+    Pools are tried in the order given, so list the preferred backend
+    first. If an input is not accepted by any pool's routing rules, it
+    may run in any pool rather than being rejected.
+
+    Attributes:
+        pools: The configured encoder pools.
+    """
+
+    def __init__(self, pools: list[EncoderSlotPool]) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            pools: Encoder pools in order of preference.
+
+        Raises:
+            ValueError: If no pools are given.
+        """
+        if not pools:
+            raise ValueError("EncoderDispatcher requires at least one pool")
+        self.pools = list(pools)
+        self._condition = asyncio.Condition()
+
+    @property
+    def total_slots(self) -> int:
+        """Get the number of conversions all pools can run at once."""
+        return sum(pool.slots for pool in self.pools)
+
+    def _eligible_pools(self, codec_info: CodecInfo | None) -> list[EncoderSlotPool]:
+        """Get the pools allowed to run an input.
+
+        Args:
+            codec_info: Codec analysis of the input, if known.
+
+        Returns:
+            Pools whose routing rules accept the input, or all pools if
+            none do.
+        """
+        eligible = [pool for pool in self.pools if pool.accepts(codec_info)]
+        return eligible or self.pools
+
+    def _free_pool(self, eligible: list[EncoderSlotPool]) -> EncoderSlotPool | None:
+        """Get the first eligible pool with a free slot."""
+        for pool in eligible:
+            if pool.has_free_slot:
+                return pool
+        return None
+
+    @asynccontextmanager
+    async def acquire(self, codec_info: CodecInfo | None = None) -> AsyncIterator[EncoderSlotPool]:
+        """Wait for a free slot in an eligible pool and hold it.
+
+        Args:
+            codec_info: Codec analysis of the input, used for routing.
+
+        Yields:
+            The pool whose converter should run the job.
+        """
+        eligible = self._eligible_pools(codec_info)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._free_pool(eligible) is not None)
+            pool = self._free_pool(eligible)
+            assert pool is not None
+            pool.active += 1
+
+        logger.debug(f"Dispatching to encoder pool '{pool.name}' ({pool.active}/{pool.slots})")
+        try:
+            yield pool
+        finally:
+            async with self._condition:
+                pool.active -= 1
+                pool.completed += 1
+                self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Cancel running conversions in every pool."""
+        for pool in self.pools:
+            pool.converter.cancel()
@@ -0,0 +1,589 @@
+"""Content fingerprints for identifying video files.
+
+This module identifies files by their content rather than their path, so
+a video that was moved, renamed or copied is recognized as the same file.
+
+Two kinds of fingerprint are computed:
+
+- A sampled fingerprint hashes the file size and fixed-size chunks taken
+  at evenly spaced offsets across the whole file. Files that share
+  headers and trailers, such as clips from the same camera, differ in
+  the sampled middle. It reads about 1 MB regardless of file size.
+- A full hash reads the whole file. It is exact but slow, so batches can
+  be hashed in a background thread pool.
+- A legacy hash covers the first and last megabyte. Conversion history
+  records from earlier versions are keyed by it.
+
+Results are memoized in a SQLite table keyed by (device, inode, size,
+mtime_ns). A moved or renamed file keeps its key on the same filesystem,
+so it is recognized without being read again.
+
+SDS Reference: SDS-C01-003
+SRS Reference: SRS-306 (Conversion History)
+
+Example:
+    >>> from video_converter.core.fingerprint import get_fingerprinter
+    >>> fingerprinter = get_fingerprinter()
+    >>> fingerprinter.fingerprint(Path("vacation.mov"))
+    'a3f1...'
+    >>> # Answered from the index, even after the file is renamed
+    >>> fingerprinter.fingerprint(Path("renamed.mov"))
+    'a3f1...'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+# Default path for the fingerprint index database
+DEFAULT_FINGERPRINT_INDEX_FILE = (
+    Path.home() / ".local" / "share" / "video_converter" / "fingerprints.db"
+)
+
+# Default maximum number of entries kept in the index
+DEFAULT_FINGERPRINT_INDEX_MAX_ENTRIES = 500_000
+
+# Bump when the sampling scheme changes to discard old fingerprints
+FINGERPRINT_SCHEMA_VERSION = 2
+
+# Schema versions that only lack columns added since, so entries are kept
+_UPGRADABLE_SCHEMA_VERSIONS = {1}
+
+# Number of chunks hashed by a sampled fingerprint, and their size
+SAMPLE_COUNT = 16
+SAMPLE_SIZE = 64 * 1024
+
+# Read size for full hashes
+_READ_SIZE = 1024 * 1024
+
+# Check the size cap after this many inserts
+_PRUNE_INTERVAL = 1000
+
+# Only refresh an entry's access time if it is older than this (seconds),
+# so that index hits do not turn into one write per file
+_ACCESS_REFRESH_INTERVAL = 24 * 60 * 60
+
+# Bytes hashed at each end of the file by the legacy hash
+_LEGACY_CHUNK = 1024 * 1024
+
+
+def file_fingerprint(stat: os.stat_result) -> str:
+    """Build the validation fingerprint for a file.
+
+    Args:
+        stat: Result of stat() on the file.
+
+    Returns:
+        Fingerprint string of device, inode, size and mtime.
+    """
+    return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def sample_hash(path: Path, size: int | None = None) -> str:
+    """Hash a file's size and chunks sampled across its content.
+
+    The first and last chunks are always included. Files no larger than
+    all samples together are hashed completely.
+
+    Args:
+        path: Path to the file.
+        size: File size in bytes, if already known.
+
+    Returns:
+        32-character hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    if size is None:
+        size = path.stat().st_size
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(size.to_bytes(8, "little"))
+    with open(path, "rb") as f:
+        if size <= SAMPLE_COUNT * SAMPLE_SIZE:
+            digest.update(f.read())
+        else:
+            step = (size - SAMPLE_SIZE) / (SAMPLE_COUNT - 1)
+            for i in range(SAMPLE_COUNT):
+                f.seek(int(i * step))
+                digest.update(f.read(SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+def full_hash(path: Path) -> str:
+    """Hash the complete content of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        64-character hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def legacy_hash(path: Path) -> str:
+    """Hash the first and last megabyte of a file.
+
+    This is the file hash of earlier versions, kept to find their
+    conversion history records.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        64-character hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    sha = hashlib.sha256()
+    file_size = path.stat().st_size
+
+    with open(path, "rb") as f:
+        sha.update(f.read(_LEGACY_CHUNK))
+
+        # Larger files add their last chunk, smaller ones the remainder
+        if file_size > 2 * _LEGACY_CHUNK:
+            f.seek(-_LEGACY_CHUNK, 2)
+            sha.update(f.read())
+        elif file_size > _LEGACY_CHUNK:
+            sha.update(f.read())
+
+    return sha.hexdigest()
+
+
+class Fingerprinter:
+    """Compute file fingerprints, memoized in a SQLite index.
+
+    Thread-safe: a single connection is shared behind a lock, and hashing
+    happens outside it. Database errors never propagate to callers; the
+    index degrades to a miss and the file is hashed as usual.
+
+    Attributes:
+        index_path: Path to the SQLite database file.
+        max_entries: Maximum number of entries kept in the index.
+    """
+
+    def __init__(
+        self,
+        index_path: Path | None = None,
+        *,
+        max_entries: int = DEFAULT_FINGERPRINT_INDEX_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the fingerprinter.
+
+        Args:
+            index_path: Path to the database file.
+                Defaults to ~/.local/share/video_converter/fingerprints.db
+            max_entries: Maximum number of entries kept in the index.
+        """
+        self.index_path = index_path or DEFAULT_FINGERPRINT_INDEX_FILE
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        self._open()
+
+    def _open(self) -> None:
+        """Open the database, recreating it if it is unreadable."""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Fingerprint index unreadable, recreating: {e}")
+            try:
+                self.index_path.unlink(missing_ok=True)
+                self._conn = self._connect()
+            except (OSError, sqlite3.Error) as e2:
+                logger.warning(f"Fingerprint index disabled: {e2}")
+                self._conn = None
+        except OSError as e:
+            logger.warning(f"Fingerprint index disabled: {e}")
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Create the connection and schema.
+
+        Returns:
+            Open SQLite connection.
+        """
+        conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version in _UPGRADABLE_SCHEMA_VERSIONS:
+            conn.execute("ALTER TABLE fingerprints ADD COLUMN legacy TEXT")
+            conn.execute(f"PRAGMA user_version={FINGERPRINT_SCHEMA_VERSION}")
+        elif version != FINGERPRINT_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS fingerprints")
+            conn.execute(f"PRAGMA user_version={FINGERPRINT_SCHEMA_VERSION}")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                stat_key TEXT PRIMARY KEY,
+                sample TEXT,
+                full TEXT,
+                legacy TEXT,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_fingerprints_accessed ON fingerprints (accessed_at)"
+        )
+        conn.commit()
+        return conn
+
+    @property
+    def available(self) -> bool:
+        """Check if the index database is usable."""
+        return self._conn is not None
+
+    def __len__(self) -> int:
+        """Get the number of entries in the index."""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            try:
+                return int(self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0])
+            except sqlite3.Error:
+                return 0
+
+    def _lookup(self, stat_key: str, column: str) -> str | None:
+        """Read a memoized hash.
+
+        A hit refreshes the entry's access time, so the size cap evicts
+        the entries that have not been used for the longest time.
+
+        Args:
+            stat_key: Key built by file_fingerprint().
+            column: "sample", "full" or "legacy".
+
+        Returns:
+            The stored hash, or None on a miss.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    f"SELECT {column}, accessed_at FROM fingerprints WHERE stat_key = ?",
+                    (stat_key,),
+                ).fetchone()
+                if row is None or row[0] is None:
+                    return None
+
+                now = time.time()
+                if now - row[1] > _ACCESS_REFRESH_INTERVAL:
+                    self._conn.execute(
+                        "UPDATE fingerprints SET accessed_at = ? WHERE stat_key = ?",
+                        (now, stat_key),
+                    )
+                    self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint lookup failed for {stat_key}: {e}")
+                return None
+        return row[0]
+
+    def _store(self, stat_key: str, column: str, value: str) -> None:
+        """Memoize a hash, keeping the other column of the entry.
+
+        Args:
+            stat_key: Key built by file_fingerprint().
+            column: "sample", "full" or "legacy".
+            value: Hash to store.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    f"INSERT INTO fingerprints (stat_key, {column}, accessed_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT (stat_key) DO UPDATE SET "
+                    f"{column} = excluded.{column}, accessed_at = excluded.accessed_at",
+                    (stat_key, value, time.time()),
+                )
+                self._inserts_since_prune += 1
+                if self._inserts_since_prune >= _PRUNE_INTERVAL:
+                    self._prune_locked()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint write failed for {stat_key}: {e}")
+
+    def _prune_locked(self) -> None:
+        """Evict least recently used entries above the size cap.
+
+        Must be called with the lock held.
+        """
+        assert self._conn is not None
+        self._inserts_since_prune = 0
+        count = self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM fingerprints WHERE stat_key IN "
+                "(SELECT stat_key FROM fingerprints ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            logger.debug(f"Fingerprint index pruned {excess} entries")
+
+    def fingerprint(self, path: Path, stat: os.stat_result | None = None) -> str:
+        """Get the sampled fingerprint of a file.
+
+        Args:
+            path: Path to the file.
+            stat: Optional stat() result if the caller already has one.
+
+        Returns:
+            32-character hex fingerprint.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if stat is None:
+            stat = path.stat()
+        stat_key = file_fingerprint(stat)
+
+        cached = self._lookup(stat_key, "sample")
+        if cached is not None:
+            return cached
+
+        value = sample_hash(path, stat.st_size)
+        self._store(stat_key, "sample", value)
+        return value
+
+    def full_hash(self, path: Path, stat: os.stat_result | None = None) -> str:
+        """Get the hash of a file's complete content.
+
+        Args:
+            path: Path to the file.
+            stat: Optional stat() result if the caller already has one.
+
+        Returns:
+            64-character hex digest.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if stat is None:
+            stat = path.stat()
+        stat_key = file_fingerprint(stat)
+
+        cached = self._lookup(stat_key, "full")
+        if cached is not None:
+            return cached
+
+        value = full_hash(path)
+        self._store(stat_key, "full", value)
+        return value
+
+    def legacy_hash(self, path: Path, stat: os.stat_result | None = None) -> str:
+        """Get the legacy hash of a file's first and last megabyte.
+
+        Args:
+            path: Path to the file.
+            stat: Optional stat() result if the caller already has one.
+
+        Returns:
+            64-character hex digest.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if stat is None:
+            stat = path.stat()
+        stat_key = file_fingerprint(stat)
+
+        cached = self._lookup(stat_key, "legacy")
+        if cached is not None:
+            return cached
+
+        value = legacy_hash(path)
+        self._store(stat_key, "legacy", value)
+        return value
+
+    def full_hashes(
+        self,
+        paths: Iterable[Path],
+        max_workers: int = 4,
+    ) -> dict[Path, str]:
+        """Hash the complete content of many files in a thread pool.
+
+        Files that cannot be read are left out of the result.
+
+        Args:
+            paths: Files to hash.
+            max_workers: Number of files hashed at once.
+
+        Returns:
+            Full hash per readable path.
+        """
+
+        def hash_one(path: Path) -> tuple[Path, str | None]:
+            try:
+                return path, self.full_hash(path)
+            except OSError as e:
+                logger.debug(f"Cannot hash {path}: {e}")
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = executor.map(hash_one, paths)
+            return {path: value for path, value in results if value is not None}
+
+    def find_duplicates(
+        self,
+        paths: Iterable[Path],
+        max_workers: int = 4,
+    ) -> list[list[Path]]:
+        """Group files with byte-identical content.
+
+        Candidates are narrowed by file size, then by sampled
+        fingerprint, and only the files still sharing a fingerprint are
+        confirmed with a full hash. Files that cannot be read are left
+        out.
+
+        Args:
+            paths: Files to group.
+            max_workers: Number of files fully hashed at once.
+
+        Returns:
+            Groups of two or more identical files, each in input order.
+            Groups are ordered by their first file.
+        """
+        position: dict[Path, int] = {}
+        by_size: dict[int, list[tuple[Path, os.stat_result]]] = {}
+        for path in paths:
+            if path in position:
+                continue
+            position[path] = len(position)
+            try:
+                stat = path.stat()
+            except OSError as e:
+                logger.debug(f"Cannot stat {path}: {e}")
+                continue
+            by_size.setdefault(stat.st_size, []).append((path, stat))
+
+        by_sample: dict[str, list[Path]] = {}
+        for entries in by_size.values():
+            if len(entries) < 2:
+                continue
+            for path, stat in entries:
+                try:
+                    by_sample.setdefault(self.fingerprint(path, stat), []).append(path)
+                except OSError as e:
+                    logger.debug(f"Cannot fingerprint {path}: {e}")
+
+        candidates = [group for group in by_sample.values() if len(group) > 1]
+        hashes = self.full_hashes(
+            (path for group in candidates for path in group), max_workers=max_workers
+        )
+
+        groups: list[list[Path]] = []
+        for group in candidates:
+            by_hash: dict[str, list[Path]] = {}
+            for path in group:
+                if path in hashes:
+                    by_hash.setdefault(hashes[path], []).append(path)
+            groups.extend(same for same in by_hash.values() if len(same) > 1)
+
+        return sorted(groups, key=lambda group: position[group[0]])
+
+    def prune(self) -> None:
+        """Enforce the size cap immediately."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._prune_locked()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Fingerprint index prune failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM fingerprints")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear fingerprint index: {e}")
+
+    def close(self) -> None:
+        """Enforce the size cap and close the database."""
+        self.prune()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton management
+_default_fingerprinter: Fingerprinter | None = None
+_fingerprinter_lock = threading.Lock()
+
+
+def get_fingerprinter(index_path: Path | None = None) -> Fingerprinter:
+    """Get or create the default Fingerprinter instance.
+
+    Args:
+        index_path: Optional path. Only used on first call.
+
+    Returns:
+        The default Fingerprinter instance.
+    """
+    global _default_fingerprinter
+    with _fingerprinter_lock:
+        if _default_fingerprinter is None:
+            _default_fingerprinter = Fingerprinter(index_path=index_path)
+        return _default_fingerprinter
+
+
+def reset_fingerprinter() -> None:
+    """Close and reset the default fingerprinter instance.
+
+    Primarily useful for testing.
+    """
+    global _default_fingerprinter
+    with _fingerprinter_lock:
+        if _default_fingerprinter is not None:
+            _default_fingerprinter.close()
+        _default_fingerprinter = None
+
+
+__all__ = [
+    "Fingerprinter",
+    "file_fingerprint",
+    "full_hash",
+    "get_fingerprinter",
+    "legacy_hash",
+    "reset_fingerprinter",
+    "sample_hash",
+    "DEFAULT_FINGERPRINT_INDEX_FILE",
+    "DEFAULT_FINGERPRINT_INDEX_MAX_ENTRIES",
+]
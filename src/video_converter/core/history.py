@@ -4,6 +4,15 @@ This module implements a conversion history tracking system to prevent
 re-converting videos that have already been processed. It uses file hashes
 or Photos UUIDs to identify videos across renames and moves.
 
+Two stores are provided. ConversionHistory keeps every record in a JSON
+file that is rewritten on each change. SQLiteHistory, the default used by
+get_history(), stores records in a WAL-mode SQLite database indexed by
+identifier, source path and timestamp. Each change is a single-row write,
+and the CLI, GUI and launchd runs can share the database safely. Triggers
+keep per-day, per-codec totals up to date on every write, so statistics
+read one row per day instead of every record. Existing JSON history is imported into the
+database once, the first time it is opened.
+
 SDS Reference: SDS-C01-003
 SRS Reference: SRS-306 (Conversion History)
 
@@ -33,16 +42,19 @@ Example:
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
+import sqlite3
 import threading
-from dataclasses import asdict, dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from video_converter.core.fingerprint import get_fingerprinter
+
 
 class StatsPeriod(Enum):
     """Time period for statistics filtering."""
@@ -61,6 +73,47 @@ logger = logging.getLogger(__name__)
 # Default path for history storage
 DEFAULT_HISTORY_DIR = Path.home() / ".local" / "share" / "video_converter"
 DEFAULT_HISTORY_FILE = DEFAULT_HISTORY_DIR / "history.json"
+DEFAULT_HISTORY_DB = DEFAULT_HISTORY_DIR / "history.db"
+
+# Bump when the records table layout changes
+HISTORY_SCHEMA_VERSION = 3
+
+# SQL pattern of a file hash identifier, as opposed to a Photos UUID
+_HASH_KEY_GLOB = "[0-9a-f]" * 16
+
+# Records read per query when iterating over the database
+_ITER_BATCH_SIZE = 1000
+
+# Rollup key of a record: its day, output codec and success flag
+_ROLLUP_KEY = "substr({0}.converted_at, 1, 10), {0}.output_codec, {0}.success"
+
+# Condition matching records in the same rollup row as OLD. The range on
+# converted_at lets SQLite use its index.
+_SAME_ROLLUP = (
+    "converted_at >= substr(OLD.converted_at, 1, 10) "
+    "AND converted_at < substr(OLD.converted_at, 1, 10) || char(1114111) "
+    "AND substr(converted_at, 1, 10) = substr(OLD.converted_at, 1, 10) "
+    "AND output_codec = OLD.output_codec AND success = OLD.success"
+)
+
+# Seconds to wait for another process holding the database write lock
+_BUSY_TIMEOUT = 30.0
+
+# Suffix given to a JSON history file after it was imported
+_MIGRATED_SUFFIX = ".migrated"
+
+_RECORD_COLUMNS = (
+    "id",
+    "source_path",
+    "output_path",
+    "source_codec",
+    "output_codec",
+    "source_size",
+    "output_size",
+    "converted_at",
+    "success",
+    "error_message",
+)
 
 
 class HistoryError(Exception):
@@ -249,6 +302,34 @@ class HistoryStatistics:
         }
 
 
+def _is_hash_key(identifier: str) -> bool:
+    """Check if an identifier is a file hash rather than a Photos UUID."""
+    return len(identifier) == 16 and all(c in "0123456789abcdef" for c in identifier)
+
+
+def _accumulate(stats: HistoryStatistics, record: ConversionRecord) -> None:
+    """Add a record to running statistics totals.
+
+    total_saved_bytes is not updated; callers derive it once at the end.
+
+    Args:
+        stats: Statistics to update.
+        record: Record to add.
+    """
+    if not record.success:
+        stats.total_failed += 1
+        return
+    stats.total_converted += 1
+    stats.total_source_bytes += record.source_size
+    if record.output_size is not None:
+        stats.total_output_bytes += record.output_size
+    if record.converted_at:
+        if stats.first_conversion is None or record.converted_at < stats.first_conversion:
+            stats.first_conversion = record.converted_at
+        if stats.last_conversion is None or record.converted_at > stats.last_conversion:
+            stats.last_conversion = record.converted_at
+
+
 class ConversionHistory:
     """Manage conversion history for duplicate prevention.
 
@@ -289,6 +370,8 @@ class ConversionHistory:
         """
         self.history_path = history_path or DEFAULT_HISTORY_FILE
         self._records: dict[str, ConversionRecord] = {}
+        # Records that may be keyed by the legacy file hash
+        self._legacy_ids: set[str] = set()
         self._lock = threading.RLock()  # RLock for reentrant locking
         self._dirty = False
 
@@ -328,6 +411,13 @@ class ConversionHistory:
                     logger.warning(f"Skipping invalid record {key}: missing {e}")
                     continue
 
+            legacy_ids = data.get("legacy_ids")
+            if legacy_ids is None:
+                # Written before the sampled fingerprint, so any hash key may be legacy
+                self._legacy_ids = {key for key in self._records if _is_hash_key(key)}
+            else:
+                self._legacy_ids = set(legacy_ids) & self._records.keys()
+
             logger.info(f"Loaded {len(self._records)} records from history")
 
         except json.JSONDecodeError as e:
@@ -341,6 +431,7 @@ class ConversionHistory:
                 "version": "0.1.0.0",
                 "updated_at": datetime.now().isoformat(),
                 "records": {k: v.to_dict() for k, v in self._records.items()},
+                "legacy_ids": sorted(self._legacy_ids),
             }
 
             # Write to temp file first, then rename for atomic update
@@ -406,6 +497,7 @@ class ConversionHistory:
         with self._lock:
             if identifier in self._records:
                 del self._records[identifier]
+                self._legacy_ids.discard(identifier)
                 self._dirty = True
                 self._save()
                 logger.debug(f"Removed record for {identifier}")
@@ -417,6 +509,7 @@ class ConversionHistory:
         with self._lock:
             count = len(self._records)
             self._records.clear()
+            self._legacy_ids.clear()
             self._dirty = True
             self._save()
 
@@ -489,6 +582,22 @@ class ConversionHistory:
             all_records = list(self._records.values())
             return self._filter_records_by_period(all_records, period)
 
+    def _new_statistics(self, period: StatsPeriod) -> HistoryStatistics:
+        """Create empty statistics labelled with a period.
+
+        Args:
+            period: The time period the statistics cover.
+
+        Returns:
+            HistoryStatistics with the period fields set.
+        """
+        stats = HistoryStatistics()
+        stats.period = period.value
+        period_start = self._get_period_start(period)
+        if period_start:
+            stats.period_start = period_start.isoformat()
+        return stats
+
     def get_statistics(
         self,
         period: StatsPeriod = StatsPeriod.ALL,
@@ -501,39 +610,97 @@ class ConversionHistory:
         Returns:
             HistoryStatistics with totals and averages.
         """
-        with self._lock:
-            stats = HistoryStatistics()
-            stats.period = period.value
+        stats = self._new_statistics(period)
+        for record in self.get_records_by_period(period):
+            _accumulate(stats, record)
+        stats.total_saved_bytes = stats.total_source_bytes - stats.total_output_bytes
+        return stats
 
-            # Calculate period start
-            period_start = self._get_period_start(period)
-            if period_start:
-                stats.period_start = period_start.isoformat()
+    def _group_statistics(
+        self,
+        period: StatsPeriod,
+        key: Callable[[ConversionRecord], str],
+    ) -> dict[str, HistoryStatistics]:
+        """Aggregate statistics per group of records.
 
-            # Filter records by period
-            all_records = list(self._records.values())
-            filtered_records = self._filter_records_by_period(all_records, period)
+        Args:
+            period: Time period to filter statistics by.
+            key: Function returning the group of a record.
 
-            successful = [r for r in filtered_records if r.success]
-            failed = [r for r in filtered_records if not r.success]
+        Returns:
+            Statistics per group, in ascending group order.
+        """
+        groups: dict[str, HistoryStatistics] = {}
+        for record in self.get_records_by_period(period):
+            group = key(record)
+            if group not in groups:
+                groups[group] = self._new_statistics(period)
+            _accumulate(groups[group], record)
+        for stats in groups.values():
+            stats.total_saved_bytes = stats.total_source_bytes - stats.total_output_bytes
+        return dict(sorted(groups.items()))
+
+    def get_daily_statistics(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> dict[str, HistoryStatistics]:
+        """Get statistics for each day with conversions.
 
-            stats.total_converted = len(successful)
-            stats.total_failed = len(failed)
+        Args:
+            period: Time period to filter statistics by.
 
-            for record in successful:
-                stats.total_source_bytes += record.source_size
-                if record.output_size is not None:
-                    stats.total_output_bytes += record.output_size
+        Returns:
+            Statistics keyed by ISO date (YYYY-MM-DD), oldest first.
+        """
+        return self._group_statistics(period, lambda r: r.converted_at[:10])
 
-            stats.total_saved_bytes = stats.total_source_bytes - stats.total_output_bytes
+    def get_codec_statistics(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> dict[str, HistoryStatistics]:
+        """Get statistics for each output codec.
+
+        Args:
+            period: Time period to filter statistics by.
+
+        Returns:
+            Statistics keyed by output codec.
+        """
+        return self._group_statistics(period, lambda r: r.output_codec)
+
+    def iter_records(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> Iterator[ConversionRecord]:
+        """Iterate over conversion records within a time period.
 
-            # Find first and last conversion times within period
-            timestamps = [r.converted_at for r in successful if r.converted_at]
-            if timestamps:
-                stats.first_conversion = min(timestamps)
-                stats.last_conversion = max(timestamps)
+        Unlike get_records_by_period(), stores may read the records in
+        batches, so exports do not hold the whole history in memory.
 
-            return stats
+        Args:
+            period: Time period to filter by.
+
+        Yields:
+            ConversionRecord instances within the period.
+        """
+        yield from self.get_records_by_period(period)
+
+    def get_recent_records(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+        limit: int = 10,
+    ) -> list[ConversionRecord]:
+        """Get the most recent conversion records within a time period.
+
+        Args:
+            period: Time period to filter by.
+            limit: Maximum number of records to return.
+
+        Returns:
+            Up to ``limit`` records, oldest first.
+        """
+        records = sorted(self.get_records_by_period(period), key=lambda r: r.converted_at)
+        return records[-limit:] if limit > 0 else []
 
     def get_all_records(self) -> list[ConversionRecord]:
         """Get all conversion records.
@@ -544,6 +711,19 @@ class ConversionHistory:
         with self._lock:
             return list(self._records.values())
 
+    def get_records_for_path(self, source_path: Path | str) -> list[ConversionRecord]:
+        """Get the conversion records of a source file.
+
+        Args:
+            source_path: Original file path at time of conversion.
+
+        Returns:
+            List of ConversionRecord instances for the path.
+        """
+        path = str(source_path)
+        with self._lock:
+            return [r for r in self._records.values() if r.source_path == path]
+
     def get_failed_records(self) -> list[ConversionRecord]:
         """Get all failed conversion records.
 
@@ -574,31 +754,36 @@ class ConversionHistory:
     def export_to_json(self, path: Path) -> None:
         """Export history to a JSON file.
 
+        Records are written one at a time as they are read.
+
         Args:
             path: Path to export file.
         """
-        with self._lock:
-            data = {
-                "exported_at": datetime.now().isoformat(),
-                "statistics": self.get_statistics().to_dict(),
-                "records": [r.to_dict() for r in self._records.values()],
-            }
+        data = {
+            "exported_at": datetime.now().isoformat(),
+            "statistics": self.get_statistics().to_dict(),
+        }
+        # Imported here: file_utils imports the core package, which imports this module
+        from video_converter.utils.file_utils import write_json_stream
 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+        records = (r.to_dict() for r in self.iter_records())
+
+        with open(path, "w", encoding="utf-8") as f:
+            write_json_stream(data, "records", records, f)
 
         logger.info(f"Exported history to {path}")
 
     def export_to_csv(self, path: Path) -> None:
         """Export history to a CSV file.
 
+        Records are written one at a time as they are read.
+
         Args:
             path: Path to export file.
         """
         import csv
 
-        with self._lock, open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8") as f:
             fieldnames = [
                 "id",
                 "source_path",
@@ -616,7 +801,7 @@ class ConversionHistory:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
 
-            for record in self._records.values():
+            for record in self.iter_records():
                 row = record.to_dict()
                 row["size_saved"] = record.size_saved
                 row["compression_ratio"] = f"{record.compression_ratio:.2%}"
@@ -624,12 +809,70 @@ class ConversionHistory:
 
         logger.info(f"Exported history to {path}")
 
+    def is_file_converted(self, path: Path, file_hash: str | None = None) -> bool:
+        """Check if a file's content has been successfully converted.
+
+        The file is identified by compute_file_hash(), so it is found
+        after being moved, renamed or copied. Records written before the
+        sampled fingerprint was introduced are keyed by the legacy hash.
+        While such records exist, a miss is looked up by the legacy hash
+        too, and a matching record is re-keyed to the current hash.
+
+        Args:
+            path: Path to the file.
+            file_hash: The file's compute_file_hash(), if already known.
+
+        Returns:
+            True if a file with the same content was converted before.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            OSError: If file cannot be read.
+        """
+        file_hash = file_hash or self.compute_file_hash(path)
+        if self.is_converted(file_hash):
+            return True
+        if not self._has_legacy_records():
+            return False
+
+        legacy_hash = self.compute_legacy_file_hash(path)
+        record = self.get_record(legacy_hash)
+        if record is None or not record.success:
+            return False
+
+        self._rekey(legacy_hash, file_hash)
+        logger.debug(f"Re-keyed history record {legacy_hash} to {file_hash}")
+        return True
+
+    def _has_legacy_records(self) -> bool:
+        """Check if any record may still be keyed by the legacy file hash."""
+        with self._lock:
+            return bool(self._legacy_ids)
+
+    def _rekey(self, old_id: str, new_id: str) -> None:
+        """Move a record to a new identifier in a single save.
+
+        Args:
+            old_id: Current identifier of the record.
+            new_id: Identifier to store it under.
+        """
+        with self._lock:
+            record = self._records.pop(old_id, None)
+            if record is None:
+                return
+            self._records[new_id] = replace(record, id=new_id)
+            self._legacy_ids.discard(old_id)
+            self._dirty = True
+            self._save()
+
     @staticmethod
     def compute_file_hash(path: Path) -> str:
         """Compute a hash for file identification.
 
-        Uses SHA-256 hash of first and last 1MB of file for
-        efficient identification of large files.
+        Uses the sampled content fingerprint, which covers the file size
+        and chunks spread across the whole file. Fingerprints are
+        memoized by device, inode, size and mtime, so a moved or renamed
+        file is identified without being read again.
 
         Args:
             path: Path to the file.
@@ -641,22 +884,622 @@ class ConversionHistory:
             FileNotFoundError: If file does not exist.
             OSError: If file cannot be read.
         """
-        sha = hashlib.sha256()
-        file_size = path.stat().st_size
+        return get_fingerprinter().fingerprint(path)[:16]
+
+    @staticmethod
+    def compute_legacy_file_hash(path: Path) -> str:
+        """Compute the file hash used by records from earlier versions.
+
+        Uses SHA-256 hash of first and last 1MB of file, memoized like
+        the sampled fingerprint.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            16-character hex hash string.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            OSError: If file cannot be read.
+        """
+        return get_fingerprinter().legacy_hash(path)[:16]
+
+
+class SQLiteHistory(ConversionHistory):
+    """Conversion history stored in a WAL-mode SQLite database.
+
+    Records live in a table keyed by identifier with indexes on source
+    path and timestamp, so lookups and period queries do not load the
+    whole history. Statistics come from the daily_stats rollup table,
+    which triggers update on every insert and delete. Every change is committed as its own
+    transaction. The CLI, GUI and launchd runs may therefore use the
+    same database at once; writers wait for each other instead of
+    overwriting each other's changes.
+
+    On first open, records from the JSON history file are imported and
+    the file is renamed with a ``.migrated`` suffix.
+
+    Attributes:
+        history_path: Path to the SQLite database file.
+        legacy_path: Path to the JSON history file to import.
+    """
+
+    def __init__(
+        self,
+        history_path: Path | None = None,
+        *,
+        legacy_path: Path | None = None,
+    ) -> None:
+        """Initialize the SQLite history store.
+
+        Args:
+            history_path: Path to the database file.
+                Defaults to ~/.local/share/video_converter/history.db
+            legacy_path: JSON history file to import on first open.
+                Defaults to history.json next to the database.
+        """
+        self.history_path = history_path or DEFAULT_HISTORY_DB
+        self.legacy_path = legacy_path or self.history_path.with_name(DEFAULT_HISTORY_FILE.name)
+        self._lock = threading.RLock()
+
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            msg = f"Cannot open history database {self.history_path}: {e}"
+            raise HistoryCorruptedError(msg) from e
+
+        self._migrate_json()
 
-        with open(path, "rb") as f:
-            # Hash first 1MB
-            sha.update(f.read(1024 * 1024))
+    def _connect(self) -> sqlite3.Connection:
+        """Create the connection and schema.
 
-            # If file is larger than 2MB, also hash last 1MB
-            if file_size > 2 * 1024 * 1024:
-                f.seek(-1024 * 1024, 2)  # Seek to last 1MB
-                sha.update(f.read())
-            elif file_size > 1024 * 1024:
-                # File between 1MB and 2MB, hash remaining
-                sha.update(f.read())
+        Returns:
+            Open SQLite connection.
+        """
+        conn = sqlite3.connect(
+            str(self.history_path),
+            timeout=_BUSY_TIMEOUT,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE must fire the delete trigger for the old row
+        conn.execute("PRAGMA recursive_triggers=ON")
 
-        return sha.hexdigest()[:16]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > HISTORY_SCHEMA_VERSION:
+                msg = f"History database schema {version} is newer than supported"
+                raise sqlite3.DatabaseError(msg)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS records (
+                    id TEXT PRIMARY KEY,
+                    source_path TEXT NOT NULL,
+                    output_path TEXT,
+                    source_codec TEXT NOT NULL,
+                    output_codec TEXT NOT NULL,
+                    source_size INTEGER NOT NULL,
+                    output_size INTEGER,
+                    converted_at TEXT NOT NULL,
+                    success INTEGER NOT NULL,
+                    error_message TEXT
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_records_source_path ON records (source_path)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_records_converted_at ON records (converted_at)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS legacy_keys (id TEXT PRIMARY KEY)")
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS records_legacy_delete AFTER DELETE ON records
+                BEGIN
+                    DELETE FROM legacy_keys WHERE id = OLD.id;
+                END
+                """
+            )
+            if version < 3:
+                # Hash keys written before the sampled fingerprint may be legacy
+                conn.execute(
+                    "INSERT OR IGNORE INTO legacy_keys SELECT id FROM records WHERE id GLOB ?",
+                    (_HASH_KEY_GLOB,),
+                )
+            self._create_rollups(conn)
+            if version < 2:
+                conn.execute("DELETE FROM daily_stats")
+                conn.execute(
+                    "INSERT INTO daily_stats SELECT "
+                    f"{_ROLLUP_KEY.format('records')}, COUNT(*), SUM(source_size), "
+                    "SUM(COALESCE(output_size, 0)), MIN(NULLIF(converted_at, '')), "
+                    "MAX(NULLIF(converted_at, '')) FROM records GROUP BY 1, 2, 3"
+                )
+            conn.execute(f"PRAGMA user_version={HISTORY_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _create_rollups(conn: sqlite3.Connection) -> None:
+        """Create the daily_stats table and the triggers that maintain it.
+
+        daily_stats holds one row per day, output codec and success flag
+        with the record count, byte totals and first and last timestamps.
+        Triggers on the records table keep it current, so statistics are
+        read from a few rows per day instead of every record.
+
+        Args:
+            conn: Connection inside a write transaction.
+        """
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                day TEXT NOT NULL,
+                output_codec TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                source_bytes INTEGER NOT NULL,
+                output_bytes INTEGER NOT NULL,
+                first_at TEXT,
+                last_at TEXT,
+                PRIMARY KEY (day, output_codec, success)
+            )
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS records_rollup_insert AFTER INSERT ON records
+            BEGIN
+                INSERT INTO daily_stats VALUES (
+                    {_ROLLUP_KEY.format("NEW")}, 1, NEW.source_size,
+                    COALESCE(NEW.output_size, 0), NULLIF(NEW.converted_at, ''),
+                    NULLIF(NEW.converted_at, '')
+                )
+                ON CONFLICT (day, output_codec, success) DO UPDATE SET
+                    count = count + 1,
+                    source_bytes = source_bytes + excluded.source_bytes,
+                    output_bytes = output_bytes + excluded.output_bytes,
+                    first_at = COALESCE(
+                        MIN(first_at, excluded.first_at), first_at, excluded.first_at
+                    ),
+                    last_at = COALESCE(
+                        MAX(last_at, excluded.last_at), last_at, excluded.last_at
+                    );
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS records_rollup_delete AFTER DELETE ON records
+            BEGIN
+                UPDATE daily_stats SET
+                    count = count - 1,
+                    source_bytes = source_bytes - OLD.source_size,
+                    output_bytes = output_bytes - COALESCE(OLD.output_size, 0),
+                    first_at = (
+                        SELECT MIN(NULLIF(converted_at, '')) FROM records WHERE {_SAME_ROLLUP}
+                    ),
+                    last_at = (
+                        SELECT MAX(NULLIF(converted_at, '')) FROM records WHERE {_SAME_ROLLUP}
+                    )
+                WHERE (day, output_codec, success) = ({_ROLLUP_KEY.format("OLD")});
+                DELETE FROM daily_stats
+                WHERE (day, output_codec, success) = ({_ROLLUP_KEY.format("OLD")})
+                    AND count <= 0;
+            END
+            """
+        )
+
+    def _migrate_json(self) -> None:
+        """Import the JSON history file once.
+
+        Runs inside a write transaction so that concurrent processes do
+        not import the file twice. Records already in the database win
+        over imported ones.
+        """
+        if not self.legacy_path.exists():
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = self._conn.execute(
+                    "SELECT value FROM meta WHERE key = 'json_migrated'"
+                ).fetchone()
+                if done is None:
+                    try:
+                        records = ConversionHistory(self.legacy_path).get_all_records()
+                    except HistoryCorruptedError as e:
+                        logger.warning(f"Not importing unreadable history {self.legacy_path}: {e}")
+                        self._conn.execute("ROLLBACK")
+                        return
+                    self._conn.executemany(
+                        f"INSERT OR IGNORE INTO records ({', '.join(_RECORD_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_RECORD_COLUMNS))})",
+                        [self._to_row(r) for r in records],
+                    )
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO legacy_keys (id) VALUES (?)",
+                        [(r.id,) for r in records if _is_hash_key(r.id)],
+                    )
+                    self._conn.execute(
+                        "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                        (datetime.now().isoformat(),),
+                    )
+                    logger.info(f"Imported {len(records)} records from {self.legacy_path}")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        try:
+            self.legacy_path.replace(
+                self.legacy_path.with_name(self.legacy_path.name + _MIGRATED_SUFFIX)
+            )
+        except OSError as e:
+            logger.debug(f"Could not rename imported history file: {e}")
+
+    @staticmethod
+    def _to_row(record: ConversionRecord) -> tuple:
+        """Convert a record to a row of column values."""
+        return (
+            record.id,
+            record.source_path,
+            record.output_path,
+            record.source_codec,
+            record.output_codec,
+            record.source_size,
+            record.output_size,
+            record.converted_at,
+            int(record.success),
+            record.error_message,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> ConversionRecord:
+        """Convert a row of column values to a record."""
+        values = dict(zip(_RECORD_COLUMNS, row, strict=True))
+        values["success"] = bool(values["success"])
+        return ConversionRecord(**values)
+
+    def _query(self, where: str = "", params: tuple = ()) -> list[ConversionRecord]:
+        """Select records matching a condition.
+
+        Args:
+            where: Optional SQL condition, without the WHERE keyword.
+            params: Parameters for the condition.
+
+        Returns:
+            Matching records in timestamp order.
+        """
+        sql = f"SELECT {', '.join(_RECORD_COLUMNS)} FROM records"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY converted_at"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def _period_condition(self, period: StatsPeriod) -> tuple[str, tuple]:
+        """Build the SQL condition selecting records within a period."""
+        period_start = self._get_period_start(period)
+        if period_start is None:
+            return "", ()
+        return "converted_at >= ?", (period_start.isoformat(),)
+
+    def is_converted(self, identifier: str) -> bool:
+        """Check if a video has been successfully converted.
+
+        Args:
+            identifier: UUID (from Photos) or file hash.
+
+        Returns:
+            True if video was successfully converted before.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT success FROM records WHERE id = ?", (identifier,)
+            ).fetchone()
+        return row is not None and bool(row[0])
+
+    def add_record(self, record: ConversionRecord) -> None:
+        """Add or update a conversion record.
+
+        Args:
+            record: The conversion record to add.
+        """
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO records ({', '.join(_RECORD_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_RECORD_COLUMNS))})",
+                self._to_row(record),
+            )
+
+        logger.debug(f"Added record for {record.id}")
+
+    def get_record(self, identifier: str) -> ConversionRecord | None:
+        """Get a conversion record by identifier.
+
+        Args:
+            identifier: UUID or file hash.
+
+        Returns:
+            The ConversionRecord if found, None otherwise.
+        """
+        records = self._query("id = ?", (identifier,))
+        return records[0] if records else None
+
+    def remove_record(self, identifier: str) -> bool:
+        """Remove a record from history.
+
+        Args:
+            identifier: UUID or file hash.
+
+        Returns:
+            True if record was removed, False if not found.
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM records WHERE id = ?", (identifier,))
+        if cursor.rowcount:
+            logger.debug(f"Removed record for {identifier}")
+            return True
+        return False
+
+    def _has_legacy_records(self) -> bool:
+        """Check if any record may still be keyed by the legacy file hash."""
+        with self._lock:
+            row = self._conn.execute("SELECT EXISTS (SELECT 1 FROM legacy_keys)").fetchone()
+        return bool(row[0])
+
+    def _rekey(self, old_id: str, new_id: str) -> None:
+        """Move a record to a new identifier in one transaction.
+
+        The rollup key is unchanged, so daily_stats needs no update.
+
+        Args:
+            old_id: Current identifier of the record.
+            new_id: Identifier to store it under.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE OR REPLACE records SET id = ? WHERE id = ?", (new_id, old_id)
+                )
+                self._conn.execute("DELETE FROM legacy_keys WHERE id = ?", (old_id,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        """Clear all history records."""
+        with self._lock:
+            # Emptying the rollups first leaves the delete trigger nothing to update
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM daily_stats")
+                cursor = self._conn.execute("DELETE FROM records")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        logger.info(f"Cleared {cursor.rowcount} records from history")
+
+    def get_records_by_period(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> list[ConversionRecord]:
+        """Get all conversion records filtered by time period.
+
+        Args:
+            period: Time period to filter by.
+
+        Returns:
+            List of ConversionRecord instances within the period.
+        """
+        return self._query(*self._period_condition(period))
+
+    def get_statistics(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> HistoryStatistics:
+        """Get aggregated statistics for conversions.
+
+        Args:
+            period: Time period to filter statistics by.
+
+        Returns:
+            HistoryStatistics with totals and averages.
+        """
+        return self._rollup_statistics(period).get("", self._new_statistics(period))
+
+    def _rollup_statistics(
+        self,
+        period: StatsPeriod,
+        group: str = "''",
+    ) -> dict[str, HistoryStatistics]:
+        """Aggregate the daily_stats rollups within a period.
+
+        Args:
+            period: Time period to filter statistics by.
+            group: SQL expression over daily_stats to group by.
+
+        Returns:
+            Statistics per group value, in ascending group order.
+        """
+        sql = (
+            f"SELECT {group}, success, SUM(count), SUM(source_bytes), SUM(output_bytes), "
+            "MIN(first_at), MAX(last_at) FROM daily_stats"
+        )
+        params: tuple = ()
+        period_start = self._get_period_start(period)
+        if period_start is not None:
+            sql += " WHERE day >= ?"
+            params = (period_start.date().isoformat(),)
+        sql += " GROUP BY 1, 2 ORDER BY 1"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        groups: dict[str, HistoryStatistics] = {}
+        for key, success, count, source_bytes, output_bytes, first, last in rows:
+            if key not in groups:
+                groups[key] = self._new_statistics(period)
+            stats = groups[key]
+            if not success:
+                stats.total_failed = count
+                continue
+            stats.total_converted = count
+            stats.total_source_bytes = source_bytes
+            stats.total_output_bytes = output_bytes
+            stats.total_saved_bytes = source_bytes - output_bytes
+            stats.first_conversion = first
+            stats.last_conversion = last
+        return groups
+
+    def get_daily_statistics(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> dict[str, HistoryStatistics]:
+        """Get statistics for each day with conversions.
+
+        Args:
+            period: Time period to filter statistics by.
+
+        Returns:
+            Statistics keyed by ISO date (YYYY-MM-DD), oldest first.
+        """
+        return self._rollup_statistics(period, "day")
+
+    def get_codec_statistics(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> dict[str, HistoryStatistics]:
+        """Get statistics for each output codec.
+
+        Args:
+            period: Time period to filter statistics by.
+
+        Returns:
+            Statistics keyed by output codec.
+        """
+        return self._rollup_statistics(period, "output_codec")
+
+    def iter_records(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+    ) -> Iterator[ConversionRecord]:
+        """Iterate over conversion records within a time period.
+
+        Records are read in batches in timestamp order. The lock is only
+        held while a batch is read.
+
+        Args:
+            period: Time period to filter by.
+
+        Yields:
+            ConversionRecord instances within the period.
+        """
+        where, params = self._period_condition(period)
+        sql = f"SELECT {', '.join(_RECORD_COLUMNS)} FROM records WHERE (converted_at, id) > (?, ?)"
+        if where:
+            sql += f" AND {where}"
+        sql += f" ORDER BY converted_at, id LIMIT {_ITER_BATCH_SIZE}"
+
+        last: tuple = ("", "")
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, last + params).fetchall()
+            for row in rows:
+                yield self._from_row(row)
+            if len(rows) < _ITER_BATCH_SIZE:
+                return
+            last = (rows[-1][_RECORD_COLUMNS.index("converted_at")], rows[-1][0])
+
+    def get_recent_records(
+        self,
+        period: StatsPeriod = StatsPeriod.ALL,
+        limit: int = 10,
+    ) -> list[ConversionRecord]:
+        """Get the most recent conversion records within a time period.
+
+        Args:
+            period: Time period to filter by.
+            limit: Maximum number of records to return.
+
+        Returns:
+            Up to ``limit`` records, oldest first.
+        """
+        where, params = self._period_condition(period)
+        sql = f"SELECT {', '.join(_RECORD_COLUMNS)} FROM records"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY converted_at DESC, id DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, max(limit, 0))).fetchall()
+        return [self._from_row(row) for row in reversed(rows)]
+
+    def get_all_records(self) -> list[ConversionRecord]:
+        """Get all conversion records.
+
+        Returns:
+            List of all ConversionRecord instances.
+        """
+        return self._query()
+
+    def get_records_for_path(self, source_path: Path | str) -> list[ConversionRecord]:
+        """Get the conversion records of a source file.
+
+        Args:
+            source_path: Original file path at time of conversion.
+
+        Returns:
+            List of ConversionRecord instances for the path.
+        """
+        return self._query("source_path = ?", (str(source_path),))
+
+    def get_failed_records(self) -> list[ConversionRecord]:
+        """Get all failed conversion records.
+
+        Returns:
+            List of failed ConversionRecord instances.
+        """
+        return self._query("success = 0")
+
+    def get_successful_records(self) -> list[ConversionRecord]:
+        """Get all successful conversion records.
+
+        Returns:
+            List of successful ConversionRecord instances.
+        """
+        return self._query("success = 1")
+
+    def count(self) -> int:
+        """Get total number of records.
+
+        Returns:
+            Number of records in history.
+        """
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
 
 # Module-level singleton management
@@ -667,6 +1510,9 @@ _history_lock = threading.Lock()
 def get_history(history_path: Path | None = None) -> ConversionHistory:
     """Get or create the default ConversionHistory instance.
 
+    The default store is the SQLite database. A path ending in ``.json``
+    selects the JSON file store instead.
+
     Args:
         history_path: Optional path. Only used on first call.
 
@@ -676,17 +1522,22 @@ def get_history(history_path: Path | None = None) -> ConversionHistory:
     global _default_history
     with _history_lock:
         if _default_history is None:
-            _default_history = ConversionHistory(history_path=history_path)
+            if history_path is not None and history_path.suffix == ".json":
+                _default_history = ConversionHistory(history_path=history_path)
+            else:
+                _default_history = SQLiteHistory(history_path=history_path)
         return _default_history
 
 
 def reset_history() -> None:
-    """Reset the default history instance.
+    """Close and reset the default history instance.
 
     Primarily useful for testing.
     """
     global _default_history
     with _history_lock:
+        if isinstance(_default_history, SQLiteHistory):
+            _default_history.close()
         _default_history = None
 
 
@@ -696,9 +1547,11 @@ __all__ = [
     "HistoryStatistics",
     "HistoryError",
     "HistoryCorruptedError",
+    "SQLiteHistory",
     "StatsPeriod",
     "get_history",
     "reset_history",
+    "DEFAULT_HISTORY_DB",
     "DEFAULT_HISTORY_DIR",
     "DEFAULT_HISTORY_FILE",
 ]
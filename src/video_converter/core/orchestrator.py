@@ -33,10 +33,11 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import uuid
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -51,15 +52,26 @@ from video_converter.converters.base import (
 )
 from video_converter.converters.factory import ConverterFactory
 from video_converter.converters.progress import ProgressInfo
+from video_converter.converters.segmented import SegmentedConverter
 from video_converter.core.concurrent import (
     AggregatedProgress,
     ConcurrentProcessor,
 )
+from video_converter.core.encoder_pool import (
+    EncoderDispatcher,
+    EncoderPoolConfig,
+    EncoderSlotPool,
+)
 from video_converter.core.error_recovery import (
     ErrorRecoveryManager,
     FailureRecord,
 )
+from video_converter.core.fingerprint import get_fingerprinter
+from video_converter.core.history import ConversionHistory, ConversionRecord
+from video_converter.core.pipeline import PipelineStage, StagedPipeline
+from video_converter.core.scheduling import TaskCostModel, estimate_makespan
 from video_converter.core.session import SessionStateManager
+from video_converter.core.thread_budget import ThreadBudget
 from video_converter.core.types import (
     BatchStatus,
     CompleteCallback,
@@ -99,7 +111,9 @@ from video_converter.processors.vmaf_analyzer import (
 from video_converter.utils.constants import (
     DEFAULT_CONCURRENT_CONVERSIONS,
     DEFAULT_CRF,
+    DEFAULT_MAX_SEGMENTS,
     DEFAULT_QUALITY,
+    DEFAULT_SEGMENT_MIN_DURATION,
     ICLOUD_DOWNLOAD_TIMEOUT,
     ICLOUD_POLL_INTERVAL,
     MIN_FREE_DISK_SPACE,
@@ -107,13 +121,33 @@ from video_converter.utils.constants import (
     VMAF_DEFAULT_SAMPLE_INTERVAL,
     VMAF_THRESHOLD_VISUALLY_LOSSLESS,
 )
+from video_converter.utils.file_utils import clone_file, scan_video_files
 
 if TYPE_CHECKING:
     from video_converter.extractors.folder_extractor import FolderVideoInfo
+    from video_converter.processors.codec_detector import CodecInfo
+    from video_converter.processors.probe_index import ProbeIndex
 
 logger = logging.getLogger(__name__)
 
 
+def _duplicate_record_id(record_id: str, path: Path) -> str:
+    """Build the history identifier for a duplicate input.
+
+    Every copy has the same content hash, so the path is appended to give
+    each copy its own record.
+
+    Args:
+        record_id: History identifier of the encoded copy.
+        path: Path of the duplicate input.
+
+    Returns:
+        Identifier of the duplicate's history record.
+    """
+    suffix = hashlib.blake2b(str(path).encode(), digest_size=4).hexdigest()
+    return f"{record_id}-{suffix}"
+
+
 @dataclass
 class OrchestratorConfig:
     """Configuration for the Orchestrator.
@@ -147,6 +181,50 @@ class OrchestratorConfig:
         vmaf_threshold: Minimum acceptable VMAF score (default 93.0 for visually lossless).
         vmaf_sample_interval: Frame sampling interval for VMAF analysis (1=all, 30=faster).
         vmaf_fail_action: Action when VMAF is below threshold ("warn", "retry", "fail").
+        enable_pipeline: Whether to run encode, verify and finalize stages as
+            separate worker pools so encoders never wait on post-encode work.
+        pipeline_verify_concurrency: Worker count for the verify stage
+            (validation and VMAF) in pipeline mode.
+        pipeline_finalize_concurrency: Worker count for the finalize stage
+            (timestamp sync and cleanup) in pipeline mode.
+        pipeline_queue_size: Capacity of the queues between pipeline stages.
+        adaptive_concurrency: Whether concurrent batches keep resizing the
+            number of running conversions from CPU, memory and load.
+        adaptive_min_concurrent: Lower bound for adaptive concurrency
+            (max_concurrent is the upper bound).
+        adaptive_interval: Seconds between adaptive resource checks.
+        encoder_pools: Encoder pools for hybrid dispatch. When set, each
+            file is routed to the first pool with a free slot (e.g. two
+            hardware sessions plus two software jobs) instead of using a
+            single converter for the whole batch, and the number of
+            parallel encodes is the total slot count of the pools.
+        segment_encoding: Whether to split long inputs at keyframes into
+            chunks encoded in parallel. Chunks only use encoder capacity
+            that no other file is waiting for, so this mostly applies at
+            the tail of a batch.
+        segment_min_duration: Shortest input (in seconds) that is split.
+        max_segments: Maximum number of encodes running at once for
+            segmented files, including other files still encoding.
+        thread_budget: Whether to divide the CPU cores among running
+            software encodes and pass each an explicit thread count,
+            instead of letting every encode size itself to the machine.
+        thread_budget_cores: Number of threads to divide. Defaults to the
+            CPUs available to the process.
+        pin_cpus: Whether to also pin each budgeted encode to its own
+            CPUs (on platforms that support CPU affinity).
+        retain_results: Whether to keep every ConversionResult on the
+            report and its task. Disable for very large batches: each
+            result is then applied to the report and session as it
+            completes and only aggregate statistics are kept, and
+            concurrent batches run on a fixed pool of workers fed from a
+            bounded queue, so memory stays flat regardless of batch size.
+        dedupe_inputs: Whether to group byte-identical inputs during
+            discovery. Only the first file of each group is encoded; the
+            outputs of the others are created from its output by hard
+            link, copy-on-write clone or copy, with their own timestamps.
+        skip_converted: Whether to skip inputs whose content the history
+            records as successfully converted, as long as the recorded
+            output still exists. Conversions are recorded either way.
     """
 
     mode: ConversionMode = ConversionMode.HARDWARE
@@ -177,9 +255,26 @@ class OrchestratorConfig:
     vmaf_threshold: float = VMAF_THRESHOLD_VISUALLY_LOSSLESS
     vmaf_sample_interval: int = VMAF_DEFAULT_SAMPLE_INTERVAL
     vmaf_fail_action: str = "warn"
-
-
-@dataclass
+    enable_pipeline: bool = False
+    pipeline_verify_concurrency: int = 2
+    pipeline_finalize_concurrency: int = 2
+    pipeline_queue_size: int = 2
+    adaptive_concurrency: bool = False
+    adaptive_min_concurrent: int = 1
+    adaptive_interval: float = 10.0
+    encoder_pools: list[EncoderPoolConfig] | None = None
+    segment_encoding: bool = False
+    segment_min_duration: float = DEFAULT_SEGMENT_MIN_DURATION
+    max_segments: int = DEFAULT_MAX_SEGMENTS
+    thread_budget: bool = False
+    thread_budget_cores: int | None = None
+    pin_cpus: bool = False
+    retain_results: bool = True
+    dedupe_inputs: bool = False
+    skip_converted: bool = True
+
+
+@dataclass(slots=True)
 class ConversionTask:
     """A single video conversion task in the queue.
 
@@ -189,6 +284,10 @@ class ConversionTask:
         status: Current status of the task.
         result: Conversion result (when complete).
         error: Error message (if failed).
+        codec_info: Codec analysis from discovery, passed on to the converter.
+        record_id: Identifier of the task's ConversionHistory record.
+        duplicates: Tasks for byte-identical inputs whose outputs are
+            created from this task's output instead of being encoded.
     """
 
     input_path: Path
@@ -196,6 +295,36 @@ class ConversionTask:
     status: ConversionStatus = ConversionStatus.PENDING
     result: ConversionResult | None = None
     error: str | None = None
+    codec_info: CodecInfo | None = None
+    record_id: str | None = None
+    duplicates: list[ConversionTask] = field(default_factory=list)
+
+
+@dataclass
+class StageJob:
+    """State of one file moving through the conversion stages.
+
+    Attributes:
+        input_path: Path to input video.
+        output_path: Path for output video.
+        task: Queue task this job belongs to (batch processing only).
+        video_info: Optional FolderVideoInfo with iCloud status.
+        codec_info: Optional codec analysis reused instead of re-probing.
+        request: Conversion request (set by the encode stage).
+        result: Current conversion result (set by the encode stage).
+        on_progress: Optional progress callback for pipeline stage updates.
+        on_progress_info: Optional callback for detailed FFmpeg progress.
+    """
+
+    input_path: Path
+    output_path: Path
+    task: ConversionTask | None = None
+    video_info: FolderVideoInfo | None = None
+    codec_info: CodecInfo | None = None
+    request: ConversionRequest | None = None
+    result: ConversionResult | None = None
+    on_progress: ProgressCallback | None = None
+    on_progress_info: Callable[[ProgressInfo], None] | None = None
 
 
 class Orchestrator:
@@ -227,6 +356,9 @@ class Orchestrator:
         enable_session_persistence: bool = True,
         retry_manager: RetryManager | None = None,
         error_recovery_manager: ErrorRecoveryManager | None = None,
+        probe_index: ProbeIndex | None = None,
+        cost_model: TaskCostModel | None = None,
+        history: ConversionHistory | None = None,
     ) -> None:
         """Initialize the Orchestrator.
 
@@ -239,6 +371,11 @@ class Orchestrator:
             enable_session_persistence: Whether to enable session persistence.
             retry_manager: Optional retry manager for failed conversions.
             error_recovery_manager: Optional error recovery manager.
+            probe_index: Optional probe index used to look up codec
+                information for cost-based queue priorities.
+            cost_model: Optional cost model for cost-based queue priorities.
+            history: Optional conversion history. Batch results, including
+                reused duplicate outputs, are recorded in it.
         """
         self.config = config or OrchestratorConfig()
         self.converter_factory = converter_factory or ConverterFactory()
@@ -265,7 +402,21 @@ class Orchestrator:
             min_free_space=self.config.min_free_space,
         )
 
+        self.probe_index = probe_index
+        self.cost_model = cost_model or TaskCostModel()
+        self.history = history
+
         self._converter: BaseConverter | None = None
+        self._dispatcher: EncoderDispatcher | None = None
+        self._segmented: list[SegmentedConverter] = []
+        self._thread_budget: ThreadBudget | None = None
+        if self.config.thread_budget:
+            self._thread_budget = ThreadBudget(
+                self.config.thread_budget_cores,
+                pin_cpus=self.config.pin_cpus,
+            )
+        self._encodes_started = 0
+        self._active_encodes = 0
         self._cancelled = False
         self._paused = False
         self._paused_reason: str | None = None
@@ -275,12 +426,15 @@ class Orchestrator:
         self._current_session_id: str | None = None
         self._tasks: list[ConversionTask] = []
         self._current_session: SessionState | None = None
+        self._pipeline: StagedPipeline[StageJob] | None = None
 
         # Concurrent processing support
         self._concurrent_processor = ConcurrentProcessor(
             max_concurrent=self.config.max_concurrent,
             enable_resource_monitoring=True,
-            adaptive_concurrency=False,
+            adaptive_concurrency=self.config.adaptive_concurrency,
+            min_concurrent=self.config.adaptive_min_concurrent,
+            adaptive_interval=self.config.adaptive_interval,
         )
 
         # Notification manager
@@ -319,6 +473,50 @@ class Orchestrator:
             )
         return self._converter
 
+    def _get_dispatcher(self) -> EncoderDispatcher:
+        """Get or create the hybrid encoder dispatcher.
+
+        Pools whose encoder is not available on this system are left out.
+
+        Returns:
+            An EncoderDispatcher over the configured encoder pools.
+
+        Raises:
+            EncoderNotAvailableError: If no configured pool has an
+                available encoder.
+        """
+        if self._dispatcher is None:
+            pools: list[EncoderSlotPool] = []
+            for pool_config in self.config.encoder_pools or []:
+                try:
+                    converter = self.converter_factory.get_converter(
+                        mode=pool_config.mode,
+                        fallback=False,
+                    )
+                except EncoderNotAvailableError as e:
+                    logger.warning(f"Skipping {pool_config.mode.value} encoder pool: {e}")
+                    continue
+                pools.append(
+                    EncoderSlotPool(
+                        name=pool_config.name or pool_config.mode.value,
+                        converter=converter,
+                        slots=pool_config.slots,
+                        max_height=pool_config.max_height,
+                        max_bit_depth=pool_config.max_bit_depth,
+                    )
+                )
+            if not pools:
+                raise EncoderNotAvailableError("No configured encoder pool is available")
+            self._dispatcher = EncoderDispatcher(pools)
+        return self._dispatcher
+
+    @property
+    def _encoder_slots(self) -> int:
+        """Get the number of files encoded in parallel during a batch."""
+        if self.config.encoder_pools:
+            return max(1, sum(pool.slots for pool in self.config.encoder_pools))
+        return self.config.max_concurrent
+
     async def _ensure_file_available(
         self,
         input_path: Path,
@@ -554,8 +752,53 @@ class Orchestrator:
         if priority == QueuePriority.SIZE_LARGEST:
             return sorted(paths, key=lambda p: p.stat().st_size, reverse=True)
 
+        if priority in (
+            QueuePriority.SHORTEST_JOB,
+            QueuePriority.LONGEST_JOB,
+            QueuePriority.MAX_SAVINGS,
+        ):
+            return self._sort_by_cost(paths, priority)
+
         return paths
 
+    def _lookup_codec_info(self, path: Path) -> CodecInfo | None:
+        """Get indexed codec information for a path without probing.
+
+        Args:
+            path: Path to the input video.
+
+        Returns:
+            CodecInfo from the probe index, or None if not indexed.
+        """
+        if self.probe_index is None:
+            return None
+        return self.probe_index.get(path)
+
+    def _sort_by_cost(self, paths: list[Path], priority: QueuePriority) -> list[Path]:
+        """Sort input paths by estimated encode cost or savings.
+
+        Args:
+            paths: List of input file paths.
+            priority: A cost-based queue priority.
+
+        Returns:
+            Sorted list of paths.
+        """
+        encoder = self._converter.encoder_name if self._converter else None
+        estimates = [
+            self.cost_model.estimate(path, self._lookup_codec_info(path), encoder=encoder)
+            for path in paths
+        ]
+        ordered = self.cost_model.order(estimates, priority)
+
+        total_savings = sum(e.expected_savings for e in ordered)
+        logger.info(
+            f"Queue ordered by {priority.value}: estimated "
+            f"{estimate_makespan(ordered, self._encoder_slots):.0f}s encode time, "
+            f"{total_savings / (1024 * 1024):.0f} MB expected savings"
+        )
+        return [e.path for e in ordered]
+
     def _emit_progress(
         self,
         callback: ProgressCallback | None,
@@ -625,6 +868,7 @@ class Orchestrator:
         on_progress: ProgressCallback | None = None,
         video_info: FolderVideoInfo | None = None,
         on_progress_info: Callable[[ProgressInfo], None] | None = None,
+        codec_info: CodecInfo | None = None,
     ) -> ConversionResult:
         """Convert a single video file through the full pipeline.
 
@@ -638,6 +882,8 @@ class Orchestrator:
             video_info: Optional FolderVideoInfo with iCloud status.
             on_progress_info: Optional progress callback for detailed FFmpeg progress
                 (percentage, speed, current size, ETA).
+            codec_info: Optional codec analysis from discovery. Defaults to
+                the one carried by video_info, if any.
 
         Returns:
             ConversionResult with success status and statistics.
@@ -648,11 +894,46 @@ class Orchestrator:
         if output_path is None:
             output_path = self._create_output_path(input_path)
 
+        if codec_info is None and video_info is not None:
+            codec_info = video_info.codec_info
+
+        job = StageJob(
+            input_path=input_path,
+            output_path=output_path,
+            video_info=video_info,
+            codec_info=codec_info,
+            on_progress=on_progress,
+            on_progress_info=on_progress_info,
+        )
+
+        if await self._run_encode_stage(job) and await self._run_verify_stage(job):
+            await self._run_finalize_stage(job)
+
+        assert job.result is not None, "Encode stage did not produce a result"
+        return job.result
+
+    async def _run_encode_stage(self, job: StageJob) -> bool:
+        """Make the input available and run the encoder.
+
+        Args:
+            job: The job to encode. Its request and result are filled in.
+
+        Returns:
+            True if the job should continue to verification, False if its
+            result is already final (failure, retry outcome, or cancellation).
+        """
+        input_path = job.input_path
+        output_path = job.output_path
+        on_progress = job.on_progress
+        self._encodes_started += 1
+
         # Ensure file is available (handles iCloud download)
-        available, error = await self._ensure_file_available(input_path, video_info, on_progress)
+        available, error = await self._ensure_file_available(
+            input_path, job.video_info, on_progress
+        )
 
         if not available:
-            return ConversionResult(
+            job.result = ConversionResult(
                 success=False,
                 request=ConversionRequest(
                     input_path=input_path,
@@ -660,10 +941,11 @@ class Orchestrator:
                 ),
                 error_message=error or f"Input file not available: {input_path}",
             )
+            return False
 
         # Validate input (file should exist after download)
         if not input_path.exists():
-            return ConversionResult(
+            job.result = ConversionResult(
                 success=False,
                 request=ConversionRequest(
                     input_path=input_path,
@@ -671,6 +953,7 @@ class Orchestrator:
                 ),
                 error_message=f"Input file not found after download: {input_path}",
             )
+            return False
 
         # Create conversion request
         request = ConversionRequest(
@@ -681,7 +964,9 @@ class Orchestrator:
             crf=self.config.crf,
             preset=self.config.preset,
             preserve_metadata=self.config.preserve_metadata,
+            codec_info=job.codec_info,
         )
+        job.request = request
 
         # Stage 1: Convert
         self._emit_progress(
@@ -693,20 +978,30 @@ class Orchestrator:
         )
 
         try:
-            converter = self._get_converter()
+            if self.config.encoder_pools:
+                dispatcher = self._get_dispatcher()
+            else:
+                converter = self._get_converter()
         except EncoderNotAvailableError as e:
-            return ConversionResult(
+            job.result = ConversionResult(
                 success=False,
                 request=request,
                 error_message=str(e),
             )
+            return False
 
-        result = await converter.convert(request, on_progress_info=on_progress_info)
+        if self.config.encoder_pools:
+            async with dispatcher.acquire(job.codec_info) as pool:
+                result = await self._encode(pool.converter, job)
+            result.encoder_pool = pool.name
+        else:
+            result = await self._encode(converter, job)
+        job.result = result
 
         if not result.success:
             if self.retry_manager:
-                return await self._retry_conversion(request, result, on_progress, input_path)
-            return result
+                job.result = await self._retry_conversion(request, result, on_progress, input_path)
+            return False
 
         if self._cancelled:
             # Clean up output file
@@ -714,7 +1009,89 @@ class Orchestrator:
                 output_path.unlink()
             result.success = False
             result.error_message = "Conversion cancelled"
-            return result
+            return False
+
+        return True
+
+    def _segment_count(self) -> int:
+        """Get the number of segments the next encode may be split into.
+
+        Segments only use encoder capacity that is not needed by files
+        still encoding or waiting to be encoded.
+
+        Returns:
+            Number of segments, 1 if the encode should not be split.
+        """
+        if not self.config.segment_encoding:
+            return 1
+        waiting = max(0, len(self._tasks) - self._encodes_started)
+        return max(1, self.config.max_segments - self._active_encodes - waiting)
+
+    async def _encode(self, converter: BaseConverter, job: StageJob) -> ConversionResult:
+        """Run the encoder for a job, splitting long inputs when encoders are idle.
+
+        With thread budgeting enabled, software encodes get an explicit
+        share of the CPU cores for the duration of the encode.
+
+        Args:
+            converter: Converter to encode with.
+            job: The job to encode. Its request must be set.
+
+        Returns:
+            The conversion result.
+        """
+        assert job.request is not None
+        segments = self._segment_count()
+
+        # Jobs that will share the currently free cores: this one plus
+        # those that can start before any running encode finishes
+        allocation = None
+        if self._thread_budget is not None and converter.mode == ConversionMode.SOFTWARE:
+            waiting = max(0, len(self._tasks) - self._encodes_started)
+            free_slots = max(1, self._encoder_slots - self._active_encodes)
+            allocation = self._thread_budget.allocate(min(free_slots, waiting + 1))
+            job.request.threads = allocation.threads
+            job.request.cpu_affinity = allocation.cpus
+
+        segmented: SegmentedConverter | None = None
+        if segments > 1:
+            segmented = SegmentedConverter(
+                converter,
+                segments,
+                min_input_duration=self.config.segment_min_duration,
+            )
+            self._segmented.append(segmented)
+            converter = segmented
+
+        self._active_encodes += 1
+        try:
+            return await converter.convert(job.request, on_progress_info=job.on_progress_info)
+        finally:
+            self._active_encodes -= 1
+            if segmented is not None:
+                self._segmented.remove(segmented)
+            if allocation is not None:
+                assert self._thread_budget is not None
+                self._thread_budget.release(allocation)
+
+    async def _run_verify_stage(self, job: StageJob) -> bool:
+        """Validate the encoded output and measure VMAF if enabled.
+
+        Args:
+            job: A job that completed the encode stage successfully.
+
+        Returns:
+            True if the job should continue to finalization, False if its
+            result is already final.
+        """
+        result = job.result
+        request = job.request
+        if result is None or request is None:
+            return False
+
+        input_path = job.input_path
+        output_path = job.output_path
+        on_progress = job.on_progress
 
         # Stage 2: Validate
         if self.config.validate_output:
@@ -726,9 +1103,13 @@ class Orchestrator:
                 message=f"Validating {output_path.name}...",
             )
 
-            validation = self.validator.validate(
+            # FFprobe runs synchronously; keep it off the event loop so
+            # concurrent encoders keep streaming progress
+            validation = await asyncio.to_thread(
+                self.validator.validate,
                 output_path,
                 strictness=self.config.validation_strictness,
+                source=input_path,
             )
 
             if not validation.valid:
@@ -739,7 +1120,10 @@ class Orchestrator:
                     result.success = False
                     result.error_message = f"Validation failed: {', '.join(validation.errors)}"
                     result.warnings.extend(validation.warnings)
-                    return await self._retry_conversion(request, result, on_progress, input_path)
+                    job.result = await self._retry_conversion(
+                        request, result, on_progress, input_path
+                    )
+                    return False
 
                 # No retry - clean up and report
                 if output_path.exists():
@@ -747,7 +1131,7 @@ class Orchestrator:
                 result.success = False
                 result.error_message = f"Validation failed: {', '.join(validation.errors)}"
                 result.warnings.extend(validation.warnings)
-                return result
+                return False
 
             result.warnings.extend(validation.warnings)
 
@@ -783,7 +1167,7 @@ class Orchestrator:
                             output_path.unlink()
                         result.success = False
                         result.error_message = vmaf_warning
-                        return result
+                        return False
 
                     elif self.config.vmaf_fail_action == "retry" and self.retry_manager:
                         # Attempt retry with adjusted settings
@@ -791,9 +1175,10 @@ class Orchestrator:
                             output_path.unlink()
                         result.success = False
                         result.error_message = vmaf_warning
-                        return await self._retry_conversion(
+                        job.result = await self._retry_conversion(
                             request, result, on_progress, input_path
                         )
+                        return False
 
                     else:  # "warn" (default)
                         result.warnings.append(vmaf_warning)
@@ -807,6 +1192,25 @@ class Orchestrator:
                 logger.warning(f"Unexpected error during VMAF analysis: {e}")
                 result.warnings.append(f"VMAF analysis error: {e}")
 
+        return True
+
+    async def _run_finalize_stage(self, job: StageJob) -> bool:
+        """Sync timestamps and clean up the original for a verified job.
+
+        Args:
+            job: A job that passed the verify stage.
+
+        Returns:
+            Always True; the job is complete after this stage.
+        """
+        result = job.result
+        if result is None:
+            return True
+
+        input_path = job.input_path
+        output_path = job.output_path
+        on_progress = job.on_progress
+
         # Stage 3: Metadata - Sync timestamps
         if self.config.preserve_timestamps:
             self._emit_progress(
@@ -817,7 +1221,8 @@ class Orchestrator:
                 message=f"Syncing timestamps for {output_path.name}...",
             )
 
-            timestamp_result = self.timestamp_synchronizer.sync_from_file(
+            timestamp_result = await asyncio.to_thread(
+                self.timestamp_synchronizer.sync_from_file,
                 source=input_path,
                 dest=output_path,
             )
@@ -834,6 +1239,10 @@ class Orchestrator:
                 timestamp_result.access_time_synced,
             )
 
+        # Create the outputs of byte-identical inputs from this one
+        if job.task is not None:
+            await self._materialize_duplicates(job.task, result)
+
         # Stage 4: Cleanup
         self._emit_progress(
             on_progress,
@@ -869,7 +1278,284 @@ class Orchestrator:
             message="Conversion complete",
         )
 
-        return result
+        return True
+
+    async def _materialize_duplicates(
+        self,
+        task: ConversionTask,
+        result: ConversionResult,
+    ) -> None:
+        """Create the outputs of a task's duplicates from its output.
+
+        Each duplicate then goes through the finalize stage on its own,
+        so its output gets its own input's timestamps and its original
+        is cleaned up. Hard links are only used when timestamps are not
+        preserved, since a hard link shares them with the task's output.
+
+        Args:
+            task: A task whose output passed the verify stage.
+            result: The task's conversion result.
+        """
+        if not result.success:
+            return
+
+        for duplicate in task.duplicates:
+            await self._materialize_duplicate(task, duplicate, result)
+
+    async def _materialize_duplicate(
+        self,
+        task: ConversionTask,
+        duplicate: ConversionTask,
+        result: ConversionResult,
+    ) -> None:
+        """Create one duplicate's output from its task's output.
+
+        The duplicate's result is set to the outcome.
+
+        Args:
+            task: A task whose output passed the verify stage.
+            duplicate: One of the task's duplicates.
+            result: The task's successful conversion result.
+        """
+        request = ConversionRequest(
+            input_path=duplicate.input_path,
+            output_path=duplicate.output_path,
+            codec_info=task.codec_info,
+        )
+        try:
+            method = await asyncio.to_thread(
+                clone_file,
+                task.output_path,
+                duplicate.output_path,
+                allow_hardlink=not self.config.preserve_timestamps,
+            )
+        except OSError as e:
+            duplicate.result = ConversionResult(
+                success=False,
+                request=request,
+                error_message=f"Could not reuse output of {task.input_path.name}: {e}",
+            )
+            return
+
+        logger.info(
+            f"Reused output of {task.input_path.name} for {duplicate.input_path.name} ({method})"
+        )
+        now = datetime.now()
+        job = StageJob(
+            input_path=duplicate.input_path,
+            output_path=duplicate.output_path,
+            request=request,
+            result=ConversionResult(
+                success=True,
+                request=request,
+                original_size=result.original_size,
+                converted_size=result.converted_size,
+                started_at=now,
+                completed_at=now,
+            ),
+        )
+        await self._run_finalize_stage(job)
+        duplicate.result = job.result
+
+    async def _finish_stream_duplicates(
+        self,
+        held: list[tuple[ConversionTask, ConversionTask]],
+        report: ConversionReport,
+    ) -> None:
+        """Create the outputs of duplicates found while streaming.
+
+        Their first copy may already have finished when a duplicate
+        arrives, so duplicates are held back until the stream has
+        drained and then handled like the duplicates of run().
+
+        Args:
+            held: Pairs of (encoded task, duplicate) in arrival order.
+            report: The conversion report to update.
+        """
+        for task, duplicate in held:
+            if self._cancelled:
+                break
+            request = ConversionRequest(input_path=task.input_path, output_path=task.output_path)
+            result = ConversionResult(
+                success=False,
+                request=request,
+                error_message=task.error or "output is not available",
+            )
+            if task.status == ConversionStatus.COMPLETED:
+                try:
+                    result = ConversionResult(
+                        success=True,
+                        request=request,
+                        original_size=duplicate.input_path.stat().st_size,
+                        converted_size=task.output_path.stat().st_size,
+                    )
+                except OSError as e:
+                    result.error_message = f"output is not available: {e}"
+                else:
+                    await self._materialize_duplicate(task, duplicate, result)
+            self._handle_duplicate_result(task, duplicate, result, report)
+
+    def _find_stream_duplicate(
+        self,
+        task: ConversionTask,
+        by_size: dict[int, list[ConversionTask]],
+    ) -> ConversionTask | None:
+        """Find an earlier streamed task with the same content as a new one.
+
+        Args:
+            task: The newly discovered task.
+            by_size: Tasks queued so far, by input size. The task is added
+                when it has no earlier copy.
+
+        Returns:
+            The earlier task with identical content, or None.
+        """
+        try:
+            size = task.input_path.stat().st_size
+        except OSError as e:
+            logger.debug(f"Cannot stat {task.input_path}: {e}")
+            return None
+
+        earlier = by_size.setdefault(size, [])
+        if earlier:
+            groups = get_fingerprinter().find_duplicates(
+                [*(other.input_path for other in earlier), task.input_path]
+            )
+            for group in groups:
+                if task.input_path in group:
+                    return next(other for other in earlier if other.input_path == group[0])
+
+        earlier.append(task)
+        return None
+
+    def _group_duplicate_tasks(
+        self,
+        tasks: list[ConversionTask],
+        report: ConversionReport,
+    ) -> list[ConversionTask]:
+        """Attach tasks for byte-identical inputs to the first of them.
+
+        A duplicate whose output path is already taken by its group (same
+        file name in different folders with a shared output directory) is
+        counted as skipped, since the output it would get already exists.
+
+        Args:
+            tasks: Queued tasks in processing order.
+            report: The batch report to update.
+
+        Returns:
+            The tasks to encode. Duplicates are only reachable through
+            the duplicates of their group's first task.
+        """
+        groups = get_fingerprinter().find_duplicates(task.input_path for task in tasks)
+        if not groups:
+            return tasks
+
+        by_path = {task.input_path: task for task in tasks}
+        reused: set[Path] = set()
+        for group in groups:
+            first = by_path[group[0]]
+            outputs = {first.output_path}
+            for path in group[1:]:
+                duplicate = by_path[path]
+                if duplicate.output_path in outputs:
+                    logger.info(f"Skipping (same output as {first.input_path.name}): {path.name}")
+                    report.skipped += 1
+                else:
+                    outputs.add(duplicate.output_path)
+                    first.duplicates.append(duplicate)
+            reused.update(group[1:])
+
+        logger.info(
+            f"Found {len(reused)} duplicate inputs in {len(groups)} groups; "
+            "their outputs will be reused"
+        )
+        return [task for task in tasks if task.input_path not in reused]
+
+    def _identify_tasks(self, report: ConversionReport) -> None:
+        """Group duplicate inputs and assign history record identifiers.
+
+        Tasks whose content was already converted are removed and counted
+        as skipped, together with their duplicates.
+
+        Args:
+            report: The batch report to update.
+        """
+        if self.config.dedupe_inputs:
+            self._tasks = self._group_duplicate_tasks(self._tasks, report)
+
+        if self.history is None:
+            return
+
+        remaining: list[ConversionTask] = []
+        for task in self._tasks:
+            if self._is_already_converted(task):
+                logger.info(f"Skipping (already converted): {task.input_path.name}")
+                report.skipped += 1 + len(task.duplicates)
+                continue
+            remaining.append(task)
+        self._tasks = remaining
+
+    def _is_already_converted(self, task: ConversionTask) -> bool:
+        """Assign a task's history identifier and look it up.
+
+        Args:
+            task: A queued task.
+
+        Returns:
+            True if skip_converted is set and the history has a successful
+            conversion of the same content, even if it was at another
+            path, whose output still exists.
+        """
+        if self.history is None:
+            return False
+
+        try:
+            task.record_id = self.history.compute_file_hash(task.input_path)
+            if self.config.skip_converted and self.history.is_file_converted(
+                task.input_path, task.record_id
+            ):
+                record = self.history.get_record(task.record_id)
+                if record is not None and record.output_path and Path(record.output_path).exists():
+                    return True
+                logger.info(
+                    f"Converting again (recorded output is missing): {task.input_path.name}"
+                )
+        except OSError as e:
+            logger.debug(f"Cannot identify {task.input_path}: {e}")
+            return False
+
+        for duplicate in task.duplicates:
+            duplicate.record_id = _duplicate_record_id(task.record_id, duplicate.input_path)
+        return False
+
+    def _record_history(self, task: ConversionTask, result: ConversionResult) -> None:
+        """Record a finished task in the conversion history.
+
+        Args:
+            task: The finished task.
+            result: The task's conversion result.
+        """
+        if self.history is None or task.record_id is None:
+            return
+
+        codec_info = task.codec_info or result.request.codec_info
+        record = ConversionRecord(
+            id=task.record_id,
+            source_path=str(task.input_path),
+            output_path=str(task.output_path) if result.success else None,
+            source_codec=codec_info.codec if codec_info else "unknown",
+            output_codec="hevc",
+            source_size=result.original_size,
+            output_size=result.converted_size if result.success else None,
+            converted_at=(result.completed_at or datetime.now()).isoformat(),
+            success=result.success,
+            error_message=result.error_message,
+        )
+        try:
+            self.history.add_record(record)
+        except Exception as e:
+            logger.warning(f"Could not record history for {task.input_path.name}: {e}")
 
     async def run(
         self,
@@ -901,6 +1587,7 @@ class Orchestrator:
             session_id=self._current_session_id,
             started_at=datetime.now(),
             total_files=len(input_paths),
+            retain_results=self.config.retain_results,
         )
 
         if not input_paths:
@@ -923,6 +1610,7 @@ class Orchestrator:
         )
 
         self._tasks = []
+        self._encodes_started = 0
         for input_path in sorted_paths:
             output_path = self._create_output_path(input_path, output_dir)
 
@@ -939,6 +1627,9 @@ class Orchestrator:
                 )
             )
 
+        if self._tasks and (self.config.dedupe_inputs or self.history is not None):
+            await asyncio.to_thread(self._identify_tasks, report)
+
         if not self._tasks:
             report.completed_at = datetime.now()
             if on_complete:
@@ -958,8 +1649,12 @@ class Orchestrator:
         # Stage 2: Process queue
         total_tasks = len(self._tasks)
 
-        # Use concurrent processing if max_concurrent > 1
-        if self.config.max_concurrent > 1:
+        # Pipeline mode overlaps stages across files and hybrid encoder
+        # pools dispatch per file; otherwise use concurrent processing if
+        # max_concurrent > 1
+        if self.config.enable_pipeline or self.config.encoder_pools:
+            await self._process_tasks_pipelined(report, on_progress, total_tasks)
+        elif self.config.max_concurrent > 1:
             await self._process_tasks_concurrent(report, on_progress, total_tasks)
         else:
             await self._process_tasks_sequential(report, on_progress, total_tasks)
@@ -991,6 +1686,180 @@ class Orchestrator:
 
         return report
 
+    async def run_stream(
+        self,
+        candidates: AsyncIterable[Path | FolderVideoInfo] | Iterable[Path | FolderVideoInfo],
+        output_dir: Path | None = None,
+        on_progress: ProgressCallback | None = None,
+        on_complete: CompleteCallback | None = None,
+    ) -> ConversionReport:
+        """Run batch conversion on videos as they are discovered.
+
+        Unlike run(), this does not wait for the full input list. Each
+        candidate is queued, added to the session and handed to the
+        encoders as soon as it arrives, so encoding overlaps with folder
+        scanning and probing. Back-pressure from busy encoders pauses
+        consumption of the iterator. Queue priority ordering does not
+        apply, since the full set of files is never known up front.
+
+        With dedupe_inputs, a file with the same content as one already
+        queued is not encoded; its output is created from that file's
+        output once the stream has drained.
+
+        Args:
+            candidates: Input videos, e.g. from
+                FolderExtractor.get_conversion_candidates_async(). Items may
+                be paths or FolderVideoInfo; codec info carried by the
+                latter is reused instead of probing again.
+            output_dir: Directory for output files. Uses original dirs if None.
+            on_progress: Optional progress callback.
+            on_complete: Optional completion callback.
+
+        Returns:
+            ConversionReport with batch statistics.
+
+        Example:
+            >>> extractor = FolderExtractor(Path("~/Videos"))
+            >>> report = await orchestrator.run_stream(
+            ...     extractor.get_conversion_candidates_async()
+            ... )
+        """
+        self._cancelled = False
+        self._paused = False
+        self._pause_event.set()
+        self._batch_status = BatchStatus.RUNNING
+        self._current_session_id = self._generate_session_id()
+        self._tasks = []
+        self._encodes_started = 0
+
+        report = ConversionReport(
+            session_id=self._current_session_id,
+            started_at=datetime.now(),
+            total_files=0,
+            retain_results=self.config.retain_results,
+        )
+
+        self._emit_progress(
+            on_progress,
+            ConversionStage.DISCOVERY,
+            ConversionStatus.IN_PROGRESS,
+            message="Discovering videos...",
+        )
+
+        if self.session_manager:
+            self._current_session = self.session_manager.create_session(
+                video_paths=[],
+                output_dir=output_dir,
+                config=self.config,
+            )
+            self._current_session_id = self._current_session.session_id
+            report.session_id = self._current_session_id
+
+        # Streamed duplicates wait for their first copy (see _finish_stream_duplicates)
+        by_size: dict[int, list[ConversionTask]] = {}
+        held: list[tuple[ConversionTask, ConversionTask]] = []
+        held_outputs: set[Path] = set()
+
+        async def discover() -> AsyncIterator[StageJob]:
+            async def items() -> AsyncIterator[Path | FolderVideoInfo]:
+                if isinstance(candidates, AsyncIterable):
+                    async for item in candidates:
+                        yield item
+                else:
+                    for item in candidates:
+                        yield item
+
+            async for item in items():
+                if isinstance(item, Path):
+                    input_path, codec_info = item, None
+                else:
+                    input_path, codec_info = item.path, item.codec_info
+
+                report.total_files += 1
+                output_path = self._create_output_path(input_path, output_dir)
+
+                # Skip if output already exists
+                if output_path.exists():
+                    logger.info(f"Skipping (output exists): {input_path.name}")
+                    report.skipped += 1
+                    continue
+
+                task = ConversionTask(
+                    input_path=input_path,
+                    output_path=output_path,
+                    codec_info=codec_info,
+                )
+                first = None
+                if self.config.dedupe_inputs:
+                    first = await asyncio.to_thread(self._find_stream_duplicate, task, by_size)
+                if first is not None:
+                    if first.status == ConversionStatus.SKIPPED:
+                        logger.info(f"Skipping (already converted): {input_path.name}")
+                        report.skipped += 1
+                    elif output_path == first.output_path or output_path in held_outputs:
+                        logger.info(
+                            f"Skipping (same output as {first.input_path.name}): {input_path.name}"
+                        )
+                        report.skipped += 1
+                    else:
+                        if first.record_id is not None:
+                            task.record_id = _duplicate_record_id(first.record_id, input_path)
+                        held.append((first, task))
+                        held_outputs.add(output_path)
+                    continue
+
+                if self.history is not None and await asyncio.to_thread(
+                    self._is_already_converted, task
+                ):
+                    logger.info(f"Skipping (already converted): {input_path.name}")
+                    task.status = ConversionStatus.SKIPPED
+                    report.skipped += 1
+                    continue
+
+                self._tasks.append(task)
+                if self.session_manager:
+                    self.session_manager.add_videos([input_path], output_dir, self.config)
+
+                yield StageJob(
+                    input_path=input_path,
+                    output_path=output_path,
+                    task=task,
+                    video_info=None if isinstance(item, Path) else item,
+                    codec_info=codec_info,
+                )
+
+        await self._run_job_pipeline(discover(), report, on_progress, lambda: len(self._tasks))
+        if held:
+            logger.info(f"Reusing outputs for {len(held)} duplicate inputs")
+            await self._finish_stream_duplicates(held, report)
+
+        # Complete
+        report.completed_at = datetime.now()
+        if not self._cancelled:
+            self._batch_status = BatchStatus.COMPLETED
+            if self.session_manager:
+                self.session_manager.complete_session()
+
+        self._emit_progress(
+            on_progress,
+            ConversionStage.COMPLETE,
+            ConversionStatus.COMPLETED,
+            total_files=len(self._tasks),
+            stage_progress=1.0,
+            message=(
+                f"Completed: {report.successful} succeeded, "
+                f"{report.failed} failed, {report.skipped} skipped"
+            ),
+        )
+
+        if self._tasks:
+            self._send_batch_notification(report)
+
+        if on_complete:
+            on_complete(report)
+
+        return report
+
     async def _process_tasks_sequential(
         self,
         report: ConversionReport,
@@ -1036,7 +1905,9 @@ class Orchestrator:
             result = await self.convert_single(
                 input_path=task.input_path,
                 output_path=task.output_path,
+                codec_info=task.codec_info,
             )
+            await self._materialize_duplicates(task, result)
 
             self._handle_task_result(task, result, report)
 
@@ -1057,9 +1928,6 @@ class Orchestrator:
             f"Starting concurrent processing with max_concurrent={self.config.max_concurrent}"
         )
 
-        # Create a mapping of task index to task for result handling
-        task_map = dict(enumerate(self._tasks))
-
         def on_aggregated_progress(agg_progress: AggregatedProgress) -> None:
             """Handle aggregated progress from concurrent processor."""
             if on_progress:
@@ -1074,6 +1942,8 @@ class Orchestrator:
                     message = f"Converting: {files_str}"
                 else:
                     message = f"Processing: {agg_progress.completed_jobs}/{agg_progress.total_jobs} completed"
+                if self.config.adaptive_concurrency:
+                    message += f" [{agg_progress.concurrency_limit} parallel]"
 
                 self._emit_progress(
                     on_progress,
@@ -1097,31 +1967,211 @@ class Orchestrator:
 
             task.status = ConversionStatus.IN_PROGRESS
 
-            # Convert the file
+            # Convert the file, feeding encoder progress into the aggregate
             result = await self.convert_single(
                 input_path=task.input_path,
                 output_path=task.output_path,
+                codec_info=task.codec_info,
+                on_progress_info=lambda info: progress_callback(info.percentage / 100.0),
             )
+            await self._materialize_duplicates(task, result)
 
             return result
 
-        # Process all tasks concurrently
-        results = await self._concurrent_processor.process_batch(
-            items=self._tasks,
-            processor=process_task,
-            on_progress=on_aggregated_progress,
+        def on_result(
+            task: ConversionTask,
+            result: ConversionResult | None,
+            error: BaseException | None,
+        ) -> None:
+            """Apply a finished task to the report and session."""
+            if result is not None:
+                self._handle_task_result(task, result, report)
+            else:
+                # Task failed with exception
+                task.status = ConversionStatus.FAILED
+                task.error = "Task failed with exception"
+
+        if not self.config.retain_results:
+            # Stream results to the report as workers finish them
+            await self._concurrent_processor.process_stream(
+                items=self._tasks,
+                processor=process_task,
+                on_result=on_result,
+                on_progress=on_aggregated_progress,
+            )
+        else:
+            # Process all tasks concurrently
+            results = await self._concurrent_processor.process_batch(
+                items=self._tasks,
+                processor=process_task,
+                on_progress=on_aggregated_progress,
+            )
+
+            # Handle results and update report
+            for task, result in zip(self._tasks, results, strict=True):
+                on_result(task, result, None)
+
+        # Check if cancelled
+        if self._cancelled:
+            report.cancelled = True
+            self._batch_status = BatchStatus.CANCELLED
+            if self.session_manager:
+                self.session_manager.cancel_session()
+
+    async def _process_tasks_pipelined(
+        self,
+        report: ConversionReport,
+        on_progress: ProgressCallback | None,
+        total_tasks: int,
+    ) -> None:
+        """Process tasks through separate encode, verify and finalize pools.
+
+        Each stage has its own concurrency limit and a bounded queue in
+        front of it, so a new file starts encoding as soon as an encoder
+        finishes, while validation, VMAF and timestamp sync of earlier
+        files continue in their own stages.
+
+        Args:
+            report: The conversion report to update.
+            on_progress: Optional progress callback.
+            total_tasks: Total number of tasks.
+        """
+        jobs = (
+            StageJob(
+                input_path=task.input_path,
+                output_path=task.output_path,
+                task=task,
+                codec_info=task.codec_info,
+            )
+            for task in self._tasks
         )
+        await self._run_job_pipeline(jobs, report, on_progress, lambda: total_tasks)
 
-        # Handle results and update report
-        for i, result in enumerate(results):
-            if i in task_map:
-                task = task_map[i]
-                if result is not None:
-                    self._handle_task_result(task, result, report)
-                else:
-                    # Task failed with exception
-                    task.status = ConversionStatus.FAILED
-                    task.error = "Task failed with exception"
+    def _build_job_pipeline(
+        self,
+        report: ConversionReport,
+        on_progress: ProgressCallback | None,
+        total_tasks: Callable[[], int],
+    ) -> tuple[StagedPipeline[StageJob], Callable[[StageJob, BaseException | None], None]]:
+        """Create the stage pipeline and completion handler for batch jobs.
+
+        With enable_pipeline, encode, verify and finalize run as separate
+        stages. Otherwise a single stage runs all three steps per file.
+        The encode stage has max_concurrent workers, or the total slot
+        count of the encoder pools in hybrid mode.
+
+        Args:
+            report: The conversion report to update.
+            on_progress: Optional progress callback.
+            total_tasks: Returns the current total number of tasks.
+
+        Returns:
+            Tuple of (pipeline, completion callback).
+        """
+        completed = 0
+
+        async def encode(job: StageJob) -> bool:
+            # Check for pause/cancel before taking an encoder slot
+            await self._pause_event.wait()
+            if self._cancelled:
+                return False
+
+            if job.task is not None:
+                job.task.status = ConversionStatus.IN_PROGRESS
+            return await self._run_encode_stage(job)
+
+        async def convert(job: StageJob) -> bool:
+            if await encode(job) and await self._run_verify_stage(job):
+                await self._run_finalize_stage(job)
+            return True
+
+        def on_job_done(job: StageJob, error: BaseException | None) -> None:
+            nonlocal completed
+            task = job.task
+            if task is None:
+                return
+
+            if error is not None:
+                job.result = ConversionResult(
+                    success=False,
+                    request=job.request
+                    or ConversionRequest(input_path=job.input_path, output_path=job.output_path),
+                    error_message=f"Pipeline error: {error}",
+                )
+
+            if job.result is None:
+                # Never started because the batch was cancelled
+                task.status = ConversionStatus.CANCELLED
+                return
+
+            self._handle_task_result(task, job.result, report)
+            completed += 1
+            total = total_tasks()
+            self._emit_progress(
+                on_progress,
+                ConversionStage.CONVERT,
+                ConversionStatus.IN_PROGRESS,
+                current_file=task.input_path.name,
+                current_index=completed,
+                total_files=total,
+                stage_progress=completed / total if total else 1.0,
+                message=f"Processed {completed}/{total}: {task.input_path.name}",
+            )
+
+        stages: list[PipelineStage[StageJob]]
+        if self.config.enable_pipeline:
+            stages = [
+                PipelineStage("encode", encode, self._encoder_slots),
+                PipelineStage(
+                    "verify", self._run_verify_stage, self.config.pipeline_verify_concurrency
+                ),
+                PipelineStage(
+                    "finalize",
+                    self._run_finalize_stage,
+                    self.config.pipeline_finalize_concurrency,
+                ),
+            ]
+        else:
+            stages = [PipelineStage("encode", convert, self._encoder_slots)]
+
+        pipeline: StagedPipeline[StageJob] = StagedPipeline(
+            stages, queue_size=self.config.pipeline_queue_size
+        )
+        return pipeline, on_job_done
+
+    async def _run_job_pipeline(
+        self,
+        jobs: Iterable[StageJob] | AsyncIterable[StageJob],
+        report: ConversionReport,
+        on_progress: ProgressCallback | None,
+        total_tasks: Callable[[], int],
+    ) -> None:
+        """Run batch jobs through the stage pipeline.
+
+        Args:
+            jobs: Jobs to process. May be an async iterable that is still
+                discovering files.
+            report: The conversion report to update.
+            on_progress: Optional progress callback.
+            total_tasks: Returns the current total number of tasks.
+        """
+        pipeline, on_job_done = self._build_job_pipeline(report, on_progress, total_tasks)
+        logger.info(
+            "Starting pipelined processing: "
+            + ", ".join(f"{stage.name}={stage.concurrency}" for stage in pipeline.stages)
+        )
+        self._pipeline = pipeline
+
+        try:
+            await pipeline.run(jobs, on_item_done=on_job_done)
+        finally:
+            self._pipeline = None
+
+        encode_stats = pipeline.stats["encode"]
+        logger.info(
+            f"Pipeline finished in {pipeline.elapsed:.1f}s "
+            f"(encoder utilization {encode_stats.utilization(pipeline.elapsed):.0%})"
+        )
 
         # Check if cancelled
         if self._cancelled:
@@ -1146,9 +2196,15 @@ class Orchestrator:
         Returns:
             RecoveryAction if failed and action is needed, None if successful.
         """
-        task.result = result
+        self._record_history(task, result)
+        for duplicate in task.duplicates:
+            self._handle_duplicate_result(task, duplicate, result, report)
+
+        if self.config.retain_results:
+            task.result = result
         if result.success:
             task.status = ConversionStatus.COMPLETED
+            self.cost_model.observe(result)
             # Update session state
             if self.session_manager and self._current_session:
                 video_entry = self._find_video_entry(task.input_path)
@@ -1200,6 +2256,39 @@ class Orchestrator:
         report.add_result(result)
         return recovery_action
 
+    def _handle_duplicate_result(
+        self,
+        task: ConversionTask,
+        duplicate: ConversionTask,
+        result: ConversionResult,
+        report: ConversionReport,
+    ) -> None:
+        """Handle the result of a duplicate whose output was reused.
+
+        A duplicate without a result shares the failure of its task.
+
+        Args:
+            task: The task that was encoded.
+            duplicate: One of the task's duplicates.
+            result: The task's conversion result.
+            report: The conversion report to update.
+        """
+        duplicate_result = duplicate.result
+        duplicate.result = None
+        if duplicate_result is None:
+            reason = result.error_message if not result.success else None
+            duplicate_result = ConversionResult(
+                success=False,
+                request=ConversionRequest(
+                    input_path=duplicate.input_path,
+                    output_path=duplicate.output_path,
+                ),
+                error_message=(
+                    f"Duplicate of {task.input_path.name}: {reason or 'output was not reused'}"
+                ),
+            )
+        self._handle_task_result(duplicate, duplicate_result, report)
+
     def _find_video_entry(self, input_path: Path) -> VideoEntry | None:
         """Find a VideoEntry in the current session by input path.
 
@@ -1212,10 +2301,7 @@ class Orchestrator:
         if self._current_session is None:
             return None
 
-        for video in self._current_session.pending_videos:
-            if video.path == input_path:
-                return video
-        return None
+        return self._current_session.find_pending_video(input_path)
 
     async def resume_session(
         self,
@@ -1313,18 +2399,13 @@ class Orchestrator:
         Returns:
             ConversionReport with batch statistics.
         """
-        # Discover video files
-        video_files: list[Path] = []
-
-        if recursive:
-            for ext in VIDEO_EXTENSIONS:
-                video_files.extend(input_dir.rglob(f"*{ext}"))
-        else:
-            for ext in VIDEO_EXTENSIONS:
-                video_files.extend(input_dir.glob(f"*{ext}"))
-
-        # Sort by name for consistent ordering
-        video_files.sort()
+        # Discover video files, sorted by name for consistent ordering
+        video_files = sorted(
+            video.path
+            for video in scan_video_files(
+                input_dir, recursive=recursive, extensions=VIDEO_EXTENSIONS
+            )
+        )
 
         return await self.run(
             input_paths=video_files,
@@ -1339,6 +2420,12 @@ class Orchestrator:
         self._batch_status = BatchStatus.CANCELLED
         if self._converter:
             self._converter.cancel()
+        if self._dispatcher:
+            self._dispatcher.cancel()
+        for segmented in list(self._segmented):
+            segmented.cancel()
+        if self._pipeline:
+            self._pipeline.cancel()
         # Also resume if paused, so the loop can exit
         self._pause_event.set()
         logger.info("Conversion cancelled by user")
@@ -0,0 +1,285 @@
+"""Staged pipeline execution for overlapping conversion stages across files.
+
+This module implements a multi-stage asynchronous pipeline in which every
+stage owns its own worker pool and hands items to the next stage through a
+bounded queue. While file N is being validated or analyzed, file N+1 can
+already occupy the encoder, so expensive post-encode work no longer holds
+an encoder slot.
+
+SDS Reference: SDS-C01-002
+SRS Reference: SRS-604 (Concurrent Processing Support)
+
+Example:
+    >>> from video_converter.core.pipeline import PipelineStage, StagedPipeline
+    >>>
+    >>> async def encode(job) -> bool:
+    ...     ...  # run ffmpeg
+    ...     return True  # continue to next stage
+    >>>
+    >>> async def verify(job) -> bool:
+    ...     ...  # validate output
+    ...     return True
+    >>>
+    >>> pipeline = StagedPipeline(
+    ...     [
+    ...         PipelineStage("encode", encode, concurrency=2),
+    ...         PipelineStage("verify", verify, concurrency=4),
+    ...     ],
+    ...     queue_size=2,
+    ... )
+    >>> completed = await pipeline.run(jobs)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Marker placed on a stage queue to tell one worker to exit
+_STOP = object()
+
+
+@dataclass
+class PipelineStage(Generic[T]):
+    """Definition of a single pipeline stage.
+
+    The handler returns True to pass the item on to the next stage, or
+    False to finish the item early (e.g. after a failed encode).
+
+    Attributes:
+        name: Stage name used for logging and statistics.
+        handler: Async function processing one item.
+        concurrency: Number of workers for this stage.
+    """
+
+    name: str
+    handler: Callable[[T], Awaitable[bool]]
+    concurrency: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate stage settings."""
+        self.concurrency = max(1, self.concurrency)
+
+
+@dataclass
+class StageStats:
+    """Runtime statistics for a pipeline stage.
+
+    Attributes:
+        name: Stage name.
+        concurrency: Configured number of workers.
+        processed: Number of items handled by the stage.
+        failed: Number of items whose handler raised an exception.
+        active: Number of items currently being handled.
+        peak_active: Highest number of simultaneously handled items.
+        busy_seconds: Total handler time summed over all workers.
+    """
+
+    name: str
+    concurrency: int
+    processed: int = 0
+    failed: int = 0
+    active: int = 0
+    peak_active: int = 0
+    busy_seconds: float = 0.0
+
+    def utilization(self, elapsed: float) -> float:
+        """Calculate worker utilization over a time window.
+
+        Args:
+            elapsed: Wall-clock duration of the run in seconds.
+
+        Returns:
+            Fraction (0.0-1.0) of worker capacity that was busy.
+        """
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / (elapsed * self.concurrency))
+
+
+ItemCallback = Callable[[T, "BaseException | None"], None]
+
+
+class StagedPipeline(Generic[T]):
+    """Runs items through a sequence of stages with per-stage worker pools.
+
+    Each stage has a fixed number of workers and an input queue bounded by
+    ``queue_size``. Back-pressure from a slow stage therefore propagates
+    upstream instead of buffering an unbounded number of finished encodes.
+
+    Attributes:
+        stages: The configured pipeline stages.
+        queue_size: Capacity of each inter-stage queue.
+    """
+
+    def __init__(
+        self,
+        stages: list[PipelineStage[T]],
+        *,
+        queue_size: int = 2,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            stages: Stages in execution order. At least one is required.
+            queue_size: Capacity of each inter-stage queue.
+
+        Raises:
+            ValueError: If no stages are given.
+        """
+        if not stages:
+            raise ValueError("StagedPipeline requires at least one stage")
+
+        self.stages = list(stages)
+        self.queue_size = max(1, queue_size)
+        self._cancelled = False
+        self._stats: dict[str, StageStats] = {}
+        self._elapsed = 0.0
+
+    @property
+    def stats(self) -> dict[str, StageStats]:
+        """Get statistics for each stage from the last run."""
+        return self._stats
+
+    @property
+    def elapsed(self) -> float:
+        """Get wall-clock duration of the last run in seconds."""
+        return self._elapsed
+
+    def cancel(self) -> None:
+        """Stop feeding new items into the pipeline.
+
+        Items already inside the pipeline are drained through their
+        current stage handlers, which are expected to check their own
+        cancellation state.
+        """
+        self._cancelled = True
+
+    async def run(
+        self,
+        items: Iterable[T] | AsyncIterable[T],
+        on_item_done: ItemCallback[T] | None = None,
+    ) -> int:
+        """Run all items through the pipeline.
+
+        Args:
+            items: Items to process. May be a regular or an async iterable,
+                so producers can stream items while earlier ones are encoding.
+            on_item_done: Optional callback invoked once per item after it
+                leaves the pipeline, with the exception raised by a stage
+                handler (or None if the item finished normally).
+
+        Returns:
+            Number of items that left the pipeline.
+
+        Raises:
+            Exception: Re-raises any error raised by the item source after
+                all in-flight items have drained.
+        """
+        self._cancelled = False
+        self._stats = {
+            s.name: StageStats(name=s.name, concurrency=s.concurrency) for s in self.stages
+        }
+        queues: list[asyncio.Queue[object]] = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in self.stages
+        ]
+        remaining_workers = [s.concurrency for s in self.stages]
+        completed = 0
+        start_time = time.perf_counter()
+
+        def finish(item: T, error: BaseException | None) -> None:
+            nonlocal completed
+            completed += 1
+            if on_item_done is None:
+                return
+            try:
+                on_item_done(item, error)
+            except Exception as e:
+                logger.warning(f"Pipeline completion callback error: {e}")
+
+        async def feed() -> None:
+            try:
+                if isinstance(items, AsyncIterable):
+                    async for item in items:
+                        if self._cancelled:
+                            break
+                        await queues[0].put(item)
+                else:
+                    for item in items:
+                        if self._cancelled:
+                            break
+                        await queues[0].put(item)
+            finally:
+                for _ in range(self.stages[0].concurrency):
+                    await queues[0].put(_STOP)
+
+        async def work(index: int) -> None:
+            stage = self.stages[index]
+            stats = self._stats[stage.name]
+            is_last = index == len(self.stages) - 1
+
+            while True:
+                entry = await queues[index].get()
+                if entry is _STOP:
+                    break
+                item: T = entry  # type: ignore[assignment]
+
+                stats.active += 1
+                stats.peak_active = max(stats.peak_active, stats.active)
+                started = time.perf_counter()
+                try:
+                    proceed = await stage.handler(item)
+                except Exception as e:
+                    logger.error(f"Pipeline stage '{stage.name}' failed: {e}")
+                    stats.failed += 1
+                    finish(item, e)
+                    continue
+                finally:
+                    stats.active -= 1
+                    stats.processed += 1
+                    stats.busy_seconds += time.perf_counter() - started
+
+                if proceed and not is_last:
+                    await queues[index + 1].put(item)
+                else:
+                    finish(item, None)
+
+            remaining_workers[index] -= 1
+            if remaining_workers[index] == 0 and not is_last:
+                for _ in range(self.stages[index + 1].concurrency):
+                    await queues[index + 1].put(_STOP)
+
+        workers = [
+            asyncio.create_task(work(index))
+            for index, stage in enumerate(self.stages)
+            for _ in range(stage.concurrency)
+        ]
+        try:
+            feed_outcome = await asyncio.gather(feed(), return_exceptions=True)
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            for worker in workers:
+                worker.cancel()
+            raise
+
+        self._elapsed = time.perf_counter() - start_time
+        for stats in self._stats.values():
+            logger.debug(
+                f"Pipeline stage '{stats.name}': {stats.processed} items, "
+                f"peak {stats.peak_active}/{stats.concurrency}, "
+                f"utilization {stats.utilization(self._elapsed):.0%}"
+            )
+
+        source_error = feed_outcome[0]
+        if isinstance(source_error, BaseException):
+            raise source_error
+
+        return completed
@@ -0,0 +1,265 @@
+"""Cost model for ordering the batch conversion queue.
+
+This module estimates, for every queued file, how long its encode will
+take and how many bytes converting it is expected to reclaim. The
+estimates drive the cost-based queue priorities:
+
+- ``SHORTEST_JOB``: shortest estimated encode first, for fast feedback.
+- ``LONGEST_JOB``: longest estimated encode first (LPT), which keeps the
+  tail of a concurrent batch short and minimizes its makespan.
+- ``MAX_SAVINGS``: most bytes reclaimed per encode-second first, so a
+  fixed conversion window recovers as much storage as possible.
+
+Encode time is estimated as duration × (pixels / 1080p pixels) divided
+by the encoder's speed (realtime multiple at 1080p). Encoder speeds
+start from conservative defaults and are refined from completed
+conversions. Expected savings compare the source video bitrate with a
+target HEVC bitrate scaled to the source resolution.
+
+SDS Reference: SDS-C01-002
+SRS Reference: SRS-601 (Orchestrator Workflow)
+
+Example:
+    >>> model = TaskCostModel()
+    >>> estimates = [model.estimate(path, codec_info) for path, codec_info in items]
+    >>> ordered = model.order(estimates, QueuePriority.MAX_SAVINGS)
+    >>> model.observe(result)  # refine encoder speed after each conversion
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from video_converter.core.types import QueuePriority
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from video_converter.core.types import ConversionResult
+    from video_converter.processors.codec_detector import CodecInfo
+
+logger = logging.getLogger(__name__)
+
+# Pixel count all encoder speeds are normalized to (1920x1080)
+REFERENCE_PIXELS = 1920 * 1080
+
+# Target HEVC video bitrate for a 1080p source (bits per second)
+DEFAULT_TARGET_BITRATE = 6_000_000
+
+# Source bitrate assumed when only the file size is known (bits per second)
+ASSUMED_SOURCE_BITRATE = 16_000_000
+
+# Encode speed at 1080p (realtime multiple) before any history is observed
+DEFAULT_ENCODER_SPEEDS: dict[str, float] = {
+    "hevc_videotoolbox": 8.0,
+    "libx265": 1.0,
+}
+
+# Speed assumed for encoders without a default or observation
+DEFAULT_ENCODER_SPEED = 2.0
+
+# Weight of a new observation in the moving average of encoder speed
+DEFAULT_SPEED_SMOOTHING = 0.3
+
+# Codecs that are not re-encoded, so converting them reclaims nothing
+_EFFICIENT_CODECS = frozenset({"hevc", "h265", "av1"})
+
+
+@dataclass(frozen=True)
+class TaskEstimate:
+    """Estimated cost and benefit of converting one file.
+
+    Attributes:
+        path: Path to the input video.
+        encode_seconds: Estimated wall-clock encode time in seconds.
+        expected_savings: Estimated bytes reclaimed by the conversion.
+    """
+
+    path: Path
+    encode_seconds: float
+    expected_savings: int
+
+    @property
+    def savings_per_second(self) -> float:
+        """Get the expected bytes reclaimed per encode-second."""
+        if self.encode_seconds <= 0:
+            return float(self.expected_savings)
+        return self.expected_savings / self.encode_seconds
+
+
+class TaskCostModel:
+    """Estimates encode time and storage savings for queued files.
+
+    The model keeps an exponential moving average of each encoder's
+    speed, normalized to 1080p, learned from successful conversion
+    results. It is safe to update from several worker threads.
+
+    Attributes:
+        target_bitrate: Target HEVC video bitrate at 1080p in bits/s.
+        smoothing: Weight of a new speed observation (0.0-1.0).
+    """
+
+    def __init__(
+        self,
+        target_bitrate: int = DEFAULT_TARGET_BITRATE,
+        smoothing: float = DEFAULT_SPEED_SMOOTHING,
+    ) -> None:
+        """Initialize the cost model.
+
+        Args:
+            target_bitrate: Target HEVC video bitrate at 1080p in bits/s.
+            smoothing: Weight of a new speed observation (0.0-1.0).
+        """
+        self.target_bitrate = target_bitrate
+        self.smoothing = min(1.0, max(0.0, smoothing))
+        self._speeds: dict[str, float] = dict(DEFAULT_ENCODER_SPEEDS)
+        self._lock = threading.Lock()
+
+    def speed_for(self, encoder: str | None) -> float:
+        """Get the estimated speed of an encoder.
+
+        Args:
+            encoder: FFmpeg encoder name, or None if unknown.
+
+        Returns:
+            Encode speed as a realtime multiple at 1080p.
+        """
+        if encoder is None:
+            return DEFAULT_ENCODER_SPEED
+        with self._lock:
+            return self._speeds.get(encoder, DEFAULT_ENCODER_SPEED)
+
+    def observe(self, result: ConversionResult) -> None:
+        """Refine the encoder speed estimate from a finished conversion.
+
+        Failed conversions and results without an encoder or speed are
+        ignored. Results without codec information are treated as 1080p.
+
+        Args:
+            result: The conversion result.
+        """
+        if not result.success or not result.encoder or result.speed_ratio <= 0:
+            return
+
+        codec_info = result.request.codec_info
+        pixels = codec_info.width * codec_info.height if codec_info else REFERENCE_PIXELS
+        speed = result.speed_ratio * max(pixels, 1) / REFERENCE_PIXELS
+
+        with self._lock:
+            previous = self._speeds.get(result.encoder)
+            if previous is None:
+                self._speeds[result.encoder] = speed
+            else:
+                self._speeds[result.encoder] = previous + (speed - previous) * self.smoothing
+            logger.debug(
+                f"Encoder speed for {result.encoder}: {self._speeds[result.encoder]:.2f}x at 1080p"
+            )
+
+    def estimate(
+        self,
+        path: Path,
+        codec_info: CodecInfo | None = None,
+        *,
+        size: int | None = None,
+        encoder: str | None = None,
+    ) -> TaskEstimate:
+        """Estimate the cost and savings of converting a file.
+
+        Without codec information, the duration is derived from the file
+        size at an assumed source bitrate and the resolution is taken as
+        1080p.
+
+        Args:
+            path: Path to the input video.
+            codec_info: Codec analysis of the input, if known.
+            size: File size in bytes. Read from disk if not given.
+            encoder: FFmpeg encoder expected to run the job.
+
+        Returns:
+            TaskEstimate for the file.
+        """
+        if codec_info is not None:
+            size = codec_info.size
+        elif size is None:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = 0
+
+        if codec_info is not None and codec_info.duration > 0:
+            duration = codec_info.duration
+            pixels = max(codec_info.width * codec_info.height, 1)
+            video_bitrate = codec_info.bitrate or int(size * 8 / duration)
+            total_bitrate = size * 8 / duration
+        else:
+            duration = size * 8 / ASSUMED_SOURCE_BITRATE
+            pixels = REFERENCE_PIXELS
+            video_bitrate = ASSUMED_SOURCE_BITRATE
+            total_bitrate = ASSUMED_SOURCE_BITRATE
+
+        scale = pixels / REFERENCE_PIXELS
+        encode_seconds = duration * scale / self.speed_for(encoder)
+
+        if codec_info is not None and codec_info.codec.lower() in _EFFICIENT_CODECS:
+            savings = 0
+        else:
+            # Audio and container overhead are copied, only video shrinks
+            other_bitrate = max(0.0, total_bitrate - video_bitrate)
+            target = min(video_bitrate, self.target_bitrate * scale)
+            expected_output = duration * (target + other_bitrate) / 8
+            savings = max(0, int(size - expected_output))
+
+        return TaskEstimate(
+            path=path,
+            encode_seconds=encode_seconds,
+            expected_savings=savings,
+        )
+
+    @staticmethod
+    def order(estimates: list[TaskEstimate], priority: QueuePriority) -> list[TaskEstimate]:
+        """Order estimates according to a cost-based priority.
+
+        Ties keep their original order.
+
+        Args:
+            estimates: Estimates for the queued files.
+            priority: Queue priority to apply.
+
+        Returns:
+            Estimates in processing order. Non cost-based priorities
+            return the input order unchanged.
+        """
+        if priority == QueuePriority.SHORTEST_JOB:
+            return sorted(estimates, key=lambda e: e.encode_seconds)
+
+        if priority == QueuePriority.LONGEST_JOB:
+            return sorted(estimates, key=lambda e: e.encode_seconds, reverse=True)
+
+        if priority == QueuePriority.MAX_SAVINGS:
+            return sorted(estimates, key=lambda e: e.savings_per_second, reverse=True)
+
+        return list(estimates)
+
+
+def estimate_makespan(estimates: list[TaskEstimate], workers: int) -> float:
+    """Estimate the wall-clock time to process estimates in order.
+
+    Each job is started on the worker that becomes free first, which is
+    how the concurrent and pipelined processors drain the queue.
+
+    Args:
+        estimates: Estimates in processing order.
+        workers: Number of jobs run at once.
+
+    Returns:
+        Estimated batch duration in seconds.
+    """
+    finish_times = [0.0] * max(1, workers)
+    for estimate in estimates:
+        start = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, start + estimate.encode_seconds)
+    return max(finish_times)
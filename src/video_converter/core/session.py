@@ -3,6 +3,12 @@
 This module implements persistent session state tracking to enable
 resuming interrupted video conversions.
 
+A session is stored as a JSON snapshot plus an append-only journal of
+JSON lines. Completing or failing a video appends one small event to the
+journal instead of rewriting the snapshot. The journal is replayed on
+load and folded into a new snapshot once it grows as long as the session
+itself, so the cost of persisting each video stays constant.
+
 SDS Reference: SDS-C01-003
 SRS Reference: SRS-603 (Session State Management)
 
@@ -32,9 +38,11 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import threading
 import uuid
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -53,8 +61,25 @@ logger = logging.getLogger(__name__)
 # Default paths for session state storage
 DEFAULT_STATE_DIR = Path.home() / ".local" / "share" / "video_converter" / "sessions"
 DEFAULT_STATE_FILE = "current_session.json"
+DEFAULT_JOURNAL_FILE = "current_session.journal"
 SESSION_HISTORY_DIR = "history"
 
+# Minimum number of journal events before the journal is compacted
+DEFAULT_COMPACT_THRESHOLD = 1000
+
+
+class JournalSync(Enum):
+    """When session files are flushed to stable storage with fsync.
+
+    ALWAYS syncs every journal event, so no completed video is lost on
+    power failure. SNAPSHOT only syncs snapshots, and the journal is
+    left to the OS. NEVER does not call fsync at all.
+    """
+
+    ALWAYS = "always"
+    SNAPSHOT = "snapshot"
+    NEVER = "never"
+
 
 class SessionStateError(Exception):
     """Base exception for session state errors."""
@@ -93,6 +118,8 @@ class SessionStateManager:
         self,
         state_dir: Path | None = None,
         auto_save_interval: int = 30,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        journal_sync: JournalSync = JournalSync.SNAPSHOT,
     ) -> None:
         """Initialize the session state manager.
 
@@ -100,6 +127,10 @@ class SessionStateManager:
             state_dir: Directory for session state files.
                       Defaults to ~/.local/share/video_converter/sessions
             auto_save_interval: Seconds between auto-saves. 0 disables auto-save.
+            compact_threshold: Minimum number of journal events before the
+                journal is folded into a new snapshot. The journal is also
+                allowed to grow to the number of videos in the session.
+            journal_sync: When session files are flushed with fsync.
         """
         self.state_dir = state_dir or DEFAULT_STATE_DIR
         self.state_dir.mkdir(parents=True, exist_ok=True)
@@ -109,6 +140,9 @@ class SessionStateManager:
         self._auto_save_interval = auto_save_interval
         self._last_save_time: datetime | None = None
         self._dirty = False
+        self._compact_threshold = compact_threshold
+        self._journal_sync = journal_sync
+        self._journal_events = 0
 
         # Check for interrupted sessions on startup
         self._check_interrupted_sessions()
@@ -123,6 +157,11 @@ class SessionStateManager:
         """Get the path to the current session state file."""
         return self.state_dir / DEFAULT_STATE_FILE
 
+    @property
+    def journal_file_path(self) -> Path:
+        """Get the path to the current session journal file."""
+        return self.state_dir / DEFAULT_JOURNAL_FILE
+
     @property
     def history_dir(self) -> Path:
         """Get the path to the session history directory."""
@@ -224,11 +263,47 @@ class SessionStateManager:
             )
 
             self._dirty = True
-            self.save()
+            self.save(force=True)
 
             logger.info(f"Created session {session_id} with {len(pending_videos)} videos")
             return self._current_session
 
+    def add_videos(
+        self,
+        video_paths: list[Path],
+        output_dir: Path | None = None,
+        config: OrchestratorConfig | None = None,
+    ) -> list[VideoEntry]:
+        """Append videos to the active session.
+
+        Used by streaming runs, where videos are discovered while earlier
+        ones are already converting. The state file is written according
+        to the auto-save interval rather than once per video.
+
+        Args:
+            video_paths: Video files to add.
+            output_dir: Directory for output files.
+            config: Orchestrator configuration with output suffix.
+
+        Returns:
+            The created video entries (empty if no session is active).
+        """
+        with self._lock:
+            if self._current_session is None:
+                return []
+
+            entries = [
+                VideoEntry(
+                    path=path,
+                    output_path=self._create_output_path(path, output_dir, config),
+                    status=ConversionStatus.PENDING,
+                )
+                for path in video_paths
+            ]
+            self._current_session.add_pending_videos(entries)
+            self._append_event({"op": "add", "videos": [e.to_dict() for e in entries]})
+            return entries
+
     def _create_output_path(
         self,
         input_path: Path,
@@ -261,6 +336,8 @@ class SessionStateManager:
     def save(self, force: bool = False) -> None:
         """Save current session state to disk.
 
+        Writes a new snapshot and empties the journal.
+
         Args:
             force: If True, save even if not dirty or interval not reached.
         """
@@ -282,8 +359,18 @@ class SessionStateManager:
                 state_file = self.state_file_path
                 self._current_session.updated_at = now
 
-                with open(state_file, "w", encoding="utf-8") as f:
+                # Replace atomically so a crash never leaves a partial snapshot
+                temp_file = state_file.with_suffix(".tmp")
+                with open(temp_file, "w", encoding="utf-8") as f:
                     json.dump(self._current_session.to_dict(), f, indent=2)
+                    if self._journal_sync != JournalSync.NEVER:
+                        f.flush()
+                        os.fsync(f.fileno())
+                temp_file.replace(state_file)
+
+                # Events replayed onto a snapshot that has them are ignored,
+                # so a crash before the journal is emptied is harmless
+                self._reset_journal()
 
                 self._last_save_time = now
                 self._dirty = False
@@ -291,6 +378,124 @@ class SessionStateManager:
             except OSError as e:
                 logger.error(f"Failed to save session state: {e}")
 
+    def _reset_journal(self) -> None:
+        """Delete the journal file."""
+        self.journal_file_path.unlink(missing_ok=True)
+        self._journal_events = 0
+
+    def _append_event(self, event: dict) -> None:
+        """Record a change to the current session in the journal.
+
+        Compacts the journal into a new snapshot once it holds as many
+        events as the session has videos, so replay never costs more
+        than reading the snapshot.
+
+        Args:
+            event: The change, with an "op" key naming its kind.
+        """
+        if self._current_session is None:
+            return
+
+        event["session_id"] = self._current_session.session_id
+        try:
+            with open(self.journal_file_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event) + "\n")
+                if self._journal_sync == JournalSync.ALWAYS:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._journal_events += 1
+        except OSError as e:
+            # Fall back to a snapshot so the change is not lost
+            logger.error(f"Failed to append to session journal: {e}")
+            self._dirty = True
+            self.save(force=True)
+            return
+
+        limit = max(self._compact_threshold, self._current_session.total_videos)
+        if self._journal_events >= limit:
+            self.save(force=True)
+
+    def _replay_journal(self, session: SessionState) -> int:
+        """Apply the journal of the current session file to a session.
+
+        Replaying an event that the snapshot already contains has no
+        effect. A truncated last line from a crash is ignored.
+
+        Args:
+            session: Session loaded from the current snapshot.
+
+        Returns:
+            Number of events found in the journal.
+        """
+        journal_file = self.journal_file_path
+        if not journal_file.exists():
+            return 0
+
+        count = 0
+        with open(journal_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring incomplete session journal entry")
+                    continue
+                if event.get("session_id") != session.session_id:
+                    continue
+                self._apply_event(session, event)
+                count += 1
+        return count
+
+    @staticmethod
+    def _find_entry(session: SessionState, path: Path) -> VideoEntry | None:
+        """Find a video of a session by input path in any state.
+
+        Args:
+            session: Session to search.
+            path: Input path of the video.
+
+        Returns:
+            The VideoEntry, or None if the session has no such video.
+        """
+        video = session.find_pending_video(path)
+        if video is not None:
+            return video
+        for video in (*session.failed_videos, *session.completed_videos):
+            if video.path == path:
+                return video
+        return None
+
+    def _apply_event(self, session: SessionState, event: dict) -> None:
+        """Apply one journal event to a session.
+
+        Args:
+            session: Session to update.
+            event: The journaled change.
+        """
+        op = event.get("op")
+        if op == "add":
+            videos = [VideoEntry.from_dict(v) for v in event["videos"]]
+            session.add_pending_videos(
+                [v for v in videos if self._find_entry(session, v.path) is None]
+            )
+        elif op == "completed":
+            video = self._find_entry(session, Path(event["path"]))
+            if video is not None and video.status != ConversionStatus.COMPLETED:
+                session.mark_video_completed(video, event["original_size"], event["converted_size"])
+            session.current_index = event["index"]
+        elif op == "failed":
+            video = self._find_entry(session, Path(event["path"]))
+            if video is not None and (
+                video.status != ConversionStatus.FAILED or video.error_message != event["error"]
+            ):
+                session.mark_video_failed(video, event["error"])
+            session.current_index = event["index"]
+        elif op == "temp_added":
+            session.add_temporary_file(Path(event["path"]))
+        elif op == "temp_removed":
+            session.remove_temporary_file(Path(event["path"]))
+        else:
+            logger.warning(f"Ignoring unknown session journal event: {op}")
+
     def load_session(self, session_id: str | None = None) -> SessionState:
         """Load a session from disk.
 
@@ -318,6 +523,8 @@ class SessionStateManager:
                     data = json.load(f)
 
                 session = SessionState.from_dict(data)
+                if session_id is None:
+                    self._journal_events = self._replay_journal(session)
                 self._current_session = session
                 self._dirty = False
                 logger.info(f"Loaded session {session.session_id}")
@@ -362,12 +569,11 @@ class SessionStateManager:
 
                 status = SessionStatus(data.get("status", "active"))
                 if status in (SessionStatus.PAUSED, SessionStatus.INTERRUPTED):
-                    total = (
-                        len(data.get("pending_videos", []))
-                        + len(data.get("completed_videos", []))
-                        + len(data.get("failed_videos", []))
-                    )
-                    completed = len(data.get("completed_videos", []))
+                    # Counts in the snapshot miss videos finished since it was written
+                    session = SessionState.from_dict(data)
+                    self._replay_journal(session)
+                    total = session.total_videos
+                    completed = len(session.completed_videos)
                     sessions.append(
                         {
                             "session_id": data.get("session_id"),
@@ -378,7 +584,7 @@ class SessionStateManager:
                             "progress": completed / total if total > 0 else 0.0,
                         }
                     )
-            except (json.JSONDecodeError, ValueError):
+            except (json.JSONDecodeError, KeyError, ValueError):
                 pass
 
         # Check history directory
@@ -430,8 +636,15 @@ class SessionStateManager:
 
             self._current_session.mark_video_completed(video, original_size, converted_size)
             self._current_session.current_index += 1
-            self._dirty = True
-            self.save()
+            self._append_event(
+                {
+                    "op": "completed",
+                    "path": str(video.path),
+                    "original_size": original_size,
+                    "converted_size": converted_size,
+                    "index": self._current_session.current_index,
+                }
+            )
 
     def mark_video_failed(self, video: VideoEntry, error: str) -> None:
         """Mark a video as failed.
@@ -446,8 +659,14 @@ class SessionStateManager:
 
             self._current_session.mark_video_failed(video, error)
             self._current_session.current_index += 1
-            self._dirty = True
-            self.save()
+            self._append_event(
+                {
+                    "op": "failed",
+                    "path": str(video.path),
+                    "error": error,
+                    "index": self._current_session.current_index,
+                }
+            )
 
     def add_temporary_file(self, path: Path) -> None:
         """Track a temporary file.
@@ -460,7 +679,7 @@ class SessionStateManager:
                 return
 
             self._current_session.add_temporary_file(path)
-            self._dirty = True
+            self._append_event({"op": "temp_added", "path": str(path)})
 
     def remove_temporary_file(self, path: Path) -> None:
         """Stop tracking a temporary file.
@@ -473,7 +692,7 @@ class SessionStateManager:
                 return
 
             self._current_session.remove_temporary_file(path)
-            self._dirty = True
+            self._append_event({"op": "temp_removed", "path": str(path)})
 
     def pause_session(self) -> bool:
         """Pause the current session.
@@ -534,9 +753,10 @@ class SessionStateManager:
             # Archive to history
             self._archive_session()
 
-            # Remove current session file
+            # Remove current session files
             if self.state_file_path.exists():
                 self.state_file_path.unlink()
+            self._reset_journal()
 
             logger.info(f"Completed session {self._current_session.session_id}")
             self._current_session = None
@@ -557,9 +777,10 @@ class SessionStateManager:
             # Archive to history
             self._archive_session()
 
-            # Remove current session file
+            # Remove current session files
             if self.state_file_path.exists():
                 self.state_file_path.unlink()
+            self._reset_journal()
 
             logger.info(f"Cancelled session {self._current_session.session_id}")
             self._current_session = None
@@ -675,6 +896,7 @@ class SessionStateManager:
                         data = json.load(f)
                     if data.get("session_id") == session_id:
                         self.state_file_path.unlink()
+                        self._reset_journal()
                         if self._current_session and self._current_session.session_id == session_id:
                             self._current_session = None
                         logger.info(f"Deleted current session {session_id}")
@@ -0,0 +1,154 @@
+"""Thread budgeting for concurrent software encodes.
+
+Left alone, every FFmpeg/libx265 process sizes its decoder threads and
+x265 thread pool to the whole machine, so several concurrent encodes
+oversubscribe the CPU and evict each other's caches. The ThreadBudget
+divides the available cores among running jobs instead. Each job gets
+an explicit thread count and, where the platform supports it, a set of
+CPUs to pin its encoder to.
+
+Allocations are sized when a job starts from the cores that are free at
+that moment and the number of jobs expected to share them. When jobs
+finish, their cores return to the budget, so jobs started later (for
+example at the tail of a batch) get a larger share.
+
+SDS Reference: SDS-C01-004
+SRS Reference: SRS-604 (Concurrent Processing Support)
+
+Example:
+    >>> budget = ThreadBudget(total_threads=16, pin_cpus=True)
+    >>> allocation = budget.allocate(expected_jobs=4)
+    >>> allocation.threads
+    4
+    >>> budget.release(allocation)
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> list[int]:
+    """Get the CPUs this process may run on.
+
+    Returns:
+        Sorted CPU ids. Falls back to 0..cpu_count-1 on platforms without
+        CPU affinity support (e.g. macOS).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def supports_cpu_affinity() -> bool:
+    """Check if processes can be pinned to CPUs on this platform."""
+    return hasattr(os, "sched_setaffinity")
+
+
+@dataclass(frozen=True)
+class ThreadAllocation:
+    """Threads and CPUs granted to one job.
+
+    Attributes:
+        threads: Number of threads the job may use.
+        cpus: CPUs the job should be pinned to, or None for no pinning.
+        id: Identifier of the allocation within its budget.
+    """
+
+    threads: int
+    cpus: tuple[int, ...] | None = None
+    id: int = field(default=0, compare=False)
+
+
+class ThreadBudget:
+    """Divides the machine's cores among concurrently running jobs.
+
+    Attributes:
+        total_threads: Number of threads shared by all jobs.
+        pin_cpus: Whether allocations include CPUs to pin jobs to.
+        min_threads: Smallest number of threads given to a job.
+    """
+
+    def __init__(
+        self,
+        total_threads: int | None = None,
+        *,
+        pin_cpus: bool = False,
+        min_threads: int = 1,
+    ) -> None:
+        """Initialize the thread budget.
+
+        Args:
+            total_threads: Number of threads to share. Defaults to the
+                number of CPUs available to this process.
+            pin_cpus: Whether to assign CPUs to jobs. Ignored on
+                platforms without CPU affinity support.
+            min_threads: Smallest number of threads given to a job.
+        """
+        cpus = available_cpus()
+        self.total_threads = max(1, total_threads or len(cpus))
+        self.pin_cpus = pin_cpus and supports_cpu_affinity()
+        self.min_threads = max(1, min_threads)
+        self._free_cpus = cpus[: self.total_threads]
+        self._allocations: dict[int, ThreadAllocation] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def threads_in_use(self) -> int:
+        """Get the number of threads granted to running jobs."""
+        with self._lock:
+            return sum(a.threads for a in self._allocations.values())
+
+    @property
+    def active_jobs(self) -> int:
+        """Get the number of jobs holding an allocation."""
+        with self._lock:
+            return len(self._allocations)
+
+    def allocate(self, expected_jobs: int = 1) -> ThreadAllocation:
+        """Grant a job its share of the free cores.
+
+        Args:
+            expected_jobs: Number of jobs, including this one, that are
+                about to share the currently free cores.
+
+        Returns:
+            The job's allocation. Release it when the job finishes.
+        """
+        with self._lock:
+            in_use = sum(a.threads for a in self._allocations.values())
+            free = max(0, self.total_threads - in_use)
+            threads = max(self.min_threads, free // max(1, expected_jobs))
+
+            cpus: tuple[int, ...] | None = None
+            if self.pin_cpus and len(self._free_cpus) >= threads:
+                cpus = tuple(self._free_cpus[:threads])
+                del self._free_cpus[:threads]
+
+            allocation = ThreadAllocation(threads=threads, cpus=cpus, id=next(self._ids))
+            self._allocations[allocation.id] = allocation
+
+        logger.debug(
+            f"Allocated {threads} thread(s) to job {allocation.id} "
+            f"({in_use + threads}/{self.total_threads} in use)"
+        )
+        return allocation
+
+    def release(self, allocation: ThreadAllocation) -> None:
+        """Return a job's threads and CPUs to the budget.
+
+        Args:
+            allocation: The allocation returned by allocate().
+        """
+        with self._lock:
+            if self._allocations.pop(allocation.id, None) is None:
+                return
+            if allocation.cpus:
+                self._free_cpus = sorted(self._free_cpus + list(allocation.cpus))
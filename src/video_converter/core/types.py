@@ -33,6 +33,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from video_converter.processors.codec_detector import CodecInfo
 
 
 class ConversionMode(Enum):
@@ -101,6 +105,10 @@ class QueuePriority(Enum):
         DATE_NEWEST: Newest files first (by modification time).
         SIZE_SMALLEST: Smallest files first.
         SIZE_LARGEST: Largest files first.
+        SHORTEST_JOB: Shortest estimated encode time first.
+        LONGEST_JOB: Longest estimated encode time first, minimizing the
+            total batch time when converting concurrently.
+        MAX_SAVINGS: Most expected bytes saved per encode-second first.
     """
 
     FIFO = "fifo"
@@ -108,6 +116,9 @@ class QueuePriority(Enum):
     DATE_NEWEST = "date_newest"
     SIZE_SMALLEST = "size_smallest"
     SIZE_LARGEST = "size_largest"
+    SHORTEST_JOB = "shortest_job"
+    LONGEST_JOB = "longest_job"
+    MAX_SAVINGS = "max_savings"
 
 
 class ConversionStage(Enum):
@@ -185,6 +196,12 @@ class ConversionRequest:
         preserve_metadata: Whether to copy metadata from original.
         bit_depth: Output bit depth (8 or 10). 10-bit for HDR content.
         hdr: Enable HDR encoding parameters for 10-bit content.
+        codec_info: Codec analysis of the input from discovery, if available.
+            Lets the converter reuse the probed duration instead of running
+            FFprobe again.
+        threads: Number of CPU threads the encode may use. None lets
+            FFmpeg and the encoder size themselves to the whole machine.
+        cpu_affinity: CPUs to pin the encoder process to, if supported.
     """
 
     input_path: Path
@@ -197,6 +214,9 @@ class ConversionRequest:
     preserve_metadata: bool = True
     bit_depth: int = 8
     hdr: bool = False
+    codec_info: CodecInfo | None = None
+    threads: int | None = None
+    cpu_affinity: tuple[int, ...] | None = None
 
     def __post_init__(self) -> None:
         """Validate and normalize fields."""
@@ -228,6 +248,10 @@ class ConversionResult:
         retry_history: Detailed history of all retry attempts.
         vmaf_score: VMAF quality score (0-100) if measured.
         vmaf_quality_level: Quality classification based on VMAF score.
+        encoder: Name of the FFmpeg encoder that produced the output
+            (e.g., "hevc_videotoolbox", "libx265").
+        encoder_pool: Name of the encoder slot pool the job ran in when
+            hybrid encoder dispatch is enabled, otherwise None.
     """
 
     success: bool
@@ -245,6 +269,8 @@ class ConversionResult:
     retry_history: list[dict] = field(default_factory=list)
     vmaf_score: float | None = None
     vmaf_quality_level: str | None = None
+    encoder: str | None = None
+    encoder_pool: str | None = None
 
     @property
     def compression_ratio(self) -> float:
@@ -318,6 +344,8 @@ class ConversionReport:
         results: Individual conversion results.
         errors: Aggregated error messages.
         warnings: Aggregated warning messages.
+        retain_results: Whether add_result() keeps each result in results.
+            When False only the aggregate statistics are updated.
     """
 
     session_id: str
@@ -334,6 +362,7 @@ class ConversionReport:
     results: list[ConversionResult] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    retain_results: bool = True
 
     @property
     def total_size_saved(self) -> int:
@@ -361,7 +390,8 @@ class ConversionReport:
         Args:
             result: The conversion result to add.
         """
-        self.results.append(result)
+        if self.retain_results:
+            self.results.append(result)
         self.total_original_size += result.original_size
         self.total_converted_size += result.converted_size
         self.total_duration_seconds += result.duration_seconds
@@ -460,7 +490,9 @@ class SessionState:
         started_at: When the session started.
         updated_at: When the session was last updated.
         current_index: Index of the file currently being processed.
-        pending_videos: List of videos waiting to be processed.
+        pending_videos: List of videos waiting to be processed, in the
+            order they were added. Backed by a dict keyed by input path,
+            so a path is pending at most once.
         completed_videos: List of successfully completed videos.
         failed_videos: List of videos that failed conversion.
         temporary_files: List of temporary files created during conversion.
@@ -496,7 +528,7 @@ class SessionState:
     @property
     def total_videos(self) -> int:
         """Get total number of videos in the session."""
-        return len(self.pending_videos) + len(self.completed_videos) + len(self.failed_videos)
+        return len(self._pending) + len(self.completed_videos) + len(self.failed_videos)
 
     @property
     def progress(self) -> float:
@@ -512,6 +544,43 @@ class SessionState:
         """Check if this session can be resumed."""
         return self.status in (SessionStatus.PAUSED, SessionStatus.INTERRUPTED)
 
+    def add_pending_videos(self, videos: list[VideoEntry]) -> None:
+        """Append videos to the pending list.
+
+        Videos whose path is already pending are ignored.
+
+        Args:
+            videos: The video entries to add.
+        """
+        for video in videos:
+            self._pending.setdefault(video.path, video)
+        self.updated_at = datetime.now()
+
+    def find_pending_video(self, path: Path) -> VideoEntry | None:
+        """Find a pending video by its input path.
+
+        Args:
+            path: Input path of the video.
+
+        Returns:
+            The pending VideoEntry, or None if no pending video has the path.
+        """
+        return self._pending.get(path)
+
+    def _remove_pending(self, video: VideoEntry) -> bool:
+        """Remove a video from the pending list.
+
+        Args:
+            video: The video entry to remove.
+
+        Returns:
+            True if the video was pending.
+        """
+        if self._pending.get(video.path) is video:
+            del self._pending[video.path]
+            return True
+        return False
+
     def mark_video_completed(
         self,
         video: VideoEntry,
@@ -528,9 +597,7 @@ class SessionState:
         video.status = ConversionStatus.COMPLETED
         video.original_size = original_size
         video.converted_size = converted_size
-        if video in self.pending_videos:
-            self.pending_videos.remove(video)
-        if video not in self.completed_videos:
+        if self._remove_pending(video) or video not in self.completed_videos:
             self.completed_videos.append(video)
         self.updated_at = datetime.now()
 
@@ -543,9 +610,7 @@ class SessionState:
         """
         video.status = ConversionStatus.FAILED
         video.error_message = error
-        if video in self.pending_videos:
-            self.pending_videos.remove(video)
-        if video not in self.failed_videos:
+        if self._remove_pending(video) or video not in self.failed_videos:
             self.failed_videos.append(video)
         self.updated_at = datetime.now()
 
@@ -577,7 +642,7 @@ class SessionState:
             "started_at": self.started_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "current_index": self.current_index,
-            "pending_videos": [v.to_dict() for v in self.pending_videos],
+            "pending_videos": [v.to_dict() for v in self._pending.values()],
             "completed_videos": [v.to_dict() for v in self.completed_videos],
             "failed_videos": [v.to_dict() for v in self.failed_videos],
             "temporary_files": [str(f) for f in self.temporary_files],
@@ -610,6 +675,25 @@ class SessionState:
         )
 
 
+def _get_pending_videos(self: SessionState) -> list[VideoEntry]:
+    """Return the pending videos in the order they were added."""
+    return list(self._pending.values())
+
+
+def _set_pending_videos(self: SessionState, videos: list[VideoEntry]) -> None:
+    """Replace the pending videos, keeping the first entry of each path."""
+    self._pending: dict[Path, VideoEntry] = {}
+    for video in videos:
+        self._pending.setdefault(video.path, video)
+
+
+# Pending videos are kept in a dict keyed by path, so finishing one does
+# not search a list; the dataclass field assigns through this property
+SessionState.pending_videos = property(  # type: ignore[assignment]
+    _get_pending_videos, _set_pending_videos, doc="Videos waiting to be processed."
+)
+
+
 # Type aliases for callbacks
 ProgressCallback = Callable[[ConversionProgress], None]
 CompleteCallback = Callable[[ConversionReport], None]
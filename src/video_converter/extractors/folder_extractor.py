@@ -18,20 +18,31 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from video_converter.utils.file_utils import scan_video_files
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 
     from video_converter.processors.codec_detector import CodecDetector, CodecInfo
+    from video_converter.processors.probe_index import ProbeIndex
 
 logger = logging.getLogger(__name__)
 
+# Default number of files analyzed in parallel during discovery
+DEFAULT_PROBE_WORKERS = os.cpu_count() or 4
+
 
 class FolderExtractorError(Exception):
     """Base exception for folder extractor operations."""
@@ -110,6 +121,7 @@ class FolderVideoInfo:
         container: Container format (e.g., "mp4", "mov").
         in_cloud: Whether file is stored in iCloud (stub file exists locally).
         stub_path: Path to iCloud stub file if in_cloud is True.
+        codec_info: Full codec analysis result (None if not analyzed).
     """
 
     path: Path
@@ -126,6 +138,7 @@ class FolderVideoInfo:
     container: str = ""
     in_cloud: bool = False
     stub_path: Path | None = None
+    codec_info: CodecInfo | None = None
 
     # Codec name variations for identification
     H264_CODECS = frozenset({"h264", "avc", "avc1", "x264"})
@@ -308,6 +321,8 @@ class FolderExtractor:
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         video_extensions: set[str] | None = None,
+        probe_index: ProbeIndex | None = None,
+        max_probe_workers: int | None = None,
     ) -> None:
         """Initialize folder extractor.
 
@@ -320,6 +335,11 @@ class FolderExtractor:
                 If None, uses DEFAULT_EXCLUDE_PATTERNS.
             video_extensions: Custom set of video file extensions.
                 If None, uses VIDEO_EXTENSIONS.
+            probe_index: Optional persistent probe index. When given, codec
+                analysis of unchanged files is read from the index instead
+                of running FFprobe.
+            max_probe_workers: Maximum number of files analyzed in parallel
+                during discovery. If None, uses DEFAULT_PROBE_WORKERS.
 
         Raises:
             FolderNotFoundError: If root_path does not exist.
@@ -335,6 +355,8 @@ class FolderExtractor:
         )
         self._video_extensions = video_extensions or self.VIDEO_EXTENSIONS
         self._codec_detector: CodecDetector | None = None
+        self._probe_index = probe_index
+        self._max_probe_workers = max(1, max_probe_workers or DEFAULT_PROBE_WORKERS)
 
         # Validate root path
         if not self._root_path.exists():
@@ -507,116 +529,132 @@ class FolderExtractor:
         """
         logger.info(f"Scanning for videos in: {self._root_path}")
 
-        pattern = "**/*" if self._recursive else "*"
-
         count = 0
         icloud_count = 0
-        seen_paths: set[Path] = set()
 
-        for path in self._root_path.glob(pattern):
-            # Skip directories
-            if not path.is_file():
+        for video in scan_video_files(
+            self._root_path,
+            recursive=self._recursive,
+            extensions=self._video_extensions,
+            exclude_patterns=self._exclude_patterns,
+            include_icloud=include_icloud,
+        ):
+            # Include patterns (excludes were already applied by the walker)
+            if not self._passes_filters(video.path):
                 continue
 
-            # Check for iCloud stub files
-            if include_icloud and self._is_video_stub(path):
-                original_path = self._get_original_path_from_stub(path)
+            count += 1
+            if video.in_cloud:
+                icloud_count += 1
+                logger.debug(f"Found iCloud stub: {video.stub_path.name} -> {video.path.name}")
+            yield video.path
 
-                # Skip if we've already seen this file (as local file)
-                if original_path in seen_paths:
-                    continue
+        logger.info(f"Scan complete: found {count} video files ({icloud_count} in iCloud)")
 
-                # Apply filters to original filename
-                if not self._passes_filters(original_path):
-                    continue
+    def _analyze_codec(self, path: Path, stat: os.stat_result | None) -> CodecInfo:
+        """Analyze a file's codec, using the probe index when configured.
 
-                seen_paths.add(original_path)
-                count += 1
-                icloud_count += 1
-                logger.debug(f"Found iCloud stub: {path.name} -> {original_path.name}")
-                yield original_path
-                continue
+        Args:
+            path: Path to the video file.
+            stat: stat() result taken before analysis, if available.
 
-            # Skip non-video files
-            if not self._is_video_file(path):
-                continue
+        Returns:
+            CodecInfo for the file.
+        """
+        if self._probe_index is None:
+            return self.codec_detector.analyze(path)
 
-            # Skip if we've already seen this file (as stub)
-            if path in seen_paths:
-                continue
+        if stat is not None:
+            cached = self._probe_index.get(path, stat)
+            if cached is not None:
+                return cached
 
-            # Apply filters
-            if not self._passes_filters(path):
-                continue
+        codec_info = self.codec_detector.analyze(path)
+        self._probe_index.put(path, codec_info, stat)
+        return codec_info
 
-            seen_paths.add(path)
-            count += 1
-            yield path
+    async def _analyze_codec_async(self, path: Path, stat: os.stat_result | None) -> CodecInfo:
+        """Analyze a file's codec asynchronously, using the probe index when configured.
 
-        logger.info(f"Scan complete: found {count} video files ({icloud_count} in iCloud)")
+        Args:
+            path: Path to the video file.
+            stat: stat() result taken before analysis, if available.
 
-    def get_video_info(self, path: Path) -> FolderVideoInfo:
-        """Get video information for a single file.
+        Returns:
+            CodecInfo for the file.
+        """
+        if self._probe_index is None:
+            return await self.codec_detector.analyze_async(path)
 
-        Handles both local files and iCloud stub files. For iCloud files,
-        the path parameter should be the original file path (not stub path).
+        if stat is not None:
+            cached = self._probe_index.get(path, stat)
+            if cached is not None:
+                return cached
+
+        codec_info = await self.codec_detector.analyze_async(path)
+        self._probe_index.put(path, codec_info, stat)
+        return codec_info
+
+    def _get_cloud_video_info(self, path: Path) -> FolderVideoInfo | None:
+        """Build video information for a file that only exists as an iCloud stub.
 
         Args:
             path: Path to the video file (original path, not stub).
 
         Returns:
-            FolderVideoInfo with file and video properties.
-            For iCloud files, in_cloud=True and stub_path is set.
-
-        Raises:
-            FileNotFoundError: If neither the file nor its stub exists.
-            InvalidVideoFileError: If the file cannot be analyzed.
+            FolderVideoInfo with in_cloud=True, or None if the file is local.
         """
-        # Check for iCloud stub
         stub_path = self._get_stub_path(path)
-        in_cloud = stub_path.exists() and not path.exists()
+        if not stub_path.exists() or path.exists():
+            return None
 
-        if in_cloud:
-            # File is in iCloud, get info from stub
-            logger.debug(f"File is in iCloud: {path.name}")
+        # File is in iCloud, get info from stub
+        logger.debug(f"File is in iCloud: {path.name}")
+        try:
+            stat = stub_path.stat()
+            # Stub file size is not the actual video size, set to 0
+            size = 0
+            modified_time = datetime.fromtimestamp(stat.st_mtime)
             try:
-                stat = stub_path.stat()
-                # Stub file size is not the actual video size, set to 0
-                size = 0
-                modified_time = datetime.fromtimestamp(stat.st_mtime)
-                try:
-                    created_time = datetime.fromtimestamp(stat.st_birthtime)
-                except AttributeError:
-                    created_time = None
-            except OSError as e:
-                logger.warning(f"Failed to get stub file stats for {path}: {e}")
-                size = 0
-                modified_time = datetime.now()
+                created_time = datetime.fromtimestamp(stat.st_birthtime)
+            except AttributeError:
                 created_time = None
+        except OSError as e:
+            logger.warning(f"Failed to get stub file stats for {path}: {e}")
+            size = 0
+            modified_time = datetime.now()
+            created_time = None
+
+        # Cannot analyze codec for iCloud-only files
+        return FolderVideoInfo(
+            path=path,
+            filename=path.name,
+            size=size,
+            modified_time=modified_time,
+            created_time=created_time,
+            codec=None,
+            duration=0.0,
+            width=0,
+            height=0,
+            fps=0.0,
+            bitrate=0,
+            container=path.suffix.lstrip(".").lower(),
+            in_cloud=True,
+            stub_path=stub_path,
+        )
 
-            # Cannot analyze codec for iCloud-only files
-            return FolderVideoInfo(
-                path=path,
-                filename=path.name,
-                size=size,
-                modified_time=modified_time,
-                created_time=created_time,
-                codec=None,
-                duration=0.0,
-                width=0,
-                height=0,
-                fps=0.0,
-                bitrate=0,
-                container=path.suffix.lstrip(".").lower(),
-                in_cloud=True,
-                stub_path=stub_path,
-            )
+    def _stat_local_file(
+        self, path: Path
+    ) -> tuple[os.stat_result | None, int, datetime, datetime | None]:
+        """Read file statistics for a local video.
 
-        # File exists locally
-        if not path.exists():
-            raise FileNotFoundError(f"Video file not found: {path}")
+        Args:
+            path: Path to the video file.
 
-        # Get file stats
+        Returns:
+            Tuple of (stat result, size, modified time, created time).
+        """
+        stat: os.stat_result | None = None
         try:
             stat = path.stat()
             size = stat.st_size
@@ -627,22 +665,28 @@ class FolderExtractor:
             size = 0
             modified_time = datetime.now()
             created_time = None
+        return stat, size, modified_time, created_time
+
+    @staticmethod
+    def _make_local_video_info(
+        path: Path,
+        size: int,
+        modified_time: datetime,
+        created_time: datetime | None,
+        codec_info: CodecInfo | None,
+    ) -> FolderVideoInfo:
+        """Build video information for a local file.
 
-        # Analyze codec
-        codec_info: CodecInfo | None = None
-        # Import exceptions first to ensure they're available in except clause
-        from video_converter.processors.codec_detector import (
-            CorruptedVideoError,
-            InvalidVideoError,
-        )
-
-        try:
-            codec_info = self.codec_detector.analyze(path)
-        except (InvalidVideoError, CorruptedVideoError) as e:
-            logger.warning(f"Failed to analyze video codec for {path}: {e}")
-        except Exception as e:
-            logger.warning(f"Unexpected error analyzing {path}: {e}")
+        Args:
+            path: Path to the video file.
+            size: File size in bytes.
+            modified_time: Last modification time.
+            created_time: Creation time (if available).
+            codec_info: Codec analysis result, or None if analysis failed.
 
+        Returns:
+            FolderVideoInfo with file and video properties.
+        """
         return FolderVideoInfo(
             path=path,
             filename=path.name,
@@ -658,8 +702,231 @@ class FolderExtractor:
             container=codec_info.container if codec_info else "",
             in_cloud=False,
             stub_path=None,
+            codec_info=codec_info,
+        )
+
+    def get_video_info(self, path: Path) -> FolderVideoInfo:
+        """Get video information for a single file.
+
+        Handles both local files and iCloud stub files. For iCloud files,
+        the path parameter should be the original file path (not stub path).
+
+        Args:
+            path: Path to the video file (original path, not stub).
+
+        Returns:
+            FolderVideoInfo with file and video properties.
+            For iCloud files, in_cloud=True and stub_path is set.
+
+        Raises:
+            FileNotFoundError: If neither the file nor its stub exists.
+            InvalidVideoFileError: If the file cannot be analyzed.
+        """
+        cloud_info = self._get_cloud_video_info(path)
+        if cloud_info is not None:
+            return cloud_info
+
+        # File exists locally
+        if not path.exists():
+            raise FileNotFoundError(f"Video file not found: {path}")
+
+        stat, size, modified_time, created_time = self._stat_local_file(path)
+
+        # Analyze codec
+        codec_info: CodecInfo | None = None
+        # Import exceptions first to ensure they're available in except clause
+        from video_converter.processors.codec_detector import (
+            CorruptedVideoError,
+            InvalidVideoError,
         )
 
+        try:
+            codec_info = self._analyze_codec(path, stat)
+        except (InvalidVideoError, CorruptedVideoError) as e:
+            logger.warning(f"Failed to analyze video codec for {path}: {e}")
+        except Exception as e:
+            logger.warning(f"Unexpected error analyzing {path}: {e}")
+
+        return self._make_local_video_info(path, size, modified_time, created_time, codec_info)
+
+    async def get_video_info_async(self, path: Path) -> FolderVideoInfo:
+        """Get video information for a single file asynchronously.
+
+        Async version of get_video_info() that probes with
+        CodecDetector.analyze_async, so many files can be analyzed
+        concurrently from one event loop.
+
+        Args:
+            path: Path to the video file (original path, not stub).
+
+        Returns:
+            FolderVideoInfo with file and video properties.
+
+        Raises:
+            FileNotFoundError: If neither the file nor its stub exists.
+        """
+        cloud_info = self._get_cloud_video_info(path)
+        if cloud_info is not None:
+            return cloud_info
+
+        if not path.exists():
+            raise FileNotFoundError(f"Video file not found: {path}")
+
+        stat, size, modified_time, created_time = self._stat_local_file(path)
+
+        codec_info: CodecInfo | None = None
+        from video_converter.processors.codec_detector import (
+            CorruptedVideoError,
+            InvalidVideoError,
+        )
+
+        try:
+            codec_info = await self._analyze_codec_async(path, stat)
+        except (InvalidVideoError, CorruptedVideoError) as e:
+            logger.warning(f"Failed to analyze video codec for {path}: {e}")
+        except Exception as e:
+            logger.warning(f"Unexpected error analyzing {path}: {e}")
+
+        return self._make_local_video_info(path, size, modified_time, created_time, codec_info)
+
+    def _iter_video_info(
+        self, paths: Iterable[Path]
+    ) -> Iterator[tuple[Path, FolderVideoInfo | None, Exception | None]]:
+        """Analyze files on a thread pool, yielding results in input order.
+
+        At most ``max_probe_workers`` files are analyzed at a time. Closing
+        the iterator early (e.g. when a limit is reached) cancels files
+        that have not started yet.
+
+        Args:
+            paths: Files to analyze.
+
+        Yields:
+            Tuple of (path, video info or None, error or None).
+        """
+        if self._max_probe_workers <= 1:
+            for path in paths:
+                try:
+                    yield path, self.get_video_info(path), None
+                except Exception as e:
+                    yield path, None, e
+            return
+
+        path_iter = iter(paths)
+        pending: deque[tuple[Path, Future[FolderVideoInfo]]] = deque()
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_probe_workers, thread_name_prefix="folder-probe"
+        ) as executor:
+            try:
+                for path in islice(path_iter, self._max_probe_workers):
+                    pending.append((path, executor.submit(self.get_video_info, path)))
+
+                while pending:
+                    path, future = pending.popleft()
+                    try:
+                        yield path, future.result(), None
+                    except Exception as e:
+                        yield path, None, e
+
+                    next_path = next(path_iter, None)
+                    if next_path is not None:
+                        pending.append((next_path, executor.submit(self.get_video_info, next_path)))
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    async def _iter_video_info_async(
+        self, width: int
+    ) -> AsyncIterator[tuple[Path, FolderVideoInfo | None, Exception | None]]:
+        """Analyze scanned files concurrently, yielding in completion order.
+
+        Args:
+            width: Maximum number of files analyzed at once.
+
+        Yields:
+            Tuple of (path, video info or None, error or None).
+        """
+        path_iter = self.scan()
+        in_flight: dict[asyncio.Task[FolderVideoInfo], Path] = {}
+
+        def refill() -> None:
+            while len(in_flight) < width:
+                path = next(path_iter, None)
+                if path is None:
+                    return
+                in_flight[asyncio.create_task(self.get_video_info_async(path))] = path
+
+        try:
+            refill()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    path = in_flight.pop(task)
+                    try:
+                        yield path, task.result(), None
+                    except Exception as e:
+                        yield path, None, e
+                refill()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def iter_video_info_async(
+        self,
+        *,
+        concurrency: int | None = None,
+        limit: int | None = None,
+        predicate: Callable[[FolderVideoInfo], bool] | None = None,
+    ) -> AsyncIterator[FolderVideoInfo]:
+        """Scan and analyze videos concurrently, yielding in completion order.
+
+        At most ``concurrency`` FFprobe processes run at a time; new files
+        are taken from the scan as earlier ones finish, so the first
+        results are available long before the whole folder is analyzed.
+        Files that cannot be analyzed are skipped.
+
+        Args:
+            concurrency: Maximum number of files analyzed at once.
+                Defaults to the extractor's max_probe_workers.
+            limit: Stop after yielding this many videos.
+            predicate: Only yield videos for which this returns True.
+                Only matching videos count toward the limit.
+
+        Yields:
+            FolderVideoInfo for each analyzed video.
+
+        Example:
+            >>> async for video in extractor.iter_video_info_async(limit=10):
+            ...     print(video.filename, video.codec)
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        width = max(1, concurrency or self._max_probe_workers)
+        yielded = 0
+        results = self._iter_video_info_async(width)
+        try:
+            async for path, video_info, error in results:
+                if error is not None:
+                    if not isinstance(error, (FileNotFoundError, InvalidVideoFileError)):
+                        raise error
+                    logger.warning(f"Skipping {path}: {error}")
+                    continue
+
+                assert video_info is not None
+                if predicate is not None and not predicate(video_info):
+                    continue
+
+                yield video_info
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+        finally:
+            await results.aclose()
+
     def get_videos(self) -> list[FolderVideoInfo]:
         """Get all videos with their information.
 
@@ -695,7 +962,8 @@ class FolderExtractor:
         """Get videos that need conversion from H.264 to H.265.
 
         This method scans the folder and identifies H.264 videos
-        that are candidates for conversion.
+        that are candidates for conversion. Files are analyzed on up to
+        ``max_probe_workers`` threads; results keep scan order.
 
         Args:
             limit: Maximum number of candidates to return.
@@ -711,10 +979,19 @@ class FolderExtractor:
         logger.info("Searching for H.264 conversion candidates...")
         candidates: list[FolderVideoInfo] = []
 
-        for path in self.scan():
-            try:
-                video_info = self.get_video_info(path)
+        if limit is not None and limit <= 0:
+            return candidates
+
+        results = self._iter_video_info(self.scan())
+        try:
+            for path, video_info, error in results:
+                if error is not None:
+                    if not isinstance(error, (FileNotFoundError, InvalidVideoFileError)):
+                        raise error
+                    logger.warning(f"Skipping {path}: {error}")
+                    continue
 
+                assert video_info is not None
                 if video_info.needs_conversion:
                     candidates.append(video_info)
                     logger.debug(
@@ -724,18 +1001,82 @@ class FolderExtractor:
 
                     if limit is not None and len(candidates) >= limit:
                         break
-
-            except (FileNotFoundError, InvalidVideoFileError) as e:
-                logger.warning(f"Skipping {path}: {e}")
+        finally:
+            results.close()
 
         logger.info(f"Found {len(candidates)} H.264 videos for conversion")
         return candidates
 
+    async def get_conversion_candidates_async(
+        self,
+        *,
+        limit: int | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[FolderVideoInfo]:
+        """Yield H.264 conversion candidates as soon as they are analyzed.
+
+        Async, bounded-parallel version of get_conversion_candidates().
+        Candidates are yielded in completion order, so a consumer can
+        start converting the first file while the rest are still probed.
+
+        Args:
+            limit: Maximum number of candidates to yield.
+            concurrency: Maximum number of files analyzed at once.
+                Defaults to the extractor's max_probe_workers.
+
+        Yields:
+            FolderVideoInfo for each H.264 video.
+
+        Example:
+            >>> async for video in extractor.get_conversion_candidates_async(limit=10):
+            ...     print(f"Found candidate: {video.filename}")
+        """
+        logger.info("Searching for H.264 conversion candidates...")
+        count = 0
+        async for video_info in self.iter_video_info_async(
+            concurrency=concurrency,
+            limit=limit,
+            predicate=lambda info: info.needs_conversion,
+        ):
+            count += 1
+            yield video_info
+        logger.info(f"Found {count} H.264 videos for conversion")
+
+    @staticmethod
+    def _add_to_stats(stats: FolderStats, video_info: FolderVideoInfo) -> None:
+        """Add one analyzed video to folder statistics.
+
+        Args:
+            stats: Statistics to update.
+            video_info: Analyzed video.
+        """
+        # Track iCloud status
+        if video_info.in_cloud:
+            stats.in_cloud += 1
+            # Cannot get size for iCloud-only files
+            size = 0
+        else:
+            try:
+                stat = video_info.path.stat()
+                size = stat.st_size
+                stats.total_size += size
+            except OSError:
+                size = 0
+
+        if video_info.is_h264:
+            stats.h264 += 1
+            stats.h264_size += size
+        elif video_info.is_hevc:
+            stats.hevc += 1
+        else:
+            stats.other += 1
+
     def get_stats(self) -> FolderStats:
         """Get statistics about videos in the folder.
 
         Analyzes all videos to provide statistics about codec distribution,
-        potential storage savings, and iCloud status.
+        potential storage savings, and iCloud status. Files are analyzed on
+        up to ``max_probe_workers`` threads.
 
         Returns:
             FolderStats with codec distribution, size, and iCloud information.
@@ -750,45 +1091,64 @@ class FolderExtractor:
         logger.info("Analyzing folder statistics...")
         stats = FolderStats()
 
-        for path in self.scan():
+        for path, video_info, error in self._iter_video_info(self.scan()):
             stats.total += 1
 
-            try:
-                video_info = self.get_video_info(path)
-
-                # Track iCloud status
-                if video_info.in_cloud:
-                    stats.in_cloud += 1
-                    # Cannot get size for iCloud-only files
-                    size = 0
-                else:
-                    try:
-                        stat = path.stat()
-                        size = stat.st_size
-                        stats.total_size += size
-                    except OSError:
-                        size = 0
-
-                if video_info.is_h264:
-                    stats.h264 += 1
-                    stats.h264_size += size
-                elif video_info.is_hevc:
-                    stats.hevc += 1
-                else:
-                    stats.other += 1
-
-            except (FileNotFoundError, InvalidVideoFileError):
+            if error is not None:
+                if not isinstance(error, (FileNotFoundError, InvalidVideoFileError)):
+                    logger.warning(f"Error analyzing {path}: {error}")
                 stats.errors += 1
-            except Exception as e:
-                logger.warning(f"Error analyzing {path}: {e}")
+                continue
+
+            assert video_info is not None
+            self._add_to_stats(stats, video_info)
+
+        self._log_stats(stats)
+        return stats
+
+    async def get_stats_async(self, *, concurrency: int | None = None) -> FolderStats:
+        """Get statistics about videos in the folder asynchronously.
+
+        Async, bounded-parallel version of get_stats().
+
+        Args:
+            concurrency: Maximum number of files analyzed at once.
+                Defaults to the extractor's max_probe_workers.
+
+        Returns:
+            FolderStats with codec distribution, size, and iCloud information.
+        """
+        logger.info("Analyzing folder statistics...")
+        stats = FolderStats()
+        width = max(1, concurrency or self._max_probe_workers)
+
+        async for path, video_info, error in self._iter_video_info_async(width):
+            stats.total += 1
+
+            if error is not None:
+                if not isinstance(error, (FileNotFoundError, InvalidVideoFileError)):
+                    logger.warning(f"Error analyzing {path}: {error}")
                 stats.errors += 1
+                continue
 
+            assert video_info is not None
+            self._add_to_stats(stats, video_info)
+
+        self._log_stats(stats)
+        return stats
+
+    @staticmethod
+    def _log_stats(stats: FolderStats) -> None:
+        """Log a folder statistics summary.
+
+        Args:
+            stats: Statistics to log.
+        """
         logger.info(
             f"Folder stats: {stats.total} total, {stats.h264} H.264, "
             f"{stats.hevc} HEVC, {stats.other} other, "
             f"{stats.in_cloud} in iCloud, {stats.errors} errors"
         )
-        return stats
 
     def get_video_count(self) -> int:
         """Get the total number of video files in the folder.
@@ -30,7 +30,8 @@ if TYPE_CHECKING:
 
     import osxphotos
 
-    from video_converter.processors.codec_detector import CodecDetector
+    from video_converter.processors.codec_detector import CodecDetector, CodecInfo
+    from video_converter.processors.probe_index import ProbeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -636,6 +637,7 @@ class PhotosVideoFilter:
         library: PhotosLibrary,
         include_albums: list[str] | None = None,
         exclude_albums: list[str] | None = None,
+        probe_index: ProbeIndex | None = None,
     ) -> None:
         """Initialize PhotosVideoFilter.
 
@@ -645,6 +647,9 @@ class PhotosVideoFilter:
                 If None, includes all albums.
             exclude_albums: Exclude videos from these albums.
                 If None, uses DEFAULT_EXCLUDE_ALBUMS.
+            probe_index: Optional persistent probe index. When given, codec
+                analysis of unmodified assets is read from the index
+                instead of running FFprobe.
         """
         self._library = library
         self._include_albums = set(include_albums) if include_albums else None
@@ -652,6 +657,7 @@ class PhotosVideoFilter:
             set(exclude_albums) if exclude_albums is not None else set(self.DEFAULT_EXCLUDE_ALBUMS)
         )
         self._codec_detector: CodecDetector | None = None
+        self._probe_index = probe_index
 
     @property
     def codec_detector(self) -> CodecDetector:
@@ -666,6 +672,33 @@ class PhotosVideoFilter:
             self._codec_detector = CodecDetector()
         return self._codec_detector
 
+    def _analyze(self, video: PhotosVideoInfo, path: Path) -> CodecInfo:
+        """Analyze a video's codec, using the probe index when configured.
+
+        Library assets are indexed by UUID and modification date, so an
+        edited asset is probed again.
+
+        Args:
+            video: Video to analyze.
+            path: Local path of the video file.
+
+        Returns:
+            CodecInfo for the video.
+        """
+        if self._probe_index is None:
+            return self.codec_detector.analyze(path)
+
+        if video.date_modified is None:
+            return self._probe_index.analyze(path, self.codec_detector)
+
+        cached = self._probe_index.get_asset(video.uuid, video.date_modified, path)
+        if cached is not None:
+            return cached
+
+        info = self.codec_detector.analyze(path)
+        self._probe_index.put_asset(video.uuid, video.date_modified, info)
+        return info
+
     def _passes_album_filter(self, video: PhotosVideoInfo) -> bool:
         """Check if video passes album filter.
 
@@ -706,7 +739,7 @@ class PhotosVideoFilter:
                 InvalidVideoError,
             )
 
-            info = self.codec_detector.analyze(video.path)
+            info = self._analyze(video, video.path)
             return info.codec
         except (InvalidVideoError, CorruptedVideoError, FileNotFoundError) as e:
             logger.warning(f"Failed to detect codec for {video.filename}: {e}")
@@ -733,7 +766,7 @@ class PhotosVideoFilter:
                 InvalidVideoError,
             )
 
-            codec_info = self.codec_detector.analyze(video.path)
+            codec_info = self._analyze(video, video.path)
             codec = codec_info.codec
             duration = codec_info.duration
         except (InvalidVideoError, CorruptedVideoError, FileNotFoundError) as e:
@@ -29,6 +29,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from video_converter.processors.probe_index import ProbeIndex
+
 from video_converter.extractors.photos_extractor import (
     LibraryStats,
     PhotosAccessDeniedError,
@@ -141,6 +143,7 @@ class PhotosSourceHandler:
         self,
         library_path: Path | None = None,
         temp_dir: Path | None = None,
+        probe_index: ProbeIndex | None = None,
     ) -> None:
         """Initialize PhotosSourceHandler.
 
@@ -149,9 +152,12 @@ class PhotosSourceHandler:
                 If None, uses the default system library.
             temp_dir: Custom temporary directory for exports.
                 If None, creates a system temporary directory.
+            probe_index: Optional persistent probe index used by the
+                video filter to skip re-probing unmodified assets.
         """
         self._library_path = library_path
         self._temp_dir = temp_dir
+        self._probe_index = probe_index
         self._library: PhotosLibrary | None = None
         self._exporter: VideoExporter | None = None
         self._filter: PhotosVideoFilter | None = None
@@ -204,6 +210,7 @@ class PhotosSourceHandler:
             library=self.library,
             include_albums=include_albums,
             exclude_albums=exclude_albums,
+            probe_index=self._probe_index,
         )
 
     def check_permissions(self) -> bool:
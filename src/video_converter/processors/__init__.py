@@ -26,6 +26,11 @@ from video_converter.processors.metadata import (
     MetadataProcessor,
     MetadataVerificationResult,
 )
+from video_converter.processors.probe_index import (
+    ProbeIndex,
+    get_probe_index,
+    reset_probe_index,
+)
 from video_converter.processors.quality_validator import (
     ComparisonSeverity,
     CompressionRange,
@@ -42,6 +47,10 @@ from video_converter.processors.quality_validator import (
     VideoInfo,
     VideoValidator,
 )
+from video_converter.processors.quicktime_metadata import (
+    QuickTimeMetadata,
+    QuickTimeMetadataError,
+)
 from video_converter.processors.timestamp import (
     FileTimestamps,
     TimestampError,
@@ -75,6 +84,10 @@ __all__ = [
     "CorruptedVideoError",
     "InvalidVideoError",
     "UnsupportedCodecError",
+    # Probe index
+    "ProbeIndex",
+    "get_probe_index",
+    "reset_probe_index",
     # GPS handling
     "GPSCoordinates",
     "GPSFormat",
@@ -85,6 +98,9 @@ __all__ = [
     "MetadataExtractionError",
     "MetadataProcessor",
     "MetadataVerificationResult",
+    # Native QuickTime metadata
+    "QuickTimeMetadata",
+    "QuickTimeMetadataError",
     # Timestamp synchronization
     "FileTimestamps",
     "TimestampError",
@@ -4,6 +4,11 @@ This module provides codec detection functionality to analyze video files
 and determine their codec, resolution, and other properties. It is used
 to identify H.264 videos that need conversion to H.265/HEVC.
 
+MP4 and MOV files are analyzed natively by reading their movie and
+track header boxes, which avoids starting an FFprobe process per file.
+Other containers, fragmented files and anything the native reader does
+not fully understand fall back to FFprobe.
+
 SDS Reference: SDS-P01-002
 SRS Reference: SRS-201 (Codec Detection)
 
@@ -18,8 +23,11 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import struct
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +36,81 @@ from video_converter.utils.command_runner import (
     CommandNotFoundError,
     FFprobeRunner,
 )
+from video_converter.utils.isobmff import BoxParseError, MovieInfo, TrackInfo, read_movie
+
+logger = logging.getLogger(__name__)
+
+# FFprobe format name reported for all MP4/MOV family files
+_ISOBMFF_FORMAT_NAME = "mov,mp4,m4a,3gp,3g2,mj2"
+
+# Start of the MP4/QuickTime time base
+_MOVIE_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)
+
+# FFprobe codec names by video sample entry type
+_VIDEO_CODECS = {
+    "avc1": "h264",
+    "avc3": "h264",
+    "hvc1": "hevc",
+    "hev1": "hevc",
+    "dvh1": "hevc",
+    "dvhe": "hevc",
+    "av01": "av1",
+    "vp09": "vp9",
+    "mp4v": "mpeg4",
+    "ap4h": "prores",
+    "ap4x": "prores",
+    "apch": "prores",
+    "apcn": "prores",
+    "apcs": "prores",
+    "apco": "prores",
+    "jpeg": "mjpeg",
+}
+
+# FFprobe codec names by audio sample entry type (mp4a is resolved via esds)
+_AUDIO_CODECS = {
+    "ac-3": "ac3",
+    "ec-3": "eac3",
+    "alac": "alac",
+    "Opus": "opus",
+    "fLaC": "flac",
+    "sowt": "pcm_s16le",
+    "twos": "pcm_s16be",
+}
+
+# FFprobe codec names by MPEG-4 objectTypeIndication
+_MP4A_OBJECT_TYPES = {
+    0x40: "aac",
+    0x66: "aac",
+    0x67: "aac",
+    0x68: "aac",
+    0x69: "mp3",
+    0x6B: "mp3",
+}
+
+# FFprobe profile names by profile_idc
+_H264_PROFILES = {
+    66: "Baseline",
+    77: "Main",
+    88: "Extended",
+    100: "High",
+    110: "High 10",
+    122: "High 4:2:2",
+    244: "High 4:4:4 Predictive",
+}
+_HEVC_PROFILES = {1: "Main", 2: "Main 10", 3: "Main Still Picture", 4: "Rext"}
+
+# H.264 profiles whose avcC record carries chroma format and bit depth
+_H264_EXTENDED_PROFILES = frozenset({100, 110, 122, 144, 244})
+
+# FFprobe color space names by colr matrix coefficients
+_COLOR_MATRICES = {
+    1: "bt709",
+    5: "bt470bg",
+    6: "smpte170m",
+    7: "smpte240m",
+    9: "bt2020nc",
+    10: "bt2020c",
+}
 
 
 class InvalidVideoError(Exception):
@@ -271,6 +354,7 @@ class CodecDetector:
     Attributes:
         ffprobe: FFprobe runner instance.
         timeout: Default timeout for FFprobe commands.
+        use_native: Whether MP4/MOV files are analyzed without FFprobe.
     """
 
     # Supported container formats
@@ -280,15 +364,20 @@ class CodecDetector:
         self,
         ffprobe_runner: FFprobeRunner | None = None,
         timeout: float = 30.0,
+        *,
+        use_native: bool = True,
     ) -> None:
         """Initialize CodecDetector.
 
         Args:
             ffprobe_runner: FFprobe runner to use. If None, creates a new one.
             timeout: Default timeout for FFprobe commands in seconds.
+            use_native: Whether to read MP4/MOV headers directly before
+                falling back to FFprobe.
         """
         self._ffprobe = ffprobe_runner or FFprobeRunner()
         self._timeout = timeout
+        self._use_native = use_native
 
     def analyze(self, path: Path) -> CodecInfo:
         """Analyze a video file and return codec information.
@@ -308,6 +397,11 @@ class CodecDetector:
         if not path.exists():
             raise FileNotFoundError(f"Video file not found: {path}")
 
+        if self._use_native:
+            native_data = self._probe_native(path)
+            if native_data is not None:
+                return self._parse_probe_data(path, native_data)
+
         try:
             probe_data = self._ffprobe.probe(
                 path,
@@ -340,6 +434,11 @@ class CodecDetector:
         if not path.exists():
             raise FileNotFoundError(f"Video file not found: {path}")
 
+        if self._use_native:
+            native_data = await asyncio.to_thread(self._probe_native, path)
+            if native_data is not None:
+                return self._parse_probe_data(path, native_data)
+
         try:
             probe_data = await self._ffprobe.probe_async(
                 path,
@@ -409,6 +508,130 @@ class CodecDetector:
         """
         return self.analyze(path).codec
 
+    def _probe_native(self, path: Path) -> dict[str, Any] | None:
+        """Build FFprobe-style data from the headers of an MP4/MOV file.
+
+        Only files whose video and audio tracks are fully understood are
+        answered natively. Everything else returns None so the caller
+        falls back to FFprobe, which also produces the detailed errors
+        for invalid or corrupted files.
+
+        Args:
+            path: Path to the video file.
+
+        Returns:
+            Data shaped like FFprobe's JSON output, or None to fall back.
+        """
+        try:
+            movie = read_movie(path)
+            size = path.stat().st_size
+        except (OSError, ValueError, BoxParseError) as e:
+            logger.debug(f"Native analysis unavailable for {path}: {e}")
+            return None
+
+        if movie.fragmented:
+            logger.debug(f"Native analysis skipped for fragmented file {path}")
+            return None
+
+        video = movie.first_track("vide")
+        if video is None or video.codec not in _VIDEO_CODECS:
+            return None
+        if not (video.width and video.height and video.timescale and video.duration):
+            return None
+
+        try:
+            video_stream = self._native_video_stream(video)
+            audio = movie.first_track("soun")
+            streams = [video_stream]
+            if audio is not None:
+                audio_codec = self._native_audio_codec(audio)
+                if audio_codec is None:
+                    return None
+                streams.append({"codec_type": "audio", "codec_name": audio_codec})
+        except (IndexError, struct.error) as e:
+            logger.debug(f"Native analysis found malformed codec data in {path}: {e}")
+            return None
+
+        return {
+            "streams": streams,
+            "format": self._native_format(movie, size),
+        }
+
+    def _native_video_stream(self, track: TrackInfo) -> dict[str, Any]:
+        """Describe a video track the way FFprobe does.
+
+        Args:
+            track: Video track read from the file.
+
+        Returns:
+            FFprobe-style video stream dictionary.
+        """
+        duration = track.duration_seconds
+        stream: dict[str, Any] = {
+            "codec_type": "video",
+            "codec_name": _VIDEO_CODECS[track.codec],
+            "width": track.width,
+            "height": track.height,
+            "avg_frame_rate": f"{track.sample_count * track.timescale}/{track.duration}",
+            "duration": str(duration),
+            "bit_rate": str(int(track.sample_bytes * 8 / duration)),
+        }
+
+        avcc = track.codec_boxes.get("avcC")
+        hvcc = track.codec_boxes.get("hvcC")
+        if avcc is not None:
+            profile_idc, level_idc = avcc[1], avcc[3]
+            stream["profile"] = _H264_PROFILES.get(profile_idc)
+            stream["level"] = level_idc
+            stream["bits_per_raw_sample"] = _avcc_bit_depth(avcc)
+        elif hvcc is not None:
+            stream["profile"] = _HEVC_PROFILES.get(hvcc[1] & 0x1F)
+            stream["level"] = hvcc[12]
+            stream["bits_per_raw_sample"] = (hvcc[17] & 0x07) + 8
+
+        colr = track.codec_boxes.get("colr")
+        if colr is not None and colr[:4] in (b"nclx", b"nclc"):
+            (matrix,) = struct.unpack_from(">H", colr, 8)
+            stream["color_space"] = _COLOR_MATRICES.get(matrix)
+
+        return stream
+
+    def _native_audio_codec(self, track: TrackInfo) -> str | None:
+        """Map an audio track to its FFprobe codec name.
+
+        Args:
+            track: Audio track read from the file.
+
+        Returns:
+            Codec name, or None if the codec is not recognized.
+        """
+        if track.codec == "mp4a":
+            esds = track.codec_boxes.get("esds")
+            if esds is None:
+                return None
+            return _MP4A_OBJECT_TYPES.get(_esds_object_type(esds))
+        return _AUDIO_CODECS.get(track.codec)
+
+    def _native_format(self, movie: MovieInfo, size: int) -> dict[str, Any]:
+        """Describe the container the way FFprobe does.
+
+        Args:
+            movie: Movie read from the file.
+            size: File size in bytes.
+
+        Returns:
+            FFprobe-style format dictionary.
+        """
+        format_info: dict[str, Any] = {
+            "format_name": _ISOBMFF_FORMAT_NAME,
+            "size": str(size),
+            "duration": str(movie.duration_seconds),
+        }
+        if movie.creation_time:
+            created = _MOVIE_EPOCH + timedelta(seconds=movie.creation_time)
+            format_info["tags"] = {"creation_time": created.isoformat()}
+        return format_info
+
     def _parse_probe_data(self, path: Path, data: dict[str, Any]) -> CodecInfo:
         """Parse FFprobe output into CodecInfo.
 
@@ -694,3 +917,72 @@ class CodecDetector:
             except (ValueError, TypeError):
                 return str(level)
         return None
+
+
+def _avcc_bit_depth(avcc: bytes) -> int:
+    """Read the luma bit depth from an AVC decoder configuration record.
+
+    Args:
+        avcc: Payload of an avcC box.
+
+    Returns:
+        Bit depth; 8 unless the record carries a high-profile extension.
+    """
+    if avcc[1] not in _H264_EXTENDED_PROFILES:
+        return 8
+
+    # Skip the SPS and PPS lists to reach the optional extension fields
+    offset = 5
+    sps_count = avcc[offset] & 0x1F
+    offset += 1
+    for _ in range(sps_count):
+        offset += 2 + int.from_bytes(avcc[offset : offset + 2], "big")
+    pps_count = avcc[offset]
+    offset += 1
+    for _ in range(pps_count):
+        offset += 2 + int.from_bytes(avcc[offset : offset + 2], "big")
+
+    if offset + 3 > len(avcc):
+        return 8
+    return (avcc[offset + 1] & 0x07) + 8
+
+
+def _esds_object_type(esds: bytes) -> int | None:
+    """Read the objectTypeIndication from an elementary stream descriptor.
+
+    Args:
+        esds: Payload of an esds box.
+
+    Returns:
+        The object type, or None if the descriptor has no decoder config.
+    """
+
+    def read_descriptor(offset: int) -> tuple[int, int]:
+        tag = esds[offset]
+        offset += 1
+        for _ in range(4):
+            more = esds[offset] & 0x80
+            offset += 1
+            if not more:
+                break
+        return tag, offset
+
+    # Skip the full box version and flags
+    tag, offset = read_descriptor(4)
+    if tag != 0x03:
+        return None
+
+    # ES_Descriptor: ES_ID, flags and the optional fields they announce
+    flags = esds[offset + 2]
+    offset += 3
+    if flags & 0x80:
+        offset += 2
+    if flags & 0x40:
+        offset += 1 + esds[offset]
+    if flags & 0x20:
+        offset += 2
+
+    tag, offset = read_descriptor(offset)
+    if tag != 0x04:
+        return None
+    return esds[offset]
@@ -417,6 +417,20 @@ class GPSHandler:
         metadata = self._processor.extract(path)
         return self._parse_gps_from_metadata(metadata)
 
+    def from_metadata(self, metadata: dict[str, Any]) -> GPSCoordinates | None:
+        """Parse GPS coordinates from already extracted metadata.
+
+        Use this when the metadata is at hand to avoid reading the file
+        again.
+
+        Args:
+            metadata: Metadata dictionary from exiftool.
+
+        Returns:
+            GPSCoordinates if found, None otherwise.
+        """
+        return self._parse_gps_from_metadata(metadata)
+
     def apply(
         self,
         path: Path,
@@ -445,15 +459,7 @@ class GPSHandler:
         # Set GPS tags in multiple formats for maximum compatibility
         tags_to_set = self._build_gps_tags(coords)
 
-        success = True
-        for tag, value in tags_to_set.items():
-            result = self._processor.set_tag(
-                path, tag, value, overwrite_original=overwrite_original
-            )
-            if not result:
-                success = False
-
-        return success
+        return self._processor.set_tags(path, tags_to_set, overwrite_original=overwrite_original)
 
     def copy(
         self,
@@ -26,15 +26,23 @@ Example:
 from __future__ import annotations
 
 import json
+import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from video_converter.processors.quicktime_metadata import QuickTimeMetadata
 from video_converter.utils.command_runner import (
     CommandExecutionError,
+    CommandNotFoundError,
     CommandRunner,
+    ExifToolPool,
+    get_exiftool_pool,
 )
+from video_converter.utils.metadata_cache import MetadataCache, get_metadata_cache
+
+logger = logging.getLogger(__name__)
 
 
 class MetadataExtractionError(Exception):
@@ -154,13 +162,35 @@ class MetadataProcessor:
         "TrackModifyDate",
     ]
 
-    def __init__(self, command_runner: CommandRunner | None = None) -> None:
+    def __init__(
+        self,
+        command_runner: CommandRunner | None = None,
+        *,
+        cache: MetadataCache | None = None,
+        use_cache: bool = True,
+        use_native: bool = True,
+    ) -> None:
         """Initialize MetadataProcessor.
 
         Args:
-            command_runner: CommandRunner instance to use. If None, creates a new one.
+            command_runner: CommandRunner instance to use. If None, uses the
+                shared ExifToolPool, so ExifTool is not started per call.
+            cache: Metadata cache to use. If None, uses the shared
+                process-wide cache.
+            use_cache: Whether to cache extracted metadata at all.
+            use_native: Whether to write core QuickTime tags directly in
+                the movie header when possible instead of using ExifTool.
         """
-        self._runner = command_runner or CommandRunner()
+        self._runner = command_runner or get_exiftool_pool()
+        self._cache: MetadataCache | None = None
+        if use_cache:
+            self._cache = cache or get_metadata_cache()
+        self._native = QuickTimeMetadata() if use_native else None
+
+    @property
+    def cache(self) -> MetadataCache | None:
+        """Get the metadata cache used by this processor, if any."""
+        return self._cache
 
     def is_available(self) -> bool:
         """Check if ExifTool is available.
@@ -181,6 +211,9 @@ class MetadataProcessor:
     def extract(self, path: Path, *, include_binary: bool = False) -> dict[str, Any]:
         """Extract all metadata from a video file.
 
+        The result is cached until the file changes or is written through
+        this processor, so repeated reads of the same file are free.
+
         Args:
             path: Path to the video file.
             include_binary: Include binary data in output (default: False).
@@ -196,6 +229,135 @@ class MetadataProcessor:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
+        if self._cache is not None:
+            cached = self._cache.get(path, include_binary=include_binary)
+            if cached is not None:
+                return cached
+
+        args = self._extract_args(include_binary)
+        args.append(str(path))
+
+        try:
+            result = self._runner.run(args, timeout=30.0)
+            if not result.success:
+                raise MetadataExtractionError(path, result.stderr)
+
+            data: list[dict[str, Any]] = json.loads(result.stdout)
+            metadata = data[0] if data else {}
+
+        except json.JSONDecodeError as e:
+            raise MetadataExtractionError(path, f"Invalid JSON output: {e}") from e
+        except CommandExecutionError as e:
+            raise MetadataExtractionError(path, str(e)) from e
+
+        if self._cache is not None:
+            self._cache.put(path, metadata, include_binary=include_binary)
+        return metadata
+
+    def extract_batch(
+        self,
+        paths: list[Path],
+        *,
+        include_binary: bool = False,
+    ) -> dict[Path, dict[str, Any]]:
+        """Extract all metadata from many video files with one ExifTool command.
+
+        Args:
+            paths: Paths to the video files.
+            include_binary: Include binary data in output (default: False).
+
+        Returns:
+            Dictionary of metadata tags and values per path. Missing or
+            unreadable files are left out.
+
+        Raises:
+            MetadataExtractionError: If ExifTool output cannot be parsed.
+            CommandNotFoundError: If exiftool is not installed.
+        """
+        results: dict[Path, dict[str, Any]] = {}
+        pending: list[Path] = []
+        for path in dict.fromkeys(paths):
+            if not path.exists():
+                continue
+            cached = (
+                self._cache.get(path, include_binary=include_binary)
+                if self._cache is not None
+                else None
+            )
+            if cached is not None:
+                results[path] = cached
+            else:
+                pending.append(path)
+
+        if not pending:
+            return results
+
+        args = self._extract_args(include_binary)
+        args.extend(str(path) for path in pending)
+
+        # Exits non-zero if any file fails, but still reports the others
+        result = self._runner.run(args, timeout=30.0 * len(pending))
+        if not result.stdout.strip():
+            return results
+
+        try:
+            data: list[dict[str, Any]] = json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            raise MetadataExtractionError(pending[0], f"Invalid JSON output: {e}") from e
+
+        by_name = {str(path): path for path in pending}
+        for item in data:
+            path = by_name.get(item.get("SourceFile", ""))
+            if path is None:
+                continue
+            results[path] = item
+            if self._cache is not None:
+                self._cache.put(path, item, include_binary=include_binary)
+        return results
+
+    def prefetch(self, paths: list[Path]) -> int:
+        """Capture metadata snapshots for files that are about to be rewritten.
+
+        Reads every uncached file with one ExifTool command, so a later
+        extract() or verification of the originals is served from the
+        cache. Call this before encoding to take the originals' snapshot
+        once.
+
+        Args:
+            paths: Paths to the video files.
+
+        Returns:
+            Number of files with a cached snapshot afterwards.
+        """
+        if self._cache is None:
+            return 0
+        try:
+            return len(self.extract_batch(paths))
+        except (MetadataExtractionError, CommandExecutionError, CommandNotFoundError) as e:
+            logger.debug(f"Metadata prefetch failed: {e}")
+            return 0
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached metadata snapshot of a file.
+
+        Writes made through this processor invalidate the destination
+        automatically; call this after modifying a file by other means.
+
+        Args:
+            path: Path whose snapshot should be dropped.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(path)
+
+    def _extract_args(self, include_binary: bool) -> list[str]:
+        """Build the ExifTool arguments for full metadata extraction.
+
+        Args:
+            include_binary: Include binary data in output.
+
+        Returns:
+            Command and options, without file names.
+        """
         args = [
             self.EXIFTOOL_CMD,
             "-json",
@@ -211,20 +373,7 @@ class MetadataProcessor:
             # Use -X for XMP or just don't include -b
             args.remove("-b")
 
-        args.append(str(path))
-
-        try:
-            result = self._runner.run(args, timeout=30.0)
-            if not result.success:
-                raise MetadataExtractionError(path, result.stderr)
-
-            data: list[dict[str, Any]] = json.loads(result.stdout)
-            return data[0] if data else {}
-
-        except json.JSONDecodeError as e:
-            raise MetadataExtractionError(path, f"Invalid JSON output: {e}") from e
-        except CommandExecutionError as e:
-            raise MetadataExtractionError(path, str(e)) from e
+        return args
 
     def extract_gps(self, path: Path) -> GPSCoordinates | None:
         """Extract GPS coordinates from a video file.
@@ -297,6 +446,27 @@ class MetadataProcessor:
         if not dest.exists():
             raise FileNotFoundError(f"Destination file not found: {dest}")
 
+        args = self._copy_all_args(source, dest, overwrite_original)
+
+        try:
+            result = self._runner.run(args, timeout=60.0)
+            return result.success
+        except CommandExecutionError as e:
+            raise MetadataApplicationError(dest, str(e)) from e
+        finally:
+            self.invalidate(dest)
+
+    def _copy_all_args(self, source: Path, dest: Path, overwrite_original: bool) -> list[str]:
+        """Build the ExifTool command that copies all metadata.
+
+        Args:
+            source: Source file with metadata.
+            dest: Destination file to receive metadata.
+            overwrite_original: If True, modify dest in place without backup.
+
+        Returns:
+            Command and arguments.
+        """
         args = [self.EXIFTOOL_CMD]
 
         if overwrite_original:
@@ -310,12 +480,7 @@ class MetadataProcessor:
                 str(dest),
             ]
         )
-
-        try:
-            result = self._runner.run(args, timeout=60.0)
-            return result.success
-        except CommandExecutionError as e:
-            raise MetadataApplicationError(dest, str(e)) from e
+        return args
 
     def copy_tags(
         self,
@@ -327,6 +492,10 @@ class MetadataProcessor:
     ) -> bool:
         """Copy specific metadata tags from source to destination.
 
+        Core QuickTime tags (dates, GPS coordinates, make and model) are
+        copied directly between movie headers when both files allow it,
+        so the destination is not rewritten by ExifTool.
+
         Args:
             source: Source file with metadata.
             dest: Destination file to receive metadata.
@@ -347,6 +516,10 @@ class MetadataProcessor:
         if not tags:
             return True  # Nothing to copy
 
+        if self._native is not None and self._native.copy(source, dest, tags):
+            self.invalidate(dest)
+            return True
+
         args = [self.EXIFTOOL_CMD]
 
         if overwrite_original:
@@ -364,6 +537,8 @@ class MetadataProcessor:
             return result.success
         except CommandExecutionError as e:
             raise MetadataApplicationError(dest, str(e)) from e
+        finally:
+            self.invalidate(dest)
 
     def copy_gps(
         self,
@@ -482,21 +657,56 @@ class MetadataProcessor:
         Returns:
             True if the tag was set successfully.
 
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            MetadataApplicationError: If setting fails.
+        """
+        return self.set_tags(path, {tag: value}, overwrite_original=overwrite_original)
+
+    def set_tags(
+        self,
+        path: Path,
+        tags: dict[str, str],
+        *,
+        overwrite_original: bool = True,
+    ) -> bool:
+        """Set several metadata tags on a file with one ExifTool command.
+
+        ExifTool rewrites the whole file for every command, so writing
+        all tags at once is much cheaper than one set_tag() per tag. Core
+        QuickTime tags are written directly in the movie header when the
+        file allows it, without ExifTool.
+
+        Args:
+            path: Path to the file.
+            tags: Mapping of tag name to value.
+            overwrite_original: If True, modify file in place.
+
+        Returns:
+            True if all tags were set successfully.
+
         Raises:
             FileNotFoundError: If the file doesn't exist.
             MetadataApplicationError: If setting fails.
         """
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
+        if not tags:
+            return True  # Nothing to set
+
+        if self._native is not None and self._native.write(path, tags):
+            self.invalidate(path)
+            return True
 
         args = [self.EXIFTOOL_CMD]
 
         if overwrite_original:
             args.append("-overwrite_original")
 
-        # Escape special characters in value
-        escaped_value = self._escape_value(value)
-        args.append(f"-{tag}={escaped_value}")
+        for tag, value in tags.items():
+            # Escape special characters in value
+            escaped_value = self._escape_value(value)
+            args.append(f"-{tag}={escaped_value}")
         args.append(str(path))
 
         try:
@@ -504,6 +714,8 @@ class MetadataProcessor:
             return result.success
         except CommandExecutionError as e:
             raise MetadataApplicationError(path, str(e)) from e
+        finally:
+            self.invalidate(path)
 
     def batch_copy_all(
         self,
@@ -513,6 +725,9 @@ class MetadataProcessor:
     ) -> dict[Path, bool]:
         """Copy metadata for multiple file pairs.
 
+        With the shared ExifToolPool, all copies are sent to one ExifTool
+        process in a single request instead of one command each.
+
         Args:
             source_dest_pairs: List of (source, dest) path tuples.
             overwrite_original: If True, modify dest files in place.
@@ -522,6 +737,29 @@ class MetadataProcessor:
         """
         results: dict[Path, bool] = {}
 
+        if isinstance(self._runner, ExifToolPool):
+            pairs = []
+            for source, dest in source_dest_pairs:
+                if source.exists() and dest.exists():
+                    pairs.append((source, dest))
+                else:
+                    results[dest] = False
+
+            try:
+                command_results = self._runner.run_many(
+                    [
+                        self._copy_all_args(source, dest, overwrite_original)
+                        for source, dest in pairs
+                    ],
+                    timeout=60.0 * max(len(pairs), 1),
+                )
+            finally:
+                for _, dest in pairs:
+                    self.invalidate(dest)
+            for (_, dest), result in zip(pairs, command_results, strict=True):
+                results[dest] = result.success
+            return results
+
         for source, dest in source_dest_pairs:
             try:
                 success = self.copy_all(source, dest, overwrite_original=overwrite_original)
@@ -0,0 +1,467 @@
+"""Persistent probe index for codec analysis results.
+
+This module stores CodecInfo results in a SQLite database next to the
+conversion history, so repeated scans of a large, mostly unchanged
+library only need a stat() per file instead of a full FFprobe run.
+
+Filesystem entries are keyed by path and validated against a fingerprint
+of (device, inode, size, mtime_ns). Photos library assets are keyed by
+their UUID and validated against the asset's modification date. A
+mismatching fingerprint invalidates the entry automatically. The index
+is capped at a maximum number of entries, evicting the least recently
+used ones.
+
+SDS Reference: SDS-P01-002
+SRS Reference: SRS-201 (Codec Detection)
+
+Example:
+    >>> from video_converter.processors.probe_index import get_probe_index
+    >>> index = get_probe_index()
+    >>> info = index.analyze(Path("vacation.mp4"), CodecDetector())
+    >>> # Second call is answered from the index without running FFprobe
+    >>> info = index.analyze(Path("vacation.mp4"), CodecDetector())
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from video_converter.core.fingerprint import file_fingerprint
+from video_converter.core.history import DEFAULT_HISTORY_DIR
+from video_converter.processors.codec_detector import CodecInfo
+
+if TYPE_CHECKING:
+    from video_converter.processors.codec_detector import CodecDetector
+
+logger = logging.getLogger(__name__)
+
+# Default path for the probe index database
+DEFAULT_PROBE_INDEX_FILE = DEFAULT_HISTORY_DIR / "probe_index.db"
+
+# Default maximum number of entries kept in the index
+DEFAULT_PROBE_INDEX_MAX_ENTRIES = 200_000
+
+# Bump when the stored CodecInfo layout changes to discard old entries
+PROBE_INDEX_SCHEMA_VERSION = 1
+
+# Only refresh an entry's access time if it is older than this (seconds),
+# so that index hits do not turn into one write per file
+_ACCESS_REFRESH_INTERVAL = 24 * 60 * 60
+
+# Check the size cap after this many inserts
+_PRUNE_INTERVAL = 1000
+
+_PHOTOS_KEY_PREFIX = "photos:"
+
+
+def _serialize(info: CodecInfo) -> str:
+    """Serialize CodecInfo to JSON, excluding the path.
+
+    Args:
+        info: Codec information to store.
+
+    Returns:
+        JSON string.
+    """
+    data: dict[str, Any] = {}
+    for f in fields(info):
+        if f.name == "path":
+            continue
+        value = getattr(info, f.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        data[f.name] = value
+    return json.dumps(data)
+
+
+def _deserialize(path: Path, payload: str) -> CodecInfo:
+    """Rebuild CodecInfo from stored JSON.
+
+    Args:
+        path: Path to attach to the result.
+        payload: JSON string produced by _serialize.
+
+    Returns:
+        Restored CodecInfo.
+    """
+    data = json.loads(payload)
+    creation_time = data.get("creation_time")
+    if creation_time:
+        data["creation_time"] = datetime.fromisoformat(creation_time)
+    return CodecInfo(path=path, **data)
+
+
+class ProbeIndex:
+    """SQLite-backed persistent index of codec analysis results.
+
+    Thread-safe: a single connection is shared behind a lock. Database
+    errors never propagate to callers; the index degrades to a miss and
+    the caller probes the file as usual.
+
+    Attributes:
+        index_path: Path to the SQLite database file.
+        max_entries: Maximum number of entries kept in the index.
+    """
+
+    def __init__(
+        self,
+        index_path: Path | None = None,
+        *,
+        max_entries: int = DEFAULT_PROBE_INDEX_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the probe index.
+
+        Args:
+            index_path: Path to the database file.
+                Defaults to ~/.local/share/video_converter/probe_index.db
+            max_entries: Maximum number of entries kept in the index.
+        """
+        self.index_path = index_path or DEFAULT_PROBE_INDEX_FILE
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        self._open()
+
+    def _open(self) -> None:
+        """Open the database, recreating it if it is unreadable."""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Probe index unreadable, recreating: {e}")
+            try:
+                self.index_path.unlink(missing_ok=True)
+                self._conn = self._connect()
+            except (OSError, sqlite3.Error) as e2:
+                logger.warning(f"Probe index disabled: {e2}")
+                self._conn = None
+        except OSError as e:
+            logger.warning(f"Probe index disabled: {e}")
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Create the connection and schema.
+
+        Returns:
+            Open SQLite connection.
+        """
+        conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != PROBE_INDEX_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS probe_index")
+            conn.execute(f"PRAGMA user_version={PROBE_INDEX_SCHEMA_VERSION}")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS probe_index (
+                key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                info TEXT NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_probe_index_accessed ON probe_index (accessed_at)"
+        )
+        conn.commit()
+        return conn
+
+    @property
+    def available(self) -> bool:
+        """Check if the index database is usable."""
+        return self._conn is not None
+
+    def __len__(self) -> int:
+        """Get the number of entries in the index."""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            try:
+                return int(self._conn.execute("SELECT COUNT(*) FROM probe_index").fetchone()[0])
+            except sqlite3.Error:
+                return 0
+
+    def _get(self, key: str, fingerprint: str, path: Path) -> CodecInfo | None:
+        """Look up an entry and validate its fingerprint.
+
+        Args:
+            key: Entry key.
+            fingerprint: Expected fingerprint.
+            path: Path to attach to the result.
+
+        Returns:
+            Stored CodecInfo, or None on a miss or stale entry.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT fingerprint, info, accessed_at FROM probe_index WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                stored_fingerprint, payload, accessed_at = row
+                if stored_fingerprint != fingerprint:
+                    self._conn.execute("DELETE FROM probe_index WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+
+                now = time.time()
+                if now - accessed_at > _ACCESS_REFRESH_INTERVAL:
+                    self._conn.execute(
+                        "UPDATE probe_index SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Probe index lookup failed for {key}: {e}")
+                return None
+
+        try:
+            return _deserialize(path, payload)
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Discarding unreadable probe index entry {key}: {e}")
+            self.invalidate(key)
+            return None
+
+    def _put(self, key: str, fingerprint: str, info: CodecInfo) -> None:
+        """Insert or replace an entry.
+
+        Args:
+            key: Entry key.
+            fingerprint: Fingerprint the entry is valid for.
+            info: Codec information to store.
+        """
+        payload = _serialize(info)
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO probe_index (key, fingerprint, info, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, fingerprint, payload, time.time()),
+                )
+                self._inserts_since_prune += 1
+                if self._inserts_since_prune >= _PRUNE_INTERVAL:
+                    self._prune_locked()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Probe index write failed for {key}: {e}")
+
+    def _prune_locked(self) -> None:
+        """Evict least recently used entries above the size cap.
+
+        Must be called with the lock held.
+        """
+        assert self._conn is not None
+        self._inserts_since_prune = 0
+        count = self._conn.execute("SELECT COUNT(*) FROM probe_index").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM probe_index WHERE key IN "
+                "(SELECT key FROM probe_index ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            logger.debug(f"Probe index pruned {excess} entries")
+
+    def prune(self) -> None:
+        """Enforce the size cap immediately."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._prune_locked()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Probe index prune failed: {e}")
+
+    def get(self, path: Path, stat: os.stat_result | None = None) -> CodecInfo | None:
+        """Look up codec information for a file.
+
+        Args:
+            path: Path to the video file.
+            stat: Optional stat() result if the caller already has one.
+
+        Returns:
+            CodecInfo if the file is indexed and unchanged, None otherwise.
+        """
+        if stat is None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return None
+        return self._get(str(path), file_fingerprint(stat), path)
+
+    def put(self, path: Path, info: CodecInfo, stat: os.stat_result | None = None) -> None:
+        """Store codec information for a file.
+
+        Args:
+            path: Path to the video file.
+            info: Codec information to store.
+            stat: stat() result taken before the file was probed. If None,
+                the file is stat'ed now.
+        """
+        if stat is None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return
+        self._put(str(path), file_fingerprint(stat), info)
+
+    def get_asset(
+        self,
+        uuid: str,
+        date_modified: datetime | None,
+        path: Path,
+    ) -> CodecInfo | None:
+        """Look up codec information for a Photos library asset.
+
+        Args:
+            uuid: Photos asset UUID.
+            date_modified: Asset modification date from the library.
+            path: Current path of the asset's video file.
+
+        Returns:
+            CodecInfo if the asset is indexed and unmodified, None otherwise.
+        """
+        fingerprint = date_modified.isoformat() if date_modified else ""
+        return self._get(f"{_PHOTOS_KEY_PREFIX}{uuid}", fingerprint, path)
+
+    def put_asset(
+        self,
+        uuid: str,
+        date_modified: datetime | None,
+        info: CodecInfo,
+    ) -> None:
+        """Store codec information for a Photos library asset.
+
+        Args:
+            uuid: Photos asset UUID.
+            date_modified: Asset modification date from the library.
+            info: Codec information to store.
+        """
+        fingerprint = date_modified.isoformat() if date_modified else ""
+        self._put(f"{_PHOTOS_KEY_PREFIX}{uuid}", fingerprint, info)
+
+    def analyze(self, path: Path, detector: CodecDetector) -> CodecInfo:
+        """Get codec information from the index, probing on a miss.
+
+        Args:
+            path: Path to the video file.
+            detector: Codec detector used when the file is not indexed.
+
+        Returns:
+            CodecInfo for the file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            InvalidVideoError: If the file is not a valid video.
+            CorruptedVideoError: If the video file is corrupted.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return detector.analyze(path)
+
+        info = self.get(path, stat)
+        if info is not None:
+            return info
+
+        info = detector.analyze(path)
+        self.put(path, info, stat)
+        return info
+
+    def invalidate(self, key: Path | str) -> None:
+        """Remove an entry.
+
+        Args:
+            key: File path, or a raw entry key.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM probe_index WHERE key = ?", (str(key),))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Probe index invalidate failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM probe_index")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear probe index: {e}")
+
+    def close(self) -> None:
+        """Enforce the size cap and close the database."""
+        self.prune()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton management
+_default_index: ProbeIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_probe_index(index_path: Path | None = None) -> ProbeIndex:
+    """Get or create the default ProbeIndex instance.
+
+    Args:
+        index_path: Optional path. Only used on first call.
+
+    Returns:
+        The default ProbeIndex instance.
+    """
+    global _default_index
+    with _index_lock:
+        if _default_index is None:
+            _default_index = ProbeIndex(index_path=index_path)
+        return _default_index
+
+
+def reset_probe_index() -> None:
+    """Close and reset the default probe index instance.
+
+    Primarily useful for testing.
+    """
+    global _default_index
+    with _index_lock:
+        if _default_index is not None:
+            _default_index.close()
+        _default_index = None
+
+
+__all__ = [
+    "ProbeIndex",
+    "file_fingerprint",
+    "get_probe_index",
+    "reset_probe_index",
+    "DEFAULT_PROBE_INDEX_FILE",
+    "DEFAULT_PROBE_INDEX_MAX_ENTRIES",
+]
@@ -4,6 +4,11 @@ This module provides video file integrity validation using FFprobe to ensure
 converted files are playable and not corrupted. It also includes compression
 ratio validation to detect encoding issues.
 
+The INDEX and STRICT levels additionally read the sample tables of MP4/MOV
+outputs (frame durations, keyframe positions and sample counts) and compare
+them with the source's tables. This catches truncated or malformed outputs
+without decoding any frames.
+
 SDS Reference: SDS-P01-003
 SRS Reference: SRS-501 (Conversion Result Verification)
 SRS Reference: SRS-503 (Compression Ratio Validation)
@@ -24,6 +29,8 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -34,6 +41,15 @@ from video_converter.utils.command_runner import (
     CommandNotFoundError,
     FFprobeRunner,
 )
+from video_converter.utils.isobmff import (
+    BoxParseError,
+    MovieInfo,
+    TrackInfo,
+    is_isobmff,
+    read_movie,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ValidationStrictness(Enum):
@@ -42,11 +58,13 @@ class ValidationStrictness(Enum):
     Attributes:
         QUICK: Only check if file is readable (fastest).
         STANDARD: Check integrity and basic properties (default).
+        INDEX: STANDARD plus container sample table checks, without decoding.
         STRICT: Full validation including all streams and metadata.
     """
 
     QUICK = "quick"
     STANDARD = "standard"
+    INDEX = "index"
     STRICT = "strict"
 
 
@@ -184,6 +202,7 @@ class VideoValidator:
         4. Audio stream integrity (if present)
         5. Duration is valid (> 0)
         6. Codec information is extractable
+        7. Sample tables are consistent and match the source (INDEX, STRICT)
 
     Example:
         >>> validator = VideoValidator()
@@ -203,6 +222,15 @@ class VideoValidator:
     # Minimum valid duration in seconds
     MIN_DURATION = 0.1
 
+    # Allowed frame count difference from the source (fraction of its frames)
+    FRAME_COUNT_TOLERANCE = 0.01
+
+    # Allowed track duration difference from the source in seconds
+    TRACK_DURATION_TOLERANCE = 0.5
+
+    # Longest keyframe interval in seconds accepted without a warning
+    MAX_KEYFRAME_INTERVAL = 10.0
+
     # Supported video codecs
     SUPPORTED_VIDEO_CODECS = {"h264", "hevc", "h265", "av1", "vp9", "vp8", "mpeg4"}
 
@@ -247,6 +275,7 @@ class VideoValidator:
         path: Path,
         *,
         strictness: ValidationStrictness | None = None,
+        source: Path | None = None,
     ) -> ValidationResult:
         """Validate a video file comprehensively.
 
@@ -256,6 +285,8 @@ class VideoValidator:
         Args:
             path: Path to the video file to validate.
             strictness: Override the default strictness level.
+            source: Original file the video was converted from. Sample table
+                checks compare against it when given.
 
         Returns:
             ValidationResult containing validation details.
@@ -302,13 +333,17 @@ class VideoValidator:
         self._validate_video_streams(video_info, result, level)
 
         # Step 5: Validate audio streams (if strict mode)
-        if level in (ValidationStrictness.STANDARD, ValidationStrictness.STRICT):
+        if level != ValidationStrictness.QUICK:
             self._validate_audio_streams(video_info, result, level)
 
         # Step 6: Validate duration
         self._validate_duration(video_info, result)
 
-        # Step 7: Additional strict checks
+        # Step 7: Validate sample tables against the source
+        if level in (ValidationStrictness.INDEX, ValidationStrictness.STRICT):
+            self._validate_index(path, source, result)
+
+        # Step 8: Additional strict checks
         if level == ValidationStrictness.STRICT:
             self._validate_strict(video_info, result)
 
@@ -319,6 +354,7 @@ class VideoValidator:
         path: Path,
         *,
         strictness: ValidationStrictness | None = None,
+        source: Path | None = None,
     ) -> ValidationResult:
         """Validate a video file asynchronously.
 
@@ -327,6 +363,7 @@ class VideoValidator:
         Args:
             path: Path to the video file to validate.
             strictness: Override the default strictness level.
+            source: Original file the video was converted from.
 
         Returns:
             ValidationResult containing validation details.
@@ -365,11 +402,14 @@ class VideoValidator:
 
         self._validate_video_streams(video_info, result, level)
 
-        if level in (ValidationStrictness.STANDARD, ValidationStrictness.STRICT):
+        if level != ValidationStrictness.QUICK:
             self._validate_audio_streams(video_info, result, level)
 
         self._validate_duration(video_info, result)
 
+        if level in (ValidationStrictness.INDEX, ValidationStrictness.STRICT):
+            await asyncio.to_thread(self._validate_index, path, source, result)
+
         if level == ValidationStrictness.STRICT:
             self._validate_strict(video_info, result)
 
@@ -627,6 +667,173 @@ class VideoValidator:
         elif video_info.duration < self.MIN_DURATION:
             result.add_warning(f"Very short duration: {video_info.duration:.3f}s")
 
+    def _validate_index(
+        self,
+        path: Path,
+        source: Path | None,
+        result: ValidationResult,
+    ) -> None:
+        """Validate the sample tables of an MP4/MOV file.
+
+        Checks that each track's tables agree with each other and, when the
+        source is an MP4/MOV file too, that frame counts, track durations
+        and keyframe spacing match it. Other containers are skipped.
+
+        Args:
+            path: Path to the video file.
+            source: Original file the video was converted from.
+            result: ValidationResult to update.
+        """
+        try:
+            with path.open("rb") as fp:
+                if not is_isobmff(fp):
+                    logger.debug(f"Sample table checks skipped for non-MP4/MOV file {path}")
+                    return
+            movie = read_movie(path, sample_tables=True)
+        except BoxParseError as e:
+            result.add_error(f"Malformed container: {e}")
+            return
+        except OSError as e:
+            result.add_warning(f"Could not read sample tables: {e}")
+            return
+
+        if movie.fragmented:
+            result.add_warning("Fragmented file, sample table checks skipped")
+            return
+
+        for track in movie.tracks:
+            if track.handler in ("vide", "soun"):
+                self._check_track_tables(track, result)
+
+        original = self._read_source_tables(source)
+        if original is None:
+            return
+
+        for handler, label in (("vide", "Video"), ("soun", "Audio")):
+            source_track = original.first_track(handler)
+            if source_track is None:
+                continue
+            output_track = movie.first_track(handler)
+            if output_track is None:
+                result.add_error(f"{label} track missing from output")
+                continue
+            self._compare_track_tables(label, source_track, output_track, result)
+
+    def _check_track_tables(self, track: TrackInfo, result: ValidationResult) -> None:
+        """Check that a track's sample tables are internally consistent.
+
+        Args:
+            track: Track read with its sample tables.
+            result: ValidationResult to update.
+        """
+        samples = track.samples
+        if samples is None:
+            return
+
+        name = f"Track {track.track_id}"
+        if samples.sample_count == 0:
+            result.add_error(f"{name} has no samples")
+            return
+
+        if samples.sample_count != track.sample_count:
+            result.add_error(
+                f"{name} sample tables disagree: {samples.sample_count} timed samples, "
+                f"{track.sample_count} sized samples"
+            )
+
+        if track.timescale:
+            diff = abs(samples.duration - track.duration) / track.timescale
+            if diff > self.TRACK_DURATION_TOLERANCE:
+                result.add_warning(f"{name} duration differs from its samples by {diff:.2f}s")
+
+        if track.handler != "vide" or samples.sync_samples is None:
+            return
+
+        if not samples.sync_samples:
+            result.add_error(f"{name} has no keyframes")
+        elif samples.sync_samples[-1] > samples.sample_count:
+            result.add_error(f"{name} keyframe table refers to missing samples")
+        elif samples.sync_samples[0] != 1:
+            result.add_warning(f"{name} does not start with a keyframe")
+
+    def _compare_track_tables(
+        self,
+        label: str,
+        original: TrackInfo,
+        converted: TrackInfo,
+        result: ValidationResult,
+    ) -> None:
+        """Compare the sample tables of a source and an output track.
+
+        Args:
+            label: Track kind used in messages ("Video" or "Audio").
+            original: Track from the source file.
+            converted: Track from the output file.
+            result: ValidationResult to update.
+        """
+        orig_samples = original.samples
+        conv_samples = converted.samples
+        if orig_samples is None or conv_samples is None:
+            return
+
+        orig_duration = self._table_seconds(original)
+        conv_duration = self._table_seconds(converted)
+        diff = abs(orig_duration - conv_duration)
+        if diff > self.TRACK_DURATION_TOLERANCE:
+            result.add_warning(
+                f"{label} track duration mismatch: {orig_duration:.2f}s → "
+                f"{conv_duration:.2f}s (diff: {diff:.2f}s)"
+            )
+
+        if converted.handler != "vide":
+            return
+
+        orig_frames = orig_samples.sample_count
+        conv_frames = conv_samples.sample_count
+        allowed = max(1, round(orig_frames * self.FRAME_COUNT_TOLERANCE))
+        if abs(orig_frames - conv_frames) > allowed:
+            result.add_error(f"Frame count mismatch: {orig_frames} → {conv_frames}")
+
+        conv_interval = self._keyframe_interval_seconds(converted)
+        limit = max(self.MAX_KEYFRAME_INTERVAL, self._keyframe_interval_seconds(original))
+        if conv_interval > limit:
+            result.add_warning(f"Keyframes are up to {conv_interval:.1f}s apart")
+
+    def _read_source_tables(self, source: Path | None) -> MovieInfo | None:
+        """Read the sample tables of the source file, if usable.
+
+        Args:
+            source: Original file the video was converted from.
+
+        Returns:
+            The source movie, or None if it is missing, not an MP4/MOV
+            file or fragmented.
+        """
+        if source is None:
+            return None
+        try:
+            movie = read_movie(source, sample_tables=True)
+        except (OSError, BoxParseError) as e:
+            logger.debug(f"Source sample tables unavailable for {source}: {e}")
+            return None
+        return None if movie.fragmented else movie
+
+    @staticmethod
+    def _table_seconds(track: TrackInfo) -> float:
+        """Get the duration covered by a track's samples in seconds."""
+        if track.samples is None or not track.timescale:
+            return 0.0
+        return track.samples.duration / track.timescale
+
+    @classmethod
+    def _keyframe_interval_seconds(cls, track: TrackInfo) -> float:
+        """Estimate the longest keyframe interval of a track in seconds."""
+        samples = track.samples
+        if samples is None or not samples.sample_count:
+            return 0.0
+        seconds_per_sample = cls._table_seconds(track) / samples.sample_count
+        return samples.max_sync_interval * seconds_per_sample
+
     def _validate_strict(
         self,
         video_info: VideoInfo,
@@ -0,0 +1,1051 @@
+"""Native QuickTime/MP4 metadata reader and writer.
+
+This module reads and writes the handful of metadata tags that matter
+for converted videos directly in the movie header (moov) of MP4 and
+QuickTime files, without starting ExifTool:
+
+- Movie, track and media creation/modification dates (mvhd, tkhd, mdhd)
+- GPS coordinates (udta ©xyz and the Keys location.ISO6709 entry)
+- Camera make and model (udta ©mak/©mod and Keys entries)
+- The Keys creation date written by Apple devices
+
+ExifTool rewrites the whole file for every write. Here only the moov box
+is rewritten: either the new moov fits in the space of the old one plus
+any free boxes right after it, or moov is the last box in the file and
+can grow. The media data never moves, so chunk offsets stay valid. When
+neither is possible the writer reports it and callers fall back to
+ExifTool.
+
+On file systems with copy-on-write clones (APFS, Btrfs, XFS) the box
+is patched in a clone of the file next to it, which then replaces the
+original, so an interrupted write never leaves a damaged movie header
+behind. Elsewhere the box is patched in place, since copying the whole
+file would cost as much as an ExifTool write.
+
+Values are returned with the same names and formatting that
+``exiftool -G -n`` uses (e.g. ``QuickTime:CreateDate`` as
+``"2024:01:15 10:30:00"``), so they can be compared with ExifTool output.
+
+SDS Reference: SDS-P01-002
+SRS Reference: SRS-401 (Metadata Preservation)
+
+Example:
+    >>> native = QuickTimeMetadata()
+    >>> tags = native.read(Path("original.mov"))
+    >>> print(tags.get("QuickTime:GPSCoordinates"))
+    >>> if not native.copy(Path("original.mov"), Path("output.mp4"), ["GPS*"]):
+    ...     processor.copy_gps(original, output)  # ExifTool fallback
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+import shutil
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from video_converter.utils.file_utils import clone_file
+from video_converter.utils.isobmff import (
+    Box,
+    BoxParseError,
+    find_box,
+    find_boxes,
+    is_isobmff,
+    iter_boxes,
+    iter_file_boxes,
+    make_box,
+)
+
+logger = logging.getLogger(__name__)
+
+# QuickTime timestamps count seconds since 1904-01-01 UTC
+QUICKTIME_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)
+
+# Largest movie header read into memory for an edit
+MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+# Tags this module can read and write, by ExifTool tag name
+NATIVE_TAGS = (
+    "CreateDate",
+    "ModifyDate",
+    "TrackCreateDate",
+    "TrackModifyDate",
+    "MediaCreateDate",
+    "MediaModifyDate",
+    "GPSCoordinates",
+    "Make",
+    "Model",
+    "CreationDate",
+)
+
+# Composite tags derived from a native tag
+_TAG_ALIASES = {"GPSPosition": "GPSCoordinates"}
+
+# Composite GPS tags that ExifTool derives from GPSCoordinates; copying
+# the coordinates copies them
+_COPY_ALIASES = {
+    **_TAG_ALIASES,
+    "GPSLatitude": "GPSCoordinates",
+    "GPSLongitude": "GPSCoordinates",
+    "GPSAltitude": "GPSCoordinates",
+    "GPSLatitudeRef": "GPSCoordinates",
+    "GPSLongitudeRef": "GPSCoordinates",
+    "GPSAltitudeRef": "GPSCoordinates",
+}
+
+# Tags a QuickTime file can only hold in boxes this module treats as
+# opaque, so a file without those boxes does not have them
+_OPAQUE_ONLY_TAGS = frozenset({"DateTimeOriginal"})
+
+# ExifTool groups whose tags live in the boxes handled here
+_QUICKTIME_GROUP = re.compile(r"^(QuickTime|UserData|Keys|ItemList|Track\d*)$", re.IGNORECASE)
+
+# Header box and field index (0 = creation, 1 = modification) per date tag
+_HEADER_DATES = {
+    "CreateDate": ("mvhd", 0),
+    "ModifyDate": ("mvhd", 1),
+    "TrackCreateDate": ("tkhd", 0),
+    "TrackModifyDate": ("tkhd", 1),
+    "MediaCreateDate": ("mdhd", 0),
+    "MediaModifyDate": ("mdhd", 1),
+}
+
+# QuickTime user data text items
+_USER_DATA_ITEMS = {
+    "GPSCoordinates": "©xyz",
+    "Make": "©mak",
+    "Model": "©mod",
+}
+
+# Apple metadata keys (moov/meta with an mdta handler)
+_KEYS_ITEMS = {
+    "GPSCoordinates": "com.apple.quicktime.location.ISO6709",
+    "Make": "com.apple.quicktime.make",
+    "Model": "com.apple.quicktime.model",
+    "CreationDate": "com.apple.quicktime.creationdate",
+}
+
+# Boxes that can hold metadata this module does not parse (XMP, vendor
+# UUID boxes, the UserData "date" DateTimeOriginal)
+_OPAQUE_BOXES = frozenset({"XMP_", "uuid", "date"})
+
+# Language code "und" packed as in QuickTime user data strings
+_UNDETERMINED_LANGUAGE = 0x55C4
+
+# Well-known data type for UTF-8 text in metadata item lists
+_UTF8_TYPE = 1
+
+_DATE_PATTERN = re.compile(
+    r"^(\d{4})[:-](\d{2})[:-](\d{2})[ T](\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.\d+)?\s*(Z|[+-]\d{2}:?\d{2})?$"
+)
+_NUMBER_PATTERN = re.compile(r"[+-]?\d+(?:\.\d+)?")
+
+
+class QuickTimeMetadataError(Exception):
+    """Raised when a file's movie header cannot be parsed."""
+
+    def __init__(self, path: Path, reason: str) -> None:
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Failed to parse QuickTime metadata in {path}: {reason}")
+
+
+@dataclass
+class _Movie:
+    """The movie header of an open file and the space around it.
+
+    Attributes:
+        moov: Location of the moov box in the file.
+        data: Contents of the moov box.
+        room: Bytes available for a rewritten moov without moving data.
+        is_last: True if only free space follows moov, so it may grow.
+        opaque: True if a top-level UUID box may hold other metadata.
+    """
+
+    moov: Box
+    data: bytes
+    room: int
+    is_last: bool
+    opaque: bool
+
+
+class QuickTimeMetadata:
+    """Read and write core QuickTime metadata without ExifTool.
+
+    Reading and writing return None/False rather than raising for files
+    that are not MP4/QuickTime or that need ExifTool, so callers can
+    fall back to it.
+
+    Example:
+        >>> native = QuickTimeMetadata()
+        >>> native.write(Path("output.mp4"), {"Make": "Apple", "Model": "iPhone 15"})
+        True
+    """
+
+    @staticmethod
+    def native_tag(name: str) -> str | None:
+        """Resolve an ExifTool tag name to a natively supported tag.
+
+        Args:
+            name: Tag name, optionally with a QuickTime group prefix.
+
+        Returns:
+            The native tag name, or None if the tag is not supported.
+        """
+        group, _, tag = name.rpartition(":")
+        if group and not _QUICKTIME_GROUP.match(group):
+            return None
+        tag = _TAG_ALIASES.get(tag, tag)
+        for native in NATIVE_TAGS:
+            if native.lower() == tag.lower():
+                return native
+        return None
+
+    def read(self, path: Path) -> dict[str, Any]:
+        """Read the supported tags of a file.
+
+        Args:
+            path: Path to the video file.
+
+        Returns:
+            Dictionary of ``QuickTime:<Tag>`` names to values, formatted
+            as ExifTool reports them with ``-n``.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            QuickTimeMetadataError: If the file is not a readable MP4/MOV.
+        """
+        values = self._read_native(path)
+        return {f"QuickTime:{tag}": value for tag, value in values.items()}
+
+    def write(self, path: Path, tags: dict[str, str]) -> bool:
+        """Write tags into a file's movie header.
+
+        Args:
+            path: Path to the video file.
+            tags: Mapping of ExifTool tag names to values in ExifTool's
+                input format.
+
+        Returns:
+            True if all tags were written. False if the file or a tag is
+            not supported, or the movie header has no room to grow;
+            nothing is modified in that case.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        values: dict[str, Any] = {}
+        for name, value in tags.items():
+            tag = self.native_tag(name)
+            encoded = self._encode_value(tag, value) if tag is not None else None
+            if encoded is None:
+                logger.debug(f"Tag {name}={value!r} needs ExifTool")
+                return False
+            values[tag] = encoded  # type: ignore[index]
+
+        if not values:
+            return True
+
+        try:
+            with path.open("rb") as fp:
+                movie = self._load_movie(fp)
+                if movie is None:
+                    return False
+                new_moov = self._rebuild_moov(movie.data, values)
+                if new_moov is None:
+                    return False
+        except (BoxParseError, struct.error, UnicodeDecodeError) as e:
+            logger.debug(f"Cannot edit {path} natively: {e}")
+            return False
+
+        replacement = self._place_moov(movie, new_moov)
+        if replacement is None:
+            return False
+        return self._store_moov(path, movie, replacement)
+
+    def copy(self, source: Path, dest: Path, tags: list[str]) -> bool:
+        """Copy tags from one file to another without ExifTool.
+
+        Tag patterns follow ExifTool's ``-tagsFromFile`` arguments
+        (e.g. ``"GPS*"`` or ``"CreateDate"``). Only tags present in the
+        source are written, as with ExifTool.
+
+        Args:
+            source: Source file with metadata.
+            dest: Destination file to receive metadata.
+            tags: Tag names or wildcard patterns.
+
+        Returns:
+            True if the tags were copied. False if the source may hold
+            matching tags this module cannot read (e.g. XMP), a pattern
+            is not supported, or the destination cannot be edited in
+            place.
+
+        Raises:
+            FileNotFoundError: If source or dest doesn't exist.
+        """
+        if not dest.exists():
+            raise FileNotFoundError(f"Destination file not found: {dest}")
+
+        try:
+            values = self._read_native(source, require_complete=True)
+        except QuickTimeMetadataError as e:
+            logger.debug(f"Cannot copy natively: {e}")
+            return False
+
+        selected: dict[str, str] = {}
+        for pattern in tags:
+            group, _, name = pattern.rpartition(":")
+            if group and not _QUICKTIME_GROUP.match(group):
+                logger.debug(f"Tag pattern {pattern} needs ExifTool")
+                return False
+            if name in _OPAQUE_ONLY_TAGS:
+                continue
+            name = _COPY_ALIASES.get(name, name).lower()
+            matches = [tag for tag in NATIVE_TAGS if fnmatch.fnmatchcase(tag.lower(), name)]
+            if not matches:
+                logger.debug(f"Tag pattern {pattern} needs ExifTool")
+                return False
+            for tag in matches:
+                if tag in values:
+                    selected[tag] = values[tag]
+
+        return self.write(dest, selected)
+
+    def _read_native(self, path: Path, *, require_complete: bool = False) -> dict[str, str]:
+        """Read supported tags by native tag name.
+
+        Args:
+            path: Path to the video file.
+            require_complete: Fail if the file has boxes that may hold
+                metadata this module does not parse.
+
+        Returns:
+            Dictionary of native tag names to ExifTool-formatted values.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            QuickTimeMetadataError: If the file cannot be read natively.
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        try:
+            with path.open("rb") as fp:
+                movie = self._load_movie(fp)
+                if movie is None:
+                    raise QuickTimeMetadataError(path, "no movie header")
+                values, complete = self._parse_moov(movie.data)
+                complete = complete and not movie.opaque
+        except (BoxParseError, struct.error, UnicodeDecodeError) as e:
+            raise QuickTimeMetadataError(path, str(e)) from e
+
+        if require_complete and not complete:
+            raise QuickTimeMetadataError(path, "metadata in boxes that need ExifTool")
+        return values
+
+    def _load_movie(self, fp: BinaryIO) -> _Movie | None:
+        """Locate and read the moov box of an open file.
+
+        Args:
+            fp: File opened in binary mode.
+
+        Returns:
+            The movie header, or None if the file is not MP4/QuickTime.
+
+        Raises:
+            BoxParseError: If the box structure is invalid.
+        """
+        if not is_isobmff(fp):
+            return None
+
+        boxes = list(iter_file_boxes(fp))
+        index = next((i for i, box in enumerate(boxes) if box.type == "moov"), None)
+        if index is None:
+            return None
+
+        moov = boxes[index]
+        if moov.size > MAX_MOOV_SIZE:
+            return None
+
+        room = moov.size
+        following = boxes[index + 1 :]
+        for box in following:
+            if box.type not in ("free", "skip"):
+                break
+            room += box.size
+        is_last = all(box.type in ("free", "skip") for box in following)
+        opaque = any(box.type == "uuid" for box in boxes)
+
+        fp.seek(moov.offset)
+        data = fp.read(moov.size)
+        return _Movie(moov, data, room, is_last, opaque)
+
+    def _parse_moov(self, data: bytes) -> tuple[dict[str, str], bool]:
+        """Extract supported tags from a moov box.
+
+        Args:
+            data: Contents of the moov box, header included.
+
+        Returns:
+            Tuple of (native tag values, whether no opaque boxes were seen).
+        """
+        moov = next(iter_boxes(data))
+        values: dict[str, str] = {}
+        complete = True
+
+        for child in iter_boxes(data, moov.payload_offset, moov.end):
+            if child.type in _OPAQUE_BOXES:
+                complete = False
+            elif child.type == "mvhd":
+                self._read_header_dates(data, child, "CreateDate", "ModifyDate", values)
+            elif child.type == "trak":
+                tkhd = find_box(data, "tkhd", child.payload_offset, child.end)
+                if tkhd is not None:
+                    self._read_header_dates(
+                        data, tkhd, "TrackCreateDate", "TrackModifyDate", values
+                    )
+                mdhd = find_box(data, "mdia/mdhd", child.payload_offset, child.end)
+                if mdhd is not None:
+                    self._read_header_dates(
+                        data, mdhd, "MediaCreateDate", "MediaModifyDate", values
+                    )
+            elif child.type == "udta":
+                for item in iter_boxes(data, child.payload_offset, child.end):
+                    if item.type in _OPAQUE_BOXES:
+                        complete = False
+                    elif item.type == "meta":
+                        for key, text in self._read_meta_items(data, item).items():
+                            self._store_item(key, text, values)
+                    else:
+                        tag = _tag_for_user_data(item.type)
+                        if tag is not None:
+                            text = self._read_user_data_text(data, item)
+                            self._store_item(tag, text, values)
+            elif child.type == "meta":
+                for key, text in self._read_meta_items(data, child).items():
+                    self._store_item(key, text, values)
+
+        return values, complete
+
+    @staticmethod
+    def _read_header_dates(
+        data: bytes,
+        box: Box,
+        create_tag: str,
+        modify_tag: str,
+        values: dict[str, str],
+    ) -> None:
+        """Read the creation and modification time of a header box.
+
+        The first occurrence of each tag wins, as ExifTool lists the
+        first track first.
+
+        Args:
+            data: Buffer containing the box.
+            box: An mvhd, tkhd or mdhd box.
+            create_tag: Tag name for the creation time.
+            modify_tag: Tag name for the modification time.
+            values: Dictionary the values are added to.
+        """
+        version = data[box.payload_offset]
+        fmt = ">QQ" if version == 1 else ">II"
+        created, modified = struct.unpack_from(fmt, data, box.payload_offset + 4)
+        values.setdefault(create_tag, _format_quicktime_time(created))
+        values.setdefault(modify_tag, _format_quicktime_time(modified))
+
+    @staticmethod
+    def _store_item(tag_or_key: str, text: str, values: dict[str, str]) -> None:
+        """Normalize a text item and add it under its tag name.
+
+        Args:
+            tag_or_key: Tag name, or an Apple metadata key.
+            text: Raw text of the item.
+            values: Dictionary the value is added to.
+        """
+        tag = _tag_for_key(tag_or_key) or tag_or_key
+        if tag == "GPSCoordinates":
+            normalized = _format_iso6709(text)
+            if normalized is not None:
+                values.setdefault(tag, normalized)
+        elif tag == "CreationDate":
+            values.setdefault(tag, _format_creation_date(text))
+        elif tag in NATIVE_TAGS:
+            values.setdefault(tag, text)
+
+    @staticmethod
+    def _read_user_data_text(data: bytes, item: Box) -> str:
+        """Decode a QuickTime international text user data item.
+
+        Args:
+            data: Buffer containing the item.
+            item: A ©-prefixed user data box.
+
+        Returns:
+            The text of the first string in the item.
+        """
+        payload = data[item.payload_offset : item.end]
+        if len(payload) >= 4:
+            length = struct.unpack_from(">H", payload, 0)[0]
+            if 4 + length <= len(payload):
+                return payload[4 : 4 + length].decode("utf-8", errors="replace").rstrip("\0")
+        return payload.decode("utf-8", errors="replace").rstrip("\0")
+
+    def _read_meta_items(self, data: bytes, meta: Box) -> dict[str, str]:
+        """Decode the text items of a metadata box.
+
+        Handles both Apple key lists (items indexed into ``keys``) and
+        iTunes-style lists whose items are named by their box type.
+
+        Args:
+            data: Buffer containing the box.
+            meta: A meta box.
+
+        Returns:
+            Dictionary of key or tag names to text values.
+        """
+        start = _meta_children_offset(data, meta)
+        keys: list[str] = []
+        keys_box = find_box(data, "keys", start, meta.end)
+        if keys_box is not None:
+            keys = _parse_keys(data, keys_box)
+
+        ilst = find_box(data, "ilst", start, meta.end)
+        if ilst is None:
+            return {}
+
+        items: dict[str, str] = {}
+        for item in iter_boxes(data, ilst.payload_offset, ilst.end):
+            raw_type = item.type.encode("latin-1")
+            if keys_box is not None:
+                index = struct.unpack(">I", raw_type)[0]
+                if not 1 <= index <= len(keys):
+                    continue
+                name = keys[index - 1]
+            else:
+                tag = _tag_for_user_data(item.type)
+                if tag is None:
+                    continue
+                name = tag
+
+            data_box = find_box(data, "data", item.payload_offset, item.end)
+            if data_box is None or data_box.size < 16:
+                continue
+            value_type = struct.unpack_from(">I", data, data_box.payload_offset)[0] & 0xFFFFFF
+            if value_type != _UTF8_TYPE:
+                continue
+            text = data[data_box.payload_offset + 8 : data_box.end].decode("utf-8")
+            items.setdefault(name, text)
+        return items
+
+    @staticmethod
+    def _encode_value(tag: str, value: str) -> Any:
+        """Convert an ExifTool-style input value to its stored form.
+
+        Args:
+            tag: Native tag name.
+            value: Value as passed to ExifTool.
+
+        Returns:
+            Seconds since 1904 for header dates, the text to store for
+            other tags, or None if the value cannot be written natively.
+        """
+        value = str(value).strip()
+        if tag in _HEADER_DATES:
+            moment = _parse_date(value)
+            if moment is None:
+                return None
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            seconds = int((moment - QUICKTIME_EPOCH).total_seconds())
+            return seconds if seconds >= 0 else None
+        if tag == "GPSCoordinates":
+            return _to_iso6709(value)
+        if tag == "CreationDate":
+            moment = _parse_date(value)
+            if moment is None:
+                return None
+            text = moment.strftime("%Y-%m-%dT%H:%M:%S")
+            if moment.tzinfo is not None:
+                text += moment.strftime("%z")
+            return text
+        return value or None
+
+    def _rebuild_moov(self, data: bytes, values: dict[str, Any]) -> bytes | None:
+        """Build a moov box with updated tags.
+
+        Header dates are patched at their fixed positions; user data and
+        Apple key lists are re-serialized. Free space inside moov is
+        dropped, since it is reclaimed around the box.
+
+        Args:
+            data: Contents of the moov box, header included.
+            values: Native tag names mapped to encoded values.
+
+        Returns:
+            The new moov box, or None if a date does not fit its field.
+        """
+        buffer = bytearray(data)
+        moov = next(iter_boxes(buffer))
+
+        for tag, (box_type, field) in _HEADER_DATES.items():
+            if tag not in values:
+                continue
+            for box in self._header_boxes(buffer, moov, box_type):
+                if not _patch_header_date(buffer, box, field, values[tag]):
+                    return None
+
+        user_data = {
+            _USER_DATA_ITEMS[tag]: value for tag, value in values.items() if tag in _USER_DATA_ITEMS
+        }
+        keyed = {_KEYS_ITEMS[tag]: value for tag, value in values.items() if tag in _KEYS_ITEMS}
+        if not user_data and not keyed:
+            return bytes(buffer)
+
+        parts: list[bytes] = []
+        has_udta = False
+        has_keys = False
+        for child in iter_boxes(buffer, moov.payload_offset, moov.end):
+            if child.type in ("free", "skip"):
+                continue
+            if child.type == "udta" and user_data:
+                parts.append(self._rebuild_udta(buffer, child, user_data))
+                has_udta = True
+            elif child.type == "meta" and keyed and _meta_handler(buffer, child) == "mdta":
+                parts.append(self._rebuild_keys_meta(buffer, child, keyed))
+                has_keys = True
+            else:
+                parts.append(bytes(buffer[child.offset : child.end]))
+
+        if user_data and not has_udta:
+            parts.append(
+                make_box("udta", b"".join(_user_data_item(k, v) for k, v in user_data.items()))
+            )
+        if keyed and not has_keys:
+            parts.append(self._new_keys_meta(keyed))
+
+        return make_box("moov", b"".join(parts))
+
+    @staticmethod
+    def _header_boxes(data: bytearray, moov: Box, box_type: str) -> list[Box]:
+        """Find all header boxes of one type within moov.
+
+        Args:
+            data: Buffer containing moov.
+            moov: The moov box.
+            box_type: "mvhd", "tkhd" or "mdhd".
+
+        Returns:
+            The matching boxes.
+        """
+        if box_type == "mvhd":
+            return find_boxes(data, "mvhd", moov.payload_offset, moov.end)
+        path = "tkhd" if box_type == "tkhd" else "mdia/mdhd"
+        boxes = []
+        for trak in find_boxes(data, "trak", moov.payload_offset, moov.end):
+            box = find_box(data, path, trak.payload_offset, trak.end)
+            if box is not None:
+                boxes.append(box)
+        return boxes
+
+    def _rebuild_udta(self, data: bytearray, udta: Box, items: dict[str, str]) -> bytes:
+        """Re-serialize a user data box with updated text items.
+
+        Args:
+            data: Buffer containing the box.
+            udta: The udta box.
+            items: User data item types mapped to text.
+
+        Returns:
+            The new udta box.
+        """
+        parts: list[bytes] = []
+        pending = dict(items)
+        for item in iter_boxes(data, udta.payload_offset, udta.end):
+            if item.type in pending:
+                language = _user_data_language(data, item)
+                parts.append(_user_data_item(item.type, pending.pop(item.type), language))
+            elif item.type == "meta" and _meta_handler(data, item) == "mdir":
+                parts.append(self._rebuild_item_list_meta(data, item, items))
+            else:
+                parts.append(bytes(data[item.offset : item.end]))
+        parts.extend(_user_data_item(item_type, text) for item_type, text in pending.items())
+        return make_box("udta", b"".join(parts))
+
+    @staticmethod
+    def _rebuild_item_list_meta(data: bytearray, meta: Box, items: dict[str, str]) -> bytes:
+        """Update existing items of an iTunes-style metadata box.
+
+        Only items already present are replaced; new tags go to the
+        QuickTime user data list instead.
+
+        Args:
+            data: Buffer containing the box.
+            meta: A meta box with an mdir handler.
+            items: Item types mapped to text.
+
+        Returns:
+            The new meta box.
+        """
+        start = _meta_children_offset(data, meta)
+        parts = [bytes(data[meta.payload_offset : start])]
+        for child in iter_boxes(data, start, meta.end):
+            if child.type != "ilst":
+                parts.append(bytes(data[child.offset : child.end]))
+                continue
+            entries = []
+            for entry in iter_boxes(data, child.payload_offset, child.end):
+                if entry.type in items:
+                    entries.append(
+                        _item_list_entry(entry.type.encode("latin-1"), items[entry.type])
+                    )
+                else:
+                    entries.append(bytes(data[entry.offset : entry.end]))
+            parts.append(make_box("ilst", b"".join(entries)))
+        return make_box("meta", b"".join(parts))
+
+    @staticmethod
+    def _rebuild_keys_meta(data: bytearray, meta: Box, items: dict[str, str]) -> bytes:
+        """Re-serialize an Apple key list metadata box with updated items.
+
+        Args:
+            data: Buffer containing the box.
+            meta: A meta box with an mdta handler.
+            items: Apple metadata keys mapped to text.
+
+        Returns:
+            The new meta box.
+        """
+        start = _meta_children_offset(data, meta)
+        keys_box = find_box(data, "keys", start, meta.end)
+        keys = _parse_keys(data, keys_box) if keys_box is not None else []
+        namespaces = _parse_key_namespaces(data, keys_box) if keys_box is not None else []
+
+        ilst = find_box(data, "ilst", start, meta.end)
+        entries: list[tuple[int, bytes]] = []
+        if ilst is not None:
+            for entry in iter_boxes(data, ilst.payload_offset, ilst.end):
+                index = struct.unpack(">I", entry.type.encode("latin-1"))[0]
+                entries.append((index, bytes(data[entry.offset : entry.end])))
+
+        for key, text in items.items():
+            if key in keys:
+                index = keys.index(key) + 1
+            else:
+                keys.append(key)
+                namespaces.append("mdta")
+                index = len(keys)
+            encoded = _item_list_entry(struct.pack(">I", index), text)
+            for position, (existing, _) in enumerate(entries):
+                if existing == index:
+                    entries[position] = (index, encoded)
+                    break
+            else:
+                entries.append((index, encoded))
+
+        parts = [bytes(data[meta.payload_offset : start])]
+        for child in iter_boxes(data, start, meta.end):
+            if child.type == "keys":
+                parts.append(_keys_box(keys, namespaces))
+            elif child.type == "ilst":
+                parts.append(make_box("ilst", b"".join(entry for _, entry in entries)))
+            else:
+                parts.append(bytes(data[child.offset : child.end]))
+        if keys_box is None:
+            parts.append(_keys_box(keys, namespaces))
+        if ilst is None:
+            parts.append(make_box("ilst", b"".join(entry for _, entry in entries)))
+        return make_box("meta", b"".join(parts))
+
+    @staticmethod
+    def _new_keys_meta(items: dict[str, str]) -> bytes:
+        """Build an Apple key list metadata box from scratch.
+
+        Args:
+            items: Apple metadata keys mapped to text.
+
+        Returns:
+            A new meta box in the layout Apple devices write.
+        """
+        handler = make_box("hdlr", struct.pack(">I4x4s12x", 0, b"mdta") + b"\0")
+        keys = list(items)
+        entries = b"".join(
+            _item_list_entry(struct.pack(">I", index), items[key])
+            for index, key in enumerate(keys, start=1)
+        )
+        return make_box(
+            "meta", handler + _keys_box(keys, ["mdta"] * len(keys)) + make_box("ilst", entries)
+        )
+
+    @staticmethod
+    def _place_moov(movie: _Movie, new_moov: bytes) -> bytes | None:
+        """Get the bytes that replace the old moov box and its free space.
+
+        Args:
+            movie: The current movie header.
+            new_moov: The rebuilt moov box.
+
+        Returns:
+            The new moov, padded with a free box to fill the old space,
+            or None if it does not fit without moving media data.
+        """
+        size = len(new_moov)
+        if movie.is_last or size == movie.room:
+            return new_moov
+        if size + 8 <= movie.room:
+            return new_moov + make_box("free", b"\0" * (movie.room - size - 8))
+        logger.debug(f"Movie header needs {size} bytes, only {movie.room} available")
+        return None
+
+    @staticmethod
+    def _store_moov(path: Path, movie: _Movie, replacement: bytes) -> bool:
+        """Write the rebuilt moov box into a file.
+
+        When the file system can clone the file, the box is written to a
+        clone that is atomically renamed over the original once it is on
+        disk. Otherwise the box is written in place.
+
+        Args:
+            path: Path to the video file.
+            movie: The current movie header.
+            replacement: Bytes to write at the moov box's offset.
+
+        Returns:
+            True once the file has the new moov box.
+        """
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            clone_file(path, temp_path, allow_hardlink=False, allow_copy=False)
+        except OSError as e:
+            logger.debug(f"Cannot clone {path.name}, writing in place: {e}")
+            _patch_moov(path, movie, replacement)
+            return True
+
+        try:
+            _patch_moov(temp_path, movie, replacement)
+            shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        _fsync_directory(path.parent)
+        logger.debug(f"Rewrote movie header of {path.name} in a clone")
+        return True
+
+
+def _patch_moov(path: Path, movie: _Movie, replacement: bytes) -> None:
+    """Write a rebuilt moov box at its offset and flush it to disk."""
+    with path.open("r+b") as fp:
+        fp.seek(movie.moov.offset)
+        fp.write(replacement)
+        if movie.is_last:
+            fp.truncate(movie.moov.offset + len(replacement))
+        fp.flush()
+        os.fsync(fp.fileno())
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory entry change, such as a rename, to disk."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _tag_for_user_data(item_type: str) -> str | None:
+    """Map a user data item type to its tag name."""
+    for tag, candidate in _USER_DATA_ITEMS.items():
+        if candidate == item_type:
+            return tag
+    return None
+
+
+def _tag_for_key(key: str) -> str | None:
+    """Map an Apple metadata key to its tag name."""
+    for tag, candidate in _KEYS_ITEMS.items():
+        if candidate == key:
+            return tag
+    return None
+
+
+def _meta_children_offset(data: bytes | bytearray, meta: Box) -> int:
+    """Get the offset of the first child of a meta box.
+
+    QuickTime meta boxes start directly with their children, while
+    ISO meta boxes have a version/flags field first.
+
+    Args:
+        data: Buffer containing the box.
+        meta: A meta box.
+
+    Returns:
+        Offset of the first child box.
+    """
+    start = meta.payload_offset
+    if data[start + 4 : start + 8] == b"hdlr":
+        return start
+    return start + 4
+
+
+def _meta_handler(data: bytes | bytearray, meta: Box) -> str | None:
+    """Get the handler type of a meta box (e.g. "mdta" or "mdir")."""
+    hdlr = find_box(data, "hdlr", _meta_children_offset(data, meta), meta.end)
+    if hdlr is None or hdlr.size < hdlr.header_size + 12:
+        return None
+    return bytes(data[hdlr.payload_offset + 8 : hdlr.payload_offset + 12]).decode("latin-1")
+
+
+def _parse_keys(data: bytes | bytearray, keys_box: Box) -> list[str]:
+    """Decode the key names of a keys box."""
+    return [name for _, name in _iter_keys(data, keys_box)]
+
+
+def _parse_key_namespaces(data: bytes | bytearray, keys_box: Box) -> list[str]:
+    """Decode the key namespaces of a keys box."""
+    return [namespace for namespace, _ in _iter_keys(data, keys_box)]
+
+
+def _iter_keys(data: bytes | bytearray, keys_box: Box) -> list[tuple[str, str]]:
+    """Decode the (namespace, name) entries of a keys box."""
+    count = struct.unpack_from(">I", data, keys_box.payload_offset + 4)[0]
+    entries = []
+    offset = keys_box.payload_offset + 8
+    for _ in range(count):
+        size, namespace = struct.unpack_from(">I4s", data, offset)
+        if size < 8 or offset + size > keys_box.end:
+            raise BoxParseError(offset, "invalid key entry")
+        name = bytes(data[offset + 8 : offset + size]).decode("utf-8")
+        entries.append((namespace.decode("latin-1"), name))
+        offset += size
+    return entries
+
+
+def _keys_box(keys: list[str], namespaces: list[str]) -> bytes:
+    """Serialize a keys box."""
+    entries = b""
+    for namespace, key in zip(namespaces, keys, strict=True):
+        encoded = key.encode("utf-8")
+        entries += struct.pack(">I4s", 8 + len(encoded), namespace.encode("latin-1")) + encoded
+    return make_box("keys", struct.pack(">II", 0, len(keys)) + entries)
+
+
+def _item_list_entry(name: bytes, text: str) -> bytes:
+    """Serialize a metadata item holding one UTF-8 data box."""
+    data = make_box("data", struct.pack(">II", _UTF8_TYPE, 0) + text.encode("utf-8"))
+    return make_box(name.decode("latin-1"), data)
+
+
+def _user_data_item(item_type: str, text: str, language: int = _UNDETERMINED_LANGUAGE) -> bytes:
+    """Serialize a QuickTime international text user data item."""
+    encoded = text.encode("utf-8")
+    return make_box(item_type, struct.pack(">HH", len(encoded), language) + encoded)
+
+
+def _user_data_language(data: bytes | bytearray, item: Box) -> int:
+    """Get the language code of an existing user data text item."""
+    if item.size >= item.header_size + 4:
+        return struct.unpack_from(">H", data, item.payload_offset + 2)[0]
+    return _UNDETERMINED_LANGUAGE
+
+
+def _patch_header_date(data: bytearray, box: Box, field: int, seconds: int) -> bool:
+    """Overwrite the creation or modification time of a header box.
+
+    Args:
+        data: Buffer containing the box.
+        box: An mvhd, tkhd or mdhd box.
+        field: 0 for the creation time, 1 for the modification time.
+        seconds: New value in seconds since 1904.
+
+    Returns:
+        False if the value does not fit a 32-bit field.
+    """
+    version = data[box.payload_offset]
+    if version == 1:
+        struct.pack_into(">Q", data, box.payload_offset + 4 + 8 * field, seconds)
+        return True
+    if seconds > 0xFFFFFFFF:
+        return False
+    struct.pack_into(">I", data, box.payload_offset + 4 + 4 * field, seconds)
+    return True
+
+
+def _format_quicktime_time(seconds: int) -> str:
+    """Format a QuickTime timestamp as ExifTool does."""
+    if seconds == 0:
+        return "0000:00:00 00:00:00"
+    return (QUICKTIME_EPOCH + timedelta(seconds=seconds)).strftime("%Y:%m:%d %H:%M:%S")
+
+
+def _parse_date(value: str) -> datetime | None:
+    """Parse an ExifTool or ISO 8601 date, keeping any time zone."""
+    match = _DATE_PATTERN.match(value.strip())
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, zone = match.groups()
+    tzinfo = None
+    if zone == "Z":
+        tzinfo = timezone.utc
+    elif zone:
+        digits = zone[1:].replace(":", "")
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tzinfo = timezone(-offset if zone[0] == "-" else offset)
+    try:
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=tzinfo
+        )
+    except ValueError:
+        return None
+
+
+def _format_creation_date(text: str) -> str:
+    """Format an Apple creation date (ISO 8601) as ExifTool does."""
+    moment = _parse_date(text)
+    if moment is None:
+        return text
+    result = moment.strftime("%Y:%m:%d %H:%M:%S")
+    offset = moment.utcoffset()
+    if offset is not None:
+        zone = moment.strftime("%z")
+        result += f"{zone[:3]}:{zone[3:]}"
+    return result
+
+
+def _format_iso6709(text: str) -> str | None:
+    """Format an ISO 6709 location as ExifTool's numeric GPSCoordinates."""
+    parts = _NUMBER_PATTERN.findall(text)
+    if len(parts) < 2:
+        return None
+    return " ".join(f"{float(part):.10g}" for part in parts[:3])
+
+
+def _to_iso6709(value: str) -> str | None:
+    """Convert a coordinate string (ISO 6709 or "lat lon [alt]") to ISO 6709."""
+    parts = _NUMBER_PATTERN.findall(value)
+    if len(parts) < 2:
+        return None
+    latitude, longitude = float(parts[0]), float(parts[1])
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return None
+    text = f"{latitude:+010.6f}{longitude:+011.6f}"
+    if len(parts) > 2:
+        text += f"{float(parts[2]):+.3f}"
+    return text + "/"
@@ -434,7 +434,10 @@ class RetryManager:
 
             validation_result = None
             if conversion_result.success and validator:
-                validation_result = validator.validate(current_request.output_path)
+                validation_result = validator.validate(
+                    current_request.output_path,
+                    source=current_request.input_path,
+                )
                 if not validation_result.valid:
                     conversion_result.success = False
                     conversion_result.error_message = (
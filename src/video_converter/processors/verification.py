@@ -314,7 +314,7 @@ class MetadataVerifier:
             checks.extend(self._verify_dates(orig_meta, conv_meta, tol))
 
         if VerificationCategory.GPS in cats:
-            checks.extend(self._verify_gps(original, converted, tol))
+            checks.extend(self._verify_gps(orig_meta, conv_meta, tol))
 
         if VerificationCategory.CAMERA in cats:
             checks.extend(self._verify_camera(orig_meta, conv_meta))
@@ -428,15 +428,15 @@ class MetadataVerifier:
 
     def _verify_gps(
         self,
-        original: Path,
-        converted: Path,
+        orig_meta: dict[str, Any],
+        conv_meta: dict[str, Any],
         tolerance: ToleranceSettings,
     ) -> list[CheckResult]:
         """Verify GPS metadata preservation.
 
         Args:
-            original: Path to original file.
-            converted: Path to converted file.
+            orig_meta: Metadata from original file.
+            conv_meta: Metadata from converted file.
             tolerance: Tolerance settings.
 
         Returns:
@@ -445,12 +445,12 @@ class MetadataVerifier:
         results: list[CheckResult] = []
 
         try:
-            orig_gps = self._gps_handler.extract(original)
+            orig_gps = self._gps_handler.from_metadata(orig_meta)
         except Exception:
             orig_gps = None
 
         try:
-            conv_gps = self._gps_handler.extract(converted)
+            conv_gps = self._gps_handler.from_metadata(conv_meta)
         except Exception:
             conv_gps = None
 
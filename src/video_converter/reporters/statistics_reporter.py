@@ -23,8 +23,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, TextIO
 
+from video_converter.utils.file_utils import write_json_stream
+
 if TYPE_CHECKING:
-    from video_converter.core.history import HistoryStatistics
+    from collections.abc import Iterable
+
+    from video_converter.core.history import ConversionRecord, HistoryStatistics
 
 
 def _format_size(size_bytes: int) -> str:
@@ -223,22 +227,34 @@ class StatisticsReporter:
         self,
         stats: HistoryStatistics,
         output_path: Path,
-        records: list | None = None,
-    ) -> None:
+        records: Iterable[ConversionRecord] | None = None,
+    ) -> int:
         """Export statistics to JSON file.
 
+        Records are written as they are consumed, so an iterator such as
+        ConversionHistory.iter_records() is never held in memory.
+
         Args:
             stats: Statistics to export.
             output_path: Path for the JSON file.
-            records: Optional list of records to include.
+            records: Optional records to include.
+
+        Returns:
+            Number of records written.
         """
         data = {
             "exported_at": datetime.now().isoformat(),
             "statistics": self.to_dict(stats),
         }
 
-        if records:
-            data["records"] = [
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            if records is None:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+                return 0
+
+            entries = (
                 {
                     "id": r.id,
                     "source_path": r.source_path,
@@ -250,29 +266,31 @@ class StatisticsReporter:
                     "success": r.success,
                 }
                 for r in records
-            ]
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+            )
+            return write_json_stream(data, "records", entries, f)
 
     def export_csv(
         self,
         stats: HistoryStatistics,
         output_path: Path,
-        records: list | None = None,
-    ) -> None:
+        records: Iterable[ConversionRecord] | None = None,
+    ) -> int:
         """Export statistics to CSV file.
 
+        Records are written as they are consumed.
+
         Args:
             stats: Statistics to export (used for header comment).
             output_path: Path for the CSV file.
-            records: List of records to export.
+            records: Records to export.
+
+        Returns:
+            Number of records written.
         """
         import csv
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
 
         with open(output_path, "w", newline="", encoding="utf-8") as f:
             # Write summary as comment
@@ -283,7 +301,7 @@ class StatisticsReporter:
             f.write(f"# Exported: {datetime.now().isoformat()}\n")
             f.write("#\n")
 
-            if records:
+            if records is not None:
                 fieldnames = [
                     "id",
                     "source_path",
@@ -299,9 +317,10 @@ class StatisticsReporter:
                     "error_message",
                 ]
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
 
                 for record in records:
+                    if count == 0:
+                        writer.writeheader()
                     row = {
                         "id": record.id,
                         "source_path": record.source_path,
@@ -317,6 +336,9 @@ class StatisticsReporter:
                         "error_message": record.error_message or "",
                     }
                     writer.writerow(row)
+                    count += 1
+
+        return count
 
     def print_summary(
         self,
@@ -19,8 +19,11 @@ from video_converter.utils.command_runner import (
     CommandResult,
     CommandRunner,
     CommandTimeoutError,
+    ExifToolPool,
     ExifToolRunner,
     FFprobeRunner,
+    get_exiftool_pool,
+    reset_exiftool_pool,
     run_command,
     run_exiftool,
     run_ffprobe,
@@ -79,9 +82,13 @@ from video_converter.utils.dependency_checker import (
 from video_converter.utils.file_utils import (
     AtomicWriteError,
     InsufficientSpaceError,
+    ParallelVideoWalker,
+    ScannedVideo,
+    WalkStats,
     atomic_write,
     check_disk_space,
     cleanup_temp_files,
+    clone_file,
     create_temp_directory,
     ensure_directory,
     ensure_disk_space,
@@ -97,6 +104,24 @@ from video_converter.utils.file_utils import (
     safe_copy,
     safe_delete,
     safe_move,
+    scan_video_files,
+    write_json_stream,
+)
+from video_converter.utils.isobmff import (
+    Box,
+    BoxParseError,
+    MovieInfo,
+    SampleTable,
+    TrackInfo,
+    read_movie,
+)
+from video_converter.utils.metadata_cache import (
+    MetadataCache,
+    get_metadata_cache,
+)
+from video_converter.utils.probe_cache import (
+    ProbeCache,
+    get_probe_cache,
 )
 from video_converter.utils.progress_parser import (
     FFmpegProgress,
@@ -113,10 +138,27 @@ __all__ = [
     # Specialized runners
     "FFprobeRunner",
     "ExifToolRunner",
+    # ExifTool worker pool
+    "ExifToolPool",
+    "get_exiftool_pool",
+    "reset_exiftool_pool",
     # Convenience functions
     "run_command",
     "run_ffprobe",
     "run_exiftool",
+    # Probe caching
+    "ProbeCache",
+    "get_probe_cache",
+    # MP4/MOV box parsing
+    "Box",
+    "BoxParseError",
+    "MovieInfo",
+    "SampleTable",
+    "TrackInfo",
+    "read_movie",
+    # Metadata caching
+    "MetadataCache",
+    "get_metadata_cache",
     # Dependency checking
     "DependencyChecker",
     "DependencyCheckResult",
@@ -146,10 +188,17 @@ __all__ = [
     # File utilities - File operations
     "safe_move",
     "safe_copy",
+    "clone_file",
     "safe_delete",
     "atomic_write",
+    "write_json_stream",
     # File utilities - File checks
     "is_video_file",
+    # File utilities - Directory scanning
+    "ScannedVideo",
+    "scan_video_files",
+    "ParallelVideoWalker",
+    "WalkStats",
     # Progress parsing
     "FFmpegProgress",
     "FFmpegProgressParser",
@@ -9,13 +9,29 @@ SDS Reference: SDS-U01-001
 from __future__ import annotations
 
 import asyncio
+import atexit
+import contextlib
 import json
+import logging
+import queue
 import shutil
 import subprocess
+import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+from video_converter.utils.probe_cache import ProbeCache, get_probe_cache
+
+logger = logging.getLogger(__name__)
+
+# Default number of long-lived exiftool processes
+DEFAULT_EXIFTOOL_WORKERS = 2
+
+# Seconds to wait for a worker to exit after asking it to stop
+_WORKER_EXIT_TIMEOUT = 2.0
 
 
 @dataclass
@@ -348,11 +364,463 @@ class CommandRunner:
             raise CommandNotFoundError(command_name) from e
 
 
+class _ExifToolWorker:
+    """One long-lived ``exiftool -stay_open True -@ -`` process.
+
+    Arguments are written to stdin one per line and each command ends
+    with ``-executeNUM``. ExifTool prints ``{readyNUM}`` on stdout when
+    the command is done, and an ``-echo4`` argument adds a matching line
+    with the exit status on stderr. Background threads read both pipes
+    so neither can fill up and block the process.
+    """
+
+    def __init__(self, command: str) -> None:
+        """Start the worker process.
+
+        Args:
+            command: The exiftool command name or path.
+
+        Raises:
+            OSError: If the process cannot be started.
+        """
+        self._process = subprocess.Popen(
+            [command, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self._stdout: queue.Queue[str | None] = queue.Queue()
+        self._stderr: queue.Queue[str | None] = queue.Queue()
+        self._counter = 0
+        for pipe, lines in (
+            (self._process.stdout, self._stdout),
+            (self._process.stderr, self._stderr),
+        ):
+            threading.Thread(target=self._read_pipe, args=(pipe, lines), daemon=True).start()
+
+    @staticmethod
+    def _read_pipe(pipe: IO[str] | None, lines: queue.Queue[str | None]) -> None:
+        """Forward lines from a pipe to a queue, then None at EOF."""
+        if pipe is not None:
+            for line in pipe:
+                lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+    @property
+    def alive(self) -> bool:
+        """Check if the process is still running."""
+        return self._process.poll() is None
+
+    def execute(self, commands: list[list[str]], timeout: float | None) -> list[CommandResult]:
+        """Run commands back to back in a single write.
+
+        Args:
+            commands: Argument lists without the exiftool command name.
+            timeout: Maximum time to wait for all commands (seconds).
+
+        Returns:
+            CommandResult for each command, in order.
+
+        Raises:
+            subprocess.TimeoutExpired: If the commands do not finish in
+                time. The worker is killed.
+            _WorkerDiedError: If the process exits before answering. Its
+                results hold the commands that were answered.
+        """
+        numbers = []
+        lines = []
+        for args in commands:
+            self._counter += 1
+            numbers.append(self._counter)
+            lines.extend(args)
+            lines.extend(["-echo4", f"{{ready{self._counter}:${{status}}}}"])
+            lines.append(f"-execute{self._counter}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results: list[CommandResult] = []
+        try:
+            assert self._process.stdin is not None
+            self._process.stdin.write("\n".join(lines) + "\n")
+            self._process.stdin.flush()
+
+            for number in numbers:
+                stdout, _ = self._read_until(self._stdout, f"{{ready{number}}}", deadline, timeout)
+                stderr, status = self._read_until(
+                    self._stderr, f"{{ready{number}:", deadline, timeout
+                )
+                results.append(self._to_result(stdout, stderr, status))
+            return results
+        except _WorkerDiedError as e:
+            e.results = results
+            raise
+        except (OSError, ValueError) as e:
+            self.close()
+            raise _WorkerDiedError(str(e), results) from e
+
+    def _read_until(
+        self,
+        lines: queue.Queue[str | None],
+        marker: str,
+        deadline: float | None,
+        timeout: float | None,
+    ) -> tuple[list[str], str]:
+        """Collect lines up to the marker.
+
+        Output that does not end with a newline shares its last line with
+        the marker, so the text before the marker is kept.
+
+        Returns:
+            Tuple of (lines before the marker, text from the marker on).
+
+        Raises:
+            subprocess.TimeoutExpired: If the deadline passes first.
+            _WorkerDiedError: If the pipe closes first.
+        """
+        collected = []
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            try:
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                self.kill()
+                raise subprocess.TimeoutExpired(ExifToolPool.EXIFTOOL_CMD, timeout or 0) from None
+            if line is None:
+                self.kill()
+                raise _WorkerDiedError("exiftool exited unexpectedly")
+            index = line.find(marker)
+            if index < 0:
+                collected.append(line)
+                continue
+            if index > 0:
+                collected.append(line[:index])
+            return collected, line[index:]
+
+    @staticmethod
+    def _to_result(stdout: list[str], stderr: list[str], marker: str) -> CommandResult:
+        """Build a result from the framed output of one command."""
+        try:
+            returncode = int(marker.rsplit(":", 1)[-1].rstrip("}"))
+        except ValueError:
+            # ExifTool older than 12.x does not expand ${status}
+            returncode = 1 if any(line.startswith("Error") for line in stderr) else 0
+        return CommandResult(
+            returncode=returncode,
+            stdout="\n".join(stdout),
+            stderr="\n".join(stderr),
+        )
+
+    def kill(self) -> None:
+        """Kill the process without waiting for it to exit cleanly."""
+        if self.alive:
+            self._process.kill()
+        self._process.wait()
+
+    def close(self) -> None:
+        """Ask the process to exit, killing it if it does not."""
+        if self.alive:
+            try:
+                assert self._process.stdin is not None
+                self._process.stdin.write("-stay_open\nFalse\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=_WORKER_EXIT_TIMEOUT)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                pass
+        self.kill()
+        for pipe in (self._process.stdin, self._process.stdout, self._process.stderr):
+            if pipe is not None:
+                with contextlib.suppress(OSError):
+                    pipe.close()
+
+
+class _WorkerDiedError(Exception):
+    """Raised when an exiftool worker exits in the middle of a request.
+
+    Attributes:
+        results: Results of the commands answered before the worker died,
+            in order. The commands after them may not have run.
+    """
+
+    def __init__(self, message: str, results: list[CommandResult] | None = None) -> None:
+        super().__init__(message)
+        self.results = results or []
+
+
+class ExifToolPool(CommandRunner):
+    """Command runner that sends exiftool commands to long-lived workers.
+
+    Starting exiftool costs a Perl interpreter start-up on every call.
+    This runner keeps up to max_workers ``exiftool -stay_open`` processes
+    running and hands each exiftool command to an idle one, so the cost
+    is paid once per worker. It is a drop-in CommandRunner: other
+    commands, and arguments that cannot be passed through an argument
+    file (empty, multi-line, or with surrounding whitespace), run as
+    separate processes as usual.
+
+    A worker that times out is killed; one that exits mid-request is
+    replaced, and the commands it did not answer are run as separate
+    processes instead. Answered commands are not run again, so a write
+    is never applied twice.
+
+    Example:
+        >>> pool = get_exiftool_pool()
+        >>> result = pool.run(["exiftool", "-j", "video.mp4"])
+        >>> results = pool.run_many([["exiftool", "-j", "a.mp4"], ["exiftool", "-j", "b.mp4"]])
+    """
+
+    EXIFTOOL_CMD = "exiftool"
+
+    def __init__(self, max_workers: int = DEFAULT_EXIFTOOL_WORKERS) -> None:
+        """Initialize the pool. Workers are started on first use.
+
+        Args:
+            max_workers: Maximum number of exiftool processes.
+        """
+        self.max_workers = max(1, max_workers)
+        self._idle: list[_ExifToolWorker] = []
+        self._started = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def worker_count(self) -> int:
+        """Get the number of running workers."""
+        with self._condition:
+            return self._started
+
+    def _can_pool(self, commands: list[list[str]]) -> bool:
+        """Check if commands can be sent to a worker.
+
+        Args:
+            commands: Full argument lists, including the command name.
+
+        Returns:
+            True if every command is an exiftool command with arguments
+            that survive the one-argument-per-line format.
+        """
+        if self._closed or not self.check_command_exists(self.EXIFTOOL_CMD):
+            return False
+        return all(
+            args
+            and args[0] == self.EXIFTOOL_CMD
+            and all(arg and arg == arg.strip() and "\n" not in arg for arg in args[1:])
+            and not any(arg.startswith("#") for arg in args[1:])
+            for args in commands
+        )
+
+    def _acquire(self) -> _ExifToolWorker:
+        """Take an idle worker, starting one if the pool is not full.
+
+        Raises:
+            OSError: If a new worker cannot be started.
+        """
+        with self._condition:
+            while not self._idle and self._started >= self.max_workers:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._started += 1
+
+        try:
+            return _ExifToolWorker(self.EXIFTOOL_CMD)
+        except OSError:
+            self._discard(None)
+            raise
+
+    def _release(self, worker: _ExifToolWorker) -> None:
+        """Return a worker to the pool, or discard it if it has exited."""
+        if not worker.alive or self._closed:
+            self._discard(worker)
+            return
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def _discard(self, worker: _ExifToolWorker | None) -> None:
+        """Close a worker and free its slot."""
+        if worker is not None:
+            worker.close()
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
+
+    def _run_separately(
+        self,
+        commands: list[list[str]],
+        *,
+        timeout: float | None,
+        check: bool,
+    ) -> list[CommandResult]:
+        """Run commands one process each, as CommandRunner does."""
+        results = []
+        for args in commands:
+            results.append(super().run(args, timeout=timeout, check=check))
+        return results
+
+    def run_many(
+        self,
+        commands: list[list[str]],
+        *,
+        timeout: float | None = 60.0,
+        check: bool = False,
+    ) -> list[CommandResult]:
+        """Run several exiftool commands in one request to a single worker.
+
+        Args:
+            commands: Command and arguments for each command.
+            timeout: Maximum time to wait for all commands (seconds).
+            check: If True, raise exception on the first non-zero exit code.
+
+        Returns:
+            CommandResult for each command, in order.
+
+        Raises:
+            CommandNotFoundError: If the command is not found.
+            CommandExecutionError: If check=True and a command fails.
+            subprocess.TimeoutExpired: If the commands time out.
+        """
+        if not commands:
+            return []
+        if not self._can_pool(commands):
+            return self._run_separately(commands, timeout=timeout, check=check)
+
+        try:
+            worker = self._acquire()
+        except OSError as e:
+            logger.debug(f"Cannot start exiftool worker: {e}")
+            return self._run_separately(commands, timeout=timeout, check=check)
+
+        try:
+            results = worker.execute([args[1:] for args in commands], timeout)
+        except _WorkerDiedError as e:
+            logger.warning(
+                f"exiftool worker died after {len(e.results)} of {len(commands)} commands, "
+                f"running the rest separately: {e}"
+            )
+            self._discard(worker)
+            results = e.results + self._run_separately(
+                commands[len(e.results) :], timeout=timeout, check=False
+            )
+        except BaseException:
+            self._discard(worker)
+            raise
+        else:
+            self._release(worker)
+
+        if check:
+            for result in results:
+                if not result.success:
+                    raise CommandExecutionError(self.EXIFTOOL_CMD, result.returncode, result.stderr)
+        return results
+
+    def run(
+        self,
+        args: list[str],
+        *,
+        timeout: float | None = 60.0,
+        check: bool = False,
+        capture_output: bool = True,
+    ) -> CommandResult:
+        """Run a command, using a pooled worker for exiftool.
+
+        Args:
+            args: Command and arguments to execute.
+            timeout: Maximum time to wait for command (seconds).
+            check: If True, raise exception on non-zero exit code.
+            capture_output: If True, capture stdout and stderr.
+
+        Returns:
+            CommandResult containing the execution result.
+
+        Raises:
+            CommandNotFoundError: If the command is not found.
+            CommandExecutionError: If check=True and command fails.
+            subprocess.TimeoutExpired: If command times out.
+        """
+        if not capture_output or not self._can_pool([args]):
+            return super().run(args, timeout=timeout, check=check, capture_output=capture_output)
+        return self.run_many([args], timeout=timeout, check=check)[0]
+
+    async def run_async(
+        self,
+        args: list[str],
+        *,
+        timeout: float | None = 60.0,
+        check: bool = False,
+    ) -> CommandResult:
+        """Run a command asynchronously, using a pooled worker for exiftool.
+
+        The exiftool request runs in a thread, so the event loop is not
+        blocked while it waits for a free worker.
+
+        Args:
+            args: Command and arguments to execute.
+            timeout: Maximum time to wait for command (seconds).
+            check: If True, raise exception on non-zero exit code.
+
+        Returns:
+            CommandResult containing the execution result.
+
+        Raises:
+            CommandNotFoundError: If the command is not found.
+            CommandExecutionError: If check=True and command fails.
+            subprocess.TimeoutExpired: If command times out.
+        """
+        if not self._can_pool([args]):
+            return await super().run_async(args, timeout=timeout, check=check)
+        return await asyncio.to_thread(self.run, args, timeout=timeout, check=check)
+
+    def close(self) -> None:
+        """Stop all idle workers. Busy workers stop when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._discard(worker)
+
+
+_default_pool: ExifToolPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_exiftool_pool() -> ExifToolPool:
+    """Get the process-wide exiftool worker pool.
+
+    Returns:
+        The default ExifToolPool instance.
+    """
+    global _default_pool
+    with _pool_lock:
+        if _default_pool is None:
+            _default_pool = ExifToolPool()
+        return _default_pool
+
+
+def reset_exiftool_pool() -> None:
+    """Stop the default pool's workers and reset it.
+
+    Primarily useful for testing.
+    """
+    global _default_pool
+    with _pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+        _default_pool = None
+
+
+atexit.register(reset_exiftool_pool)
+
+
 class FFprobeRunner:
     """Specialized runner for FFprobe commands.
 
     Provides convenient methods for common FFprobe operations with
-    JSON output parsing.
+    JSON output parsing. Probe results are cached per file state, so
+    repeated probes of an unchanged file do not spawn FFprobe again.
 
     Example:
         ```python
@@ -364,13 +832,29 @@ class FFprobeRunner:
 
     FFPROBE_CMD = "ffprobe"
 
-    def __init__(self, command_runner: CommandRunner | None = None) -> None:
+    def __init__(
+        self,
+        command_runner: CommandRunner | None = None,
+        *,
+        cache: ProbeCache | None = None,
+        use_cache: bool = True,
+    ) -> None:
         """Initialize FFprobe runner.
 
         Args:
             command_runner: CommandRunner instance to use. If None, creates a new one.
+            cache: Probe cache to use. If None, uses the shared process-wide cache.
+            use_cache: Whether to cache probe results at all.
         """
         self._runner = command_runner or CommandRunner()
+        self._cache: ProbeCache | None = None
+        if use_cache:
+            self._cache = cache or get_probe_cache()
+
+    @property
+    def cache(self) -> ProbeCache | None:
+        """Get the probe cache used by this runner, if any."""
+        return self._cache
 
     def _build_json_args(
         self,
@@ -436,6 +920,11 @@ class FFprobeRunner:
         if not path.exists():
             raise FileNotFoundError(f"Video file not found: {path}")
 
+        if self._cache is not None:
+            cached = self._cache.get(path, show_format=show_format, show_streams=show_streams)
+            if cached is not None:
+                return cached
+
         args = self._build_json_args(
             path,
             show_format=show_format,
@@ -444,6 +933,9 @@ class FFprobeRunner:
 
         result = self._runner.run(args, timeout=timeout, check=True)
         parsed: dict[str, Any] = json.loads(result.stdout)
+
+        if self._cache is not None:
+            self._cache.put(path, parsed, show_format=show_format, show_streams=show_streams)
         return parsed
 
     async def probe_async(
@@ -468,6 +960,11 @@ class FFprobeRunner:
         if not path.exists():
             raise FileNotFoundError(f"Video file not found: {path}")
 
+        if self._cache is not None:
+            cached = self._cache.get(path, show_format=show_format, show_streams=show_streams)
+            if cached is not None:
+                return cached
+
         args = self._build_json_args(
             path,
             show_format=show_format,
@@ -476,8 +973,52 @@ class FFprobeRunner:
 
         result = await self._runner.run_async(args, timeout=timeout, check=True)
         parsed: dict[str, Any] = json.loads(result.stdout)
+
+        if self._cache is not None:
+            self._cache.put(path, parsed, show_format=show_format, show_streams=show_streams)
         return parsed
 
+    async def keyframe_times_async(self, path: Path, *, timeout: float = 300.0) -> list[float]:
+        """Get the timestamps of the keyframes of the first video stream.
+
+        Reads packet flags only, so the video is not decoded.
+
+        Args:
+            path: Path to the video file.
+            timeout: Maximum time to wait (seconds).
+
+        Returns:
+            Sorted keyframe timestamps in seconds.
+
+        Raises:
+            CommandNotFoundError: If FFprobe is not installed.
+            CommandExecutionError: If probing fails.
+        """
+        args = [
+            self.FFPROBE_CMD,
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ]
+        result = await self._runner.run_async(args, timeout=timeout, check=True)
+
+        times = []
+        for line in result.stdout.splitlines():
+            pts_time, _, flags = line.partition(",")
+            if not flags.startswith("K"):
+                continue
+            try:
+                times.append(float(pts_time))
+            except ValueError:
+                continue  # Packets without a timestamp report "N/A"
+        return sorted(times)
+
     def quick_check(self, path: Path, timeout: float = 10.0) -> bool:
         """Quickly check if a video file is valid.
 
@@ -512,7 +1053,8 @@ class ExifToolRunner:
     """Specialized runner for ExifTool commands.
 
     Provides convenient methods for extracting and modifying metadata
-    from media files using ExifTool.
+    from media files using ExifTool. By default, commands go to the
+    shared pool of long-lived exiftool processes.
 
     Example:
         >>> runner = ExifToolRunner()
@@ -527,9 +1069,10 @@ class ExifToolRunner:
         """Initialize ExifTool runner.
 
         Args:
-            command_runner: CommandRunner instance to use. If None, creates a new one.
+            command_runner: CommandRunner instance to use. If None, uses the
+                shared ExifToolPool.
         """
-        self._runner = command_runner or CommandRunner()
+        self._runner = command_runner or get_exiftool_pool()
 
     def read_metadata(
         self,
@@ -601,6 +1144,49 @@ class ExifToolRunner:
 
         return data[0] if data else {}
 
+    def read_metadata_batch(
+        self,
+        paths: list[Path],
+        *,
+        timeout: float = 120.0,
+        tags: list[str] | None = None,
+    ) -> dict[Path, dict[str, Any]]:
+        """Read metadata from many files with a single ExifTool command.
+
+        Args:
+            paths: Paths to the files.
+            timeout: Maximum time to wait (seconds).
+            tags: Specific tags to read. If None, reads all tags.
+
+        Returns:
+            Metadata per path. Missing or unreadable files are left out.
+
+        Raises:
+            CommandNotFoundError: If ExifTool is not installed.
+        """
+        existing = [path for path in paths if path.exists()]
+        if not existing:
+            return {}
+
+        args = [self.EXIFTOOL_CMD, "-j", "-n"]
+
+        if tags:
+            args.extend(f"-{tag}" for tag in tags)
+
+        args.extend(str(path) for path in existing)
+
+        # Exits non-zero if any file fails, but still reports the others
+        result = self._runner.run(args, timeout=timeout)
+        try:
+            data: list[dict[str, Any]] = json.loads(result.stdout) if result.stdout else []
+        except json.JSONDecodeError:
+            return {}
+
+        by_name = {str(path): path for path in existing}
+        return {
+            by_name[item["SourceFile"]]: item for item in data if item.get("SourceFile") in by_name
+        }
+
     def write_metadata(
         self,
         path: Path,
@@ -120,6 +120,11 @@ MAX_CONCURRENT_CONVERSIONS = 8
 MIN_CONCURRENT_CONVERSIONS = 1
 DEFAULT_CONCURRENT_CONVERSIONS = 2
 
+# Segment-parallel encoding of long videos
+DEFAULT_MAX_SEGMENTS = 4
+DEFAULT_SEGMENT_MIN_DURATION = 10 * SECONDS_PER_MINUTE  # only split longer inputs
+MIN_SEGMENT_DURATION = 60.0  # seconds, shortest chunk worth a separate encoder
+
 # Disk space requirements
 MIN_FREE_DISK_SPACE = 1 * BYTES_PER_GB
 DEFAULT_MIN_FREE_SPACE_GB = 1.0
@@ -231,6 +236,9 @@ __all__ = [
     "MAX_CONCURRENT_CONVERSIONS",
     "MIN_CONCURRENT_CONVERSIONS",
     "DEFAULT_CONCURRENT_CONVERSIONS",
+    "DEFAULT_MAX_SEGMENTS",
+    "DEFAULT_SEGMENT_MIN_DURATION",
+    "MIN_SEGMENT_DURATION",
     "MIN_FREE_DISK_SPACE",
     "DEFAULT_MIN_FREE_SPACE_GB",
     # Helper functions
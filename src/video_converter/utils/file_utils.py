@@ -23,17 +23,28 @@ Example:
 from __future__ import annotations
 
 import atexit
+import fnmatch
+import json
+import os
 import shutil
+import sys
 import tempfile
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable, Iterator
 
 from video_converter.core.logger import get_logger
+from video_converter.utils.constants import (
+    ICLOUD_STUB_PREFIX,
+    ICLOUD_STUB_SUFFIX,
+    VIDEO_EXTENSIONS,
+)
 
 logger = get_logger(__name__)
 
@@ -435,6 +446,109 @@ def safe_copy(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path
     return dst_path
 
 
+def _reflink(src: Path, dst: Path) -> bool:
+    """Create dst as a copy-on-write clone of src.
+
+    Uses clonefile() on macOS (APFS) and the FICLONE ioctl on Linux
+    (Btrfs, XFS). The clone shares data blocks with the source but is a
+    separate file with its own metadata.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path (must not exist).
+
+    Returns:
+        True if the clone was created, False if the platform or file
+        system does not support it.
+    """
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        ficlone = 0x40049409
+        try:
+            with open(src, "rb") as src_file, open(dst, "xb") as dst_file:
+                try:
+                    fcntl.ioctl(dst_file.fileno(), ficlone, src_file.fileno())
+                    return True
+                except OSError:
+                    pass
+            dst.unlink()
+        except OSError:
+            pass
+
+    return False
+
+
+def clone_file(
+    src: str | Path,
+    dst: str | Path,
+    allow_hardlink: bool = True,
+    allow_copy: bool = True,
+) -> str:
+    """Create dst with the same content as src as cheaply as possible.
+
+    Tries a hard link, then a copy-on-write clone, then a full copy.
+    A hard link shares the inode with the source, so timestamps and any
+    later in-place edits apply to both paths; pass allow_hardlink=False
+    when dst needs its own metadata.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+        allow_hardlink: Whether a hard link may be used.
+        allow_copy: Whether a full copy may be made when no link or
+            clone is possible.
+
+    Returns:
+        How the file was created: "hardlink", "reflink" or "copy".
+
+    Raises:
+        FileNotFoundError: If source file doesn't exist.
+        FileExistsError: If destination already exists.
+        OSError: If the copy fails, or no link or clone could be made
+            and allow_copy is False.
+
+    Example:
+        >>> clone_file("/output/a_h265.mp4", "/output/b_h265.mp4")
+        'hardlink'
+    """
+    src_path = expand_path(src)
+    dst_path = expand_path(dst)
+
+    if not src_path.exists():
+        raise FileNotFoundError(f"Source file not found: {src_path}")
+
+    if dst_path.exists():
+        raise FileExistsError(f"Destination already exists: {dst_path}")
+
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+
+    method = "copy"
+    if allow_hardlink:
+        try:
+            os.link(src_path, dst_path)
+            method = "hardlink"
+        except OSError:
+            pass
+
+    if method == "copy" and _reflink(src_path, dst_path):
+        method = "reflink"
+
+    if method == "copy":
+        if not allow_copy:
+            raise OSError(f"Cannot clone {src_path} without copying")
+        shutil.copy2(str(src_path), str(dst_path))
+
+    logger.debug("Cloned file (%s): %s -> %s", method, src_path, dst_path)
+    return method
+
+
 def safe_delete(path: str | Path, missing_ok: bool = True) -> bool:
     """Safely delete a file.
 
@@ -524,6 +638,45 @@ def atomic_write(
         _temp_files.discard(temp_path)
 
 
+def write_json_stream(
+    data: dict,
+    key: str,
+    items: Iterable[dict],
+    f: TextIO,
+) -> int:
+    """Write a JSON object whose last member is a streamed list.
+
+    Produces the same layout as ``json.dump(..., indent=2)`` of ``data``
+    with ``key`` set to the list of ``items``, without building the list.
+
+    Args:
+        data: Members written before the list.
+        key: Name of the list member.
+        items: Entries of the list.
+        f: Text stream to write to.
+
+    Returns:
+        Number of list entries written.
+
+    Example:
+        >>> with open("export.json", "w") as f:
+        ...     write_json_stream({"total": 2}, "items", ({"n": i} for i in range(2)), f)
+        2
+    """
+    f.write("{\n")
+    for name, value in data.items():
+        text = json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        f.write(f"  {json.dumps(name)}: {text},\n")
+    f.write(f"  {json.dumps(key)}: [")
+    count = 0
+    for item in items:
+        text = json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        f.write(f"{',' if count else ''}\n    {text}")
+        count += 1
+    f.write("\n  ]\n}\n" if count else "]\n}\n")
+    return count
+
+
 def get_file_size(path: str | Path) -> int:
     """Get the size of a file in bytes.
 
@@ -699,6 +852,338 @@ def generate_output_path(
     return output_dir / f"{stem}{suffix}{ext}"
 
 
+@dataclass(frozen=True)
+class ScannedVideo:
+    """A video file found by scan_video_files() or ParallelVideoWalker.
+
+    Attributes:
+        path: Path to the video file. For iCloud-only files this is the
+            original path, which does not exist locally.
+        stub_path: Path to the iCloud stub file if the video is only in
+            iCloud, otherwise None.
+        stat: stat() result of the file, if it was read during the walk.
+    """
+
+    path: Path
+    stub_path: Path | None = None
+    stat: os.stat_result | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def in_cloud(self) -> bool:
+        """Check if the video is only available as an iCloud stub."""
+        return self.stub_path is not None
+
+
+def _matches_any(name: str, patterns: Iterable[str]) -> bool:
+    """Check if a file or directory name matches any glob pattern."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def scan_video_files(
+    root: str | Path,
+    *,
+    recursive: bool = True,
+    extensions: Iterable[str] = VIDEO_EXTENSIONS,
+    exclude_patterns: Iterable[str] = (),
+    include_icloud: bool = False,
+    follow_symlinks: bool = False,
+) -> Iterator[ScannedVideo]:
+    """Walk a directory tree and yield video files in a single pass.
+
+    Uses os.scandir, so file type checks come from the directory listing
+    instead of one stat() call per entry. Extension matching, exclusion
+    patterns and iCloud stub detection are all done on the entry name.
+    Directories whose name matches an exclude pattern are not descended
+    into. When a video exists both locally and as an iCloud stub, only
+    the local file is reported.
+
+    Args:
+        root: Directory to scan.
+        recursive: Whether to descend into subdirectories.
+        extensions: Lowercase video file extensions to match (with dot).
+        exclude_patterns: Glob patterns matched against file and directory
+            names. For iCloud stubs the original file name is matched.
+        include_icloud: Whether to report iCloud stub files
+            (``.name.icloud``) as videos.
+        follow_symlinks: Whether to descend into symlinked directories.
+
+    Yields:
+        ScannedVideo for each matching file, directory by directory.
+        Unreadable directories are logged and skipped.
+
+    Example:
+        >>> for video in scan_video_files("~/Movies", include_icloud=True):
+        ...     print(video.path, video.in_cloud)
+    """
+    extensions = frozenset(extensions)
+    exclude_patterns = tuple(exclude_patterns)
+    stub_prefix_len = len(ICLOUD_STUB_PREFIX)
+    stub_suffix_len = len(ICLOUD_STUB_SUFFIX)
+
+    pending = [Path(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            continue
+
+        local_names: list[str] = []
+        stub_names: list[tuple[str, str]] = []
+        subdirs: list[Path] = []
+
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if recursive and not _matches_any(name, exclude_patterns):
+                        subdirs.append(directory / name)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+
+            if name.startswith(ICLOUD_STUB_PREFIX) and name.endswith(ICLOUD_STUB_SUFFIX):
+                if not include_icloud:
+                    continue
+                original = name[stub_prefix_len:-stub_suffix_len]
+                if os.path.splitext(original)[1].lower() in extensions and not _matches_any(
+                    original, exclude_patterns
+                ):
+                    stub_names.append((original, name))
+                continue
+
+            if os.path.splitext(name)[1].lower() in extensions and not _matches_any(
+                name, exclude_patterns
+            ):
+                local_names.append(name)
+
+        for name in local_names:
+            yield ScannedVideo(path=directory / name)
+
+        local_set = set(local_names)
+        for original, stub in stub_names:
+            if original not in local_set:
+                yield ScannedVideo(path=directory / original, stub_path=directory / stub)
+
+        # Reversed so subdirectories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+
+# Default number of directories listed in parallel by ParallelVideoWalker.
+# Directory listing is latency-bound (especially on network and USB
+# drives), so this is deliberately larger than the CPU count.
+DEFAULT_WALK_WORKERS = 16
+
+
+@dataclass
+class WalkStats:
+    """Counters collected by ParallelVideoWalker.
+
+    Attributes:
+        scanned_dirs: Number of directories listed.
+        skipped_dirs: Number of directories pruned by exclusion rules.
+        duplicates: Number of files or directories already reached
+            through another path (hard links, symlinks, firmlinks or
+            overlapping roots).
+        permission_errors: Number of directories that could not be read
+            because access was denied.
+        os_errors: Number of entries that could not be read for other
+            reasons (I/O errors, vanished files).
+    """
+
+    scanned_dirs: int = 0
+    skipped_dirs: int = 0
+    duplicates: int = 0
+    permission_errors: int = 0
+    os_errors: int = 0
+
+
+@dataclass
+class _DirListing:
+    """Result of listing one directory on a worker thread."""
+
+    videos: list[ScannedVideo] = field(default_factory=list)
+    subdirs: list[tuple[Path, tuple[int, int]]] = field(default_factory=list)
+    skipped_dirs: int = 0
+    permission_error: bool = False
+    os_errors: int = 0
+
+
+class ParallelVideoWalker:
+    """Walks several directory trees concurrently to find video files.
+
+    Every directory is listed by a task on a thread pool; subdirectories
+    found in a listing are queued as new tasks, so large trees and
+    several roots (e.g. the home folder plus an external drive) are
+    walked in parallel. Files and directories are identified by
+    (st_dev, st_ino), so a file reachable through hard links, symlinks,
+    macOS firmlinks or overlapping roots is reported once, and
+    directory cycles are not followed. Results are yielded as soon as
+    each directory has been listed.
+
+    Attributes:
+        stats: Counters for the most recent walk.
+
+    Example:
+        >>> walker = ParallelVideoWalker(exclude_dirs={"node_modules"})
+        >>> for video in walker.walk([Path.home(), Path("/Volumes/Archive")]):
+        ...     print(video.path, video.stat.st_size)
+    """
+
+    def __init__(
+        self,
+        *,
+        extensions: Iterable[str] = VIDEO_EXTENSIONS,
+        exclude_dirs: Iterable[str] = (),
+        skip_hidden_dirs: bool = False,
+        min_size: int = 0,
+        max_workers: int = DEFAULT_WALK_WORKERS,
+    ) -> None:
+        """Initialize the walker.
+
+        Args:
+            extensions: Lowercase video file extensions to match (with dot).
+            exclude_dirs: Directory names that are not descended into.
+            skip_hidden_dirs: Whether to skip directories starting with ".".
+            min_size: Minimum file size in bytes.
+            max_workers: Maximum number of directories listed at once.
+        """
+        self._extensions = frozenset(extensions)
+        self._exclude_dirs = frozenset(exclude_dirs)
+        self._skip_hidden_dirs = skip_hidden_dirs
+        self._min_size = min_size
+        self._max_workers = max(1, max_workers)
+        self.stats = WalkStats()
+
+    def _is_excluded_dir(self, name: str) -> bool:
+        """Check if a directory name is pruned from the walk."""
+        return name in self._exclude_dirs or (self._skip_hidden_dirs and name.startswith("."))
+
+    def _list_directory(self, directory: Path) -> _DirListing:
+        """List one directory, collecting matching videos and subdirectories.
+
+        Runs on a worker thread and does not touch shared state.
+
+        Args:
+            directory: Directory to list.
+
+        Returns:
+            _DirListing with the videos and subdirectories found.
+        """
+        listing = _DirListing()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            listing.permission_error = True
+            return listing
+        except OSError:
+            listing.os_errors += 1
+            return listing
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if self._is_excluded_dir(entry.name):
+                        listing.skipped_dirs += 1
+                        continue
+                    dir_stat = entry.stat(follow_symlinks=False)
+                    listing.subdirs.append(
+                        (directory / entry.name, (dir_stat.st_dev, dir_stat.st_ino))
+                    )
+                    continue
+
+                if os.path.splitext(entry.name)[1].lower() not in self._extensions:
+                    continue
+                if not entry.is_file():
+                    continue
+
+                # Follows symlinks, so a link and its target share an identity
+                file_stat = entry.stat()
+            except OSError:
+                listing.os_errors += 1
+                continue
+
+            if file_stat.st_size >= self._min_size:
+                listing.videos.append(ScannedVideo(path=directory / entry.name, stat=file_stat))
+
+        return listing
+
+    def walk(self, roots: Iterable[str | Path]) -> Iterator[ScannedVideo]:
+        """Walk the given roots and yield each distinct video file.
+
+        Closing the iterator early cancels directories not yet listed.
+
+        Args:
+            roots: Directories to walk. Roots inside other roots are fine;
+                shared subtrees are only walked once.
+
+        Yields:
+            ScannedVideo with stat data for each video, in the order the
+            containing directories finish listing.
+        """
+        self.stats = WalkStats()
+        seen_dirs: set[tuple[int, int]] = set()
+        seen_files: set[tuple[int, int]] = set()
+        pending: set[Future[_DirListing]] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="video-walk"
+        ) as executor:
+
+            def submit(directory: Path, identity: tuple[int, int]) -> None:
+                if identity in seen_dirs:
+                    self.stats.duplicates += 1
+                    return
+                seen_dirs.add(identity)
+                pending.add(executor.submit(self._list_directory, directory))
+
+            try:
+                for root in roots:
+                    root_path = Path(root).expanduser()
+                    try:
+                        root_stat = root_path.stat()
+                    except PermissionError:
+                        self.stats.permission_errors += 1
+                        continue
+                    except OSError as e:
+                        logger.warning(f"Cannot scan {root_path}: {e}")
+                        self.stats.os_errors += 1
+                        continue
+                    submit(root_path, (root_stat.st_dev, root_stat.st_ino))
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.discard(future)
+                        listing = future.result()
+
+                        self.stats.scanned_dirs += 1
+                        self.stats.skipped_dirs += listing.skipped_dirs
+                        self.stats.os_errors += listing.os_errors
+                        if listing.permission_error:
+                            self.stats.permission_errors += 1
+
+                        for subdir, identity in listing.subdirs:
+                            submit(subdir, identity)
+
+                        for video in listing.videos:
+                            assert video.stat is not None
+                            identity = (video.stat.st_dev, video.stat.st_ino)
+                            if identity in seen_files:
+                                self.stats.duplicates += 1
+                                continue
+                            seen_files.add(identity)
+                            yield video
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
 # Register cleanup on exit
 atexit.register(cleanup_temp_files)
 
@@ -727,8 +1212,15 @@ __all__ = [
     # File operations
     "safe_move",
     "safe_copy",
+    "clone_file",
     "safe_delete",
     "atomic_write",
+    "write_json_stream",
     # File checks
     "is_video_file",
+    # Directory scanning
+    "ScannedVideo",
+    "scan_video_files",
+    "ParallelVideoWalker",
+    "WalkStats",
 ]
@@ -0,0 +1,629 @@
+"""Minimal ISO base media file format (MP4/MOV) box reader.
+
+This module walks the box (atom) tree of MP4 and QuickTime files. The
+generic helpers only decode box headers; callers interpret the payloads
+they need. Buffers can be bytes, bytearray or mmap objects, so large
+files can be inspected without reading them into memory.
+
+read_movie() decodes the movie and track headers (mvhd, tkhd, mdhd,
+hdlr, stsd, stsz) of a file. The file is memory-mapped and only the
+top-level box headers and the moov box are touched, so a moov stored
+after gigabytes of media data costs a few kilobytes of reads. With
+sample_tables=True it also decodes the time-to-sample (stts) and sync
+sample (stss) tables, which describe every frame's duration and the
+keyframe positions without touching the media data.
+
+SDS Reference: SDS-U01-001
+
+Example:
+    >>> with open(path, "rb") as fp:
+    ...     boxes = list(iter_file_boxes(fp))
+    >>> moov = next(box for box in boxes if box.type == "moov")
+
+    >>> movie = read_movie(path)
+    >>> video = movie.first_track("vide")
+    >>> print(video.codec, video.width, video.height)  # "hvc1 3840 2160"
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import pairwise
+from pathlib import Path
+from typing import BinaryIO
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+# File types whose top level is a sequence of ISO-BMFF boxes
+TOP_LEVEL_TYPES = frozenset({"ftyp", "moov", "mdat", "free", "skip", "wide", "uuid", "pnot"})
+
+# Bytes before the child boxes of visual and audio sample entries
+_VISUAL_ENTRY_SIZE = 78
+_AUDIO_ENTRY_SIZE = 28
+
+# Extra audio sample entry bytes per QuickTime sound description version
+_AUDIO_ENTRY_EXTRA = {1: 16, 2: 36}
+
+
+class BoxParseError(Exception):
+    """Raised when a box header is malformed or exceeds its parent."""
+
+    def __init__(self, offset: int, reason: str) -> None:
+        self.offset = offset
+        self.reason = reason
+        super().__init__(f"Invalid box at offset {offset}: {reason}")
+
+
+@dataclass(frozen=True)
+class Box:
+    """Location of one box within a buffer or file.
+
+    Attributes:
+        type: Four-character box type, decoded as Latin-1 (e.g. "©xyz").
+        offset: Offset of the box header.
+        size: Total box size including the header.
+        header_size: Size of the header (8, or 16 with a 64-bit size).
+    """
+
+    type: str
+    offset: int
+    size: int
+    header_size: int
+
+    @property
+    def payload_offset(self) -> int:
+        """Get the offset of the first byte after the header."""
+        return self.offset + self.header_size
+
+    @property
+    def end(self) -> int:
+        """Get the offset just past the end of the box."""
+        return self.offset + self.size
+
+
+def _parse_header(header: Buffer, offset: int, limit: int) -> Box:
+    """Decode a box header.
+
+    Args:
+        header: At least 8 bytes (16 for 64-bit sizes) starting at the box.
+        offset: Offset of the box.
+        limit: Offset of the end of the enclosing region.
+
+    Returns:
+        The decoded box.
+
+    Raises:
+        BoxParseError: If the header is invalid.
+    """
+    size, raw_type = struct.unpack_from(">I4s", header, 0)
+    header_size = 8
+    if size == 1:
+        if len(header) < 16:
+            raise BoxParseError(offset, "truncated 64-bit size")
+        (size,) = struct.unpack_from(">Q", header, 8)
+        header_size = 16
+    elif size == 0:
+        # Box extends to the end of the enclosing region
+        size = limit - offset
+
+    if size < header_size:
+        raise BoxParseError(offset, f"size {size} smaller than header")
+    if offset + size > limit:
+        raise BoxParseError(offset, f"size {size} exceeds parent")
+
+    return Box(raw_type.decode("latin-1"), offset, size, header_size)
+
+
+def iter_boxes(data: Buffer, start: int = 0, end: int | None = None) -> Iterator[Box]:
+    """Iterate over the boxes in a region of a buffer.
+
+    Fewer than 8 trailing bytes (e.g. the zero terminator QuickTime
+    allows at the end of a user data list) are ignored.
+
+    Args:
+        data: Buffer containing the boxes.
+        start: Offset of the first box.
+        end: Offset of the end of the region. Defaults to the buffer end.
+
+    Yields:
+        Each box in order.
+
+    Raises:
+        BoxParseError: If a box header is invalid.
+    """
+    limit = len(data) if end is None else end
+    offset = start
+    while limit - offset >= 8:
+        box = _parse_header(data[offset : offset + 16], offset, limit)
+        yield box
+        offset = box.end
+
+
+def find_box(
+    data: Buffer,
+    path: str | Sequence[str],
+    start: int = 0,
+    end: int | None = None,
+) -> Box | None:
+    """Find the first box along a path of box types.
+
+    Args:
+        data: Buffer containing the boxes.
+        path: Box types separated by "/" (e.g. "mdia/minf/stbl").
+        start: Offset of the first box of the region.
+        end: Offset of the end of the region.
+
+    Returns:
+        The first matching box, or None if there is none.
+
+    Raises:
+        BoxParseError: If a box header is invalid.
+    """
+    types = path.split("/") if isinstance(path, str) else list(path)
+    box: Box | None = None
+    for box_type in types:
+        box = next(
+            (child for child in iter_boxes(data, start, end) if child.type == box_type), None
+        )
+        if box is None:
+            return None
+        start, end = box.payload_offset, box.end
+    return box
+
+
+def find_boxes(data: Buffer, box_type: str, start: int = 0, end: int | None = None) -> list[Box]:
+    """Find all direct children of a given type in a region.
+
+    Args:
+        data: Buffer containing the boxes.
+        box_type: Box type to match.
+        start: Offset of the first box of the region.
+        end: Offset of the end of the region.
+
+    Returns:
+        Matching boxes in file order.
+
+    Raises:
+        BoxParseError: If a box header is invalid.
+    """
+    return [box for box in iter_boxes(data, start, end) if box.type == box_type]
+
+
+def iter_file_boxes(fp: BinaryIO, file_size: int | None = None) -> Iterator[Box]:
+    """Iterate over the top-level boxes of an open file.
+
+    Only the headers are read, so this is cheap even for very large
+    files.
+
+    Args:
+        fp: File opened in binary mode.
+        file_size: Size of the file. Determined from the file if None.
+
+    Yields:
+        Each top-level box in order.
+
+    Raises:
+        BoxParseError: If a box header is invalid.
+    """
+    if file_size is None:
+        file_size = os.fstat(fp.fileno()).st_size
+
+    offset = 0
+    while file_size - offset >= 8:
+        fp.seek(offset)
+        box = _parse_header(fp.read(16), offset, file_size)
+        yield box
+        offset = box.end
+
+
+def make_box(box_type: str, payload: bytes) -> bytes:
+    """Serialize a box.
+
+    Args:
+        box_type: Four-character box type (Latin-1).
+        payload: Box contents after the header.
+
+    Returns:
+        The encoded box, with a 64-bit size only when required.
+    """
+    raw_type = box_type.encode("latin-1")
+    size = len(payload) + 8
+    if size > 0xFFFFFFFF:
+        return struct.pack(">I4sQ", 1, raw_type, size + 8) + payload
+    return struct.pack(">I4s", size, raw_type) + payload
+
+
+def is_isobmff(fp: BinaryIO) -> bool:
+    """Check whether a file starts with a plausible ISO-BMFF box.
+
+    Args:
+        fp: File opened in binary mode.
+
+    Returns:
+        True if the first box type is one that starts MP4/MOV files.
+    """
+    fp.seek(0)
+    header = fp.read(8)
+    if len(header) < 8:
+        return False
+    return header[4:8].decode("latin-1") in TOP_LEVEL_TYPES
+
+
+@dataclass
+class TrackInfo:
+    """Properties of one track, read from its header boxes.
+
+    Attributes:
+        track_id: Track ID from the track header.
+        handler: Handler type (e.g. "vide", "soun").
+        codec: Four-character code of the first sample entry (e.g. "avc1").
+        timescale: Media time units per second.
+        duration: Media duration in timescale units.
+        sample_count: Number of samples (frames for video).
+        sample_bytes: Total size of all samples in bytes.
+        width: Coded width for video tracks.
+        height: Coded height for video tracks.
+        codec_boxes: Payloads of the sample entry's child boxes by type
+            (e.g. "avcC", "hvcC", "colr", "esds").
+        samples: Timing and sync tables, if they were requested.
+    """
+
+    track_id: int
+    handler: str
+    codec: str
+    timescale: int
+    duration: int
+    sample_count: int
+    sample_bytes: int
+    width: int = 0
+    height: int = 0
+    codec_boxes: dict[str, bytes] = field(default_factory=dict)
+    samples: SampleTable | None = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get the media duration in seconds."""
+        return self.duration / self.timescale if self.timescale else 0.0
+
+
+@dataclass
+class SampleTable:
+    """Timing and sync information from a track's sample table.
+
+    Attributes:
+        sample_count: Number of samples in the time-to-sample table.
+        duration: Sum of all sample durations in media timescale units.
+        sync_samples: 1-based numbers of the sync samples (keyframes), or
+            None if the track has no stss box and every sample is a sync
+            sample.
+    """
+
+    sample_count: int
+    duration: int
+    sync_samples: list[int] | None = None
+
+    @property
+    def max_sync_interval(self) -> int:
+        """Get the longest run of samples starting at a sync sample.
+
+        Samples before the first sync sample are counted as a run of
+        their own, since they cannot be decoded without one.
+        """
+        if self.sync_samples is None:
+            return 1 if self.sample_count else 0
+        points = [1, *self.sync_samples, self.sample_count + 1]
+        return max(later - earlier for earlier, later in pairwise(points))
+
+
+@dataclass
+class MovieInfo:
+    """Properties of a movie, read from its header boxes.
+
+    Attributes:
+        major_brand: Major brand from the ftyp box, if present.
+        timescale: Movie time units per second.
+        duration: Movie duration in timescale units.
+        creation_time: Creation time in seconds since 1904-01-01 UTC.
+        fragmented: True if the file uses movie fragments.
+        tracks: Tracks in file order.
+    """
+
+    major_brand: str | None
+    timescale: int
+    duration: int
+    creation_time: int
+    fragmented: bool
+    tracks: list[TrackInfo] = field(default_factory=list)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get the movie duration in seconds."""
+        return self.duration / self.timescale if self.timescale else 0.0
+
+    def first_track(self, handler: str) -> TrackInfo | None:
+        """Get the first track with a given handler type.
+
+        Args:
+            handler: Handler type (e.g. "vide" or "soun").
+
+        Returns:
+            The first matching track, or None.
+        """
+        return next((track for track in self.tracks if track.handler == handler), None)
+
+
+def read_movie(path: Path, *, sample_tables: bool = False) -> MovieInfo:
+    """Read the movie and track headers of an MP4/MOV file.
+
+    Args:
+        path: Path to the file.
+        sample_tables: Also decode each track's stts and stss tables.
+
+    Returns:
+        The decoded movie information.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+        BoxParseError: If the file is not a well-formed MP4/MOV file.
+    """
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size < 8:
+            raise BoxParseError(0, "file too small")
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_movie(data, sample_tables=sample_tables)
+
+
+def parse_movie(data: Buffer, *, sample_tables: bool = False) -> MovieInfo:
+    """Decode the movie and track headers in a buffer holding a whole file.
+
+    Args:
+        data: Contents of the file.
+        sample_tables: Also decode each track's stts and stss tables.
+
+    Returns:
+        The decoded movie information.
+
+    Raises:
+        BoxParseError: If the data is not a well-formed MP4/MOV file.
+    """
+    brand: str | None = None
+    moov: Box | None = None
+    fragmented = False
+    for box in iter_boxes(data):
+        if box.offset == 0 and box.type not in TOP_LEVEL_TYPES:
+            raise BoxParseError(0, f"unexpected first box {box.type!r}")
+        if box.type == "ftyp" and box.size >= box.header_size + 4:
+            brand = bytes(data[box.payload_offset : box.payload_offset + 4]).decode("latin-1")
+        elif box.type == "moov" and moov is None:
+            moov = box
+        elif box.type == "moof":
+            fragmented = True
+
+    if moov is None:
+        raise BoxParseError(0, "no movie header")
+
+    try:
+        mvhd = find_box(data, "mvhd", moov.payload_offset, moov.end)
+        if mvhd is None:
+            raise BoxParseError(moov.offset, "no mvhd box")
+        creation_time, _, timescale, duration = _read_header_times(data, mvhd)
+        if find_box(data, "mvex", moov.payload_offset, moov.end) is not None:
+            fragmented = True
+
+        tracks = [
+            _parse_track(data, trak, sample_tables=sample_tables)
+            for trak in find_boxes(data, "trak", moov.payload_offset, moov.end)
+        ]
+    except struct.error as e:
+        raise BoxParseError(moov.offset, f"truncated header: {e}") from e
+
+    return MovieInfo(
+        major_brand=brand,
+        timescale=timescale,
+        duration=duration,
+        creation_time=creation_time,
+        fragmented=fragmented,
+        tracks=tracks,
+    )
+
+
+def _read_header_times(data: Buffer, box: Box) -> tuple[int, int, int, int]:
+    """Decode the times of an mvhd or mdhd box.
+
+    Args:
+        data: Buffer containing the box.
+        box: An mvhd or mdhd box.
+
+    Returns:
+        Tuple of (creation time, modification time, timescale, duration).
+    """
+    if data[box.payload_offset] == 1:
+        return struct.unpack_from(">QQIQ", data, box.payload_offset + 4)
+    return struct.unpack_from(">IIII", data, box.payload_offset + 4)
+
+
+def _parse_track(data: Buffer, trak: Box, *, sample_tables: bool = False) -> TrackInfo:
+    """Decode the headers and sample description of a track.
+
+    Args:
+        data: Buffer containing the track.
+        trak: A trak box.
+        sample_tables: Also decode the stts and stss tables.
+
+    Returns:
+        The decoded track information.
+
+    Raises:
+        BoxParseError: If a required box is missing.
+    """
+    tkhd = find_box(data, "tkhd", trak.payload_offset, trak.end)
+    mdia = find_box(data, "mdia", trak.payload_offset, trak.end)
+    if tkhd is None or mdia is None:
+        raise BoxParseError(trak.offset, "track without tkhd or mdia")
+
+    id_offset = tkhd.payload_offset + (20 if data[tkhd.payload_offset] == 1 else 12)
+    (track_id,) = struct.unpack_from(">I", data, id_offset)
+
+    mdhd = find_box(data, "mdhd", mdia.payload_offset, mdia.end)
+    hdlr = find_box(data, "hdlr", mdia.payload_offset, mdia.end)
+    stbl = find_box(data, "minf/stbl", mdia.payload_offset, mdia.end)
+    if mdhd is None or hdlr is None or stbl is None:
+        raise BoxParseError(mdia.offset, "media without mdhd, hdlr or stbl")
+
+    _, _, timescale, duration = _read_header_times(data, mdhd)
+    handler = bytes(data[hdlr.payload_offset + 8 : hdlr.payload_offset + 12]).decode("latin-1")
+
+    stsd = find_box(data, "stsd", stbl.payload_offset, stbl.end)
+    if stsd is None:
+        raise BoxParseError(stbl.offset, "no stsd box")
+    entry = next(iter_boxes(data, stsd.payload_offset + 8, stsd.end), None)
+    if entry is None:
+        raise BoxParseError(stsd.offset, "empty sample description")
+
+    width = height = 0
+    children_offset: int | None = None
+    if handler == "vide":
+        width, height = struct.unpack_from(">HH", data, entry.payload_offset + 24)
+        children_offset = entry.payload_offset + _VISUAL_ENTRY_SIZE
+    elif handler == "soun":
+        (version,) = struct.unpack_from(">H", data, entry.payload_offset + 8)
+        children_offset = (
+            entry.payload_offset + _AUDIO_ENTRY_SIZE + _AUDIO_ENTRY_EXTRA.get(version, 0)
+        )
+
+    codec_boxes: dict[str, bytes] = {}
+    if children_offset is not None:
+        codec_boxes = _sample_entry_children(data, children_offset, entry.end)
+
+    sample_count, sample_bytes = _read_sample_sizes(data, stbl)
+    samples = _read_sample_table(data, stbl) if sample_tables else None
+
+    return TrackInfo(
+        track_id=track_id,
+        handler=handler,
+        codec=entry.type,
+        timescale=timescale,
+        duration=duration,
+        sample_count=sample_count,
+        sample_bytes=sample_bytes,
+        width=width,
+        height=height,
+        codec_boxes=codec_boxes,
+        samples=samples,
+    )
+
+
+def _sample_entry_children(data: Buffer, start: int, end: int) -> dict[str, bytes]:
+    """Collect the payloads of a sample entry's child boxes.
+
+    Children of a QuickTime "wave" box (which wraps esds in MOV audio
+    entries) are included as well. Unparseable trailing data is ignored,
+    as some encoders pad sample entries.
+
+    Args:
+        data: Buffer containing the sample entry.
+        start: Offset of the first child box.
+        end: Offset of the end of the sample entry.
+
+    Returns:
+        Child payloads by box type; the first occurrence wins.
+    """
+    children: dict[str, bytes] = {}
+    try:
+        for child in iter_boxes(data, start, end):
+            payload = bytes(data[child.payload_offset : child.end])
+            children.setdefault(child.type, payload)
+            if child.type == "wave":
+                for inner in iter_boxes(payload):
+                    children.setdefault(inner.type, payload[inner.payload_offset : inner.end])
+    except BoxParseError:
+        pass
+    return children
+
+
+def _read_sample_sizes(data: Buffer, stbl: Box) -> tuple[int, int]:
+    """Read the sample count and total sample size of a track.
+
+    Args:
+        data: Buffer containing the sample table.
+        stbl: An stbl box.
+
+    Returns:
+        Tuple of (sample count, total bytes).
+
+    Raises:
+        BoxParseError: If there is no usable sample size box.
+    """
+    stsz = find_box(data, "stsz", stbl.payload_offset, stbl.end)
+    if stsz is None:
+        raise BoxParseError(stbl.offset, "no stsz box")
+
+    sample_size, sample_count = struct.unpack_from(">II", data, stsz.payload_offset + 4)
+    if sample_size:
+        return sample_count, sample_size * sample_count
+
+    sizes = _read_u32_table(data, stsz, stsz.payload_offset + 12, sample_count)
+    return sample_count, sum(sizes)
+
+
+def _read_sample_table(data: Buffer, stbl: Box) -> SampleTable:
+    """Read the time-to-sample and sync sample tables of a track.
+
+    Args:
+        data: Buffer containing the sample table.
+        stbl: An stbl box.
+
+    Returns:
+        The decoded sample table.
+
+    Raises:
+        BoxParseError: If there is no stts box or a table is truncated.
+    """
+    stts = find_box(data, "stts", stbl.payload_offset, stbl.end)
+    if stts is None:
+        raise BoxParseError(stbl.offset, "no stts box")
+
+    (entry_count,) = struct.unpack_from(">I", data, stts.payload_offset + 4)
+    entries = _read_u32_table(data, stts, stts.payload_offset + 8, 2 * entry_count)
+    counts = entries[0::2]
+    deltas = entries[1::2]
+    duration = sum(count * delta for count, delta in zip(counts, deltas, strict=True))
+
+    sync_samples: list[int] | None = None
+    stss = find_box(data, "stss", stbl.payload_offset, stbl.end)
+    if stss is not None:
+        (sync_count,) = struct.unpack_from(">I", data, stss.payload_offset + 4)
+        sync_samples = _read_u32_table(data, stss, stss.payload_offset + 8, sync_count).tolist()
+
+    return SampleTable(sample_count=sum(counts), duration=duration, sync_samples=sync_samples)
+
+
+def _read_u32_table(data: Buffer, box: Box, start: int, count: int) -> array[int]:
+    """Read a table of big-endian 32-bit integers from a box.
+
+    Args:
+        data: Buffer containing the box.
+        box: Box holding the table.
+        start: Offset of the first entry.
+        count: Number of entries.
+
+    Returns:
+        The entries in host byte order.
+
+    Raises:
+        BoxParseError: If the table extends past the end of the box.
+    """
+    end = start + 4 * count
+    if end > box.end:
+        raise BoxParseError(box.offset, f"{box.type} table truncated")
+    table = array("I")
+    table.frombytes(bytes(data[start:end]))
+    if sys.byteorder == "little":
+        table.byteswap()
+    return table
@@ -0,0 +1,145 @@
+"""In-memory cache for ExifTool metadata snapshots.
+
+This module provides a small thread-safe LRU cache for the parsed
+ExifTool JSON of a file. Entries use the same file identity as the
+probe cache (path, size, modification time and inode), so a snapshot is
+only returned while the file on disk is unchanged. Writers additionally
+invalidate the destination explicitly, since a tag rewrite may land
+within the filesystem's timestamp resolution.
+
+Metadata verification reads both files in full and then reads them
+again for the GPS comparison, and the original is read once more by
+every consumer that inspects it. Each read starts an ExifTool command,
+so sharing one snapshot per file state removes most of them.
+
+SDS Reference: SDS-U01-001
+
+Example:
+    >>> cache = MetadataCache(max_entries=256)
+    >>> data = cache.get(path)
+    >>> if data is None:
+    ...     data = run_exiftool(path)
+    ...     cache.put(path, data)
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from video_converter.utils.probe_cache import FileKey, file_key
+
+# Default number of metadata snapshots kept in memory
+DEFAULT_METADATA_CACHE_SIZE = 1024
+
+
+class MetadataCache:
+    """Thread-safe LRU cache of ExifTool metadata snapshots.
+
+    Snapshots with and without binary data are stored separately.
+    Callers receive a deep copy, so mutating a returned dictionary never
+    affects the cached entry.
+
+    Attributes:
+        max_entries: Maximum number of files kept in the cache.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required a new extraction.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_METADATA_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of files kept in the cache.
+        """
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[FileKey, dict[bool, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached files."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, path: Path, *, include_binary: bool = False) -> dict[str, Any] | None:
+        """Look up a cached metadata snapshot.
+
+        Args:
+            path: Path to the file.
+            include_binary: Whether the snapshot must include binary data.
+
+        Returns:
+            A copy of the cached metadata, or None on a miss.
+        """
+        key = file_key(path)
+        if key is None:
+            return None
+
+        with self._lock:
+            variants = self._entries.get(key)
+            data = variants.get(include_binary) if variants is not None else None
+
+            if data is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy.deepcopy(data)
+
+    def put(self, path: Path, data: dict[str, Any], *, include_binary: bool = False) -> None:
+        """Store a metadata snapshot.
+
+        Args:
+            path: Path to the file.
+            data: Parsed ExifTool metadata for the file.
+            include_binary: Whether the data includes binary data.
+        """
+        key = file_key(path)
+        if key is None:
+            return
+
+        stored = copy.deepcopy(data)
+        with self._lock:
+            variants = self._entries.setdefault(key, {})
+            variants[include_binary] = stored
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Path) -> None:
+        """Remove all cached snapshots for a path.
+
+        Args:
+            path: Path whose entries should be dropped.
+        """
+        path_str = str(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path_str]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached snapshots and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_default_cache = MetadataCache()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the process-wide metadata cache shared by all metadata processors.
+
+    Returns:
+        The default MetadataCache instance.
+    """
+    return _default_cache
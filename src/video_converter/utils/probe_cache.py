@@ -0,0 +1,189 @@
+"""In-memory cache for FFprobe results.
+
+This module provides a small thread-safe LRU cache for parsed FFprobe
+output. Entries are keyed by the file's identity and state (path, size,
+modification time and inode), so a cached result is only returned while
+the file on disk is unchanged. A file that is rewritten, replaced or
+still growing (e.g. an in-progress iCloud download) gets a new key and
+is probed again.
+
+The same file is otherwise probed several times per conversion: once
+during discovery, once by the converter for the progress duration, and
+again during validation. On network-backed libraries each probe pays
+the full open/seek latency, so sharing the result removes a fixed
+per-file cost.
+
+SDS Reference: SDS-U01-001
+
+Example:
+    >>> cache = ProbeCache(max_entries=256)
+    >>> data = cache.get(path, show_format=True, show_streams=True)
+    >>> if data is None:
+    ...     data = run_probe(path)
+    ...     cache.put(path, data, show_format=True, show_streams=True)
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default number of probe results kept in memory
+DEFAULT_PROBE_CACHE_SIZE = 1024
+
+# (path, size, mtime_ns, inode)
+FileKey = tuple[str, int, int, int]
+
+
+def file_key(path: Path) -> FileKey | None:
+    """Build the cache identity for a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Tuple of (path, size, mtime_ns, inode), or None if the file
+        cannot be stat'ed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class ProbeCache:
+    """Thread-safe LRU cache of FFprobe results.
+
+    A result probed with both format and stream information also
+    satisfies requests for a subset (e.g. format-only duration lookups).
+    Callers receive a deep copy, so mutating a returned dictionary never
+    affects the cached entry.
+
+    Attributes:
+        max_entries: Maximum number of files kept in the cache.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required a new probe.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PROBE_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of files kept in the cache.
+        """
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[FileKey, dict[tuple[bool, bool], dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached files."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+        self,
+        path: Path,
+        *,
+        show_format: bool = True,
+        show_streams: bool = True,
+    ) -> dict[str, Any] | None:
+        """Look up a cached probe result.
+
+        Args:
+            path: Path to the probed file.
+            show_format: Whether format information is required.
+            show_streams: Whether stream information is required.
+
+        Returns:
+            A copy of the cached probe data, or None on a miss.
+        """
+        key = file_key(path)
+        if key is None:
+            return None
+
+        with self._lock:
+            variants = self._entries.get(key)
+            data = None
+            if variants is not None:
+                # Any variant that includes at least the requested sections
+                for (has_format, has_streams), candidate in variants.items():
+                    if (has_format or not show_format) and (has_streams or not show_streams):
+                        data = candidate
+                        break
+
+            if data is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy.deepcopy(data)
+
+    def put(
+        self,
+        path: Path,
+        data: dict[str, Any],
+        *,
+        show_format: bool = True,
+        show_streams: bool = True,
+    ) -> None:
+        """Store a probe result.
+
+        Args:
+            path: Path to the probed file.
+            data: Parsed FFprobe output.
+            show_format: Whether the data includes format information.
+            show_streams: Whether the data includes stream information.
+        """
+        key = file_key(path)
+        if key is None:
+            return
+
+        stored = copy.deepcopy(data)
+        with self._lock:
+            variants = self._entries.setdefault(key, {})
+            variants[(show_format, show_streams)] = stored
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Path) -> None:
+        """Remove all cached results for a path.
+
+        Args:
+            path: Path whose entries should be dropped.
+        """
+        path_str = str(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path_str]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_default_cache = ProbeCache()
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the process-wide probe cache shared by all FFprobe runners.
+
+    Returns:
+        The default ProbeCache instance.
+    """
+    return _default_cache
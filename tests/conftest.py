@@ -26,6 +26,9 @@ from unittest.mock import MagicMock
 import pytest
 
 from video_converter.core.config import Config
+from video_converter.core.fingerprint import reset_fingerprinter
+from video_converter.utils.metadata_cache import get_metadata_cache
+from video_converter.utils.probe_cache import get_probe_cache
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -51,6 +54,61 @@ class MockCommandResult:
         return self.returncode == 0
 
 
+@pytest.fixture(autouse=True)
+def clear_probe_cache() -> Generator[None, None, None]:
+    """Clear the shared FFprobe result cache around each test.
+
+    Yields:
+        None
+    """
+    get_probe_cache().clear()
+    yield
+    get_probe_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata_cache() -> Generator[None, None, None]:
+    """Clear the shared ExifTool metadata cache around each test.
+
+    Yields:
+        None
+    """
+    get_metadata_cache().clear()
+    yield
+    get_metadata_cache().clear()
+
+
+@pytest.fixture(scope="session")
+def fingerprint_index_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    """Point the default fingerprint index at a temporary directory.
+
+    Yields:
+        Directory holding the default fingerprint index.
+    """
+    index_dir = tmp_path_factory.mktemp("fingerprints")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "video_converter.core.fingerprint.DEFAULT_FINGERPRINT_INDEX_FILE",
+            index_dir / "fingerprints.db",
+        )
+        yield index_dir
+
+
+@pytest.fixture(autouse=True)
+def isolate_fingerprint_index(fingerprint_index_dir: Path) -> Generator[None, None, None]:
+    """Discard the default fingerprint index after each test.
+
+    Yields:
+        None
+    """
+    yield
+    reset_fingerprinter()
+    for index_file in fingerprint_index_dir.iterdir():
+        index_file.unlink()
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Provide a temporary directory for test files.
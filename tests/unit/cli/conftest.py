@@ -276,6 +276,8 @@ def mock_history() -> MagicMock:
 
     mock.get_statistics.return_value = mock_stats
     mock.get_records_by_period.return_value = []
+    mock.get_recent_records.return_value = []
+    mock.iter_records.return_value = iter([])
 
     return mock
 
@@ -5,10 +5,12 @@ This module tests the video-converter scan command including:
 - Permission error handling (continues scanning after errors)
 - Error counting and reporting
 - Path and size filtering options
+- Scanning several roots with duplicate detection
 """
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +19,19 @@ from click.testing import CliRunner
 
 from video_converter.__main__ import main
 
+_real_scandir = os.scandir
+
+
+def _failing_scandir(names: set[str], error: OSError):
+    """Build an os.scandir replacement that fails for the given directory names."""
+
+    def scandir(path):
+        if Path(path).name in names:
+            raise error
+        return _real_scandir(path)
+
+    return scandir
+
 
 @pytest.fixture
 def cli_runner() -> CliRunner:
@@ -100,10 +115,8 @@ class TestScanPermissionErrorHandling:
         assert result.exit_code == 0
 
     @patch("video_converter.extractors.photos_extractor.PhotosLibrary")
-    @patch("pathlib.Path.rglob")
     def test_scan_handles_mixed_permission_errors(
         self,
-        mock_rglob: MagicMock,
         mock_photos_library: MagicMock,
         cli_runner: CliRunner,
         tmp_path: Path,
@@ -117,29 +130,18 @@ class TestScanPermissionErrorHandling:
         )
         mock_photos_library.return_value.__exit__ = MagicMock(return_value=False)
 
-        # Create mock items that raise PermissionError on some operations
-        accessible_file = MagicMock()
-        accessible_file.is_dir.return_value = False
-        accessible_file.is_file.return_value = True
-        accessible_file.suffix = ".mp4"
-        accessible_file.name = "video.mp4"
-        accessible_file.parents = []
-        accessible_file.stat.return_value.st_size = 5 * 1024 * 1024  # 5MB
-        accessible_file.resolve.return_value = str(tmp_path / "video.mp4")
+        (tmp_path / "protected").mkdir()
+        (tmp_path / "video.mp4").write_bytes(b"\x00" * (5 * 1024 * 1024))  # 5MB
 
-        def permission_error_is_dir():
-            raise PermissionError("Access denied")
-
-        protected_item = MagicMock()
-        protected_item.is_dir.side_effect = permission_error_is_dir
-        protected_item.name = "protected"
-
-        mock_rglob.return_value = iter([protected_item, accessible_file])
-
-        result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
+        with patch(
+            "video_converter.utils.file_utils.os.scandir",
+            side_effect=_failing_scandir({"protected"}, PermissionError("Access denied")),
+        ):
+            result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
 
         # Should complete and report permission errors
         assert result.exit_code == 0
+        assert "video.mp4" in result.output
         assert (
             "permission denied" in result.output.lower()
             or "could not be accessed" in result.output.lower()
@@ -150,15 +152,13 @@ class TestScanOSErrorHandling:
     """Tests for general OS error handling during filesystem scan."""
 
     @patch("video_converter.extractors.photos_extractor.PhotosLibrary")
-    @patch("pathlib.Path.rglob")
     def test_scan_handles_broken_symlinks(
         self,
-        mock_rglob: MagicMock,
         mock_photos_library: MagicMock,
         cli_runner: CliRunner,
         tmp_path: Path,
     ) -> None:
-        """Test scan gracefully handles broken symlinks (OSError)."""
+        """Test scan gracefully handles broken symlinks."""
         # Setup mock Photos library
         mock_library_instance = MagicMock()
         mock_library_instance.get_video_paths.return_value = set()
@@ -167,27 +167,17 @@ class TestScanOSErrorHandling:
         )
         mock_photos_library.return_value.__exit__ = MagicMock(return_value=False)
 
-        # Create mock broken symlink that raises OSError
-        def os_error_is_file():
-            raise OSError("Broken symlink")
-
-        broken_symlink = MagicMock()
-        broken_symlink.is_dir.return_value = False
-        broken_symlink.is_file.side_effect = os_error_is_file
-        broken_symlink.name = "broken_link"
-
-        mock_rglob.return_value = iter([broken_symlink])
+        (tmp_path / "broken_link.mp4").symlink_to(tmp_path / "missing.mp4")
 
         result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
 
         # Should complete without crashing
         assert result.exit_code == 0
+        assert "No unregistered videos found" in result.output
 
     @patch("video_converter.extractors.photos_extractor.PhotosLibrary")
-    @patch("pathlib.Path.rglob")
     def test_scan_reports_os_error_count(
         self,
-        mock_rglob: MagicMock,
         mock_photos_library: MagicMock,
         cli_runner: CliRunner,
         tmp_path: Path,
@@ -201,29 +191,19 @@ class TestScanOSErrorHandling:
         )
         mock_photos_library.return_value.__exit__ = MagicMock(return_value=False)
 
-        # Create mock items that raise OSError
-        def os_error_is_file():
-            raise OSError("Broken symlink")
-
-        broken_symlinks = []
-        for i in range(3):
-            broken_symlink = MagicMock()
-            broken_symlink.is_dir.return_value = False
-            broken_symlink.is_file.side_effect = os_error_is_file
-            broken_symlink.name = f"broken_link_{i}"
-            broken_symlinks.append(broken_symlink)
+        unreadable = {f"unreadable_{i}" for i in range(3)}
+        for name in unreadable:
+            (tmp_path / name).mkdir()
 
-        mock_rglob.return_value = iter(broken_symlinks)
-
-        result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
+        with patch(
+            "video_converter.utils.file_utils.os.scandir",
+            side_effect=_failing_scandir(unreadable, OSError("I/O error")),
+        ):
+            result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
 
         # Should complete and report OS errors
         assert result.exit_code == 0
-        assert (
-            "could not be read" in result.output.lower()
-            or "broken symlinks" in result.output.lower()
-            or "i/o errors" in result.output.lower()
-        )
+        assert "3 items could not be read" in result.output
 
 
 class TestScanFiltering:
@@ -283,14 +263,44 @@ class TestScanFiltering:
         assert custom_dir.name in result.output
 
 
+class TestScanMultipleRoots:
+    """Tests for scanning several roots at once."""
+
+    @patch("video_converter.extractors.photos_extractor.PhotosLibrary")
+    def test_scan_multiple_paths_deduplicates(
+        self,
+        mock_photos_library: MagicMock,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+    ) -> None:
+        """Test overlapping roots and links report each video once."""
+        mock_photos_library.return_value.check_permissions.return_value = False
+
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "clip.mp4").write_bytes(b"\x00" * (2 * 1024 * 1024))
+        (second / "other.mov").write_bytes(b"\x00" * (2 * 1024 * 1024))
+        (second / "alias.mp4").symlink_to(first / "clip.mp4")
+
+        result = cli_runner.invoke(
+            main,
+            ["scan", "--path", str(first), "--path", str(second), "--path", str(tmp_path)],
+        )
+
+        assert result.exit_code == 0
+        assert "Found 2 video(s) not in Photos library" in result.output
+
+
 class TestScanKeyboardInterrupt:
     """Tests for keyboard interrupt handling."""
 
     @patch("video_converter.extractors.photos_extractor.PhotosLibrary")
-    @patch("pathlib.Path.rglob")
+    @patch("video_converter.__main__.ParallelVideoWalker.walk")
     def test_scan_handles_keyboard_interrupt(
         self,
-        mock_rglob: MagicMock,
+        mock_walk: MagicMock,
         mock_photos_library: MagicMock,
         cli_runner: CliRunner,
         tmp_path: Path,
@@ -304,15 +314,10 @@ class TestScanKeyboardInterrupt:
         )
         mock_photos_library.return_value.__exit__ = MagicMock(return_value=False)
 
-        # Simulate keyboard interrupt during iteration
-        def raise_keyboard_interrupt():
-            raise KeyboardInterrupt()
-
-        mock_rglob.return_value = iter([])
+        mock_walk.side_effect = KeyboardInterrupt()
 
-        # Note: CliRunner doesn't propagate KeyboardInterrupt the same way,
-        # but we can verify the exception handling path exists
         result = cli_runner.invoke(main, ["scan", "--path", str(tmp_path)])
 
         # Should complete (empty results)
         assert result.exit_code == 0
+        assert "Scan interrupted by user" in result.output
@@ -306,10 +306,11 @@ class TestStatsExportCommand:
         """Test exporting statistics with records."""
         mock_history = MagicMock()
         mock_history.get_statistics.return_value = mock_history_stats
-        mock_history.get_records_by_period.return_value = [MagicMock(), MagicMock()]
+        mock_history.iter_records.return_value = iter([MagicMock(), MagicMock()])
         mock_get_history.return_value = mock_history
 
         mock_reporter = MagicMock()
+        mock_reporter.export_json.return_value = 2
         mock_reporter_class.return_value = mock_reporter
 
         output_file = temp_dir / "stats_records.json"
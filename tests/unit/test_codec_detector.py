@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import struct
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +21,61 @@ from video_converter.utils.command_runner import (
     CommandNotFoundError,
     FFprobeRunner,
 )
+from video_converter.utils.isobmff import make_box
+
+# 2024-01-15 10:30:00 UTC in seconds since 1904
+CREATED = 3788159400
+
+AVCC_HIGH = bytes([1, 100, 0, 40, 0xFF, 0xE1, 0, 2]) + b"\x67\x64" + bytes([1, 0, 1, 0x68])
+AVCC_HIGH += bytes([0xFD, 0xF8, 0xF8, 0])
+HVCC_MAIN10 = bytes([1, 2]) + b"\0" * 10 + bytes([153, 0xF0, 0, 0xFC, 0xFD, 0xFA, 0xFA])
+HVCC_MAIN10 += b"\0\0\x0f\0"
+COLR_BT709 = b"nclx" + struct.pack(">HHHB", 1, 1, 1, 0)
+
+
+def _full_box(kind: str, payload: bytes) -> bytes:
+    """Encode a box with a version/flags field."""
+    return make_box(kind, b"\0\0\0\0" + payload)
+
+
+def _esds(object_type: int) -> bytes:
+    """Encode an elementary stream descriptor box."""
+    config = bytes([0x04, 13, object_type, 0x15]) + b"\0" * 11
+    return _full_box("esds", bytes([0x03, 3 + len(config), 0, 1, 0]) + config)
+
+
+def _trak(handler: str, entry: bytes, timescale: int, duration: int, samples: int) -> bytes:
+    """Encode a track whose samples are all 1000 bytes."""
+    tkhd = _full_box("tkhd", struct.pack(">IIIII", 0, 0, 1, 0, duration) + b"\0" * 60)
+    mdhd = _full_box("mdhd", struct.pack(">IIII", 0, 0, timescale, duration) + b"\0" * 4)
+    hdlr = _full_box("hdlr", b"\0" * 4 + handler.encode() + b"\0" * 13)
+    stsd = _full_box("stsd", struct.pack(">I", 1) + entry)
+    stsz = _full_box("stsz", struct.pack(">II", 1000, samples))
+    stbl = make_box("stbl", stsd + stsz)
+    return make_box("trak", tkhd + make_box("mdia", mdhd + hdlr + make_box("minf", stbl)))
+
+
+def _write_mp4(
+    path: Path,
+    *,
+    video: str = "avc1",
+    config: bytes = make_box("avcC", AVCC_HIGH) + make_box("colr", COLR_BT709),
+    audio: bytes | None = make_box("mp4a", b"\0" * 28 + _esds(0x40)),
+    faststart: bool = True,
+    extra: bytes = b"",
+) -> Path:
+    """Write a 2 second 1920x1080 30 fps MP4 file."""
+    visual = b"\0" * 6 + struct.pack(">H", 1) + b"\0" * 16 + struct.pack(">HH", 1920, 1080)
+    visual += b"\0" * 46 + struct.pack(">Hh", 24, -1)
+    traks = _trak("vide", make_box(video, visual + config), 600, 1200, 60)
+    if audio is not None:
+        traks += _trak("soun", audio, 48000, 96000, 94)
+    mvhd = _full_box("mvhd", struct.pack(">IIII", CREATED, CREATED, 600, 1200) + b"\0" * 80)
+    ftyp = make_box("ftyp", b"isom\0\0\x02\0isom")
+    moov = make_box("moov", mvhd + traks + extra)
+    mdat = make_box("mdat", b"\0" * 1024)
+    path.write_bytes(ftyp + moov + mdat if faststart else ftyp + mdat + moov)
+    return path
 
 
 class TestCodecInfo:
@@ -461,9 +517,7 @@ class TestCodecDetector:
         video_path.write_bytes(b"fake video content")
 
         mock_runner = MagicMock(spec=FFprobeRunner)
-        mock_runner.probe.return_value = self._create_mock_probe_data(
-            width=3840, height=2160
-        )
+        mock_runner.probe.return_value = self._create_mock_probe_data(width=3840, height=2160)
 
         detector = CodecDetector(ffprobe_runner=mock_runner)
         info = detector.analyze(video_path)
@@ -484,9 +538,7 @@ class TestCodecDetector:
         video_path.write_text("not a video")
 
         mock_runner = MagicMock(spec=FFprobeRunner)
-        mock_runner.probe.side_effect = CommandExecutionError(
-            "ffprobe", 1, "Invalid data found"
-        )
+        mock_runner.probe.side_effect = CommandExecutionError("ffprobe", 1, "Invalid data found")
 
         detector = CodecDetector(ffprobe_runner=mock_runner)
         with pytest.raises(InvalidVideoError):
@@ -602,9 +654,7 @@ class TestCodecDetector:
 class TestCodecDetectorConvenienceMethods:
     """Tests for convenience methods."""
 
-    def _create_detector_with_mock(
-        self, codec: str, tmp_path: Path
-    ) -> tuple[CodecDetector, Path]:
+    def _create_detector_with_mock(self, codec: str, tmp_path: Path) -> tuple[CodecDetector, Path]:
         """Create detector with mock and test file."""
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"content")
@@ -921,3 +971,90 @@ class TestCodecDetectorLevelParsing:
         detector = CodecDetector(ffprobe_runner=mock_runner)
         info = detector.analyze(video_path)
         assert info.level == "5.1"
+
+
+class TestCodecDetectorNative:
+    """Tests for analyzing MP4/MOV headers without FFprobe."""
+
+    def test_analyze_h264_natively(self, tmp_path: Path) -> None:
+        """Test an MP4 file is analyzed without running FFprobe."""
+        video_path = _write_mp4(tmp_path / "test.mp4")
+        mock_runner = MagicMock(spec=FFprobeRunner)
+
+        info = CodecDetector(ffprobe_runner=mock_runner).analyze(video_path)
+
+        mock_runner.probe.assert_not_called()
+        assert info.codec == "h264"
+        assert (info.width, info.height) == (1920, 1080)
+        assert info.fps == pytest.approx(30.0)
+        assert info.duration == pytest.approx(2.0)
+        assert info.bitrate == 240_000
+        assert info.size == video_path.stat().st_size
+        assert info.audio_codec == "aac"
+        assert info.container == "mov"
+        assert info.creation_time == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert info.color_space == "bt709"
+        assert info.bit_depth == 8
+        assert info.profile == "High"
+        assert info.level == "4.0"
+
+    def test_analyze_hevc_trailing_moov(self, tmp_path: Path) -> None:
+        """Test a movie header after the media data is read natively."""
+        video_path = _write_mp4(
+            tmp_path / "test.mov",
+            video="hvc1",
+            config=make_box("hvcC", HVCC_MAIN10),
+            audio=None,
+            faststart=False,
+        )
+        mock_runner = MagicMock(spec=FFprobeRunner)
+
+        info = CodecDetector(ffprobe_runner=mock_runner).analyze(video_path)
+
+        mock_runner.probe.assert_not_called()
+        assert info.codec == "hevc"
+        assert info.audio_codec is None
+        assert info.profile == "Main 10"
+        assert info.bit_depth == 10
+        assert info.level == "15.3"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "extra"),
+        [
+            ({"video": "xyz1"}, b""),
+            ({"audio": make_box("mp4a", b"\0" * 28 + _esds(0xA5))}, b""),
+            ({"audio": make_box("samr", b"\0" * 28)}, b""),
+            ({}, make_box("mvex", b"")),
+        ],
+        ids=["unknown-video", "unknown-object-type", "unknown-audio", "fragmented"],
+    )
+    def test_falls_back_to_ffprobe(self, tmp_path: Path, kwargs: dict, extra: bytes) -> None:
+        """Test files the native reader does not fully understand use FFprobe."""
+        video_path = _write_mp4(tmp_path / "test.mp4", extra=extra, **kwargs)
+        mock_runner = MagicMock(spec=FFprobeRunner)
+        mock_runner.probe.return_value = TestCodecDetector()._create_mock_probe_data()
+
+        info = CodecDetector(ffprobe_runner=mock_runner).analyze(video_path)
+
+        mock_runner.probe.assert_called_once()
+        assert info.container == "mp4"
+
+    def test_native_disabled(self, tmp_path: Path) -> None:
+        """Test use_native=False always runs FFprobe."""
+        video_path = _write_mp4(tmp_path / "test.mp4")
+        mock_runner = MagicMock(spec=FFprobeRunner)
+        mock_runner.probe.return_value = TestCodecDetector()._create_mock_probe_data()
+
+        CodecDetector(ffprobe_runner=mock_runner, use_native=False).analyze(video_path)
+
+        mock_runner.probe.assert_called_once()
+
+    async def test_analyze_async_natively(self, tmp_path: Path) -> None:
+        """Test async analysis also uses the native reader."""
+        video_path = _write_mp4(tmp_path / "test.mp4")
+        mock_runner = MagicMock(spec=FFprobeRunner)
+
+        info = await CodecDetector(ffprobe_runner=mock_runner).analyze_async(video_path)
+
+        mock_runner.probe_async.assert_not_called()
+        assert info.codec == "h264"
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
@@ -13,12 +18,17 @@ from video_converter.utils.command_runner import (
     CommandResult,
     CommandRunner,
     CommandTimeoutError,
+    ExifToolPool,
     ExifToolRunner,
     FFprobeRunner,
     run_command,
     run_exiftool,
     run_ffprobe,
 )
+from video_converter.utils.probe_cache import ProbeCache
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 
 class TestCommandResult:
@@ -150,6 +160,38 @@ class TestFFprobeRunner:
                 result = runner.probe(Path("test.mp4"))
                 assert "format" in result
 
+    def test_probe_uses_cache(self, tmp_path: Path) -> None:
+        """Test repeated probes of an unchanged file run FFprobe once."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+        runner = FFprobeRunner(cache=ProbeCache())
+        with patch.object(runner._runner, "run") as mock_run:
+            mock_run.return_value = CommandResult(
+                returncode=0,
+                stdout='{"format": {"duration": "10"}, "streams": []}',
+                stderr="",
+            )
+            first = runner.probe(video)
+            second = runner.probe(video, show_streams=False)
+
+        assert mock_run.call_count == 1
+        assert first == second
+
+    def test_probe_cache_disabled(self, tmp_path: Path) -> None:
+        """Test probes are not cached when caching is disabled."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+        runner = FFprobeRunner(use_cache=False)
+        assert runner.cache is None
+        with patch.object(runner._runner, "run") as mock_run:
+            mock_run.return_value = CommandResult(
+                returncode=0, stdout='{"format": {}}', stderr=""
+            )
+            runner.probe(video)
+            runner.probe(video)
+
+        assert mock_run.call_count == 2
+
 
 class TestFFprobeRunnerAsync:
     """Async tests for FFprobeRunner."""
@@ -161,6 +203,36 @@ class TestFFprobeRunnerAsync:
         with pytest.raises(FileNotFoundError):
             await runner.probe_async(Path("/nonexistent/video.mp4"))
 
+    @pytest.mark.asyncio
+    async def test_probe_async_uses_cache(self, tmp_path: Path) -> None:
+        """Test probe_async returns a cached result from a sync probe."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+        runner = FFprobeRunner(cache=ProbeCache())
+        with patch.object(runner._runner, "run") as mock_run:
+            mock_run.return_value = CommandResult(
+                returncode=0, stdout='{"format": {"duration": "5"}}', stderr=""
+            )
+            runner.probe(video)
+
+        with patch.object(runner._runner, "run_async") as mock_run_async:
+            result = await runner.probe_async(video)
+
+        mock_run_async.assert_not_called()
+        assert result["format"]["duration"] == "5"
+
+    @pytest.mark.asyncio
+    async def test_keyframe_times_async(self) -> None:
+        """Test keyframe timestamps are read from packet flags."""
+        runner = FFprobeRunner()
+        stdout = "0.000000,K_\n0.033367,__\n2.002000,K_\nN/A,K_\n1.001000,K_\n"
+        with patch.object(runner._runner, "run_async") as mock_run_async:
+            mock_run_async.return_value = CommandResult(returncode=0, stdout=stdout, stderr="")
+            times = await runner.keyframe_times_async(Path("video.mp4"))
+
+        assert times == [0.0, 1.001, 2.002]
+        assert "packet=pts_time,flags" in mock_run_async.call_args.args[0]
+
 
 class TestCommandTimeoutError:
     """Tests for CommandTimeoutError exception."""
@@ -283,6 +355,160 @@ class TestExifToolRunner:
                 assert result["CreateDate"] == "2024:01:15 10:30:00"
 
 
+FAKE_EXIFTOOL = """
+import json, os, sys, time
+
+def process(args, pooled):
+    if "-crash" in args:
+        sys.exit(3)
+    if "-sleep" in args:
+        time.sleep(5)
+    status = 1 if "-fail" in args else 0
+    if status:
+        sys.stderr.write("Error: failed\\n")
+    sys.stdout.write(json.dumps({"pid": os.getpid(), "pooled": pooled, "args": args}) + "\\n")
+    return status
+
+argv = sys.argv[1:]
+if argv != ["-stay_open", "True", "-@", "-"]:
+    sys.exit(process(argv, False))
+
+args = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if line.startswith("-execute"):
+        index = args.index("-echo4")
+        echo = args[index + 1]
+        del args[index : index + 2]
+        status = process(args, True)
+        sys.stderr.write(echo.replace("${status}", str(status)) + "\\n")
+        sys.stderr.flush()
+        sys.stdout.write("{ready%s}\\n" % line[len("-execute") :])
+        sys.stdout.flush()
+        args = []
+    elif args[-1:] == ["-stay_open"] and line == "False":
+        break
+    else:
+        args.append(line)
+"""
+
+
+@pytest.fixture
+def fake_exiftool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a fake exiftool that speaks the -stay_open protocol on PATH."""
+    script = tmp_path / "bin" / "exiftool"
+    script.parent.mkdir()
+    script.write_text(f"#!{sys.executable}\n{FAKE_EXIFTOOL}")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+@pytest.fixture
+def pool(fake_exiftool: Path) -> Generator[ExifToolPool, None, None]:
+    """Provide a pool of fake exiftool workers."""
+    instance = ExifToolPool(max_workers=2)
+    yield instance
+    instance.close()
+
+
+class TestExifToolPool:
+    """Tests for the pool of long-lived exiftool processes."""
+
+    def test_worker_reused(self, pool: ExifToolPool) -> None:
+        """Test consecutive commands are answered by the same process."""
+        first = json.loads(pool.run(["exiftool", "-j", "a.mp4"]).stdout)
+        second = json.loads(pool.run(["exiftool", "-j", "b.mp4"]).stdout)
+
+        assert first["pooled"] is True
+        assert first["args"] == ["-j", "a.mp4"]
+        assert second["pid"] == first["pid"]
+        assert pool.worker_count == 1
+
+    def test_run_many_in_one_request(self, pool: ExifToolPool) -> None:
+        """Test batched commands keep their order and separate outputs."""
+        results = pool.run_many([["exiftool", f"file{i}.mp4"] for i in range(5)])
+
+        outputs = [json.loads(result.stdout) for result in results]
+        assert [output["args"] for output in outputs] == [[f"file{i}.mp4"] for i in range(5)]
+        assert len({output["pid"] for output in outputs}) == 1
+
+    def test_failure_status(self, pool: ExifToolPool) -> None:
+        """Test the exit status and stderr of a failed command are kept."""
+        result = pool.run(["exiftool", "-fail", "a.mp4"])
+
+        assert result.returncode == 1
+        assert result.stderr == "Error: failed"
+        with pytest.raises(CommandExecutionError):
+            pool.run(["exiftool", "-fail", "a.mp4"], check=True)
+
+    def test_timeout_replaces_worker(self, pool: ExifToolPool) -> None:
+        """Test a timed out worker is killed and a new one is started."""
+        first = json.loads(pool.run(["exiftool", "a.mp4"]).stdout)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run(["exiftool", "-sleep"], timeout=0.5)
+
+        second = json.loads(pool.run(["exiftool", "a.mp4"]).stdout)
+        assert second["pid"] != first["pid"]
+        assert pool.worker_count == 1
+
+    def test_crash_falls_back_to_separate_process(self, pool: ExifToolPool) -> None:
+        """Test a request whose worker dies is run as its own process."""
+        result = pool.run(["exiftool", "-crash"])
+
+        assert result.returncode == 3
+        assert pool.worker_count == 0
+        assert json.loads(pool.run(["exiftool", "a.mp4"]).stdout)["pooled"] is True
+
+    def test_crash_reruns_only_unanswered_commands(self, pool: ExifToolPool) -> None:
+        """Test commands answered before a worker died are not run again."""
+        results = pool.run_many(
+            [["exiftool", "a.mp4"], ["exiftool", "-crash"], ["exiftool", "b.mp4"]]
+        )
+
+        assert json.loads(results[0].stdout)["pooled"] is True
+        assert results[1].returncode == 3
+        assert json.loads(results[2].stdout)["pooled"] is False
+
+    def test_unsafe_arguments_not_pooled(self, pool: ExifToolPool) -> None:
+        """Test arguments that do not fit an argument file bypass the pool."""
+        result = pool.run(["exiftool", "-Comment=line one\nline two", "a.mp4"])
+
+        assert json.loads(result.stdout)["pooled"] is False
+        assert pool.worker_count == 0
+
+    def test_other_commands_not_pooled(self, pool: ExifToolPool) -> None:
+        """Test non-exiftool commands run as usual."""
+        result = pool.run(["echo", "test"])
+
+        assert result.stdout.strip() == "test"
+        assert pool.worker_count == 0
+
+    @pytest.mark.asyncio
+    async def test_run_async(self, pool: ExifToolPool) -> None:
+        """Test async submission uses a pooled worker."""
+        result = await pool.run_async(["exiftool", "a.mp4"])
+
+        assert json.loads(result.stdout)["pooled"] is True
+
+    def test_read_metadata_batch(self, pool: ExifToolPool, tmp_path: Path) -> None:
+        """Test many files are read with a single command."""
+        files = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for path in files:
+            path.write_bytes(b"")
+        output = json.dumps([{"SourceFile": str(path), "Duration": 1} for path in files])
+        runner = ExifToolRunner(pool)
+
+        with patch.object(
+            pool, "run", return_value=CommandResult(returncode=0, stdout=output, stderr="")
+        ) as mock_run:
+            metadata = runner.read_metadata_batch([*files, tmp_path / "missing.mp4"])
+
+        assert set(metadata) == set(files)
+        mock_run.assert_called_once()
+
+
 class TestExifToolRunnerAsync:
     """Async tests for ExifToolRunner."""
 
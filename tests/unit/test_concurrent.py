@@ -11,9 +11,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from video_converter.core.concurrent import (
+    AdaptiveConcurrencyController,
     AggregatedProgress,
     ConcurrentProcessor,
     JobProgress,
+    ProgressPublisher,
+    ResizableSemaphore,
     ResourceLevel,
     ResourceMonitor,
     ResourceStatus,
@@ -181,6 +184,211 @@ class TestResourceMonitor:
         assert recommended >= 1
 
 
+class TestResizableSemaphore:
+    """Tests for ResizableSemaphore class."""
+
+    @pytest.mark.asyncio
+    async def test_limits_holders(self) -> None:
+        """Test no more than limit holders run at once."""
+        semaphore = ResizableSemaphore(2)
+        active = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal active, peak
+            async with semaphore:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(job() for _ in range(6)))
+
+        assert peak == 2
+        assert semaphore.active == 0
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_admits_waiters(self) -> None:
+        """Test a higher limit lets waiting tasks start immediately."""
+        semaphore = ResizableSemaphore(1)
+        await semaphore.acquire()
+
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await semaphore.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert semaphore.active == 2
+
+    @pytest.mark.asyncio
+    async def test_lowering_limit_waits_for_release(self) -> None:
+        """Test a lower limit blocks new holders until enough release."""
+        semaphore = ResizableSemaphore(2)
+        await semaphore.acquire()
+        await semaphore.acquire()
+        await semaphore.set_limit(1)
+        await semaphore.release()
+
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await semaphore.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert semaphore.active == 1
+
+    def test_limit_minimum_is_one(self) -> None:
+        """Test the limit is clamped to at least one."""
+        assert ResizableSemaphore(0).limit == 1
+
+
+class TestAdaptiveConcurrencyController:
+    """Tests for AdaptiveConcurrencyController class."""
+
+    @staticmethod
+    def _monitor(recommended: int, level: ResourceLevel = ResourceLevel.NORMAL) -> MagicMock:
+        monitor = MagicMock()
+        monitor.get_status.return_value = ResourceStatus(
+            cpu_percent=50.0,
+            cpu_level=level,
+            recommended_concurrency=recommended,
+        )
+        return monitor
+
+    @pytest.mark.asyncio
+    async def test_shrinks_to_recommended(self) -> None:
+        """Test the limit drops straight to the recommendation under load."""
+        semaphore = ResizableSemaphore(4)
+        controller = AdaptiveConcurrencyController(
+            semaphore, self._monitor(1, ResourceLevel.CRITICAL), max_concurrent=4
+        )
+
+        decision = await controller.evaluate()
+
+        assert semaphore.limit == 1
+        assert decision is not None
+        assert decision.previous_limit == 4
+        assert decision.new_limit == 1
+        assert "pressure" in decision.reason
+
+    @pytest.mark.asyncio
+    async def test_grows_one_step_at_a_time(self) -> None:
+        """Test the limit grows gradually and stays within bounds."""
+        semaphore = ResizableSemaphore(1)
+        controller = AdaptiveConcurrencyController(
+            semaphore, self._monitor(8), min_concurrent=1, max_concurrent=3
+        )
+
+        await controller.evaluate()
+        assert semaphore.limit == 2
+        await controller.evaluate()
+        assert semaphore.limit == 3
+        assert await controller.evaluate() is None
+        assert semaphore.limit == 3
+        assert len(controller.decisions) == 2
+
+    @pytest.mark.asyncio
+    async def test_respects_minimum(self) -> None:
+        """Test the limit never drops below min_concurrent."""
+        semaphore = ResizableSemaphore(3)
+        controller = AdaptiveConcurrencyController(
+            semaphore, self._monitor(1), min_concurrent=2, max_concurrent=4
+        )
+
+        await controller.evaluate()
+
+        assert semaphore.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self) -> None:
+        """Test periodic evaluation runs until stopped."""
+        monitor = self._monitor(2)
+        controller = AdaptiveConcurrencyController(
+            ResizableSemaphore(2), monitor, max_concurrent=2, interval=0.01
+        )
+
+        controller.start()
+        await asyncio.sleep(0.05)
+        await controller.stop()
+
+        assert monitor.get_status.call_count >= 2
+
+
+class TestProgressPublisher:
+    """Tests for ProgressPublisher."""
+
+    def test_first_update_delivered_immediately(self) -> None:
+        """Test the first notification is delivered without delay."""
+        delivered: list[AggregatedProgress] = []
+        publisher = ProgressPublisher(
+            delivered.append, lambda: AggregatedProgress(total_jobs=1), min_interval=10.0
+        )
+
+        publisher.notify()
+
+        assert len(delivered) == 1
+        assert publisher.published == 1
+
+    def test_updates_within_interval_are_coalesced(self) -> None:
+        """Test rapid updates collapse into one trailing delivery."""
+        snapshots = iter(range(1, 100))
+        delivered: list[AggregatedProgress] = []
+        publisher = ProgressPublisher(
+            delivered.append,
+            lambda: AggregatedProgress(completed_jobs=next(snapshots)),
+            min_interval=10.0,
+        )
+
+        for _ in range(50):
+            publisher.notify()
+        assert len(delivered) == 1
+
+        publisher.flush()
+        assert [p.completed_jobs for p in delivered] == [1, 2]
+
+        # Nothing left to deliver
+        publisher.flush()
+        assert len(delivered) == 2
+
+    @pytest.mark.asyncio
+    async def test_trailing_update_delivered_after_interval(self) -> None:
+        """Test a coalesced update is delivered once the interval passes."""
+        delivered: list[AggregatedProgress] = []
+        publisher = ProgressPublisher(delivered.append, AggregatedProgress, min_interval=0.02)
+
+        publisher.notify()
+        publisher.notify()
+        publisher.notify()
+        assert len(delivered) == 1
+
+        await asyncio.sleep(0.05)
+        assert len(delivered) == 2
+        publisher.close()
+
+    def test_close_drops_pending_update(self) -> None:
+        """Test close() discards a coalesced update."""
+        delivered: list[AggregatedProgress] = []
+        publisher = ProgressPublisher(delivered.append, AggregatedProgress, min_interval=10.0)
+
+        publisher.notify()
+        publisher.notify()
+        publisher.close()
+        publisher.flush()
+
+        assert len(delivered) == 1
+
+    def test_callback_errors_are_swallowed(self) -> None:
+        """Test a failing callback does not propagate."""
+        publisher = ProgressPublisher(
+            MagicMock(side_effect=ValueError("boom")), AggregatedProgress, min_interval=0.0
+        )
+
+        publisher.notify()
+
+        assert publisher.published == 1
+
+
 class TestConcurrentProcessor:
     """Tests for ConcurrentProcessor class."""
 
@@ -380,6 +588,232 @@ class TestConcurrentProcessor:
         assert agg.total_jobs == 2
 
 
+class TestConcurrentProcessorAggregates:
+    """Tests for incrementally maintained aggregated progress."""
+
+    @pytest.mark.asyncio
+    async def test_aggregates_track_running_jobs(self) -> None:
+        """Test counts and overall progress while jobs are running."""
+        processor = ConcurrentProcessor(max_concurrent=2, enable_resource_monitoring=False)
+        release = asyncio.Event()
+
+        async def work(item, callback):
+            callback(0.5)
+            await release.wait()
+            if item.name == "bad.mov":
+                raise ValueError("encode failed")
+            return item
+
+        items = [Path("a.mov"), Path("bad.mov"), Path("c.mov"), Path("d.mov")]
+        batch = asyncio.create_task(processor.process_batch(items, work))
+        await asyncio.sleep(0.01)
+
+        agg = processor.get_aggregated_progress()
+        assert agg.in_progress_jobs == 2
+        assert agg.pending_jobs == 2
+        assert agg.overall_progress == pytest.approx(0.25)
+        assert agg.current_files == ["a.mov", "bad.mov"]
+
+        release.set()
+        results = await batch
+
+        assert results == [items[0], None, items[2], items[3]]
+        final = processor.get_aggregated_progress()
+        assert final.completed_jobs == 4
+        assert final.failed_jobs == 1
+        assert final.in_progress_jobs == 0
+        assert final.pending_jobs == 0
+        assert final.current_files == []
+
+    @pytest.mark.asyncio
+    async def test_progress_updates_are_rate_limited(self) -> None:
+        """Test per-line progress is coalesced and the final state delivered."""
+        processor = ConcurrentProcessor(
+            max_concurrent=2, enable_resource_monitoring=False, progress_interval=10.0
+        )
+        updates: list[AggregatedProgress] = []
+
+        async def work(item, callback):
+            for i in range(1000):
+                callback(i / 1000)
+            await asyncio.sleep(0)
+            return item
+
+        await processor.process_batch(list(range(4)), work, updates.append)
+
+        assert len(updates) == 2
+        assert updates[-1].completed_jobs == 4
+        assert updates[-1].overall_progress == 1.0
+
+    def test_reset_clears_running_aggregates(self) -> None:
+        """Test reset() clears the incremental counters."""
+        processor = ConcurrentProcessor()
+        processor._failed_count = 2
+        processor._pending_count = 3
+        processor._active_progress = 0.5
+
+        processor.reset()
+
+        agg = processor.get_aggregated_progress()
+        assert agg.failed_jobs == 0
+        assert agg.pending_jobs == 0
+        assert agg.overall_progress == 0.0
+
+
+class TestConcurrentProcessorStream:
+    """Tests for worker-pool streaming in ConcurrentProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_results_streamed_to_callback(self) -> None:
+        """Test every item reaches on_result and nothing is retained."""
+        processor = ConcurrentProcessor(max_concurrent=3, enable_resource_monitoring=False)
+        results: dict[int, int] = {}
+
+        async def work(item, callback):
+            callback(0.5)
+            await asyncio.sleep(0)
+            return item * 2
+
+        count = await processor.process_stream(
+            range(20), work, lambda item, result, _error: results.__setitem__(item, result)
+        )
+
+        assert count == 20
+        assert results == {i: i * 2 for i in range(20)}
+        agg = processor.get_aggregated_progress()
+        assert agg.total_jobs == 20
+        assert agg.completed_jobs == 20
+        assert agg.pending_jobs == 0
+        assert agg.job_progresses == []
+
+    @pytest.mark.asyncio
+    async def test_items_consumed_lazily(self) -> None:
+        """Test the producer stays within the queue and worker bounds."""
+        processor = ConcurrentProcessor(max_concurrent=2, enable_resource_monitoring=False)
+        produced = 0
+        finished = 0
+        max_ahead = 0
+        running = 0
+        max_running = 0
+
+        async def items():
+            nonlocal produced
+            for i in range(50):
+                produced += 1
+                yield i
+
+        async def work(item, callback):
+            nonlocal running, max_running, max_ahead
+            running += 1
+            max_running = max(max_running, running)
+            max_ahead = max(max_ahead, produced - finished)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return item
+
+        def on_result(item, result, error):
+            nonlocal finished
+            finished += 1
+
+        await processor.process_stream(items(), work, on_result, queue_size=2)
+
+        assert finished == 50
+        assert max_running == 2
+        # Running jobs, queued jobs and the item the producer holds
+        assert max_ahead <= 2 + 2 + 1
+        assert len(processor._job_progresses) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reported_per_item(self) -> None:
+        """Test a failing item is reported and the batch continues."""
+        processor = ConcurrentProcessor(max_concurrent=2, enable_resource_monitoring=False)
+        outcomes: list[tuple[int, int | None, BaseException | None]] = []
+
+        async def work(item, callback):
+            if item == 1:
+                raise ValueError("bad item")
+            return item
+
+        await processor.process_stream(
+            [0, 1, 2], work, lambda item, result, error: outcomes.append((item, result, error))
+        )
+
+        outcomes.sort(key=lambda o: o[0])
+        assert [o[1] for o in outcomes] == [0, None, 2]
+        assert isinstance(outcomes[1][2], ValueError)
+        assert processor.get_aggregated_progress().failed_jobs == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_producing(self) -> None:
+        """Test cancelling stops pulling new items."""
+        processor = ConcurrentProcessor(max_concurrent=1, enable_resource_monitoring=False)
+        started: list[int] = []
+
+        async def work(item, callback):
+            started.append(item)
+            processor.cancel()
+            return item
+
+        await processor.process_stream(range(100), work, lambda *_args: None)
+
+        assert started == [0]
+        agg = processor.get_aggregated_progress()
+        assert agg.pending_jobs == 0
+        assert agg.in_progress_jobs == 0
+
+
+class TestConcurrentProcessorAdaptive:
+    """Tests for adaptive concurrency in ConcurrentProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_limit_follows_resources_during_batch(self) -> None:
+        """Test the running limit changes mid-batch and is reported."""
+        processor = ConcurrentProcessor(
+            max_concurrent=3,
+            adaptive_concurrency=True,
+            adaptive_interval=0.01,
+        )
+        # Idle when the batch starts, then another workload saturates the CPU
+        monitor = MagicMock()
+        monitor.get_status.side_effect = [
+            ResourceStatus(recommended_concurrency=3)
+        ] + [
+            ResourceStatus(recommended_concurrency=1, cpu_level=ResourceLevel.CRITICAL)
+        ] * 100
+        processor._resource_monitor = monitor
+        limits: list[int] = []
+
+        async def work(item, callback):
+            await asyncio.sleep(0.02)
+            return item
+
+        results = await processor.process_batch(
+            list(range(8)),
+            work,
+            on_progress=lambda agg: limits.append(agg.concurrency_limit),
+        )
+
+        assert results == list(range(8))
+        assert limits[0] == 3
+        assert 1 in limits
+        assert processor.concurrency_decisions
+        assert processor.get_aggregated_progress().last_decision is not None
+
+    @pytest.mark.asyncio
+    async def test_fixed_limit_without_adaptive(self) -> None:
+        """Test the limit stays at max_concurrent when not adaptive."""
+        processor = ConcurrentProcessor(max_concurrent=2, enable_resource_monitoring=False)
+
+        async def work(item, callback):
+            return item
+
+        await processor.process_batch([1, 2, 3], work)
+
+        agg = processor.get_aggregated_progress()
+        assert agg.concurrency_limit == 2
+        assert agg.last_decision is None
+
+
 class TestConcurrentProcessorIntegration:
     """Integration tests for ConcurrentProcessor."""
 
@@ -204,6 +204,17 @@ class TestProcessingConfig:
         assert config.check_disk_space is False
         assert config.min_free_space_gb == 2.5
 
+    def test_pipeline_settings(self) -> None:
+        """Test pipeline mode is off by default and its sizes are validated."""
+        config = ProcessingConfig()
+        assert config.pipeline is False
+        assert config.pipeline_verify_concurrency == 2
+        assert config.pipeline_finalize_concurrency == 2
+        assert config.pipeline_queue_size == 2
+
+        with pytest.raises(ValueError):
+            ProcessingConfig(pipeline_queue_size=0)
+
     def test_max_concurrent_validation_min(self) -> None:
         """Test max_concurrent minimum validation."""
         with pytest.raises(ValueError):
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from video_converter.converters.base import (
+    DEFAULT_STATS_PERIOD,
     BaseConverter,
     ConversionError,
     EncoderNotAvailableError,
 )
 from video_converter.converters.factory import ConverterFactory, get_converter
 from video_converter.converters.hardware import HardwareConverter
-from video_converter.converters.software import SoftwareConverter
+from video_converter.converters.software import SoftwareConverter, x265_frame_threads
 from video_converter.core.types import ConversionMode, ConversionRequest
 
 
@@ -108,6 +110,19 @@ class TestHardwareConverter:
         quality_idx = command.index("-q:v") + 1
         assert command[quality_idx] == "1"
 
+    def test_build_command_thread_budget(self) -> None:
+        """Test a thread budget limits decoder threads."""
+        converter = HardwareConverter()
+        request = ConversionRequest(
+            input_path=Path("input.mov"),
+            output_path=Path("output.mp4"),
+            threads=4,
+        )
+        command = converter.build_command(request)
+
+        assert command[command.index("-threads") + 1] == "4"
+        assert command.index("-threads") < command.index("-i")
+
 
 class TestSoftwareConverter:
     """Tests for SoftwareConverter."""
@@ -138,6 +153,21 @@ class TestSoftwareConverter:
         converter = SoftwareConverter()
         assert converter.is_available() is False
 
+    @pytest.mark.asyncio
+    async def test_convert_result_records_encoder(self, tmp_path: Path) -> None:
+        """Test conversion results name the encoder that ran."""
+        converter = SoftwareConverter()
+        request = ConversionRequest(
+            input_path=tmp_path / "missing.mov",
+            output_path=tmp_path / "out.mp4",
+        )
+
+        with patch.object(converter, "is_available", return_value=True):
+            result = await converter.convert(request)
+
+        assert result.success is False
+        assert result.encoder == "libx265"
+
     def test_build_command(self) -> None:
         """Test FFmpeg command is built correctly."""
         converter = SoftwareConverter()
@@ -290,12 +320,160 @@ class TestSoftwareConverter:
         # Should not have 10-bit options
         assert "-pix_fmt" not in command
 
+    def test_build_command_thread_budget(self) -> None:
+        """Test a thread budget sizes decoder threads and the x265 pool."""
+        converter = SoftwareConverter()
+        request = ConversionRequest(
+            input_path=Path("input.mov"),
+            output_path=Path("output.mp4"),
+            threads=6,
+        )
+        command = converter.build_command(request)
+
+        assert command[command.index("-threads") + 1] == "6"
+        assert command.index("-threads") < command.index("-i")
+        x265_params = command[command.index("-x265-params") + 1]
+        assert x265_params == "pools=6:frame-threads=2"
+
+    def test_build_command_thread_budget_with_hdr(self) -> None:
+        """Test thread and HDR parameters are combined into one option."""
+        converter = SoftwareConverter()
+        request = ConversionRequest(
+            input_path=Path("input.mov"),
+            output_path=Path("output.mp4"),
+            bit_depth=10,
+            hdr=True,
+            threads=16,
+        )
+        command = converter.build_command(request)
+
+        assert command.count("-x265-params") == 1
+        x265_params = command[command.index("-x265-params") + 1]
+        assert x265_params.startswith("pools=16:frame-threads=5:")
+        assert "hdr-opt=1" in x265_params
+
+    def test_build_command_without_thread_budget(self) -> None:
+        """Test no thread options are added without a budget."""
+        converter = SoftwareConverter()
+        request = ConversionRequest(input_path=Path("input.mov"), output_path=Path("output.mp4"))
+        command = converter.build_command(request)
+
+        assert "-threads" not in command
+        assert "-x265-params" not in command
+
+    def test_x265_frame_threads(self) -> None:
+        """Test frame threads follow x265 defaults for the core count."""
+        assert x265_frame_threads(1) == 1
+        assert x265_frame_threads(4) == 2
+        assert x265_frame_threads(8) == 3
+        assert x265_frame_threads(16) == 5
+        assert x265_frame_threads(64) == 6
+
     def test_valid_bit_depths(self) -> None:
         """Test valid bit depths constant is correct."""
         assert SoftwareConverter.VALID_BIT_DEPTHS == [8, 10]
         assert SoftwareConverter.DEFAULT_BIT_DEPTH == 8
 
 
+class TestConverterProgressOutput:
+    """Tests for FFmpeg progress output and stderr capture."""
+
+    def test_progress_options_added_after_executable(self) -> None:
+        """Test progress is requested on stdout with the stats period."""
+        converter = SoftwareConverter()
+        command = converter._with_progress_output(["ffmpeg", "-hide_banner", "-i", "in.mov"])
+
+        assert command[:6] == [
+            "ffmpeg",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-stats_period",
+            f"{DEFAULT_STATS_PERIOD:g}",
+        ]
+        assert command[6:] == ["-hide_banner", "-i", "in.mov"]
+
+    def test_progress_options_custom_stats_period(self) -> None:
+        """Test the stats period is configurable and can be omitted."""
+        converter = HardwareConverter()
+        converter.stats_period = 2.0
+        command = converter._with_progress_output(["ffmpeg", "-i", "in.mov"])
+        assert command[command.index("-stats_period") + 1] == "2"
+
+        converter.stats_period = None
+        command = converter._with_progress_output(["ffmpeg", "-i", "in.mov"])
+        assert "-stats_period" not in command
+        assert "-progress" in command
+
+    def test_existing_progress_option_kept(self) -> None:
+        """Test commands that already request progress are unchanged."""
+        converter = SoftwareConverter()
+        original = ["ffmpeg", "-progress", "pipe:2", "-i", "in.mov"]
+        assert converter._with_progress_output(original) == original
+
+    @staticmethod
+    def _scripted_converter(script: str) -> SoftwareConverter:
+        """Create a converter that runs a Python script instead of FFmpeg."""
+        converter = SoftwareConverter()
+        converter.build_command = lambda request: [  # type: ignore[method-assign]
+            sys.executable,
+            "-c",
+            script,
+            str(request.output_path),
+        ]
+        converter._with_progress_output = lambda command: command  # type: ignore[method-assign]
+        converter.is_available = lambda: True  # type: ignore[method-assign]
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_convert_reports_progress_from_stdout(self, tmp_path: Path) -> None:
+        """Test progress blocks on stdout drive the progress callbacks."""
+        script = (
+            "import sys\n"
+            "for us, state in ((2000000, 'continue'), (5000000, 'end')):\n"
+            "    print('frame=30'); print('out_time_us=%d' % us)\n"
+            "    print('speed=2.5x'); print('progress=' + state)\n"
+            "open(sys.argv[1], 'wb').write(b'x')\n"
+        )
+        converter = self._scripted_converter(script)
+        source = tmp_path / "in.mov"
+        source.write_bytes(b"0" * 100)
+        request = ConversionRequest(input_path=source, output_path=tmp_path / "out.mp4")
+        ratios: list[float] = []
+        infos = []
+
+        with patch.object(converter, "_get_video_duration", return_value=10.0):
+            result = await converter.convert(
+                request, on_progress=ratios.append, on_progress_info=infos.append
+            )
+
+        assert result.success is True
+        assert result.speed_ratio == 2.5
+        assert [info.current_time for info in infos] == [2.0, 5.0]
+        assert ratios == [0.2, 0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_convert_keeps_bounded_stderr_tail(self, tmp_path: Path) -> None:
+        """Test only the last stderr lines are kept for the error message."""
+        script = (
+            "import sys\n"
+            "for i in range(5000):\n"
+            "    sys.stderr.write('warning %d\\n' % i)\n"
+            "sys.exit(1)\n"
+        )
+        converter = self._scripted_converter(script)
+        converter.stderr_tail_lines = 3
+        source = tmp_path / "in.mov"
+        source.write_bytes(b"0" * 100)
+        request = ConversionRequest(input_path=source, output_path=tmp_path / "out.mp4")
+
+        with patch.object(converter, "_get_video_duration", return_value=10.0):
+            result = await converter.convert(request)
+
+        assert result.success is False
+        assert result.error_message == "FFmpeg failed: warning 4997\nwarning 4998\nwarning 4999"
+
+
 class TestConverterFactory:
     """Tests for ConverterFactory."""
 
@@ -0,0 +1,141 @@
+"""Unit tests for hybrid encoder dispatch module."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_converter.converters.software import SoftwareConverter
+from video_converter.core.encoder_pool import EncoderDispatcher, EncoderSlotPool
+from video_converter.processors.codec_detector import CodecInfo
+
+
+def _codec_info(height: int = 1080, bit_depth: int | None = 8) -> CodecInfo:
+    return CodecInfo(
+        path=Path("video.mov"),
+        codec="h264",
+        width=height * 16 // 9,
+        height=height,
+        fps=30.0,
+        duration=10.0,
+        bitrate=0,
+        size=0,
+        audio_codec=None,
+        container="mov",
+        bit_depth=bit_depth,
+    )
+
+
+class TestEncoderSlotPool:
+    """Tests for EncoderSlotPool dataclass."""
+
+    def test_slots_minimum_is_one(self) -> None:
+        """Test slot count is clamped to at least one."""
+        pool = EncoderSlotPool("software", SoftwareConverter(), slots=0)
+        assert pool.slots == 1
+
+    def test_accepts_without_codec_info(self) -> None:
+        """Test inputs without analysis are accepted by restricted pools."""
+        pool = EncoderSlotPool("hw", SoftwareConverter(), max_height=1080)
+        assert pool.accepts(None) is True
+
+    def test_routing_limits(self) -> None:
+        """Test height and bit depth limits are applied."""
+        pool = EncoderSlotPool("hw", SoftwareConverter(), max_height=1080, max_bit_depth=8)
+
+        assert pool.accepts(_codec_info(1080, 8)) is True
+        assert pool.accepts(_codec_info(2160, 8)) is False
+        assert pool.accepts(_codec_info(1080, 10)) is False
+        assert pool.accepts(_codec_info(1080, None)) is True
+
+
+class TestEncoderDispatcher:
+    """Tests for EncoderDispatcher class."""
+
+    def test_requires_pools(self) -> None:
+        """Test dispatcher rejects an empty pool list."""
+        with pytest.raises(ValueError):
+            EncoderDispatcher([])
+
+    def test_total_slots(self) -> None:
+        """Test total slots sum all pools."""
+        dispatcher = EncoderDispatcher(
+            [
+                EncoderSlotPool("a", SoftwareConverter(), slots=2),
+                EncoderSlotPool("b", SoftwareConverter(), slots=3),
+            ]
+        )
+        assert dispatcher.total_slots == 5
+
+    @pytest.mark.asyncio
+    async def test_prefers_first_pool_then_overflows(self) -> None:
+        """Test jobs fill the first pool before using the next one."""
+        dispatcher = EncoderDispatcher(
+            [
+                EncoderSlotPool("a", SoftwareConverter(), slots=1),
+                EncoderSlotPool("b", SoftwareConverter(), slots=1),
+            ]
+        )
+
+        async with dispatcher.acquire() as first, dispatcher.acquire() as second:
+            assert (first.name, second.name) == ("a", "b")
+            assert first.active == second.active == 1
+
+        assert [pool.completed for pool in dispatcher.pools] == [1, 1]
+        assert all(pool.active == 0 for pool in dispatcher.pools)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_free_slot(self) -> None:
+        """Test a job waits until any pool frees a slot."""
+        dispatcher = EncoderDispatcher([EncoderSlotPool("a", SoftwareConverter(), slots=1)])
+        order: list[str] = []
+
+        async def job(name: str) -> None:
+            async with dispatcher.acquire():
+                order.append(f"start_{name}")
+                await asyncio.sleep(0.01)
+                order.append(f"end_{name}")
+
+        await asyncio.gather(job("x"), job("y"))
+
+        assert order == ["start_x", "end_x", "start_y", "end_y"]
+
+    @pytest.mark.asyncio
+    async def test_routes_by_codec_info(self) -> None:
+        """Test inputs skip pools whose routing rules reject them."""
+        dispatcher = EncoderDispatcher(
+            [
+                EncoderSlotPool("hd", SoftwareConverter(), slots=2, max_height=1080),
+                EncoderSlotPool("any", SoftwareConverter(), slots=2),
+            ]
+        )
+
+        async with dispatcher.acquire(_codec_info(2160)) as pool:
+            assert pool.name == "any"
+        async with dispatcher.acquire(_codec_info(720)) as pool:
+            assert pool.name == "hd"
+
+    @pytest.mark.asyncio
+    async def test_unroutable_input_uses_any_pool(self) -> None:
+        """Test an input rejected by every pool still gets a slot."""
+        dispatcher = EncoderDispatcher(
+            [EncoderSlotPool("hd", SoftwareConverter(), slots=1, max_height=1080)]
+        )
+
+        async with dispatcher.acquire(_codec_info(2160)) as pool:
+            assert pool.name == "hd"
+
+    def test_cancel_all_pools(self) -> None:
+        """Test cancel reaches every pool's converter."""
+        converters = [MagicMock(), MagicMock()]
+        dispatcher = EncoderDispatcher(
+            [EncoderSlotPool(f"p{i}", c) for i, c in enumerate(converters)]
+        )
+
+        dispatcher.cancel()
+
+        for converter in converters:
+            converter.cancel.assert_called_once()
@@ -12,9 +12,11 @@ import pytest
 from video_converter.utils.file_utils import (
     AtomicWriteError,
     InsufficientSpaceError,
+    ParallelVideoWalker,
     atomic_write,
     check_disk_space,
     cleanup_temp_files,
+    clone_file,
     create_temp_directory,
     ensure_directory,
     ensure_disk_space,
@@ -30,6 +32,7 @@ from video_converter.utils.file_utils import (
     safe_copy,
     safe_delete,
     safe_move,
+    scan_video_files,
 )
 
 
@@ -315,6 +318,65 @@ class TestSafeCopy:
             safe_copy(src, dst)
 
 
+class TestCloneFile:
+    """Tests for clone_file function."""
+
+    def test_hardlink_preferred(self, tmp_path: Path) -> None:
+        """Test a hard link is used when allowed."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "out" / "dest.mp4"
+        src.write_bytes(b"video")
+
+        assert clone_file(src, dst) == "hardlink"
+        assert dst.stat().st_ino == src.stat().st_ino
+
+    def test_separate_file_without_hardlink(self, tmp_path: Path) -> None:
+        """Test the clone has its own inode when hard links are not allowed."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "dest.mp4"
+        src.write_bytes(b"video")
+
+        assert clone_file(src, dst, allow_hardlink=False) in ("reflink", "copy")
+        assert dst.read_bytes() == b"video"
+        assert dst.stat().st_ino != src.stat().st_ino
+
+    def test_falls_back_to_copy(self, tmp_path: Path) -> None:
+        """Test a full copy is made when links and clones fail."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "dest.mp4"
+        src.write_bytes(b"video")
+
+        with (
+            patch("video_converter.utils.file_utils.os.link", side_effect=OSError("EXDEV")),
+            patch("video_converter.utils.file_utils._reflink", return_value=False),
+        ):
+            assert clone_file(src, dst) == "copy"
+        assert dst.read_bytes() == b"video"
+
+    def test_raises_when_dest_exists(self, tmp_path: Path) -> None:
+        """Test that FileExistsError is raised when dest exists."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "dest.mp4"
+        src.write_bytes(b"source")
+        dst.write_bytes(b"dest")
+
+        with pytest.raises(FileExistsError):
+            clone_file(src, dst)
+
+    def test_raises_instead_of_copying(self, tmp_path: Path) -> None:
+        """Test no copy is made when copies are not allowed."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "dest.mp4"
+        src.write_bytes(b"video")
+
+        with (
+            patch("video_converter.utils.file_utils._reflink", return_value=False),
+            pytest.raises(OSError),
+        ):
+            clone_file(src, dst, allow_hardlink=False, allow_copy=False)
+        assert not dst.exists()
+
+
 class TestSafeDelete:
     """Tests for safe_delete function."""
 
@@ -478,6 +540,119 @@ class TestIsVideoFile:
         assert is_video_file("video.MOV") is True
 
 
+class TestScanVideoFiles:
+    """Tests for scan_video_files function."""
+
+    def test_finds_videos_recursively(self, tmp_path: Path) -> None:
+        """Test videos are found in nested directories with any case."""
+        (tmp_path / "a.mp4").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.MOV").touch()
+
+        found = {v.path for v in scan_video_files(tmp_path)}
+
+        assert found == {tmp_path / "a.mp4", tmp_path / "sub" / "b.MOV"}
+
+    def test_non_recursive(self, tmp_path: Path) -> None:
+        """Test subdirectories are ignored when not recursive."""
+        (tmp_path / "a.mp4").touch()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.mp4").touch()
+
+        found = [v.path for v in scan_video_files(tmp_path, recursive=False)]
+
+        assert found == [tmp_path / "a.mp4"]
+
+    def test_directory_with_video_extension_ignored(self, tmp_path: Path) -> None:
+        """Test directories named like videos are not reported."""
+        (tmp_path / "folder.mov").mkdir()
+
+        assert list(scan_video_files(tmp_path)) == []
+
+    def test_excluded_directories_pruned(self, tmp_path: Path) -> None:
+        """Test excluded directories are not descended into."""
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "a.mp4").touch()
+        (tmp_path / "b.mp4").touch()
+        (tmp_path / "c.mp4.part").touch()
+
+        found = [v.path for v in scan_video_files(tmp_path, exclude_patterns=["cache"])]
+
+        assert found == [tmp_path / "b.mp4"]
+
+    def test_icloud_stubs(self, tmp_path: Path) -> None:
+        """Test iCloud stubs are reported by original path when requested."""
+        (tmp_path / ".cloud.mov.icloud").touch()
+        (tmp_path / ".local.mov.icloud").touch()
+        (tmp_path / "local.mov").touch()
+        (tmp_path / ".doc.pdf.icloud").touch()
+
+        assert {v.path for v in scan_video_files(tmp_path)} == {tmp_path / "local.mov"}
+
+        videos = {v.path: v for v in scan_video_files(tmp_path, include_icloud=True)}
+        assert set(videos) == {tmp_path / "cloud.mov", tmp_path / "local.mov"}
+        assert videos[tmp_path / "cloud.mov"].in_cloud is True
+        assert videos[tmp_path / "cloud.mov"].stub_path == tmp_path / ".cloud.mov.icloud"
+        assert videos[tmp_path / "local.mov"].in_cloud is False
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path) -> None:
+        """Test an unreadable root directory is skipped."""
+        assert list(scan_video_files(tmp_path / "missing")) == []
+
+
+class TestParallelVideoWalker:
+    """Tests for ParallelVideoWalker class."""
+
+    def test_walks_multiple_roots(self, tmp_path: Path) -> None:
+        """Test videos from all roots are reported with stat data."""
+        for name in ("a", "b"):
+            (tmp_path / name / "nested").mkdir(parents=True)
+            (tmp_path / name / "nested" / f"{name}.mp4").write_bytes(b"x" * 10)
+
+        walker = ParallelVideoWalker(max_workers=4)
+        videos = list(walker.walk([tmp_path / "a", tmp_path / "b"]))
+
+        assert {v.path.name for v in videos} == {"a.mp4", "b.mp4"}
+        assert all(v.stat is not None and v.stat.st_size == 10 for v in videos)
+        assert walker.stats.scanned_dirs == 4
+
+    def test_deduplicates_by_inode(self, tmp_path: Path) -> None:
+        """Test overlapping roots, hard links and symlinks are reported once."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "clip.mov").touch()
+        os.link(tmp_path / "sub" / "clip.mov", tmp_path / "hardlink.mov")
+        (tmp_path / "symlink.mov").symlink_to(tmp_path / "sub" / "clip.mov")
+
+        walker = ParallelVideoWalker()
+        videos = list(walker.walk([tmp_path, tmp_path / "sub"]))
+
+        assert len(videos) == 1
+        assert walker.stats.duplicates == 3
+
+    def test_exclusions_and_min_size(self, tmp_path: Path) -> None:
+        """Test excluded and hidden directories and small files are skipped."""
+        for name in ("node_modules", ".hidden", "keep"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "video.mp4").write_bytes(b"x" * 100)
+        (tmp_path / "keep" / "tiny.mp4").write_bytes(b"x")
+
+        walker = ParallelVideoWalker(
+            exclude_dirs={"node_modules"}, skip_hidden_dirs=True, min_size=50
+        )
+        videos = list(walker.walk([tmp_path]))
+
+        assert [v.path for v in videos] == [tmp_path / "keep" / "video.mp4"]
+        assert walker.stats.skipped_dirs == 2
+
+    def test_missing_root_counted(self, tmp_path: Path) -> None:
+        """Test a missing root is counted as an error and skipped."""
+        walker = ParallelVideoWalker()
+
+        assert list(walker.walk([tmp_path / "missing"])) == []
+        assert walker.stats.os_errors == 1
+
+
 class TestGenerateOutputPath:
     """Tests for generate_output_path function."""
 
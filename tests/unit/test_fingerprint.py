@@ -0,0 +1,227 @@
+"""Unit tests for fingerprint module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from video_converter.core.fingerprint import (
+    SAMPLE_COUNT,
+    SAMPLE_SIZE,
+    Fingerprinter,
+    full_hash,
+    legacy_hash,
+    sample_hash,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def fingerprinter(tmp_path: Path) -> Generator[Fingerprinter, None, None]:
+    """Provide a fingerprinter with an index in a temporary directory."""
+    instance = Fingerprinter(tmp_path / "index" / "fingerprints.db")
+    yield instance
+    instance.close()
+
+
+def _camera_file(path: Path, middle: bytes) -> Path:
+    """Write a file with a fixed header and trailer around a middle section."""
+    header = b"H" * (2 * 1024 * 1024)
+    trailer = b"T" * (2 * 1024 * 1024)
+    body = middle * (4 * 1024 * 1024 // len(middle))
+    path.write_bytes(header + body + trailer)
+    return path
+
+
+class TestSampleHash:
+    """Tests for the sampled fingerprint."""
+
+    def test_same_content_same_hash(self, tmp_path: Path) -> None:
+        """Test identical files get the same fingerprint."""
+        first = _camera_file(tmp_path / "a.mov", b"1")
+        second = _camera_file(tmp_path / "b.mov", b"1")
+
+        assert sample_hash(first) == sample_hash(second)
+
+    def test_shared_header_and_trailer(self, tmp_path: Path) -> None:
+        """Test files differing only in the middle get different fingerprints."""
+        first = _camera_file(tmp_path / "a.mov", b"1")
+        second = _camera_file(tmp_path / "b.mov", b"2")
+
+        assert sample_hash(first) != sample_hash(second)
+
+    def test_size_is_included(self, tmp_path: Path) -> None:
+        """Test files with the same samples but different sizes differ."""
+        first = tmp_path / "a.bin"
+        second = tmp_path / "b.bin"
+        first.write_bytes(b"\0" * 100)
+        second.write_bytes(b"\0" * 101)
+
+        assert sample_hash(first) != sample_hash(second)
+
+    def test_small_file_hashed_completely(self, tmp_path: Path) -> None:
+        """Test every byte of a small file affects the fingerprint."""
+        size = SAMPLE_COUNT * SAMPLE_SIZE
+        first = tmp_path / "a.bin"
+        second = tmp_path / "b.bin"
+        first.write_bytes(b"\0" * size)
+        second.write_bytes(b"\0" * (SAMPLE_SIZE + 1) + b"\1" + b"\0" * (size - SAMPLE_SIZE - 2))
+
+        assert sample_hash(first) != sample_hash(second)
+
+
+class TestFingerprinter:
+    """Tests for the memoizing Fingerprinter."""
+
+    def test_memoized_by_inode(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test a renamed file is identified without reading it again."""
+        video = _camera_file(tmp_path / "clip.mov", b"1")
+        value = fingerprinter.fingerprint(video)
+        renamed = video.rename(tmp_path / "renamed.mov")
+
+        with patch("video_converter.core.fingerprint.sample_hash") as mock_hash:
+            assert fingerprinter.fingerprint(renamed) == value
+
+        mock_hash.assert_not_called()
+
+    def test_modified_file_rehashed(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test a changed file gets a new fingerprint."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"a" * 1000)
+        before = fingerprinter.fingerprint(video)
+
+        video.write_bytes(b"b" * 2000)
+
+        assert fingerprinter.fingerprint(video) != before
+
+    def test_persistent(self, tmp_path: Path) -> None:
+        """Test fingerprints survive reopening the index."""
+        video = _camera_file(tmp_path / "clip.mov", b"1")
+        index_path = tmp_path / "fingerprints.db"
+        first = Fingerprinter(index_path)
+        value = first.fingerprint(video)
+        first.close()
+
+        second = Fingerprinter(index_path)
+        with patch("video_converter.core.fingerprint.sample_hash") as mock_hash:
+            assert second.fingerprint(video) == value
+        mock_hash.assert_not_called()
+        second.close()
+
+    def test_full_hash_keeps_sample(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test storing a full hash does not discard the sampled one."""
+        video = _camera_file(tmp_path / "clip.mov", b"1")
+        sample = fingerprinter.fingerprint(video)
+
+        assert fingerprinter.full_hash(video) == full_hash(video)
+        assert fingerprinter.fingerprint(video) == sample
+        assert len(fingerprinter) == 1
+
+    def test_full_hashes_in_pool(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test batches are hashed and unreadable files are skipped."""
+        videos = [_camera_file(tmp_path / f"clip{i}.mov", str(i).encode()) for i in range(3)]
+        missing = tmp_path / "missing.mov"
+
+        hashes = fingerprinter.full_hashes([*videos, missing], max_workers=2)
+
+        assert set(hashes) == set(videos)
+        assert len(set(hashes.values())) == 3
+
+    def test_find_duplicates(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test identical files are grouped in input order."""
+        first = _camera_file(tmp_path / "a.mov", b"1")
+        other = _camera_file(tmp_path / "b.mov", b"2")
+        copy = _camera_file(tmp_path / "c.mov", b"1")
+        small = tmp_path / "d.mov"
+        small.write_bytes(b"x")
+
+        groups = fingerprinter.find_duplicates([first, other, small, copy, first])
+
+        assert groups == [[first, copy]]
+
+    def test_find_duplicates_confirms_with_full_hash(
+        self, fingerprinter: Fingerprinter, tmp_path: Path
+    ) -> None:
+        """Test files whose samples collide are not grouped."""
+        first = _camera_file(tmp_path / "a.mov", b"1")
+        second = _camera_file(tmp_path / "b.mov", b"2")
+
+        with patch("video_converter.core.fingerprint.sample_hash", return_value="same"):
+            assert fingerprinter.find_duplicates([first, second]) == []
+
+    def test_missing_file_raises(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test fingerprinting a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            fingerprinter.fingerprint(tmp_path / "missing.mov")
+
+    def test_unreadable_index_recreated(self, tmp_path: Path) -> None:
+        """Test a corrupted index database is replaced."""
+        index_path = tmp_path / "fingerprints.db"
+        index_path.write_bytes(b"not a database" * 100)
+
+        instance = Fingerprinter(index_path)
+
+        assert instance.available
+        instance.close()
+
+    def test_hit_refreshes_access_time(self, tmp_path: Path) -> None:
+        """Test the size cap evicts the entry used least recently."""
+        instance = Fingerprinter(tmp_path / "fingerprints.db", max_entries=2)
+        videos = []
+        for i in range(3):
+            video = tmp_path / f"clip{i}.mov"
+            video.write_bytes(str(i).encode() * 1000)
+            videos.append(video)
+
+        with patch("video_converter.core.fingerprint.time.time", side_effect=[0, 1]):
+            instance.fingerprint(videos[0])
+            instance.fingerprint(videos[1])
+        with patch("video_converter.core.fingerprint.time.time", return_value=10**6):
+            instance.fingerprint(videos[0])
+        with patch("video_converter.core.fingerprint.time.time", return_value=10**6 + 1):
+            instance.fingerprint(videos[2])
+        instance.prune()
+
+        with patch("video_converter.core.fingerprint.sample_hash", return_value="x") as mock_hash:
+            instance.fingerprint(videos[0])
+            instance.fingerprint(videos[1])
+        assert mock_hash.call_count == 1
+        assert mock_hash.call_args.args[0] == videos[1]
+        instance.close()
+
+    def test_legacy_hash_memoized(self, fingerprinter: Fingerprinter, tmp_path: Path) -> None:
+        """Test the legacy hash is read once and kept next to the sample."""
+        video = _camera_file(tmp_path / "clip.mov", b"1")
+        value = fingerprinter.legacy_hash(video)
+
+        with patch("video_converter.core.fingerprint.legacy_hash") as mock_hash:
+            assert fingerprinter.legacy_hash(video) == value
+        mock_hash.assert_not_called()
+        assert value == legacy_hash(video)
+        assert len(fingerprinter) == 1
+
+    def test_version_1_index_upgraded(self, tmp_path: Path) -> None:
+        """Test an index without the legacy column keeps its fingerprints."""
+        import sqlite3
+
+        index_path = tmp_path / "fingerprints.db"
+        conn = sqlite3.connect(index_path)
+        conn.execute(
+            "CREATE TABLE fingerprints (stat_key TEXT PRIMARY KEY, sample TEXT, full TEXT, "
+            "accessed_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO fingerprints VALUES ('key', 'sample', NULL, 0)")
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+        conn.close()
+
+        instance = Fingerprinter(index_path)
+
+        assert instance._lookup("key", "sample") == "sample"
+        assert instance._lookup("key", "legacy") is None
+        instance.close()
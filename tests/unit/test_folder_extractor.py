@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -542,6 +543,43 @@ class TestFolderExtractor:
         assert info.width == 1920
         assert info.height == 1080
 
+    @requires_full_deps
+    def test_get_video_info_uses_probe_index(self, tmp_path: Path) -> None:
+        """Test unchanged files are answered from the probe index."""
+        from video_converter.processors.codec_detector import CodecInfo
+        from video_converter.processors.probe_index import ProbeIndex
+
+        video_file = tmp_path / "test.mp4"
+        video_file.write_bytes(b"x" * 1000)
+
+        mock_detector = MagicMock()
+        mock_detector.analyze.return_value = CodecInfo(
+            path=video_file,
+            codec="h264",
+            width=1920,
+            height=1080,
+            fps=30.0,
+            duration=60.0,
+            bitrate=5000000,
+            size=1000,
+            audio_codec=None,
+            container="mp4",
+        )
+
+        probe_index = ProbeIndex(tmp_path / "index.db")
+        try:
+            extractor = FolderExtractor(tmp_path, probe_index=probe_index)
+            extractor._codec_detector = mock_detector
+
+            first = extractor.get_video_info(video_file)
+            second = extractor.get_video_info(video_file)
+        finally:
+            probe_index.close()
+
+        assert mock_detector.analyze.call_count == 1
+        assert first.codec == second.codec == "h264"
+        assert second.codec_info is not None
+
     def test_get_video_info_nonexistent_file(self, tmp_path: Path) -> None:
         """Test get_video_info raises for non-existent file."""
         extractor = FolderExtractor(tmp_path)
@@ -781,6 +819,151 @@ class TestFolderExtractor:
             mock_class.assert_called_once()
 
 
+def _codec_info_for(path: Path) -> MagicMock:
+    """Build mock codec info whose codec is taken from the filename prefix."""
+    info = MagicMock()
+    info.codec = path.name.split("_")[0]
+    info.duration = 60.0
+    info.width = 1920
+    info.height = 1080
+    info.fps = 30.0
+    info.bitrate = 5000000
+    info.container = "mp4"
+    return info
+
+
+@requires_full_deps
+class TestFolderExtractorConcurrentDiscovery:
+    """Tests for parallel and async discovery in FolderExtractor."""
+
+    def _make_files(self, tmp_path: Path) -> None:
+        for i in range(4):
+            (tmp_path / f"h264_{i}.mp4").write_bytes(b"x" * 10)
+        for i in range(2):
+            (tmp_path / f"hevc_{i}.mp4").write_bytes(b"x" * 10)
+
+    def test_candidates_threaded_keep_scan_order(self, tmp_path: Path) -> None:
+        """Test threaded discovery returns candidates in scan order."""
+        self._make_files(tmp_path)
+        mock_detector = MagicMock()
+        mock_detector.analyze.side_effect = _codec_info_for
+
+        extractor = FolderExtractor(tmp_path, max_probe_workers=3)
+        extractor._codec_detector = mock_detector
+
+        candidates = extractor.get_conversion_candidates()
+        expected = [p for p in extractor.scan() if p.name.startswith("h264")]
+
+        assert [c.path for c in candidates] == expected
+
+    def test_candidates_threaded_respect_limit(self, tmp_path: Path) -> None:
+        """Test threaded discovery stops at the limit."""
+        self._make_files(tmp_path)
+        mock_detector = MagicMock()
+        mock_detector.analyze.side_effect = _codec_info_for
+
+        extractor = FolderExtractor(tmp_path, max_probe_workers=2)
+        extractor._codec_detector = mock_detector
+
+        assert len(extractor.get_conversion_candidates(limit=2)) == 2
+
+    def test_stats_threaded(self, tmp_path: Path) -> None:
+        """Test threaded statistics count every file."""
+        self._make_files(tmp_path)
+        mock_detector = MagicMock()
+        mock_detector.analyze.side_effect = _codec_info_for
+
+        extractor = FolderExtractor(tmp_path, max_probe_workers=4)
+        extractor._codec_detector = mock_detector
+
+        stats = extractor.get_stats()
+        assert stats.total == 6
+        assert stats.h264 == 4
+        assert stats.hevc == 2
+
+    @pytest.mark.asyncio
+    async def test_candidates_async_bounded_concurrency(self, tmp_path: Path) -> None:
+        """Test async discovery never exceeds the concurrency limit."""
+        self._make_files(tmp_path)
+        active = 0
+        peak = 0
+
+        async def analyze_async(path: Path) -> MagicMock:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _codec_info_for(path)
+
+        mock_detector = MagicMock()
+        mock_detector.analyze_async = AsyncMock(side_effect=analyze_async)
+
+        extractor = FolderExtractor(tmp_path)
+        extractor._codec_detector = mock_detector
+
+        candidates = [
+            video async for video in extractor.get_conversion_candidates_async(concurrency=2)
+        ]
+
+        assert len(candidates) == 4
+        assert all(c.is_h264 for c in candidates)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_candidates_async_completion_order(self, tmp_path: Path) -> None:
+        """Test async discovery yields fast files before slow ones."""
+        (tmp_path / "h264_slow.mp4").write_bytes(b"x")
+        (tmp_path / "h264_fast.mp4").write_bytes(b"x")
+
+        async def analyze_async(path: Path) -> MagicMock:
+            await asyncio.sleep(0.05 if "slow" in path.name else 0.0)
+            return _codec_info_for(path)
+
+        mock_detector = MagicMock()
+        mock_detector.analyze_async = AsyncMock(side_effect=analyze_async)
+
+        extractor = FolderExtractor(tmp_path)
+        extractor._codec_detector = mock_detector
+
+        names = [v.filename async for v in extractor.iter_video_info_async(concurrency=2)]
+        assert names == ["h264_fast.mp4", "h264_slow.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_candidates_async_respect_limit(self, tmp_path: Path) -> None:
+        """Test async discovery stops once the limit is reached."""
+        self._make_files(tmp_path)
+        mock_detector = MagicMock()
+        mock_detector.analyze_async = AsyncMock(side_effect=_codec_info_for)
+
+        extractor = FolderExtractor(tmp_path)
+        extractor._codec_detector = mock_detector
+
+        candidates = [
+            video
+            async for video in extractor.get_conversion_candidates_async(
+                limit=1, concurrency=2
+            )
+        ]
+        assert len(candidates) == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_async(self, tmp_path: Path) -> None:
+        """Test async statistics count every file."""
+        self._make_files(tmp_path)
+        mock_detector = MagicMock()
+        mock_detector.analyze_async = AsyncMock(side_effect=_codec_info_for)
+
+        extractor = FolderExtractor(tmp_path)
+        extractor._codec_detector = mock_detector
+
+        stats = await extractor.get_stats_async(concurrency=3)
+        assert stats.total == 6
+        assert stats.h264 == 4
+        assert stats.hevc == 2
+        assert stats.errors == 0
+
+
 class TestFolderExtractorEdgeCases:
     """Edge case tests for FolderExtractor."""
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +16,8 @@ from video_converter.core.history import (
     ConversionRecord,
     HistoryCorruptedError,
     HistoryStatistics,
+    SQLiteHistory,
+    StatsPeriod,
     get_history,
     reset_history,
 )
@@ -747,6 +751,346 @@ class TestConversionHistory:
 
             assert len(file_hash) == 16
 
+    def test_is_file_converted_after_rename(self, tmp_path: Path) -> None:
+        """Test a converted file is recognized after it was renamed."""
+        history = ConversionHistory(tmp_path / "history.json")
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        history.add_record(
+            _record(ConversionHistory.compute_file_hash(video), source_path=str(video))
+        )
+
+        renamed = video.rename(tmp_path / "renamed.mov")
+
+        assert history.is_file_converted(renamed) is True
+
+    def test_legacy_record_rekeyed(self, tmp_path: Path) -> None:
+        """Test a record keyed by the legacy hash is found and re-keyed."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        legacy_hash = ConversionHistory.compute_legacy_file_hash(video)
+        history = _legacy_json_history(tmp_path, _record(legacy_hash, source_path=str(video)))
+
+        assert history.is_file_converted(video) is True
+        assert history.get_record(legacy_hash) is None
+        assert history.is_converted(ConversionHistory.compute_file_hash(video)) is True
+        reloaded = ConversionHistory(tmp_path / "history.json")
+        assert reloaded.count() == 1
+        assert reloaded._has_legacy_records() is False
+
+    def test_failed_legacy_record_not_converted(self, tmp_path: Path) -> None:
+        """Test a failed legacy record does not mark the file converted."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        legacy_hash = ConversionHistory.compute_legacy_file_hash(video)
+        history = _legacy_json_history(tmp_path, _record(legacy_hash, success=False))
+
+        assert history.is_file_converted(video) is False
+        assert history.get_record(legacy_hash) is not None
+
+    def test_no_legacy_lookup_without_legacy_records(self, tmp_path: Path) -> None:
+        """Test a miss does not hash the file the legacy way in a new history."""
+        history = ConversionHistory(tmp_path / "history.json")
+        history.add_record(_record("0123456789abcdef"))
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+
+        with patch.object(ConversionHistory, "compute_legacy_file_hash") as mock_hash:
+            assert history.is_file_converted(video) is False
+
+        mock_hash.assert_not_called()
+
+
+def _legacy_json_history(tmp_path: Path, record: ConversionRecord) -> ConversionHistory:
+    """Write a history file in the format of earlier versions and open it."""
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"version": "0.1.0.0", "records": {record.id: record.to_dict()}}))
+    return ConversionHistory(path)
+
+
+def _record(
+    identifier: str,
+    *,
+    success: bool = True,
+    converted_at: str = "2025-01-01T10:00:00",
+    source_path: str | None = None,
+) -> ConversionRecord:
+    """Create a conversion record for tests."""
+    return ConversionRecord(
+        id=identifier,
+        source_path=source_path or f"/videos/{identifier}.mov",
+        output_path=f"/videos/{identifier}_h265.mp4" if success else None,
+        source_codec="h264",
+        output_codec="hevc",
+        source_size=1000000,
+        output_size=400000 if success else None,
+        converted_at=converted_at,
+        success=success,
+        error_message=None if success else "encode failed",
+    )
+
+
+class TestSQLiteHistory:
+    """Tests for the SQLite history store."""
+
+    def test_add_and_get_record(self, tmp_path: Path) -> None:
+        """Test records round-trip through the database."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        record = _record("abc")
+
+        history.add_record(record)
+
+        assert history.get_record("abc") == record
+        assert history.is_converted("abc") is True
+        assert history.is_converted("missing") is False
+        assert history.count() == 1
+        history.close()
+
+    def test_failed_record_not_converted(self, tmp_path: Path) -> None:
+        """Test failed records are stored but not treated as converted."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("bad", success=False))
+
+        assert history.is_converted("bad") is False
+        assert history.get_failed_records()[0].error_message == "encode failed"
+        assert history.get_successful_records() == []
+        history.close()
+
+    def test_add_record_replaces_existing(self, tmp_path: Path) -> None:
+        """Test a new record for an identifier replaces the old one."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("abc", success=False))
+        history.add_record(_record("abc"))
+
+        assert history.count() == 1
+        assert history.is_converted("abc") is True
+        history.close()
+
+    def test_remove_and_clear(self, tmp_path: Path) -> None:
+        """Test records can be removed individually and all at once."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("a"))
+        history.add_record(_record("b"))
+
+        assert history.remove_record("a") is True
+        assert history.remove_record("a") is False
+        history.clear()
+
+        assert history.count() == 0
+        history.close()
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test writes from one connection are seen by another."""
+        db_path = tmp_path / "history.db"
+        first = SQLiteHistory(db_path)
+        second = SQLiteHistory(db_path)
+
+        first.add_record(_record("a"))
+        second.add_record(_record("b"))
+
+        assert {r.id for r in first.get_all_records()} == {"a", "b"}
+        assert second.is_converted("a") is True
+        first.close()
+        second.close()
+
+    def test_records_for_path(self, tmp_path: Path) -> None:
+        """Test records are looked up by source path."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("a", source_path="/videos/clip.mov"))
+        history.add_record(_record("b"))
+
+        records = history.get_records_for_path(Path("/videos/clip.mov"))
+
+        assert [r.id for r in records] == ["a"]
+        history.close()
+
+    def test_statistics_match_json_store(self, tmp_path: Path) -> None:
+        """Test SQL statistics agree with the JSON store."""
+        sqlite_history = SQLiteHistory(tmp_path / "history.db")
+        json_history = ConversionHistory(tmp_path / "history.json")
+        records = [
+            _record(f"ok{i}", converted_at=f"2025-01-{i + 1:02d}T10:00:00") for i in range(3)
+        ]
+        records.append(_record("bad", success=False, converted_at="2025-01-04T10:00:00"))
+        for record in records:
+            sqlite_history.add_record(record)
+            json_history.add_record(record)
+
+        assert sqlite_history.get_statistics() == json_history.get_statistics()
+        stats = sqlite_history.get_statistics()
+        assert stats.total_converted == 3
+        assert stats.total_failed == 1
+        assert stats.total_saved_bytes == 1800000
+        assert stats.first_conversion == "2025-01-01T10:00:00"
+        assert stats.last_conversion == "2025-01-03T10:00:00"
+        sqlite_history.close()
+
+    def test_records_by_period(self, tmp_path: Path) -> None:
+        """Test period queries only return records in the period."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("old", converted_at="2000-01-01T10:00:00"))
+        history.add_record(_record("new", converted_at=datetime.now().isoformat()))
+
+        assert [r.id for r in history.get_records_by_period(StatsPeriod.TODAY)] == ["new"]
+        assert len(history.get_records_by_period(StatsPeriod.ALL)) == 2
+        assert history.get_statistics(StatsPeriod.TODAY).total_converted == 1
+        history.close()
+
+    def test_migrates_json_history_once(self, tmp_path: Path) -> None:
+        """Test JSON history is imported on first open and then renamed."""
+        json_path = tmp_path / "history.json"
+        json_history = ConversionHistory(json_path)
+        json_history.add_record(_record("a"))
+        json_history.add_record(_record("b", success=False))
+
+        history = SQLiteHistory(tmp_path / "history.db")
+
+        assert history.count() == 2
+        assert history.get_record("a") == _record("a")
+        assert not json_path.exists()
+        assert (tmp_path / "history.json.migrated").exists()
+        history.close()
+
+        # A restored JSON file is not imported again
+        ConversionHistory(json_path).add_record(_record("c"))
+        history = SQLiteHistory(tmp_path / "history.db")
+        assert history.count() == 2
+        history.close()
+
+    def test_corrupted_json_not_imported(self, tmp_path: Path) -> None:
+        """Test an unreadable JSON file is left in place."""
+        json_path = tmp_path / "history.json"
+        json_path.write_text("not valid json")
+
+        history = SQLiteHistory(tmp_path / "history.db")
+
+        assert history.count() == 0
+        assert json_path.exists()
+        history.close()
+
+    def test_corrupted_database_raises(self, tmp_path: Path) -> None:
+        """Test an unreadable database raises HistoryCorruptedError."""
+        db_path = tmp_path / "history.db"
+        db_path.write_bytes(b"not a database" * 100)
+
+        with pytest.raises(HistoryCorruptedError):
+            SQLiteHistory(db_path)
+
+    def test_rollups_follow_replace_and_remove(self, tmp_path: Path) -> None:
+        """Test rollup statistics stay equal to a scan of the records."""
+        sqlite_history = SQLiteHistory(tmp_path / "history.db")
+        json_history = ConversionHistory(tmp_path / "history.json")
+        changes = [
+            _record("a", converted_at="2025-01-01T08:00:00"),
+            _record("b", converted_at="2025-01-01T20:00:00"),
+            _record("c", success=False, converted_at="2025-01-02T10:00:00"),
+            _record("a", converted_at="2025-01-03T10:00:00"),
+            _record("c", converted_at="2025-01-02T11:00:00"),
+        ]
+        for record in changes:
+            sqlite_history.add_record(record)
+            json_history.add_record(record)
+        sqlite_history.remove_record("b")
+        json_history.remove_record("b")
+
+        assert sqlite_history.get_statistics() == json_history.get_statistics()
+        assert sqlite_history.get_daily_statistics() == json_history.get_daily_statistics()
+        assert list(sqlite_history.get_daily_statistics()) == ["2025-01-02", "2025-01-03"]
+        sqlite_history.close()
+
+    def test_codec_statistics(self, tmp_path: Path) -> None:
+        """Test statistics are grouped by output codec."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("a"))
+        history.add_record(dataclasses.replace(_record("b"), output_codec="av1"))
+        history.add_record(_record("c", success=False))
+
+        by_codec = history.get_codec_statistics()
+
+        assert by_codec["hevc"].total_converted == 1
+        assert by_codec["hevc"].total_failed == 1
+        assert by_codec["av1"].total_saved_bytes == 600000
+        history.close()
+
+    def test_rollups_built_for_existing_database(self, tmp_path: Path) -> None:
+        """Test a version 1 database gets rollups for its records."""
+        db_path = tmp_path / "history.db"
+        history = SQLiteHistory(db_path)
+        history.add_record(_record("a"))
+        history.add_record(_record("b", success=False))
+        history._conn.execute("DELETE FROM daily_stats")
+        history._conn.execute("PRAGMA user_version=1")
+        history.close()
+
+        history = SQLiteHistory(db_path)
+
+        stats = history.get_statistics()
+        assert stats.total_converted == 1
+        assert stats.total_failed == 1
+        history.close()
+
+    def test_clear_resets_statistics(self, tmp_path: Path) -> None:
+        """Test clearing history also clears the rollups."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("a"))
+
+        history.clear()
+
+        assert history.get_statistics().total_converted == 0
+        assert history.get_daily_statistics() == {}
+        history.close()
+
+    def test_imported_legacy_record_rekeyed(self, tmp_path: Path) -> None:
+        """Test an imported legacy record is re-keyed in place."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        legacy_hash = ConversionHistory.compute_legacy_file_hash(video)
+        _legacy_json_history(tmp_path, _record(legacy_hash, source_path=str(video)))
+        history = SQLiteHistory(tmp_path / "history.db")
+        assert history._has_legacy_records() is True
+
+        assert history.is_file_converted(video) is True
+
+        assert history.get_record(legacy_hash) is None
+        assert history.is_converted(ConversionHistory.compute_file_hash(video)) is True
+        assert history.get_statistics().total_converted == 1
+        assert history._has_legacy_records() is False
+        history.close()
+
+    def test_iter_records_in_batches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test iteration returns every record across batch boundaries."""
+        monkeypatch.setattr("video_converter.core.history._ITER_BATCH_SIZE", 2)
+        history = SQLiteHistory(tmp_path / "history.db")
+        for i in range(5):
+            history.add_record(_record(f"r{i}", converted_at="2025-01-01T10:00:00"))
+
+        assert [r.id for r in history.iter_records()] == [f"r{i}" for i in range(5)]
+        history.close()
+
+    def test_recent_records(self, tmp_path: Path) -> None:
+        """Test only the latest records are returned, oldest first."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        for i in range(5):
+            history.add_record(_record(f"r{i}", converted_at=f"2025-01-0{i + 1}T10:00:00"))
+
+        assert [r.id for r in history.get_recent_records(limit=2)] == ["r3", "r4"]
+        history.close()
+
+    def test_export_to_json(self, tmp_path: Path) -> None:
+        """Test exports read records from the database."""
+        history = SQLiteHistory(tmp_path / "history.db")
+        history.add_record(_record("a"))
+        export_path = tmp_path / "export.json"
+
+        history.export_to_json(export_path)
+
+        data = json.loads(export_path.read_text())
+        assert [r["id"] for r in data["records"]] == ["a"]
+        assert data["statistics"]["total_converted"] == 1
+        history.close()
+
 
 class TestModuleLevelFunctions:
     """Tests for module-level convenience functions."""
@@ -779,3 +1123,13 @@ class TestModuleLevelFunctions:
             assert history1 is not history2
 
             reset_history()
+
+    def test_get_history_uses_sqlite_by_default(self, tmp_path: Path) -> None:
+        """Test the default store is SQLite and .json selects the JSON store."""
+        reset_history()
+        assert isinstance(get_history(tmp_path / "history.db"), SQLiteHistory)
+        reset_history()
+
+        history = get_history(tmp_path / "legacy.json")
+        assert type(history) is ConversionHistory
+        reset_history()
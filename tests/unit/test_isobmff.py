@@ -0,0 +1,276 @@
+"""Unit tests for isobmff module."""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from video_converter.utils.isobmff import (
+    BoxParseError,
+    SampleTable,
+    find_box,
+    iter_boxes,
+    make_box,
+    read_movie,
+)
+
+# 2024-01-15 10:30:00 UTC in seconds since 1904
+CREATED = 3788159400
+
+
+def _full_box(kind: str, payload: bytes, version: int = 0) -> bytes:
+    """Encode a box with a version/flags field."""
+    return make_box(kind, bytes([version, 0, 0, 0]) + payload)
+
+
+def _video_entry(codec: str, width: int, height: int, children: bytes = b"") -> bytes:
+    """Encode a visual sample entry."""
+    fields = (
+        b"\0" * 6
+        + struct.pack(">H", 1)
+        + b"\0" * 16
+        + struct.pack(">HHII", width, height, 0x480000, 0x480000)
+        + b"\0" * 4
+        + struct.pack(">H", 1)
+        + b"\0" * 32
+        + struct.pack(">Hh", 24, -1)
+    )
+    return make_box(codec, fields + children)
+
+
+def _audio_entry(codec: str, children: bytes = b"", version: int = 0) -> bytes:
+    """Encode an audio sample entry."""
+    fields = (
+        b"\0" * 6
+        + struct.pack(">HH", 1, version)
+        + b"\0" * 6
+        + struct.pack(">HHHHI", 2, 16, 0, 0, 48000 << 16)
+        + b"\0" * {0: 0, 1: 16, 2: 36}[version]
+    )
+    return make_box(codec, fields + children)
+
+
+def _trak(
+    track_id: int,
+    handler: str,
+    entry: bytes,
+    *,
+    timescale: int = 600,
+    duration: int = 1200,
+    sizes: list[int] | None = None,
+    sample_size: int = 0,
+    sample_count: int | None = None,
+    version: int = 0,
+) -> bytes:
+    """Encode a track with a single sample description."""
+    sizes = sizes if sizes is not None else [100] * 60
+    if version == 1:
+        tkhd = _full_box("tkhd", struct.pack(">QQIIQ", 0, 0, track_id, 0, duration) + b"\0" * 60, 1)
+        mdhd = _full_box("mdhd", struct.pack(">QQIQ", 0, 0, timescale, duration) + b"\0" * 4, 1)
+    else:
+        tkhd = _full_box("tkhd", struct.pack(">IIIII", 0, 0, track_id, 0, duration) + b"\0" * 60)
+        mdhd = _full_box("mdhd", struct.pack(">IIII", 0, 0, timescale, duration) + b"\0" * 4)
+    hdlr = _full_box("hdlr", b"\0" * 4 + handler.encode() + b"\0" * 13)
+    stsd = _full_box("stsd", struct.pack(">I", 1) + entry)
+    stts = _full_box(
+        "stts", struct.pack(">III", 2, max(len(sizes) - 1, 0), 20) + struct.pack(">II", 1, 30)
+    )
+    stss = _full_box("stss", struct.pack(">III", 2, 1, 31))
+    stsz = _full_box(
+        "stsz",
+        struct.pack(">II", sample_size, len(sizes) if sample_count is None else sample_count)
+        + b"".join(struct.pack(">I", s) for s in sizes),
+    )
+    stbl = make_box("stbl", stsd + stts + stsz + stss)
+    return make_box("trak", tkhd + make_box("mdia", mdhd + hdlr + make_box("minf", stbl)))
+
+
+def _write_mp4(path: Path, traks: bytes, *, faststart: bool = True, extra: bytes = b"") -> Path:
+    """Write an MP4 file with the given tracks."""
+    ftyp = make_box("ftyp", b"isom\0\0\x02\0isomiso2mp41")
+    mvhd = _full_box("mvhd", struct.pack(">IIII", CREATED, CREATED, 600, 1200) + b"\0" * 80)
+    moov = make_box("moov", mvhd + traks + extra)
+    mdat = make_box("mdat", b"\0" * 6000)
+    path.write_bytes(ftyp + moov + mdat if faststart else ftyp + mdat + moov)
+    return path
+
+
+class TestBoxIteration:
+    """Tests for the generic box helpers."""
+
+    def test_iter_and_find(self) -> None:
+        """Test nested boxes are found by path."""
+        data = make_box("moov", make_box("trak", make_box("mdia", b"abc")))
+
+        boxes = list(iter_boxes(data))
+        mdia = find_box(data, "moov/trak/mdia")
+
+        assert [box.type for box in boxes] == ["moov"]
+        assert mdia is not None
+        assert data[mdia.payload_offset : mdia.end] == b"abc"
+
+    def test_oversized_box_rejected(self) -> None:
+        """Test a box claiming more bytes than available raises."""
+        with pytest.raises(BoxParseError):
+            list(iter_boxes(b"fake video content"))
+
+
+class TestReadMovie:
+    """Tests for read_movie function."""
+
+    def test_reads_tracks(self, tmp_path: Path) -> None:
+        """Test movie and track headers are decoded."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(1, "vide", _video_entry("avc1", 1920, 1080, make_box("avcC", b"\x01\x64")))
+            + _trak(
+                2,
+                "soun",
+                _audio_entry("mp4a", make_box("esds", b"\0" * 8)),
+                timescale=48000,
+                duration=96000,
+                sizes=[],
+            ),
+        )
+
+        movie = read_movie(video)
+
+        assert movie.major_brand == "isom"
+        assert movie.creation_time == CREATED
+        assert movie.duration_seconds == pytest.approx(2.0)
+        assert movie.fragmented is False
+        video_track = movie.first_track("vide")
+        assert video_track is not None
+        assert video_track.track_id == 1
+        assert video_track.codec == "avc1"
+        assert (video_track.width, video_track.height) == (1920, 1080)
+        assert video_track.sample_count == 60
+        assert video_track.sample_bytes == 6000
+        assert video_track.codec_boxes["avcC"] == b"\x01\x64"
+        audio_track = movie.first_track("soun")
+        assert audio_track is not None
+        assert audio_track.duration_seconds == pytest.approx(2.0)
+        assert "esds" in audio_track.codec_boxes
+
+    def test_trailing_moov(self, tmp_path: Path) -> None:
+        """Test a movie header after the media data is found."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(1, "vide", _video_entry("hvc1", 3840, 2160)),
+            faststart=False,
+        )
+
+        movie = read_movie(video)
+
+        assert movie.tracks[0].codec == "hvc1"
+
+    def test_version_1_headers(self, tmp_path: Path) -> None:
+        """Test 64-bit media headers are decoded."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(7, "vide", _video_entry("avc1", 640, 480), duration=3000, version=1),
+        )
+
+        track = read_movie(video).tracks[0]
+
+        assert track.track_id == 7
+        assert track.duration == 3000
+
+    def test_constant_sample_size(self, tmp_path: Path) -> None:
+        """Test a constant sample size is multiplied by the sample count."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(
+                1,
+                "vide",
+                _video_entry("avc1", 640, 480),
+                sizes=[],
+                sample_size=500,
+                sample_count=30,
+            ),
+        )
+
+        track = read_movie(video).tracks[0]
+
+        assert track.sample_count == 30
+        assert track.sample_bytes == 15000
+
+    def test_quicktime_sound_v1_children(self, tmp_path: Path) -> None:
+        """Test esds nested in a wave box of a version 1 sound entry is found."""
+        wave = make_box("wave", make_box("frma", b"mp4a") + make_box("esds", b"\0" * 8))
+        video = _write_mp4(
+            tmp_path / "clip.mov",
+            _trak(1, "soun", _audio_entry("mp4a", wave, version=1)),
+        )
+
+        track = read_movie(video).tracks[0]
+
+        assert track.codec_boxes["esds"] == b"\0" * 8
+
+    def test_fragmented(self, tmp_path: Path) -> None:
+        """Test movie extends boxes mark the movie fragmented."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(1, "vide", _video_entry("avc1", 640, 480)),
+            extra=make_box("mvex", b""),
+        )
+
+        assert read_movie(video).fragmented is True
+
+    def test_not_isobmff(self, tmp_path: Path) -> None:
+        """Test other files raise BoxParseError."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"\x1a\x45\xdf\xa3" + b"\0" * 64)
+
+        with pytest.raises(BoxParseError):
+            read_movie(video)
+
+    def test_missing_moov(self, tmp_path: Path) -> None:
+        """Test a file without a movie header raises BoxParseError."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(make_box("ftyp", b"isom\0\0\0\0") + make_box("mdat", b"\0" * 16))
+
+        with pytest.raises(BoxParseError):
+            read_movie(video)
+
+    def test_truncated_sample_table(self, tmp_path: Path) -> None:
+        """Test a sample size table shorter than its count raises."""
+        video = _write_mp4(
+            tmp_path / "clip.mp4",
+            _trak(1, "vide", _video_entry("avc1", 640, 480), sample_count=1000),
+        )
+
+        with pytest.raises(BoxParseError):
+            read_movie(video)
+
+
+class TestSampleTables:
+    """Tests for reading stts and stss tables."""
+
+    def test_tables_read_on_request(self, tmp_path: Path) -> None:
+        """Test sample durations and sync samples are decoded when requested."""
+        video = _write_mp4(tmp_path / "clip.mp4", _trak(1, "vide", _video_entry("avc1", 640, 480)))
+
+        assert read_movie(video).tracks[0].samples is None
+
+        samples = read_movie(video, sample_tables=True).tracks[0].samples
+
+        assert samples == SampleTable(sample_count=60, duration=59 * 20 + 30, sync_samples=[1, 31])
+
+    @pytest.mark.parametrize(
+        ("sync_samples", "expected"),
+        [
+            (None, 1),
+            ([], 60),
+            ([1, 31], 30),
+            ([1, 11], 50),
+            ([21], 40),
+        ],
+    )
+    def test_max_sync_interval(self, sync_samples: list[int] | None, expected: int) -> None:
+        """Test the longest keyframe interval includes leading and trailing runs."""
+        table = SampleTable(sample_count=60, duration=600, sync_samples=sync_samples)
+
+        assert table.max_sync_interval == expected
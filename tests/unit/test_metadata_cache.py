@@ -0,0 +1,101 @@
+"""Unit tests for metadata_cache module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from video_converter.utils.metadata_cache import MetadataCache, get_metadata_cache
+
+
+class TestMetadataCache:
+    """Tests for MetadataCache class."""
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        """Test a stored snapshot is returned for the same file."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+
+        assert cache.get(video) is None
+        cache.put(video, {"QuickTime:Make": "Apple"})
+
+        assert cache.get(video) == {"QuickTime:Make": "Apple"}
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_modified_file_misses(self, tmp_path: Path) -> None:
+        """Test a changed file is not served from the cache."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+        cache.put(video, {"QuickTime:Make": "Apple"})
+
+        video.write_bytes(b"abcdef")
+        assert cache.get(video) is None
+
+    def test_binary_variant_separate(self, tmp_path: Path) -> None:
+        """Test a snapshot without binary data does not serve binary requests."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+        cache.put(video, {"QuickTime:Make": "Apple"})
+
+        assert cache.get(video, include_binary=True) is None
+
+    def test_returns_copies(self, tmp_path: Path) -> None:
+        """Test mutating a returned snapshot does not change the cache."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+        cache.put(video, {"Keys:Keywords": ["a"]})
+
+        cache.get(video)["Keys:Keywords"].append("b")  # type: ignore[index]
+
+        assert cache.get(video) == {"Keys:Keywords": ["a"]}
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test the least recently used file is evicted first."""
+        videos = []
+        for name in ("a", "b", "c"):
+            video = tmp_path / f"{name}.mp4"
+            video.write_bytes(name.encode())
+            videos.append(video)
+        cache = MetadataCache(max_entries=2)
+
+        cache.put(videos[0], {})
+        cache.put(videos[1], {})
+        cache.get(videos[0])
+        cache.put(videos[2], {})
+
+        assert len(cache) == 2
+        assert cache.get(videos[1]) is None
+        assert cache.get(videos[0]) == {}
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test invalidating a path drops its snapshot."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+        cache.put(video, {})
+
+        cache.invalidate(video)
+
+        assert cache.get(video) is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clear drops entries and statistics."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = MetadataCache()
+        cache.put(video, {})
+        cache.get(video)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+    def test_default_cache_is_shared(self) -> None:
+        """Test the process-wide cache is a single instance."""
+        assert get_metadata_cache() is get_metadata_cache()
@@ -19,6 +19,7 @@ from video_converter.utils.command_runner import (
     CommandNotFoundError,
     CommandResult,
     CommandRunner,
+    ExifToolPool,
 )
 
 
@@ -168,6 +169,136 @@ class TestMetadataProcessor:
         assert result["QuickTime:CreateDate"] == "2024:01:15 10:30:00"
         assert result["Composite:GPSLatitude"] == 37.7749
 
+    def test_extract_batch_single_command(
+        self,
+        processor: MetadataProcessor,
+        mock_runner: MagicMock,
+        sample_metadata: dict,
+        tmp_path: Path,
+    ) -> None:
+        """Test many files are extracted with one ExifTool command."""
+        files = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for path in files:
+            path.touch()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0,
+            stdout=json.dumps([{**sample_metadata, "SourceFile": str(path)} for path in files]),
+            stderr="",
+        )
+
+        result = processor.extract_batch([*files, tmp_path / "missing.mp4"])
+
+        assert set(result) == set(files)
+        mock_runner.run.assert_called_once()
+        assert mock_runner.run.call_args[0][0][-2:] == [str(path) for path in files]
+
+    def test_extract_cached_until_written(
+        self,
+        processor: MetadataProcessor,
+        mock_runner: MagicMock,
+        sample_metadata: dict,
+        tmp_path: Path,
+    ) -> None:
+        """Test repeated reads are cached and writes invalidate the snapshot."""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0,
+            stdout=json.dumps([sample_metadata]),
+            stderr="",
+        )
+
+        processor.extract(video_file)
+        processor.extract_gps(video_file)
+        assert mock_runner.run.call_count == 1
+
+        processor.set_tag(video_file, "Make", "Sony")
+        processor.extract(video_file)
+        assert mock_runner.run.call_count == 3
+
+    def test_extract_without_cache(
+        self,
+        mock_runner: MagicMock,
+        sample_metadata: dict,
+        tmp_path: Path,
+    ) -> None:
+        """Test caching can be disabled."""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0,
+            stdout=json.dumps([sample_metadata]),
+            stderr="",
+        )
+        processor = MetadataProcessor(mock_runner, use_cache=False)
+
+        processor.extract(video_file)
+        processor.extract(video_file)
+
+        assert processor.cache is None
+        assert mock_runner.run.call_count == 2
+
+    def test_prefetch_serves_later_reads(
+        self,
+        processor: MetadataProcessor,
+        mock_runner: MagicMock,
+        sample_metadata: dict,
+        tmp_path: Path,
+    ) -> None:
+        """Test prefetched snapshots are reused by extract and extract_batch."""
+        files = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for path in files:
+            path.touch()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0,
+            stdout=json.dumps([{**sample_metadata, "SourceFile": str(path)} for path in files]),
+            stderr="",
+        )
+
+        assert processor.prefetch(files) == 2
+        processor.extract(files[0])
+        processor.extract_batch(files)
+
+        mock_runner.run.assert_called_once()
+
+    def test_set_tags_single_command(
+        self, processor: MetadataProcessor, mock_runner: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test several tags are written with one ExifTool command."""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        mock_runner.run.return_value = CommandResult(returncode=0, stdout="", stderr="")
+
+        assert processor.set_tags(video_file, {"Make": "Apple", "Model": "iPhone"}) is True
+
+        mock_runner.run.assert_called_once()
+        args = mock_runner.run.call_args[0][0]
+        assert "-Make=Apple" in args
+        assert "-Model=iPhone" in args
+
+    def test_batch_copy_all_one_request(self, tmp_path: Path) -> None:
+        """Test the shared pool gets all copies in a single request."""
+        pool = MagicMock(spec=ExifToolPool)
+        pool.run_many.return_value = [
+            CommandResult(returncode=0, stdout="", stderr=""),
+            CommandResult(returncode=1, stdout="", stderr="Error"),
+        ]
+        processor = MetadataProcessor(pool)
+        pairs = []
+        for name in ("a", "b"):
+            source = tmp_path / f"{name}.mov"
+            dest = tmp_path / f"{name}.mp4"
+            source.touch()
+            dest.touch()
+            pairs.append((source, dest))
+        missing = (tmp_path / "c.mov", tmp_path / "c.mp4")
+
+        results = processor.batch_copy_all([*pairs, missing])
+
+        assert results == {pairs[0][1]: True, pairs[1][1]: False, missing[1]: False}
+        pool.run_many.assert_called_once()
+        assert len(pool.run_many.call_args[0][0]) == 2
+
     def test_extract_file_not_found(self, processor: MetadataProcessor) -> None:
         """Test extract raises FileNotFoundError for missing file."""
         with pytest.raises(FileNotFoundError):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,7 @@ from video_converter.core.orchestrator import (
     ConversionTask,
     Orchestrator,
     OrchestratorConfig,
+    StageJob,
     VIDEO_EXTENSIONS,
 )
 from video_converter.core.types import (
@@ -26,6 +29,7 @@ from video_converter.core.types import (
     ConversionStatus,
     QueuePriority,
 )
+from video_converter.processors.codec_detector import CodecInfo
 from video_converter.processors.quality_validator import (
     ValidationResult,
     ValidationStrictness,
@@ -232,6 +236,40 @@ class TestOrchestratorConvertSingle:
         finally:
             input_path.unlink()
 
+    @pytest.mark.asyncio
+    async def test_convert_single_passes_codec_info(self) -> None:
+        """Test discovery codec info is forwarded to the conversion request."""
+        config = OrchestratorConfig(validate_output=False, preserve_timestamps=False)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        codec_info = CodecInfo(
+            path=Path("video.mov"),
+            codec="h264",
+            width=1920,
+            height=1080,
+            fps=30.0,
+            duration=12.5,
+            bitrate=0,
+            size=0,
+            audio_codec=None,
+            container="mov",
+        )
+
+        converter = MagicMock()
+        converter.convert = AsyncMock(
+            side_effect=lambda request, **_: ConversionResult(
+                success=True, request=request
+            )
+        )
+        orchestrator._converter = converter
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "video.mov"
+            input_path.touch()
+            await orchestrator.convert_single(input_path=input_path, codec_info=codec_info)
+
+        request = converter.convert.await_args.args[0]
+        assert request.codec_info is codec_info
+
 
 class TestOrchestratorRun:
     """Tests for run method."""
@@ -426,6 +464,96 @@ class TestQueuePriority:
             assert sorted_paths[0] == large
             assert sorted_paths[1] == small
 
+    @staticmethod
+    def _codec_info(
+        path: Path, codec: str, height: int, duration: float, bitrate: int = 20_000_000
+    ) -> CodecInfo:
+        """Create codec info for cost-based ordering tests."""
+        return CodecInfo(
+            path=path,
+            codec=codec,
+            width=height * 16 // 9,
+            height=height,
+            fps=30.0,
+            duration=duration,
+            bitrate=bitrate,
+            size=int(duration * bitrate / 8),
+            audio_codec="aac",
+            container="mov",
+        )
+
+    def _cost_orchestrator(self, priority: QueuePriority) -> Orchestrator:
+        """Create an orchestrator whose probe index knows three files."""
+        infos = {
+            Path("short_4k.mov"): self._codec_info(
+                Path("short_4k.mov"), "h264", 2160, 10.0, bitrate=50_000_000
+            ),
+            Path("long_720p.mov"): self._codec_info(Path("long_720p.mov"), "h264", 720, 60.0),
+            Path("done.mov"): self._codec_info(Path("done.mov"), "hevc", 1080, 30.0),
+        }
+        probe_index = MagicMock()
+        probe_index.get.side_effect = infos.get
+        return Orchestrator(
+            config=OrchestratorConfig(queue_priority=priority),
+            enable_session_persistence=False,
+            probe_index=probe_index,
+        )
+
+    def test_sort_by_priority_shortest_job(self) -> None:
+        """Test shortest estimated encode runs first."""
+        orchestrator = self._cost_orchestrator(QueuePriority.SHORTEST_JOB)
+        paths = [Path("done.mov"), Path("long_720p.mov"), Path("short_4k.mov")]
+
+        sorted_paths = orchestrator._sort_by_priority(paths)
+
+        assert sorted_paths == [Path("long_720p.mov"), Path("done.mov"), Path("short_4k.mov")]
+
+    def test_sort_by_priority_longest_job(self) -> None:
+        """Test longest estimated encode runs first."""
+        orchestrator = self._cost_orchestrator(QueuePriority.LONGEST_JOB)
+        paths = [Path("done.mov"), Path("long_720p.mov"), Path("short_4k.mov")]
+
+        sorted_paths = orchestrator._sort_by_priority(paths)
+
+        assert sorted_paths == [Path("short_4k.mov"), Path("done.mov"), Path("long_720p.mov")]
+
+    def test_sort_by_priority_max_savings(self) -> None:
+        """Test files that reclaim the most bytes per second run first."""
+        orchestrator = self._cost_orchestrator(QueuePriority.MAX_SAVINGS)
+        paths = [Path("done.mov"), Path("short_4k.mov"), Path("long_720p.mov")]
+
+        sorted_paths = orchestrator._sort_by_priority(paths)
+
+        assert sorted_paths == [Path("long_720p.mov"), Path("short_4k.mov"), Path("done.mov")]
+
+    def test_cost_sort_without_probe_index_uses_size(self) -> None:
+        """Test cost-based ordering falls back to file size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            small = Path(tmpdir) / "small.mov"
+            large = Path(tmpdir) / "large.mov"
+            small.write_bytes(b"x" * 100)
+            large.write_bytes(b"x" * 1000)
+
+            config = OrchestratorConfig(queue_priority=QueuePriority.SHORTEST_JOB)
+            orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+
+            assert orchestrator._sort_by_priority([large, small]) == [small, large]
+
+    def test_successful_result_updates_cost_model(self) -> None:
+        """Test completed conversions refine the encoder speed."""
+        orchestrator = Orchestrator(enable_session_persistence=False)
+        task = ConversionTask(input_path=Path("a.mov"), output_path=Path("a_h265.mp4"))
+        result = ConversionResult(
+            success=True,
+            request=MagicMock(codec_info=None),
+            speed_ratio=4.0,
+            encoder="libx265",
+        )
+
+        orchestrator._handle_task_result(task, result, MagicMock())
+
+        assert orchestrator.cost_model.speed_for("libx265") > 1.0
+
 
 class TestBatchStatus:
     """Tests for batch status management."""
@@ -541,3 +669,787 @@ class TestOrchestratorVmafIntegration:
         for action in ["warn", "retry", "fail"]:
             config = OrchestratorConfig(vmaf_fail_action=action)
             assert config.vmaf_fail_action == action
+
+
+class TestOrchestratorPipeline:
+    """Tests for pipelined stage processing in Orchestrator."""
+
+    def test_pipeline_config_defaults(self) -> None:
+        """Test default pipeline configuration values."""
+        config = OrchestratorConfig()
+        assert config.enable_pipeline is False
+        assert config.pipeline_verify_concurrency == 2
+        assert config.pipeline_finalize_concurrency == 2
+        assert config.pipeline_queue_size == 2
+
+    @pytest.mark.asyncio
+    async def test_run_pipelined_converts_all_files(self) -> None:
+        """Test pipelined run passes every file through all stages."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inputs = []
+            for name in ("a.mov", "b.mov", "c.mov"):
+                path = Path(tmpdir) / name
+                path.write_bytes(b"x" * 100)
+                inputs.append(path)
+
+            config = OrchestratorConfig(
+                enable_pipeline=True,
+                validate_output=True,
+                preserve_timestamps=False,
+                max_concurrent=1,
+            )
+            orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+
+            async def fake_convert(request, on_progress_info=None):
+                request.output_path.write_bytes(b"y" * 50)
+                return ConversionResult(
+                    success=True,
+                    request=request,
+                    original_size=100,
+                    converted_size=50,
+                )
+
+            converter = MagicMock()
+            converter.convert = AsyncMock(side_effect=fake_convert)
+            orchestrator._converter = converter
+            orchestrator.validator = MagicMock()
+            orchestrator.validator.validate.return_value = ValidationResult(
+                valid=True, integrity_ok=True
+            )
+
+            report = await orchestrator.run(input_paths=inputs)
+
+            assert report.successful == 3
+            assert report.failed == 0
+            assert converter.convert.await_count == 3
+            assert orchestrator.validator.validate.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_pipelined_validation_failure(self) -> None:
+        """Test a validation failure is reported without finalizing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "video.mov"
+            input_path.write_bytes(b"x" * 100)
+
+            config = OrchestratorConfig(
+                enable_pipeline=True,
+                preserve_timestamps=False,
+            )
+            orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+            orchestrator.retry_manager = None
+
+            async def fake_convert(request, on_progress_info=None):
+                request.output_path.write_bytes(b"y" * 50)
+                return ConversionResult(success=True, request=request)
+
+            orchestrator._converter = MagicMock()
+            orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+            orchestrator.validator = MagicMock()
+            orchestrator.validator.validate.return_value = ValidationResult(
+                valid=False, integrity_ok=False, errors=["corrupt"]
+            )
+
+            with patch.object(orchestrator, "_run_finalize_stage") as mock_finalize:
+                report = await orchestrator.run(input_paths=[input_path])
+
+            assert report.failed == 1
+            mock_finalize.assert_not_called()
+
+
+class TestOrchestratorRunStream:
+    """Tests for streaming discovery-to-encode in Orchestrator."""
+
+    @staticmethod
+    def _make_orchestrator(**config_kwargs) -> Orchestrator:
+        config = OrchestratorConfig(
+            validate_output=False,
+            preserve_timestamps=False,
+            **config_kwargs,
+        )
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+
+        async def fake_convert(request, on_progress_info=None):
+            request.output_path.write_bytes(b"y" * 50)
+            return ConversionResult(
+                success=True,
+                request=request,
+                original_size=100,
+                converted_size=50,
+            )
+
+        orchestrator._converter = MagicMock()
+        orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_run_stream_converts_async_source(self) -> None:
+        """Test every streamed candidate is converted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for name in ("a.mov", "b.mov", "c.mov"):
+                path = Path(tmpdir) / name
+                path.write_bytes(b"x" * 100)
+                paths.append(path)
+
+            async def source():
+                for path in paths:
+                    yield path
+
+            orchestrator = self._make_orchestrator()
+            report = await orchestrator.run_stream(source())
+
+            assert report.total_files == 3
+            assert report.successful == 3
+            assert len(orchestrator.get_completed_tasks()) == 3
+
+    @pytest.mark.asyncio
+    async def test_run_stream_skips_existing_output(self) -> None:
+        """Test candidates with an existing output are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "video.mov"
+            input_path.write_bytes(b"x" * 100)
+            (Path(tmpdir) / "video_h265.mp4").write_bytes(b"y")
+
+            orchestrator = self._make_orchestrator()
+            report = await orchestrator.run_stream([input_path])
+
+            assert report.total_files == 1
+            assert report.skipped == 1
+            orchestrator._converter.convert.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_stream_reuses_codec_info(self) -> None:
+        """Test codec info from discovery is passed to the converter."""
+        from video_converter.extractors.folder_extractor import FolderVideoInfo
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "video.mov"
+            input_path.write_bytes(b"x" * 100)
+            codec_info = CodecInfo(
+                path=input_path,
+                codec="h264",
+                width=1920,
+                height=1080,
+                fps=30.0,
+                duration=12.5,
+                bitrate=1000,
+                size=100,
+                audio_codec="aac",
+                container="mov",
+            )
+            info = FolderVideoInfo(
+                path=input_path,
+                filename=input_path.name,
+                size=100,
+                modified_time=datetime.now(),
+                codec_info=codec_info,
+            )
+
+            orchestrator = self._make_orchestrator()
+            await orchestrator.run_stream([info])
+
+            request = orchestrator._converter.convert.await_args.args[0]
+            assert request.codec_info is codec_info
+
+    @pytest.mark.asyncio
+    async def test_run_stream_encodes_before_source_exhausted(self) -> None:
+        """Test encoding starts while discovery is still producing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            events: list[str] = []
+            orchestrator = self._make_orchestrator(max_concurrent=1)
+            convert = orchestrator._converter.convert.side_effect
+
+            async def tracking_convert(request, on_progress_info=None):
+                events.append(f"encode_{request.input_path.name}")
+                return await convert(request, on_progress_info)
+
+            orchestrator._converter.convert.side_effect = tracking_convert
+
+            async def source():
+                for name in ("a.mov", "b.mov", "c.mov", "d.mov"):
+                    path = Path(tmpdir) / name
+                    path.write_bytes(b"x" * 100)
+                    events.append(f"found_{name}")
+                    yield path
+                    await asyncio.sleep(0.01)
+
+            report = await orchestrator.run_stream(source())
+
+            assert report.successful == 4
+            assert events.index("encode_a.mov") < events.index("found_d.mov")
+
+
+class TestOrchestratorHybridEncoders:
+    """Tests for hybrid encoder pool dispatch in Orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_both_pools(self) -> None:
+        """Test files are spread over pools and the pool is recorded."""
+        from video_converter.converters.software import SoftwareConverter
+        from video_converter.core.encoder_pool import (
+            EncoderDispatcher,
+            EncoderPoolConfig,
+            EncoderSlotPool,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inputs = []
+            for i in range(6):
+                path = Path(tmpdir) / f"video{i}.mov"
+                path.write_bytes(b"x" * 100)
+                inputs.append(path)
+
+            async def fake_convert(request, on_progress_info=None):
+                await asyncio.sleep(0.01)
+                request.output_path.write_bytes(b"y" * 50)
+                return ConversionResult(success=True, request=request, encoder="libx265")
+
+            # Two software converters stand in for hardware and software pools
+            converters = [SoftwareConverter(), SoftwareConverter()]
+            for converter in converters:
+                converter.convert = AsyncMock(side_effect=fake_convert)
+
+            config = OrchestratorConfig(
+                validate_output=False,
+                preserve_timestamps=False,
+                encoder_pools=[
+                    EncoderPoolConfig(ConversionMode.HARDWARE, slots=1, name="primary"),
+                    EncoderPoolConfig(ConversionMode.SOFTWARE, slots=2, name="secondary"),
+                ],
+            )
+            orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+            orchestrator._dispatcher = EncoderDispatcher(
+                [
+                    EncoderSlotPool("primary", converters[0], slots=1),
+                    EncoderSlotPool("secondary", converters[1], slots=2),
+                ]
+            )
+
+            report = await orchestrator.run(input_paths=inputs)
+
+            assert report.successful == 6
+            pools = {t.result.encoder_pool for t in orchestrator.get_completed_tasks()}
+            assert pools == {"primary", "secondary"}
+            assert converters[0].convert.await_count >= 1
+            assert converters[1].convert.await_count >= 1
+            assert orchestrator._encoder_slots == 3
+
+    def test_get_dispatcher_skips_unavailable_pools(self) -> None:
+        """Test pools without an available encoder are left out."""
+        from video_converter.core.encoder_pool import EncoderPoolConfig
+
+        config = OrchestratorConfig(
+            encoder_pools=[
+                EncoderPoolConfig(ConversionMode.HARDWARE, slots=2),
+                EncoderPoolConfig(ConversionMode.SOFTWARE, slots=2),
+            ],
+        )
+        factory = MagicMock()
+        software = MagicMock()
+
+        def get_converter(mode, fallback=True):
+            if mode == ConversionMode.HARDWARE:
+                raise EncoderNotAvailableError("no hardware encoder")
+            return software
+
+        factory.get_converter.side_effect = get_converter
+        orchestrator = Orchestrator(
+            config=config, converter_factory=factory, enable_session_persistence=False
+        )
+
+        dispatcher = orchestrator._get_dispatcher()
+
+        assert [pool.name for pool in dispatcher.pools] == ["software"]
+        assert dispatcher.pools[0].converter is software
+
+    def test_get_dispatcher_no_pools_available(self) -> None:
+        """Test an error is raised when no pool can be created."""
+        from video_converter.core.encoder_pool import EncoderPoolConfig
+
+        config = OrchestratorConfig(
+            encoder_pools=[EncoderPoolConfig(ConversionMode.HARDWARE)],
+        )
+        factory = MagicMock()
+        factory.get_converter.side_effect = EncoderNotAvailableError("none")
+        orchestrator = Orchestrator(
+            config=config, converter_factory=factory, enable_session_persistence=False
+        )
+
+        with pytest.raises(EncoderNotAvailableError):
+            orchestrator._get_dispatcher()
+
+
+class TestOrchestratorSegmentEncoding:
+    """Tests for segment-parallel encoding in Orchestrator."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test encodes are not split unless enabled."""
+        orchestrator = Orchestrator(enable_session_persistence=False)
+        assert orchestrator._segment_count() == 1
+
+    def test_not_split_while_files_wait(self) -> None:
+        """Test encoders needed by queued files are not used for segments."""
+        config = OrchestratorConfig(segment_encoding=True, max_segments=4)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        orchestrator._tasks = [
+            ConversionTask(input_path=Path(f"{i}.mov"), output_path=Path(f"{i}.mp4"))
+            for i in range(10)
+        ]
+        orchestrator._encodes_started = 2
+        orchestrator._active_encodes = 1
+
+        assert orchestrator._segment_count() == 1
+
+    def test_split_at_batch_tail(self) -> None:
+        """Test the last files use the encoders other files left idle."""
+        config = OrchestratorConfig(segment_encoding=True, max_segments=4)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        orchestrator._tasks = [
+            ConversionTask(input_path=Path(f"{i}.mov"), output_path=Path(f"{i}.mp4"))
+            for i in range(3)
+        ]
+        orchestrator._encodes_started = 3
+        orchestrator._active_encodes = 1
+
+        assert orchestrator._segment_count() == 3
+
+    @pytest.mark.asyncio
+    async def test_encode_uses_segmented_converter(self) -> None:
+        """Test a split encode runs through SegmentedConverter."""
+        from video_converter.converters.segmented import SegmentedConverter
+        from video_converter.converters.software import SoftwareConverter
+        from video_converter.core.orchestrator import StageJob
+        from video_converter.core.types import ConversionRequest
+
+        config = OrchestratorConfig(
+            segment_encoding=True, max_segments=4, segment_min_duration=300.0
+        )
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        request = ConversionRequest(input_path=Path("a.mov"), output_path=Path("a.mp4"))
+        job = StageJob(input_path=request.input_path, output_path=request.output_path)
+        job.request = request
+        expected = ConversionResult(success=True, request=request)
+        seen: list[SegmentedConverter] = []
+
+        async def fake_convert(self, request, on_progress=None, on_progress_info=None):
+            seen.append(self)
+            return expected
+
+        with patch.object(SegmentedConverter, "convert", fake_convert):
+            result = await orchestrator._encode(SoftwareConverter(), job)
+
+        assert result is expected
+        assert seen[0].segments == 4
+        assert seen[0].min_input_duration == 300.0
+        assert orchestrator._segmented == []
+        assert orchestrator._active_encodes == 0
+
+
+class TestOrchestratorThreadBudget:
+    """Tests for per-job thread budgeting in Orchestrator."""
+
+    @staticmethod
+    def _job() -> StageJob:
+        """Create a job with a conversion request."""
+        from video_converter.core.types import ConversionRequest
+
+        request = ConversionRequest(input_path=Path("a.mov"), output_path=Path("a.mp4"))
+        job = StageJob(input_path=request.input_path, output_path=request.output_path)
+        job.request = request
+        return job
+
+    def test_disabled_by_default(self) -> None:
+        """Test no budget is created unless enabled."""
+        assert Orchestrator(enable_session_persistence=False)._thread_budget is None
+
+    @pytest.mark.asyncio
+    async def test_software_encode_gets_share(self) -> None:
+        """Test software encodes get their share and release it afterwards."""
+        from video_converter.converters.software import SoftwareConverter
+
+        config = OrchestratorConfig(thread_budget=True, thread_budget_cores=16, max_concurrent=4)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        orchestrator._tasks = [
+            ConversionTask(input_path=Path(f"{i}.mov"), output_path=Path(f"{i}.mp4"))
+            for i in range(8)
+        ]
+        orchestrator._encodes_started = 1
+        converter = SoftwareConverter()
+        seen: list[int | None] = []
+
+        async def fake_convert(request, on_progress_info=None):
+            seen.append(request.threads)
+            assert orchestrator._thread_budget.threads_in_use == 4
+            return ConversionResult(success=True, request=request)
+
+        converter.convert = AsyncMock(side_effect=fake_convert)
+        job = self._job()
+
+        await orchestrator._encode(converter, job)
+
+        assert seen == [4]
+        assert orchestrator._thread_budget.threads_in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_last_job_gets_all_free_cores(self) -> None:
+        """Test a job at the end of the batch uses every free core."""
+        from video_converter.converters.software import SoftwareConverter
+
+        config = OrchestratorConfig(thread_budget=True, thread_budget_cores=16, max_concurrent=4)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        converter = SoftwareConverter()
+        converter.convert = AsyncMock(
+            side_effect=lambda request, **_: ConversionResult(
+                success=True, request=request
+            )
+        )
+        job = self._job()
+
+        await orchestrator._encode(converter, job)
+
+        assert job.request is not None
+        assert job.request.threads == 16
+
+    @pytest.mark.asyncio
+    async def test_hardware_encode_not_budgeted(self) -> None:
+        """Test hardware encodes do not take CPU shares."""
+        from video_converter.converters.hardware import HardwareConverter
+
+        config = OrchestratorConfig(thread_budget=True, thread_budget_cores=16)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+        converter = HardwareConverter()
+        converter.convert = AsyncMock(
+            side_effect=lambda request, **_: ConversionResult(
+                success=True, request=request
+            )
+        )
+        job = self._job()
+
+        await orchestrator._encode(converter, job)
+
+        assert job.request is not None
+        assert job.request.threads is None
+
+
+class TestOrchestratorRetainResults:
+    """Tests for running large batches without retaining results."""
+
+    def test_conversion_task_uses_slots(self) -> None:
+        """Test task records carry no per-instance dict."""
+        task = ConversionTask(input_path=Path("a.mov"), output_path=Path("a.mp4"))
+        assert not hasattr(task, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batch_streams_results(self, tmp_path: Path) -> None:
+        """Test results update the report without being kept."""
+        inputs = []
+        for name in ("a.mov", "b.mov", "c.mov", "d.mov"):
+            path = tmp_path / name
+            path.write_bytes(b"x" * 100)
+            inputs.append(path)
+
+        config = OrchestratorConfig(max_concurrent=2, retain_results=False)
+        orchestrator = Orchestrator(config=config, enable_session_persistence=False)
+
+        async def fake_convert_single(input_path, output_path=None, **kwargs):
+            from video_converter.core.types import ConversionRequest
+
+            request = ConversionRequest(input_path=input_path, output_path=output_path)
+            success = input_path.name != "c.mov"
+            return ConversionResult(
+                success=success,
+                request=request,
+                original_size=100,
+                converted_size=40 if success else 0,
+                error_message=None if success else "encode failed",
+            )
+
+        with (
+            patch.object(orchestrator, "convert_single", side_effect=fake_convert_single),
+            patch.object(
+                orchestrator._concurrent_processor,
+                "process_batch",
+                side_effect=AssertionError("process_batch should not be used"),
+            ),
+        ):
+            report = await orchestrator.run(input_paths=inputs)
+
+        assert report.successful == 3
+        assert report.failed == 1
+        assert report.total_converted_size == 120
+        assert report.results == []
+        assert report.errors == ["c.mov: encode failed"]
+        assert all(task.result is None for task in orchestrator._tasks)
+        assert len(orchestrator.get_completed_tasks()) == 3
+        assert len(orchestrator.get_failed_tasks()) == 1
+
+
+class TestOrchestratorHistorySkip:
+    """Tests for skipping inputs whose content was already converted."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_moved_file_skipped(self, tmp_path: Path, streaming: bool) -> None:
+        """Test a converted file moved to another folder is not converted again."""
+        from video_converter.core.history import ConversionHistory
+
+        first_dir = tmp_path / "2024"
+        second_dir = tmp_path / "archive" / "2024"
+        first_dir.mkdir()
+        second_dir.mkdir(parents=True)
+        video = first_dir / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        other = first_dir / "other.mov"
+        other.write_bytes(b"other" * 1000)
+
+        history = ConversionHistory(tmp_path / "history.json")
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(validate_output=False, preserve_timestamps=False),
+            enable_session_persistence=False,
+            history=history,
+        )
+        encoded: list[Path] = []
+
+        async def fake_convert(request, on_progress_info=None):
+            encoded.append(request.input_path)
+            request.output_path.write_bytes(b"hevc")
+            return ConversionResult(success=True, request=request)
+
+        orchestrator._converter = MagicMock()
+        orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+
+        await orchestrator.run(input_paths=[video])
+        moved = video.rename(second_dir / "clip.mov")
+        if streaming:
+            report = await orchestrator.run_stream([moved, other])
+        else:
+            report = await orchestrator.run(input_paths=[moved, other])
+
+        assert encoded == [video, other]
+        assert report.skipped == 1
+        assert report.successful == 1
+        assert not (second_dir / "clip_h265.mp4").exists()
+
+    @staticmethod
+    def _recording_orchestrator(
+        tmp_path: Path, skip_converted: bool = True
+    ) -> tuple[Orchestrator, list[Path]]:
+        from video_converter.core.history import ConversionHistory
+
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(
+                validate_output=False, preserve_timestamps=False, skip_converted=skip_converted
+            ),
+            enable_session_persistence=False,
+            history=ConversionHistory(tmp_path / "history.json"),
+        )
+        encoded: list[Path] = []
+
+        async def fake_convert(request, on_progress_info=None):
+            encoded.append(request.input_path)
+            request.output_path.write_bytes(b"hevc")
+            return ConversionResult(success=True, request=request)
+
+        orchestrator._converter = MagicMock()
+        orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+        return orchestrator, encoded
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_deleted_output_converted_again(self, tmp_path: Path, streaming: bool) -> None:
+        """Test a converted file is converted again when its output was deleted."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        orchestrator, encoded = self._recording_orchestrator(tmp_path)
+
+        await orchestrator.run(input_paths=[video])
+        (tmp_path / "clip_h265.mp4").unlink()
+        if streaming:
+            report = await orchestrator.run_stream([video])
+        else:
+            report = await orchestrator.run(input_paths=[video])
+
+        assert encoded == [video, video]
+        assert report.skipped == 0
+        assert report.successful == 1
+        assert (tmp_path / "clip_h265.mp4").exists()
+
+    @pytest.mark.asyncio
+    async def test_skip_converted_disabled(self, tmp_path: Path) -> None:
+        """Test converted files are converted again when skipping is disabled."""
+        video = tmp_path / "clip.mov"
+        video.write_bytes(b"frame" * 1000)
+        orchestrator, encoded = self._recording_orchestrator(tmp_path, skip_converted=False)
+
+        await orchestrator.run(input_paths=[video])
+        video.rename(tmp_path / "renamed.mov")
+        report = await orchestrator.run(input_paths=[tmp_path / "renamed.mov"])
+
+        assert encoded == [video, tmp_path / "renamed.mov"]
+        assert report.skipped == 0
+        assert report.successful == 1
+        assert orchestrator.history.count() == 1
+
+
+class TestOrchestratorDedupe:
+    """Tests for reusing outputs of byte-identical inputs."""
+
+    @staticmethod
+    def _inputs(tmp_path: Path) -> list[Path]:
+        inputs = []
+        for name, content in (("a.mov", b"same"), ("b.mov", b"other"), ("c.mov", b"same")):
+            path = tmp_path / name
+            path.write_bytes(content * 1000)
+            inputs.append(path)
+        return inputs
+
+    @staticmethod
+    def _fake_convert(success: bool):
+        encoded: list[Path] = []
+
+        async def fake_convert_single(input_path, output_path=None, **kwargs):
+            from video_converter.core.types import ConversionRequest
+
+            encoded.append(input_path)
+            if success:
+                output_path.write_bytes(b"hevc")
+            return ConversionResult(
+                success=success,
+                request=ConversionRequest(input_path=input_path, output_path=output_path),
+                original_size=4000,
+                converted_size=4 if success else 0,
+                error_message=None if success else "encode failed",
+            )
+
+        return fake_convert_single, encoded
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test duplicates are encoded independently by default."""
+        inputs = self._inputs(tmp_path)
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(max_concurrent=1), enable_session_persistence=False
+        )
+        fake_convert_single, encoded = self._fake_convert(success=True)
+
+        with patch.object(orchestrator, "convert_single", side_effect=fake_convert_single):
+            await orchestrator.run(input_paths=inputs)
+
+        assert encoded == inputs
+
+    @pytest.mark.asyncio
+    async def test_duplicate_output_reused(self, tmp_path: Path) -> None:
+        """Test one copy is encoded and the other gets its output and record."""
+        from video_converter.core.history import ConversionHistory
+
+        inputs = self._inputs(tmp_path)
+        duplicate = inputs[2]
+        os.utime(duplicate, (1_600_000_000, 1_600_000_000))
+        history = ConversionHistory(tmp_path / "history.json")
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(max_concurrent=1, dedupe_inputs=True),
+            enable_session_persistence=False,
+            history=history,
+        )
+        fake_convert_single, encoded = self._fake_convert(success=True)
+
+        with patch.object(orchestrator, "convert_single", side_effect=fake_convert_single):
+            report = await orchestrator.run(input_paths=inputs)
+
+        output = tmp_path / "c_h265.mp4"
+        assert encoded == inputs[:2]
+        assert report.successful == 3
+        assert output.read_bytes() == b"hevc"
+        assert output.stat().st_mtime == 1_600_000_000
+        assert output.stat().st_ino != (tmp_path / "a_h265.mp4").stat().st_ino
+        assert history.count() == 3
+        assert history.is_file_converted(duplicate)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_shares_failure(self, tmp_path: Path) -> None:
+        """Test duplicates fail with the copy that was encoded."""
+        inputs = self._inputs(tmp_path)
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(max_concurrent=2, dedupe_inputs=True, enable_retry=False),
+            enable_session_persistence=False,
+        )
+        fake_convert_single, encoded = self._fake_convert(success=False)
+
+        with patch.object(orchestrator, "convert_single", side_effect=fake_convert_single):
+            report = await orchestrator.run(input_paths=inputs)
+
+        assert sorted(encoded) == inputs[:2]
+        assert report.failed == 3
+        assert "c.mov: Duplicate of a.mov: encode failed" in report.errors
+
+    @pytest.mark.asyncio
+    async def test_run_stream_reuses_duplicate_output(self, tmp_path: Path) -> None:
+        """Test streaming encodes one copy and reuses its output for the other."""
+        from video_converter.core.history import ConversionHistory
+
+        inputs = self._inputs(tmp_path)
+        history = ConversionHistory(tmp_path / "history.json")
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(
+                dedupe_inputs=True, validate_output=False, preserve_timestamps=False
+            ),
+            enable_session_persistence=False,
+            history=history,
+        )
+        encoded: list[Path] = []
+
+        async def fake_convert(request, on_progress_info=None):
+            encoded.append(request.input_path)
+            request.output_path.write_bytes(b"hevc")
+            return ConversionResult(
+                success=True, request=request, original_size=4000, converted_size=4
+            )
+
+        orchestrator._converter = MagicMock()
+        orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+
+        report = await orchestrator.run_stream(inputs)
+
+        assert encoded == inputs[:2]
+        assert report.successful == 3
+        assert (tmp_path / "c_h265.mp4").read_bytes() == b"hevc"
+        assert history.count() == 3
+        assert history.is_file_converted(inputs[2])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_duplicate_with_same_output_skipped(
+        self, tmp_path: Path, streaming: bool
+    ) -> None:
+        """Test a same-named copy from another folder is skipped, not failed."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        inputs = []
+        for folder in ("2023", "2024"):
+            (tmp_path / folder).mkdir()
+            path = tmp_path / folder / "clip.mov"
+            path.write_bytes(b"same" * 1000)
+            inputs.append(path)
+        orchestrator = Orchestrator(
+            config=OrchestratorConfig(
+                dedupe_inputs=True, validate_output=False, preserve_timestamps=False
+            ),
+            enable_session_persistence=False,
+        )
+
+        async def fake_convert(request, on_progress_info=None):
+            request.output_path.write_bytes(b"hevc")
+            return ConversionResult(success=True, request=request)
+
+        orchestrator._converter = MagicMock()
+        orchestrator._converter.convert = AsyncMock(side_effect=fake_convert)
+
+        if streaming:
+            report = await orchestrator.run_stream(inputs, output_dir=output_dir)
+        else:
+            report = await orchestrator.run(input_paths=inputs, output_dir=output_dir)
+
+        assert report.successful == 1
+        assert report.skipped == 1
+        assert report.failed == 0
+        assert (output_dir / "clip_h265.mp4").read_bytes() == b"hevc"
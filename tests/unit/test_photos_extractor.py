@@ -858,6 +858,50 @@ class TestPhotosVideoFilter:
         assert len(candidates) == 1
         assert candidates[0].codec == "h264"
 
+    def test_detect_codec_uses_probe_index(self, tmp_path: Path) -> None:
+        """Test unmodified assets are answered from the probe index."""
+        from video_converter.processors.codec_detector import CodecInfo
+        from video_converter.processors.probe_index import ProbeIndex
+
+        video_file = tmp_path / "clip.mov"
+        video_file.write_bytes(b"data")
+        video = PhotosVideoInfo(
+            uuid="uuid1",
+            filename="clip.mov",
+            path=video_file,
+            date=datetime(2024, 1, 1),
+            date_modified=datetime(2024, 1, 2),
+            duration=60.0,
+        )
+
+        mock_detector = MagicMock()
+        mock_detector.analyze.return_value = CodecInfo(
+            path=video_file,
+            codec="h264",
+            width=1920,
+            height=1080,
+            fps=30.0,
+            duration=60.0,
+            bitrate=0,
+            size=4,
+            audio_codec=None,
+            container="mov",
+        )
+
+        probe_index = ProbeIndex(tmp_path / "index.db")
+        try:
+            filter = PhotosVideoFilter(
+                MagicMock(spec=PhotosLibrary), exclude_albums=[], probe_index=probe_index
+            )
+            filter._codec_detector = mock_detector
+
+            assert filter._detect_codec(video) == "h264"
+            assert filter._detect_codec(video) == "h264"
+        finally:
+            probe_index.close()
+
+        assert mock_detector.analyze.call_count == 1
+
     def test_get_conversion_candidates_skips_icloud_only(self) -> None:
         """Test get_conversion_candidates skips iCloud-only videos."""
         mock_library = MagicMock(spec=PhotosLibrary)
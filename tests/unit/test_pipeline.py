@@ -0,0 +1,205 @@
+"""Unit tests for staged pipeline module."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from video_converter.core.pipeline import PipelineStage, StagedPipeline, StageStats
+
+
+class TestPipelineStage:
+    """Tests for PipelineStage dataclass."""
+
+    def test_concurrency_minimum_is_one(self) -> None:
+        """Test concurrency is clamped to at least one worker."""
+
+        async def handler(item: int) -> bool:
+            return True
+
+        stage = PipelineStage("encode", handler, concurrency=0)
+        assert stage.concurrency == 1
+
+
+class TestStageStats:
+    """Tests for StageStats dataclass."""
+
+    def test_utilization(self) -> None:
+        """Test utilization is busy time over worker capacity."""
+        stats = StageStats(name="encode", concurrency=2, busy_seconds=10.0)
+        assert stats.utilization(10.0) == pytest.approx(0.5)
+
+    def test_utilization_zero_elapsed(self) -> None:
+        """Test utilization with no elapsed time."""
+        stats = StageStats(name="encode", concurrency=2, busy_seconds=1.0)
+        assert stats.utilization(0.0) == 0.0
+
+
+class TestStagedPipeline:
+    """Tests for StagedPipeline class."""
+
+    def test_requires_stages(self) -> None:
+        """Test pipeline rejects an empty stage list."""
+        with pytest.raises(ValueError):
+            StagedPipeline([])
+
+    @pytest.mark.asyncio
+    async def test_items_pass_through_all_stages(self) -> None:
+        """Test each item visits every stage in order."""
+        visits: dict[int, list[str]] = {}
+
+        def make_handler(name: str):
+            async def handler(item: int) -> bool:
+                visits.setdefault(item, []).append(name)
+                return True
+
+            return handler
+
+        pipeline = StagedPipeline(
+            [
+                PipelineStage("a", make_handler("a"), 2),
+                PipelineStage("b", make_handler("b"), 1),
+                PipelineStage("c", make_handler("c"), 3),
+            ]
+        )
+        done: list[int] = []
+        count = await pipeline.run(range(5), on_item_done=lambda i, _e: done.append(i))
+
+        assert count == 5
+        assert sorted(done) == [0, 1, 2, 3, 4]
+        assert all(v == ["a", "b", "c"] for v in visits.values())
+        assert pipeline.stats["b"].processed == 5
+
+    @pytest.mark.asyncio
+    async def test_early_finish_skips_later_stages(self) -> None:
+        """Test returning False finishes the item without later stages."""
+        second_stage: list[int] = []
+
+        async def first(item: int) -> bool:
+            return item % 2 == 0
+
+        async def second(item: int) -> bool:
+            second_stage.append(item)
+            return True
+
+        pipeline = StagedPipeline([PipelineStage("a", first), PipelineStage("b", second)])
+        count = await pipeline.run([1, 2, 3, 4])
+
+        assert count == 4
+        assert sorted(second_stage) == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_reported(self) -> None:
+        """Test handler exceptions are passed to the completion callback."""
+
+        async def failing(item: int) -> bool:
+            if item == 2:
+                raise RuntimeError("boom")
+            return True
+
+        errors: dict[int, BaseException | None] = {}
+        pipeline = StagedPipeline([PipelineStage("a", failing)])
+        await pipeline.run([1, 2, 3], on_item_done=lambda i, e: errors.__setitem__(i, e))
+
+        assert errors[1] is None
+        assert isinstance(errors[2], RuntimeError)
+        assert pipeline.stats["a"].failed == 1
+
+    @pytest.mark.asyncio
+    async def test_encoder_not_blocked_by_slow_verify(self) -> None:
+        """Test the next encode starts while an earlier item is verifying."""
+        events: list[str] = []
+
+        async def encode(item: int) -> bool:
+            events.append(f"encode_start_{item}")
+            await asyncio.sleep(0.01)
+            return True
+
+        async def verify(item: int) -> bool:
+            events.append(f"verify_start_{item}")
+            await asyncio.sleep(0.05)
+            events.append(f"verify_end_{item}")
+            return True
+
+        pipeline = StagedPipeline(
+            [PipelineStage("encode", encode, 1), PipelineStage("verify", verify, 2)]
+        )
+        await pipeline.run([0, 1])
+
+        assert events.index("encode_start_1") < events.index("verify_end_0")
+
+    @pytest.mark.asyncio
+    async def test_stage_concurrency_limit(self) -> None:
+        """Test a stage never exceeds its worker count."""
+        active = 0
+        peak = 0
+
+        async def handler(item: int) -> bool:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        pipeline = StagedPipeline([PipelineStage("a", handler, 2)])
+        await pipeline.run(range(6))
+
+        assert peak == 2
+        assert pipeline.stats["a"].peak_active == 2
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_source(self) -> None:
+        """Test items can be streamed from an async iterator."""
+
+        async def source():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        seen: list[int] = []
+
+        async def handler(item: int) -> bool:
+            seen.append(item)
+            return True
+
+        pipeline = StagedPipeline([PipelineStage("a", handler)])
+        assert await pipeline.run(source()) == 3
+        assert sorted(seen) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_source_error_raised_after_drain(self) -> None:
+        """Test source errors propagate once queued items are finished."""
+
+        async def source():
+            yield 1
+            raise OSError("scan failed")
+
+        seen: list[int] = []
+
+        async def handler(item: int) -> bool:
+            seen.append(item)
+            return True
+
+        pipeline = StagedPipeline([PipelineStage("a", handler)])
+        with pytest.raises(OSError):
+            await pipeline.run(source())
+        assert seen == [1]
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_feeding(self) -> None:
+        """Test cancel prevents further items from entering."""
+        seen: list[int] = []
+
+        async def handler(item: int) -> bool:
+            seen.append(item)
+            pipeline.cancel()
+            return True
+
+        pipeline: StagedPipeline[int] = StagedPipeline(
+            [PipelineStage("a", handler)], queue_size=1
+        )
+        await pipeline.run(range(100))
+
+        assert len(seen) < 100
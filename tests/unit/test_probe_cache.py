@@ -0,0 +1,142 @@
+"""Unit tests for probe_cache module."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from video_converter.utils.probe_cache import ProbeCache, file_key, get_probe_cache
+
+
+class TestFileKey:
+    """Tests for file_key function."""
+
+    def test_key_contains_file_state(self, tmp_path: Path) -> None:
+        """Test key includes path, size, mtime and inode."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        stat = video.stat()
+
+        assert file_key(video) == (str(video), 3, stat.st_mtime_ns, stat.st_ino)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test missing files have no key."""
+        assert file_key(tmp_path / "missing.mp4") is None
+
+
+class TestProbeCache:
+    """Tests for ProbeCache class."""
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        """Test a stored result is returned for the same file."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+
+        assert cache.get(video) is None
+        cache.put(video, {"format": {"duration": "1.0"}})
+
+        assert cache.get(video) == {"format": {"duration": "1.0"}}
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_modified_file_misses(self, tmp_path: Path) -> None:
+        """Test a changed file is not served from the cache."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {}})
+
+        video.write_bytes(b"abcdef")
+        assert cache.get(video) is None
+
+    def test_replaced_file_misses(self, tmp_path: Path) -> None:
+        """Test a file replaced with the same size and mtime misses."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        stat = video.stat()
+        cache = ProbeCache()
+        cache.put(video, {"format": {}})
+
+        replacement = tmp_path / "new.mp4"
+        replacement.write_bytes(b"xyz")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, video)
+
+        assert cache.get(video) is None
+
+    def test_full_probe_serves_format_only(self, tmp_path: Path) -> None:
+        """Test a full probe satisfies a format-only lookup."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {}, "streams": []})
+
+        assert cache.get(video, show_streams=False) is not None
+
+    def test_format_only_does_not_serve_full_probe(self, tmp_path: Path) -> None:
+        """Test a format-only probe does not satisfy a stream lookup."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {}}, show_streams=False)
+
+        assert cache.get(video) is None
+        assert cache.get(video, show_streams=False) is not None
+
+    def test_returns_copies(self, tmp_path: Path) -> None:
+        """Test mutating a returned result does not change the cache."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {"duration": "1.0"}})
+
+        result = cache.get(video)
+        assert result is not None
+        result["format"]["duration"] = "99"
+
+        assert cache.get(video) == {"format": {"duration": "1.0"}}
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used entries are evicted first."""
+        paths = []
+        for name in ("a.mp4", "b.mp4", "c.mp4"):
+            path = tmp_path / name
+            path.write_bytes(b"abc")
+            paths.append(path)
+
+        cache = ProbeCache(max_entries=2)
+        cache.put(paths[0], {"format": {}})
+        cache.put(paths[1], {"format": {}})
+        cache.get(paths[0])
+        cache.put(paths[2], {"format": {}})
+
+        assert len(cache) == 2
+        assert cache.get(paths[0]) is not None
+        assert cache.get(paths[1]) is None
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test invalidate drops entries for a path."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {}})
+
+        cache.invalidate(video)
+        assert cache.get(video) is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clear removes entries and resets statistics."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"abc")
+        cache = ProbeCache()
+        cache.put(video, {"format": {}})
+        cache.get(video)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+    def test_default_cache_is_shared(self) -> None:
+        """Test the default cache is a single shared instance."""
+        assert get_probe_cache() is get_probe_cache()
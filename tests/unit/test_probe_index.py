@@ -0,0 +1,186 @@
+"""Unit tests for probe_index module."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_converter.processors.codec_detector import CodecInfo
+from video_converter.processors.probe_index import ProbeIndex, file_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def make_codec_info(path: Path, codec: str = "h264") -> CodecInfo:
+    """Create a CodecInfo for testing."""
+    return CodecInfo(
+        path=path,
+        codec=codec,
+        width=1920,
+        height=1080,
+        fps=29.97,
+        duration=61.5,
+        bitrate=5_000_000,
+        size=1000,
+        audio_codec="aac",
+        container="mp4",
+        creation_time=datetime(2024, 1, 15, 10, 30),
+        bit_depth=8,
+    )
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> Generator[ProbeIndex, None, None]:
+    """Provide a probe index in a temporary directory."""
+    probe_index = ProbeIndex(tmp_path / "index" / "probe_index.db")
+    yield probe_index
+    probe_index.close()
+
+
+@pytest.fixture
+def video(tmp_path: Path) -> Path:
+    """Provide a small placeholder video file."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"x" * 1000)
+    return path
+
+
+class TestFileFingerprint:
+    """Tests for file_fingerprint function."""
+
+    def test_fingerprint_changes_with_content(self, video: Path) -> None:
+        """Test the fingerprint changes when the file changes."""
+        before = file_fingerprint(video.stat())
+        video.write_bytes(b"y" * 2000)
+        assert file_fingerprint(video.stat()) != before
+
+
+class TestProbeIndex:
+    """Tests for ProbeIndex class."""
+
+    def test_creates_database(self, index: ProbeIndex) -> None:
+        """Test the database file is created."""
+        assert index.available
+        assert index.index_path.exists()
+
+    def test_round_trip(self, index: ProbeIndex, video: Path) -> None:
+        """Test stored codec info is returned unchanged."""
+        info = make_codec_info(video)
+        index.put(video, info)
+
+        restored = index.get(video)
+        assert restored == info
+
+    def test_miss(self, index: ProbeIndex, video: Path) -> None:
+        """Test lookup of an unindexed file returns None."""
+        assert index.get(video) is None
+
+    def test_modified_file_invalidated(self, index: ProbeIndex, video: Path) -> None:
+        """Test a changed file is not served and its entry is dropped."""
+        index.put(video, make_codec_info(video))
+        video.write_bytes(b"y" * 500)
+
+        assert index.get(video) is None
+        assert len(index) == 0
+
+    def test_persists_across_instances(self, tmp_path: Path, video: Path) -> None:
+        """Test entries survive reopening the database."""
+        db = tmp_path / "probe_index.db"
+        first = ProbeIndex(db)
+        first.put(video, make_codec_info(video))
+        first.close()
+
+        second = ProbeIndex(db)
+        try:
+            assert second.get(video) is not None
+        finally:
+            second.close()
+
+    def test_analyze_probes_once(self, index: ProbeIndex, video: Path) -> None:
+        """Test analyze only calls the detector on a miss."""
+        detector = MagicMock()
+        detector.analyze.return_value = make_codec_info(video)
+
+        first = index.analyze(video, detector)
+        second = index.analyze(video, detector)
+
+        assert detector.analyze.call_count == 1
+        assert first == second
+
+    def test_asset_keyed_by_modification_date(self, index: ProbeIndex, video: Path) -> None:
+        """Test Photos assets are invalidated by a new modification date."""
+        modified = datetime(2024, 1, 1, 12, 0)
+        index.put_asset("UUID-1", modified, make_codec_info(video))
+
+        assert index.get_asset("UUID-1", modified, video) is not None
+        assert index.get_asset("UUID-1", datetime(2024, 2, 1), video) is None
+
+    def test_size_cap(self, tmp_path: Path) -> None:
+        """Test prune evicts the least recently used entries."""
+        index = ProbeIndex(tmp_path / "probe_index.db", max_entries=2)
+        try:
+            paths = []
+            for i in range(3):
+                path = tmp_path / f"video{i}.mp4"
+                path.write_bytes(b"x")
+                index.put(path, make_codec_info(path))
+                paths.append(path)
+
+            index.prune()
+            assert len(index) == 2
+            assert index.get(paths[0]) is None
+            assert index.get(paths[2]) is not None
+        finally:
+            index.close()
+
+    def test_corrupted_database_recreated(self, tmp_path: Path, video: Path) -> None:
+        """Test an unreadable database file is replaced."""
+        db = tmp_path / "probe_index.db"
+        db.write_bytes(b"not a sqlite database" * 100)
+
+        index = ProbeIndex(db)
+        try:
+            assert index.available
+            index.put(video, make_codec_info(video))
+            assert index.get(video) is not None
+        finally:
+            index.close()
+
+    def test_closed_index_misses(self, index: ProbeIndex, video: Path) -> None:
+        """Test a closed index degrades to misses."""
+        index.put(video, make_codec_info(video))
+        index.close()
+
+        assert index.get(video) is None
+        index.put(video, make_codec_info(video))
+
+    def test_invalidate_and_clear(self, index: ProbeIndex, video: Path) -> None:
+        """Test invalidate and clear remove entries."""
+        index.put(video, make_codec_info(video))
+        index.invalidate(video)
+        assert index.get(video) is None
+
+        index.put(video, make_codec_info(video))
+        index.clear()
+        assert len(index) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "link"), reason="Requires hard links")
+    def test_replaced_file_invalidated(self, index: ProbeIndex, tmp_path: Path) -> None:
+        """Test a file replaced by another inode is not served."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"abc")
+        stat = video.stat()
+        index.put(video, make_codec_info(video))
+
+        replacement = tmp_path / "replacement.mp4"
+        replacement.write_bytes(b"xyz")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, video)
+
+        assert index.get(video) is None
@@ -236,6 +236,68 @@ class TestProgressParser:
         assert info.eta_seconds == pytest.approx(30.0, rel=0.01)
         assert info.eta_formatted == "30s"
 
+    def test_parse_progress_block(self) -> None:
+        """Test a -progress key=value block yields one ProgressInfo."""
+        parser = ProgressParser(total_duration=120.0)
+        lines = [
+            "frame=720",
+            "fps=180.00",
+            "stream_0_0_q=32.0",
+            "bitrate=5242.9kbits/s",
+            "total_size=15728640",
+            "out_time_us=24000000",
+            "out_time_ms=24000000",
+            "out_time=00:00:24.000000",
+            "dup_frames=0",
+            "drop_frames=0",
+            "speed=6.0x",
+        ]
+
+        assert all(parser.parse_progress(line + "\n") is None for line in lines)
+        info = parser.parse_progress("progress=continue\n")
+
+        assert info is not None
+        assert info.frame == 720
+        assert info.fps == 180.0
+        assert info.quality == 32.0
+        assert info.bitrate == 5242.9
+        assert info.current_size == 15728640
+        assert info.current_time == 24.0
+        assert info.speed == 6.0
+        assert info.percentage == pytest.approx(20.0, rel=0.01)
+        assert parser.last_info is info
+
+    def test_parse_progress_starts_new_block(self) -> None:
+        """Test values do not leak from one block into the next."""
+        parser = ProgressParser(total_duration=60.0)
+        parser.parse_progress("frame=10")
+        parser.parse_progress("speed=3.0x")
+        parser.parse_progress("progress=continue")
+
+        parser.parse_progress("out_time_us=1000000")
+        info = parser.parse_progress("progress=end")
+
+        assert info is not None
+        assert info.frame == 0
+        assert info.speed == 0.0
+        assert info.current_time == 1.0
+
+    def test_parse_progress_unavailable_values(self) -> None:
+        """Test N/A, negative and malformed values are ignored."""
+        parser = ProgressParser(total_duration=60.0)
+        parser.parse_progress("bitrate=N/A")
+        parser.parse_progress("speed=N/A")
+        parser.parse_progress("out_time_us=-23220")
+        parser.parse_progress("frame=abc")
+        parser.parse_progress("not a progress line")
+        info = parser.parse_progress("progress=continue")
+
+        assert info is not None
+        assert info.bitrate == 0.0
+        assert info.speed == 0.0
+        assert info.current_time == 0.0
+        assert info.frame == 0
+
 
 class TestProgressMonitor:
     """Tests for ProgressMonitor."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import struct
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,7 @@ from video_converter.processors.quality_validator import (
     VideoValidator,
 )
 from video_converter.utils.command_runner import CommandExecutionError, FFprobeRunner
+from video_converter.utils.isobmff import make_box
 
 
 class TestStreamInfo:
@@ -406,6 +408,7 @@ class TestValidationStrictness:
         """Test that strictness enum has expected values."""
         assert ValidationStrictness.QUICK.value == "quick"
         assert ValidationStrictness.STANDARD.value == "standard"
+        assert ValidationStrictness.INDEX.value == "index"
         assert ValidationStrictness.STRICT.value == "strict"
 
 
@@ -1217,3 +1220,176 @@ class TestCompressionValidator:
         result_max = validator.validate(100_000_000, 20_000_000, ContentType.LOW_MOTION)
         assert result_max.valid is True
         assert result_max.severity == CompressionSeverity.NORMAL
+
+
+def _full_box(kind: str, payload: bytes) -> bytes:
+    """Encode a box with a version/flags field."""
+    return make_box(kind, b"\0\0\0\0" + payload)
+
+
+def _table(kind: str, values: list[int]) -> bytes:
+    """Encode a box holding a counted table of 32-bit values."""
+    count = len(values) // 2 if kind == "stts" else len(values)
+    return _full_box(kind, struct.pack(f">I{len(values)}I", count, *values))
+
+
+def _trak(
+    track_id: int,
+    handler: str,
+    frames: int,
+    *,
+    timescale: int = 30,
+    keyframes: list[int] | None = None,
+    sized: int | None = None,
+) -> bytes:
+    """Encode a track whose samples each last one timescale unit."""
+    tkhd = _full_box("tkhd", struct.pack(">IIIII", 0, 0, track_id, 0, frames) + b"\0" * 60)
+    mdhd = _full_box("mdhd", struct.pack(">IIII", 0, 0, timescale, frames) + b"\0" * 4)
+    hdlr = _full_box("hdlr", b"\0" * 4 + handler.encode() + b"\0" * 13)
+    stsd = _full_box("stsd", struct.pack(">I", 1) + make_box("avc1", b"\0" * 78))
+    stts = _table("stts", [frames, 1] if frames else [])
+    stsz = _full_box("stsz", struct.pack(">II", 100, frames if sized is None else sized))
+    stss = _table("stss", keyframes) if keyframes is not None else b""
+    stbl = make_box("stbl", stsd + stts + stsz + stss)
+    return make_box("trak", tkhd + make_box("mdia", mdhd + hdlr + make_box("minf", stbl)))
+
+
+def _write_movie(path: Path, *traks: bytes) -> Path:
+    """Write an MP4 file with the given tracks and a trailing movie header."""
+    mvhd = _full_box("mvhd", struct.pack(">IIII", 0, 0, 30, 300) + b"\0" * 80)
+    path.write_bytes(
+        make_box("ftyp", b"isom\0\0\0\0")
+        + make_box("mdat", b"\0" * 64)
+        + make_box("moov", mvhd + b"".join(traks))
+    )
+    return path
+
+
+class TestVideoValidatorIndex:
+    """Tests for the sample table checks of the INDEX strictness level."""
+
+    @pytest.fixture
+    def validator(self) -> VideoValidator:
+        """Create a validator whose FFprobe reports a valid video."""
+        mock_ffprobe = MagicMock(spec=FFprobeRunner)
+        mock_ffprobe.probe.return_value = {
+            "format": {"format_name": "mov,mp4", "duration": "10.0", "size": "1000"},
+            "streams": [
+                {"index": 0, "codec_type": "video", "codec_name": "hevc"},
+                {"index": 1, "codec_type": "audio", "codec_name": "aac"},
+            ],
+        }
+        return VideoValidator(strictness=ValidationStrictness.INDEX, ffprobe=mock_ffprobe)
+
+    def test_matching_tables_valid(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test an output whose tables match the source passes."""
+        tracks = (
+            _trak(1, "vide", 300, keyframes=[1, 31, 61, 91]),
+            _trak(2, "soun", 480000, timescale=48000),
+        )
+        source = _write_movie(tmp_path / "source.mp4", *tracks)
+        output = _write_movie(tmp_path / "output.mp4", *tracks)
+
+        result = validator.validate(output, source=source)
+
+        assert result.valid is True
+        assert result.warnings == []
+
+    def test_truncated_output(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test an output with fewer frames than the source fails."""
+        source = _write_movie(tmp_path / "source.mp4", _trak(1, "vide", 300))
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 150))
+
+        result = validator.validate(output, source=source)
+
+        assert result.valid is False
+        assert any("Frame count mismatch: 300 → 150" in e for e in result.errors)
+        assert any("duration mismatch" in w for w in result.warnings)
+
+    def test_missing_audio_track(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test an output that lost the source's audio track fails."""
+        source = _write_movie(
+            tmp_path / "source.mp4",
+            _trak(1, "vide", 300),
+            _trak(2, "soun", 480000, timescale=48000),
+        )
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 300))
+
+        result = validator.validate(output, source=source)
+
+        assert "Audio track missing from output" in result.errors
+
+    def test_inconsistent_tables(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test disagreeing sample counts are reported without a source."""
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 300, sized=200))
+
+        result = validator.validate(output)
+
+        assert any("sample tables disagree" in e for e in result.errors)
+
+    @pytest.mark.parametrize(
+        ("keyframes", "message"),
+        [
+            ([], "has no keyframes"),
+            ([1, 400], "refers to missing samples"),
+        ],
+    )
+    def test_bad_keyframe_table(
+        self, tmp_path: Path, validator: VideoValidator, keyframes: list[int], message: str
+    ) -> None:
+        """Test unusable keyframe tables fail validation."""
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 300, keyframes=keyframes))
+
+        result = validator.validate(output)
+
+        assert any(message in e for e in result.errors)
+
+    def test_sparse_keyframes_warn(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test keyframes further apart than the limit and the source warn."""
+        source = _write_movie(tmp_path / "source.mp4", _trak(1, "vide", 600, keyframes=[1, 301]))
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 600, keyframes=[1]))
+
+        result = validator.validate(output, source=source)
+
+        assert result.valid is True
+        assert any("Keyframes are up to 20.0s apart" in w for w in result.warnings)
+
+    def test_malformed_container(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test an MP4 whose movie header is cut off fails validation."""
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 300))
+        output.write_bytes(output.read_bytes()[:-100])
+
+        result = validator.validate(output)
+
+        assert any("Malformed container" in e for e in result.errors)
+
+    def test_other_containers_skipped(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test non-MP4/MOV outputs are not checked."""
+        output = tmp_path / "output.mkv"
+        output.write_bytes(b"\x1a\x45\xdf\xa3" + b"\0" * 64)
+
+        result = validator.validate(output)
+
+        assert result.valid is True
+
+    def test_standard_skips_tables(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test the STANDARD level does not read sample tables."""
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 300, sized=200))
+
+        result = validator.validate(output, strictness=ValidationStrictness.STANDARD)
+
+        assert result.valid is True
+
+    async def test_validate_async(self, tmp_path: Path, validator: VideoValidator) -> None:
+        """Test async validation runs the sample table checks."""
+        source = _write_movie(tmp_path / "source.mp4", _trak(1, "vide", 300))
+        output = _write_movie(tmp_path / "output.mp4", _trak(1, "vide", 150))
+
+        async def probe_async(*args: object, **kwargs: object) -> dict:
+            return validator.ffprobe.probe.return_value  # type: ignore[attr-defined]
+
+        validator.ffprobe.probe_async = probe_async  # type: ignore[method-assign]
+
+        result = await validator.validate_async(output, source=source)
+
+        assert any("Frame count mismatch" in e for e in result.errors)
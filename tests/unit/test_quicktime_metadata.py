@@ -0,0 +1,376 @@
+"""Unit tests for quicktime_metadata module."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import struct
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from video_converter.processors.metadata import MetadataProcessor
+from video_converter.processors.quicktime_metadata import (
+    QuickTimeMetadata,
+    QuickTimeMetadataError,
+)
+from video_converter.utils.command_runner import CommandResult, CommandRunner
+
+# 2024-01-15 10:30:00 UTC in seconds since 1904
+CREATED = 3788159400
+MEDIA = b"\xab" * 4096
+
+
+def _box(kind: str, payload: bytes) -> bytes:
+    """Encode a box."""
+    return struct.pack(">I4s", len(payload) + 8, kind.encode("latin-1")) + payload
+
+
+def _fake_reflink(src: Path, dst: Path) -> bool:
+    """Stand in for a copy-on-write clone on file systems without one."""
+    shutil.copyfile(src, dst)
+    return True
+
+
+def _full_box(kind: str, payload: bytes, version: int = 0) -> bytes:
+    """Encode a box with a version/flags field."""
+    return _box(kind, bytes([version, 0, 0, 0]) + payload)
+
+
+def _text(kind: str, text: str) -> bytes:
+    """Encode a QuickTime user data text item."""
+    encoded = text.encode()
+    return _box(kind, struct.pack(">HH", len(encoded), 0x15C7) + encoded)
+
+
+def _keys_meta(items: dict[str, str]) -> bytes:
+    """Encode an Apple key list metadata box."""
+    handler = _box("hdlr", b"\0" * 8 + b"mdta" + b"\0" * 13)
+    keys = b"".join(struct.pack(">I4s", 8 + len(key), b"mdta") + key.encode() for key in items)
+    entries = b"".join(
+        _box(
+            struct.pack(">I", index).decode("latin-1"),
+            _box("data", struct.pack(">II", 1, 0) + value.encode()),
+        )
+        for index, value in enumerate(items.values(), start=1)
+    )
+    return _box(
+        "meta",
+        handler + _full_box("keys", struct.pack(">I", len(items)) + keys) + _box("ilst", entries),
+    )
+
+
+def _moov(children: bytes = b"") -> bytes:
+    """Encode a movie header with one track."""
+    mvhd = _full_box("mvhd", struct.pack(">IIII", CREATED, CREATED, 600, 6000) + b"\0" * 80)
+    tkhd = _full_box("tkhd", struct.pack(">II", CREATED, CREATED) + b"\0" * 72)
+    mdhd = _full_box("mdhd", struct.pack(">IIII", CREATED, CREATED, 600, 6000) + b"\0" * 4)
+    trak = _box("trak", tkhd + _box("mdia", mdhd))
+    return _box("moov", mvhd + trak + children)
+
+
+def _write_movie(
+    path: Path,
+    children: bytes = b"",
+    *,
+    faststart: bool = False,
+    free: int = 0,
+) -> Path:
+    """Write a minimal QuickTime file.
+
+    Args:
+        path: Destination path.
+        children: Extra moov children (udta, meta).
+        faststart: Place moov before the media data.
+        free: Size of a free box after moov.
+    """
+    ftyp = _box("ftyp", b"qt  \0\0\0\0qt  ")
+    moov = _moov(children)
+    padding = _box("free", b"\0" * (free - 8)) if free else b""
+    mdat = _box("mdat", MEDIA)
+    if faststart:
+        path.write_bytes(ftyp + moov + padding + mdat)
+    else:
+        path.write_bytes(ftyp + mdat + moov + padding)
+    return path
+
+
+class TestQuickTimeMetadataRead:
+    """Tests for reading native metadata."""
+
+    def test_read_header_and_user_data(self, tmp_path: Path) -> None:
+        """Test dates, GPS and camera tags are read in ExifTool format."""
+        video = _write_movie(
+            tmp_path / "clip.mov",
+            _box(
+                "udta",
+                _text("©xyz", "+37.7749-122.4194+010.500/")
+                + _text("©mak", "Apple")
+                + _text("©mod", "iPhone 15 Pro"),
+            ),
+        )
+
+        tags = QuickTimeMetadata().read(video)
+
+        assert tags["QuickTime:CreateDate"] == "2024:01:15 10:30:00"
+        assert tags["QuickTime:TrackModifyDate"] == "2024:01:15 10:30:00"
+        assert tags["QuickTime:MediaCreateDate"] == "2024:01:15 10:30:00"
+        assert tags["QuickTime:GPSCoordinates"] == "37.7749 -122.4194 10.5"
+        assert tags["QuickTime:Make"] == "Apple"
+        assert tags["QuickTime:Model"] == "iPhone 15 Pro"
+
+    def test_read_apple_keys(self, tmp_path: Path) -> None:
+        """Test Apple metadata keys are read."""
+        video = _write_movie(
+            tmp_path / "clip.mov",
+            _keys_meta(
+                {
+                    "com.apple.quicktime.make": "Apple",
+                    "com.apple.quicktime.location.ISO6709": "+37.7749-122.4194/",
+                    "com.apple.quicktime.creationdate": "2024-01-15T19:30:00+0900",
+                }
+            ),
+        )
+
+        tags = QuickTimeMetadata().read(video)
+
+        assert tags["QuickTime:Make"] == "Apple"
+        assert tags["QuickTime:GPSCoordinates"] == "37.7749 -122.4194"
+        assert tags["QuickTime:CreationDate"] == "2024:01:15 19:30:00+09:00"
+
+    def test_read_non_movie_raises(self, tmp_path: Path) -> None:
+        """Test a file that is not MP4/QuickTime is rejected."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"\x1a\x45\xdf\xa3" + b"\0" * 100)
+
+        with pytest.raises(QuickTimeMetadataError):
+            QuickTimeMetadata().read(video)
+
+    def test_read_missing_file(self, tmp_path: Path) -> None:
+        """Test reading a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            QuickTimeMetadata().read(tmp_path / "missing.mov")
+
+
+class TestQuickTimeMetadataWrite:
+    """Tests for writing native metadata."""
+
+    def test_write_trailing_moov_grows(self, tmp_path: Path) -> None:
+        """Test a trailing movie header is extended without touching media."""
+        video = _write_movie(tmp_path / "clip.mov")
+        native = QuickTimeMetadata()
+
+        assert native.write(
+            video,
+            {
+                "CreateDate": "2023:06:01 08:00:00",
+                "GPSCoordinates": "+48.858400+002.294500/",
+                "Make": "Apple",
+            },
+        )
+
+        tags = native.read(video)
+        assert tags["QuickTime:CreateDate"] == "2023:06:01 08:00:00"
+        assert tags["QuickTime:TrackCreateDate"] == "2024:01:15 10:30:00"
+        assert tags["QuickTime:GPSCoordinates"] == "48.8584 2.2945"
+        assert tags["QuickTime:Make"] == "Apple"
+        assert MEDIA in video.read_bytes()
+
+    def test_write_uses_free_space(self, tmp_path: Path) -> None:
+        """Test a leading movie header grows into the free box after it."""
+        video = _write_movie(tmp_path / "clip.mov", faststart=True, free=1024)
+        size = video.stat().st_size
+        media_offset = video.read_bytes().index(MEDIA)
+
+        assert QuickTimeMetadata().write(video, {"Model": "iPhone 15 Pro"})
+
+        data = video.read_bytes()
+        assert len(data) == size
+        assert data.index(MEDIA) == media_offset
+        assert QuickTimeMetadata().read(video)["QuickTime:Model"] == "iPhone 15 Pro"
+
+    def test_write_without_room_declines(self, tmp_path: Path) -> None:
+        """Test a leading movie header without free space is left alone."""
+        video = _write_movie(tmp_path / "clip.mov", faststart=True)
+        before = video.read_bytes()
+
+        assert QuickTimeMetadata().write(video, {"Model": "iPhone 15 Pro"}) is False
+        assert video.read_bytes() == before
+
+    def test_date_patch_in_place(self, tmp_path: Path) -> None:
+        """Test dates are patched without needing free space."""
+        video = _write_movie(tmp_path / "clip.mov", faststart=True)
+        size = video.stat().st_size
+
+        assert QuickTimeMetadata().write(video, {"MediaModifyDate": "2024:01:15 19:30:00+09:00"})
+
+        assert video.stat().st_size == size
+        tags = QuickTimeMetadata().read(video)
+        assert tags["QuickTime:MediaModifyDate"] == "2024:01:15 10:30:00"
+
+    def test_existing_items_replaced(self, tmp_path: Path) -> None:
+        """Test existing user data and key items are updated, not duplicated."""
+        video = _write_movie(
+            tmp_path / "clip.mov",
+            _box("udta", _text("©mak", "Sony") + _text("©nam", "Title"))
+            + _keys_meta({"com.apple.quicktime.make": "Sony"}),
+        )
+
+        assert QuickTimeMetadata().write(video, {"Keys:Make": "Apple"})
+
+        data = video.read_bytes()
+        assert b"Sony" not in data
+        assert data.count(b"com.apple.quicktime.make") == 1
+        assert b"Title" in data
+        assert QuickTimeMetadata().read(video)["QuickTime:Make"] == "Apple"
+
+    def test_interrupted_write_keeps_original(self, tmp_path: Path) -> None:
+        """Test a write that fails before the rename leaves the file untouched."""
+        video = _write_movie(tmp_path / "clip.mov")
+        before = video.read_bytes()
+
+        with (
+            patch("video_converter.utils.file_utils._reflink", side_effect=_fake_reflink),
+            patch("video_converter.processors.quicktime_metadata.os.replace", side_effect=OSError),
+            pytest.raises(OSError),
+        ):
+            QuickTimeMetadata().write(video, {"Make": "Apple"})
+
+        assert video.read_bytes() == before
+        assert list(tmp_path.iterdir()) == [video]
+
+    def test_write_in_place_without_clones(self, tmp_path: Path) -> None:
+        """Test the file is patched in place, not copied, without clone support."""
+        video = _write_movie(tmp_path / "clip.mov")
+        inode = video.stat().st_ino
+
+        with patch("video_converter.utils.file_utils._reflink", return_value=False):
+            assert QuickTimeMetadata().write(video, {"Make": "Apple"})
+
+        assert video.stat().st_ino == inode
+        assert list(tmp_path.iterdir()) == [video]
+        assert QuickTimeMetadata().read(video)["QuickTime:Make"] == "Apple"
+
+    def test_write_replaces_clone(self, tmp_path: Path) -> None:
+        """Test the patched clone is renamed over the file when clones work."""
+        video = _write_movie(tmp_path / "clip.mov")
+        video.chmod(0o640)
+        inode = video.stat().st_ino
+
+        with patch("video_converter.utils.file_utils._reflink", side_effect=_fake_reflink):
+            assert QuickTimeMetadata().write(video, {"Make": "Apple"})
+
+        assert video.stat().st_ino != inode
+        assert video.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [video]
+        assert QuickTimeMetadata().read(video)["QuickTime:Make"] == "Apple"
+
+    def test_write_keeps_file_mode(self, tmp_path: Path) -> None:
+        """Test the rewritten file keeps the original's permissions."""
+        video = _write_movie(tmp_path / "clip.mov")
+        video.chmod(0o640)
+
+        assert QuickTimeMetadata().write(video, {"Make": "Apple"})
+
+        assert video.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [video]
+
+    def test_unsupported_tag_declines(self, tmp_path: Path) -> None:
+        """Test tags outside the native set are left to ExifTool."""
+        video = _write_movie(tmp_path / "clip.mov")
+        before = video.read_bytes()
+
+        assert QuickTimeMetadata().write(video, {"XMP:Make": "Apple"}) is False
+        assert QuickTimeMetadata().write(video, {"Title": "Holiday"}) is False
+        assert video.read_bytes() == before
+
+
+class TestQuickTimeMetadataCopy:
+    """Tests for copying native metadata."""
+
+    def test_copy_gps(self, tmp_path: Path) -> None:
+        """Test GPS patterns copy the coordinates."""
+        source = _write_movie(
+            tmp_path / "source.mov",
+            _box("udta", _text("©xyz", "+37.7749-122.4194/") + _text("©mak", "Apple")),
+        )
+        dest = _write_movie(tmp_path / "dest.mp4")
+
+        assert QuickTimeMetadata().copy(source, dest, ["GPS*", "GPSCoordinates", "GPSPosition"])
+
+        tags = QuickTimeMetadata().read(dest)
+        assert tags["QuickTime:GPSCoordinates"] == "37.7749 -122.4194"
+        assert "QuickTime:Make" not in tags
+
+    def test_copy_declines_xmp_source(self, tmp_path: Path) -> None:
+        """Test a source with XMP is left to ExifTool."""
+        source = _write_movie(
+            tmp_path / "source.mov",
+            _box("udta", _text("©xyz", "+37.7749-122.4194/") + _box("XMP_", b"<x:xmpmeta/>")),
+        )
+        dest = _write_movie(tmp_path / "dest.mp4")
+
+        assert QuickTimeMetadata().copy(source, dest, ["GPS*"]) is False
+
+    def test_copy_declines_unknown_pattern(self, tmp_path: Path) -> None:
+        """Test patterns for tags that are not handled natively decline."""
+        source = _write_movie(tmp_path / "source.mov")
+        dest = _write_movie(tmp_path / "dest.mp4")
+
+        assert QuickTimeMetadata().copy(source, dest, ["Title"]) is False
+
+
+class TestMetadataProcessorNative:
+    """Tests for the native fast path in MetadataProcessor."""
+
+    @pytest.fixture
+    def mock_runner(self) -> MagicMock:
+        """Create a mock CommandRunner."""
+        runner = MagicMock(spec=CommandRunner)
+        runner.run.return_value = CommandResult(returncode=0, stdout="", stderr="")
+        return runner
+
+    def test_copy_dates_without_exiftool(self, mock_runner: MagicMock, tmp_path: Path) -> None:
+        """Test date copies between movies do not start ExifTool."""
+        source = _write_movie(tmp_path / "source.mov")
+        dest = _write_movie(tmp_path / "dest.mp4")
+        QuickTimeMetadata().write(dest, {"CreateDate": "2000:01:01 00:00:00"})
+        processor = MetadataProcessor(mock_runner)
+
+        assert processor.copy_dates(source, dest) is True
+
+        mock_runner.run.assert_not_called()
+        assert QuickTimeMetadata().read(dest)["QuickTime:CreateDate"] == "2024:01:15 10:30:00"
+
+    def test_set_tags_falls_back(self, mock_runner: MagicMock, tmp_path: Path) -> None:
+        """Test tags outside the native set are written with ExifTool."""
+        video = _write_movie(tmp_path / "clip.mov")
+        processor = MetadataProcessor(mock_runner)
+
+        assert processor.set_tags(video, {"Make": "Apple", "XMP:GPSLatitude": "37.7749"})
+
+        mock_runner.run.assert_called_once()
+
+    def test_native_write_invalidates_cache(self, mock_runner: MagicMock, tmp_path: Path) -> None:
+        """Test a native write drops the cached metadata snapshot."""
+        video = _write_movie(tmp_path / "clip.mov")
+        mock_runner.run.return_value = CommandResult(
+            returncode=0, stdout=json.dumps([{"QuickTime:Make": "Sony"}]), stderr=""
+        )
+        processor = MetadataProcessor(mock_runner)
+        processor.extract(video)
+
+        processor.set_tag(video, "Make", "Apple")
+        processor.extract(video)
+
+        assert mock_runner.run.call_count == 2
+
+    def test_native_disabled(self, mock_runner: MagicMock, tmp_path: Path) -> None:
+        """Test the native path can be turned off."""
+        video = _write_movie(tmp_path / "clip.mov")
+        processor = MetadataProcessor(mock_runner, use_native=False)
+
+        processor.set_tag(video, "Make", "Apple")
+
+        mock_runner.run.assert_called_once()
@@ -0,0 +1,212 @@
+"""Unit tests for queue scheduling cost model."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_converter.core.scheduling import (
+    ASSUMED_SOURCE_BITRATE,
+    DEFAULT_ENCODER_SPEED,
+    TaskCostModel,
+    TaskEstimate,
+    estimate_makespan,
+)
+from video_converter.core.types import ConversionResult, QueuePriority
+from video_converter.processors.codec_detector import CodecInfo
+
+
+def make_codec_info(
+    codec: str = "h264",
+    width: int = 1920,
+    height: int = 1080,
+    duration: float = 60.0,
+    bitrate: int = 20_000_000,
+    audio_bitrate: int = 0,
+) -> CodecInfo:
+    """Create a CodecInfo for cost model tests."""
+    return CodecInfo(
+        path=Path("video.mov"),
+        codec=codec,
+        width=width,
+        height=height,
+        fps=30.0,
+        duration=duration,
+        bitrate=bitrate,
+        size=int(duration * (bitrate + audio_bitrate) / 8),
+        audio_codec="aac",
+        container="mov",
+    )
+
+
+class TestTaskEstimate:
+    """Tests for TaskEstimate dataclass."""
+
+    def test_savings_per_second(self) -> None:
+        """Test savings rate is bytes over encode seconds."""
+        estimate = TaskEstimate(Path("a.mov"), encode_seconds=10.0, expected_savings=1000)
+        assert estimate.savings_per_second == pytest.approx(100.0)
+
+    def test_savings_per_second_zero_time(self) -> None:
+        """Test a zero-cost estimate does not divide by zero."""
+        estimate = TaskEstimate(Path("a.mov"), encode_seconds=0.0, expected_savings=1000)
+        assert estimate.savings_per_second == 1000.0
+
+
+class TestTaskCostModel:
+    """Tests for TaskCostModel class."""
+
+    def test_encode_time_scales_with_resolution(self) -> None:
+        """Test a 4K source costs four times a 1080p source."""
+        model = TaskCostModel()
+        hd = model.estimate(Path("hd.mov"), make_codec_info())
+        uhd = model.estimate(Path("uhd.mov"), make_codec_info(width=3840, height=2160))
+
+        assert hd.encode_seconds == pytest.approx(60.0 / DEFAULT_ENCODER_SPEED)
+        assert uhd.encode_seconds == pytest.approx(4 * hd.encode_seconds)
+
+    def test_encode_time_uses_encoder_speed(self) -> None:
+        """Test the hardware encoder is estimated faster than software."""
+        model = TaskCostModel()
+        info = make_codec_info()
+        hardware = model.estimate(Path("a.mov"), info, encoder="hevc_videotoolbox")
+        software = model.estimate(Path("a.mov"), info, encoder="libx265")
+
+        assert hardware.encode_seconds < software.encode_seconds
+
+    def test_expected_savings_against_target_bitrate(self) -> None:
+        """Test savings are the video bitrate above the target."""
+        model = TaskCostModel(target_bitrate=6_000_000)
+        estimate = model.estimate(
+            Path("a.mov"), make_codec_info(bitrate=20_000_000, audio_bitrate=256_000)
+        )
+
+        assert estimate.expected_savings == pytest.approx(60 * 14_000_000 / 8, rel=1e-6)
+
+    def test_low_bitrate_source_saves_nothing(self) -> None:
+        """Test sources already below the target reclaim nothing."""
+        model = TaskCostModel(target_bitrate=6_000_000)
+        estimate = model.estimate(Path("a.mov"), make_codec_info(bitrate=4_000_000))
+        assert estimate.expected_savings == 0
+
+    def test_hevc_source_saves_nothing(self) -> None:
+        """Test already efficient codecs reclaim nothing."""
+        model = TaskCostModel()
+        estimate = model.estimate(Path("a.mov"), make_codec_info(codec="hevc"))
+        assert estimate.expected_savings == 0
+
+    def test_estimate_from_size_only(self) -> None:
+        """Test files without codec info are estimated from their size."""
+        model = TaskCostModel()
+        size = ASSUMED_SOURCE_BITRATE * 10 // 8
+        estimate = model.estimate(Path("a.mov"), size=size)
+
+        assert estimate.encode_seconds == pytest.approx(10.0 / DEFAULT_ENCODER_SPEED)
+        assert estimate.expected_savings > 0
+
+    def test_estimate_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file is estimated as free."""
+        estimate = TaskCostModel().estimate(tmp_path / "missing.mov")
+        assert estimate.encode_seconds == 0.0
+        assert estimate.expected_savings == 0
+
+    def test_observe_learns_new_encoder(self) -> None:
+        """Test the first observation sets an unknown encoder's speed."""
+        model = TaskCostModel()
+        result = ConversionResult(
+            success=True,
+            request=MagicMock(codec_info=make_codec_info(width=3840, height=2160)),
+            speed_ratio=1.5,
+            encoder="hevc_nvenc",
+        )
+
+        model.observe(result)
+
+        # 1.5x realtime at 4K is 6x realtime at 1080p
+        assert model.speed_for("hevc_nvenc") == pytest.approx(6.0)
+
+    def test_observe_smooths_known_encoder(self) -> None:
+        """Test later observations move the speed towards the sample."""
+        model = TaskCostModel(smoothing=0.5)
+        result = ConversionResult(
+            success=True,
+            request=MagicMock(codec_info=None),
+            speed_ratio=3.0,
+            encoder="libx265",
+        )
+
+        model.observe(result)
+
+        assert model.speed_for("libx265") == pytest.approx(2.0)
+
+    def test_observe_ignores_failures(self) -> None:
+        """Test failed or incomplete results do not change speeds."""
+        model = TaskCostModel()
+        model.observe(
+            ConversionResult(
+                success=False,
+                request=MagicMock(codec_info=None),
+                speed_ratio=10.0,
+                encoder="libx265",
+            )
+        )
+        model.observe(
+            ConversionResult(success=True, request=MagicMock(codec_info=None), encoder="libx265")
+        )
+
+        assert model.speed_for("libx265") == pytest.approx(1.0)
+
+
+class TestOrder:
+    """Tests for cost-based ordering."""
+
+    @pytest.fixture
+    def estimates(self) -> list[TaskEstimate]:
+        """Estimates with distinct cost and savings rates."""
+        return [
+            TaskEstimate(Path("medium.mov"), encode_seconds=20.0, expected_savings=1000),
+            TaskEstimate(Path("short.mov"), encode_seconds=5.0, expected_savings=100),
+            TaskEstimate(Path("long.mov"), encode_seconds=60.0, expected_savings=12000),
+        ]
+
+    def test_shortest_job(self, estimates: list[TaskEstimate]) -> None:
+        """Test shortest-job-first ordering."""
+        ordered = TaskCostModel.order(estimates, QueuePriority.SHORTEST_JOB)
+        assert [e.path.stem for e in ordered] == ["short", "medium", "long"]
+
+    def test_longest_job(self, estimates: list[TaskEstimate]) -> None:
+        """Test longest-processing-time-first ordering."""
+        ordered = TaskCostModel.order(estimates, QueuePriority.LONGEST_JOB)
+        assert [e.path.stem for e in ordered] == ["long", "medium", "short"]
+
+    def test_max_savings(self, estimates: list[TaskEstimate]) -> None:
+        """Test most-bytes-per-second-first ordering."""
+        ordered = TaskCostModel.order(estimates, QueuePriority.MAX_SAVINGS)
+        assert [e.path.stem for e in ordered] == ["long", "medium", "short"]
+
+    def test_non_cost_priority_keeps_order(self, estimates: list[TaskEstimate]) -> None:
+        """Test other priorities leave the order unchanged."""
+        assert TaskCostModel.order(estimates, QueuePriority.FIFO) == estimates
+
+
+class TestEstimateMakespan:
+    """Tests for estimate_makespan function."""
+
+    def test_single_worker_is_sum(self) -> None:
+        """Test one worker runs jobs back to back."""
+        estimates = [TaskEstimate(Path(f"{i}.mov"), float(i), 0) for i in (1, 2, 3)]
+        assert estimate_makespan(estimates, 1) == pytest.approx(6.0)
+
+    def test_longest_first_shortens_makespan(self) -> None:
+        """Test LPT ordering finishes sooner than shortest-first."""
+        estimates = [
+            TaskEstimate(Path(f"{i}.mov"), seconds, 0)
+            for i, seconds in enumerate([1.0, 1.0, 1.0, 1.0, 4.0])
+        ]
+        sjf = TaskCostModel.order(estimates, QueuePriority.SHORTEST_JOB)
+        lpt = TaskCostModel.order(estimates, QueuePriority.LONGEST_JOB)
+
+        assert estimate_makespan(lpt, 2) == pytest.approx(4.0)
+        assert estimate_makespan(sjf, 2) == pytest.approx(6.0)
@@ -0,0 +1,276 @@
+"""Unit tests for segmented converter module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from video_converter.converters.progress import ProgressInfo
+from video_converter.converters.segmented import (
+    Segment,
+    SegmentedConverter,
+    _SegmentConverter,
+    plan_segments,
+    segment_command,
+    split_thread_budget,
+)
+from video_converter.converters.software import SoftwareConverter
+from video_converter.core.types import ConversionRequest, ConversionResult
+from video_converter.processors.codec_detector import CodecInfo
+from video_converter.utils.command_runner import CommandResult
+
+
+def make_request(tmp_path: Path, duration: float) -> ConversionRequest:
+    """Create a request for an input of the given duration."""
+    input_path = tmp_path / "long.mov"
+    input_path.write_bytes(b"x" * 1000)
+    codec_info = CodecInfo(
+        path=input_path,
+        codec="h264",
+        width=3840,
+        height=2160,
+        fps=30.0,
+        duration=duration,
+        bitrate=50_000_000,
+        size=1000,
+        audio_codec="aac",
+        container="mov",
+    )
+    return ConversionRequest(
+        input_path=input_path,
+        output_path=tmp_path / "out" / "long_h265.mp4",
+        codec_info=codec_info,
+    )
+
+
+class TestPlanSegments:
+    """Tests for plan_segments function."""
+
+    def test_boundaries_snap_to_keyframes(self) -> None:
+        """Test chunks start at the keyframes nearest an even split."""
+        keyframes = [float(t) for t in range(0, 1200, 7)]
+        segments = plan_segments(1200.0, keyframes, 4)
+
+        assert [s.start for s in segments] == [0.0, 301.0, 602.0, 903.0]
+        assert segments[0].end == 301.0
+        assert segments[-1].end is None
+        assert [s.index for s in segments] == [0, 1, 2, 3]
+
+    def test_count_limited_by_min_duration(self) -> None:
+        """Test short inputs get fewer, longer chunks."""
+        keyframes = [float(t) for t in range(0, 150, 2)]
+        segments = plan_segments(150.0, keyframes, 8, min_duration=60.0)
+        assert len(segments) == 2
+
+    def test_too_short_is_not_split(self) -> None:
+        """Test an input below two minimum chunks stays whole."""
+        segments = plan_segments(90.0, [0.0, 30.0, 60.0], 4, min_duration=60.0)
+        assert segments == [Segment(index=0, start=0.0)]
+
+    def test_no_keyframes_is_not_split(self) -> None:
+        """Test an input without usable keyframes stays whole."""
+        assert plan_segments(3600.0, [], 4) == [Segment(index=0, start=0.0)]
+
+    def test_sparse_keyframes_drop_short_chunks(self) -> None:
+        """Test boundaries that would create too-short chunks are skipped."""
+        segments = plan_segments(1200.0, [0.0, 580.0, 590.0, 610.0], 4, min_duration=60.0)
+        assert [s.start for s in segments] == [0.0, 580.0]
+
+    def test_segment_duration(self) -> None:
+        """Test segment length for closed and open-ended segments."""
+        assert Segment(index=0, start=0.0, end=30.0).duration(100.0) == 30.0
+        assert Segment(index=1, start=30.0).duration(100.0) == 70.0
+
+
+class TestSegmentCommand:
+    """Tests for segment_command function."""
+
+    def test_adds_seek_and_drops_audio(self) -> None:
+        """Test the command seeks to the segment and skips audio."""
+        command = ["ffmpeg", "-y", "-i", "in.mov", "-c:v", "libx265", "-c:a", "copy", "out.mp4"]
+        result = segment_command(command, Segment(index=1, start=10.0, end=25.5))
+
+        assert result == [
+            "ffmpeg",
+            "-y",
+            "-ss",
+            "10.000000",
+            "-t",
+            "15.500000",
+            "-i",
+            "in.mov",
+            "-c:v",
+            "libx265",
+            "-an",
+            "out.mp4",
+        ]
+
+    def test_last_segment_runs_to_end(self) -> None:
+        """Test an open-ended segment has no duration limit."""
+        result = segment_command(["ffmpeg", "-i", "in.mov", "out.mp4"], Segment(2, 50.0))
+        assert "-t" not in result
+        assert result[1:3] == ["-ss", "50.000000"]
+
+    def test_uses_converter_command_builder(self) -> None:
+        """Test chunks are built with the wrapped converter's settings."""
+        chunk = _SegmentConverter(SoftwareConverter(), Segment(0, 0.0, 60.0), 60.0)
+        request = ConversionRequest(
+            input_path=Path("/in.mov"), output_path=Path("/seg.mp4"), crf=20
+        )
+
+        command = chunk.build_command(request)
+
+        assert "libx265" in command
+        assert command[command.index("-crf") + 1] == "20"
+        assert "-an" in command
+
+
+class TestSplitThreadBudget:
+    """Tests for split_thread_budget function."""
+
+    def test_no_budget(self) -> None:
+        """Test chunks of an unbudgeted request stay unbudgeted."""
+        request = ConversionRequest(input_path=Path("a.mov"), output_path=Path("a.mp4"))
+        assert split_thread_budget(request, 0, 4) == {"threads": None, "cpu_affinity": None}
+
+    def test_threads_and_cpus_divided(self) -> None:
+        """Test each chunk gets its own slice of the job's CPUs."""
+        request = ConversionRequest(
+            input_path=Path("a.mov"),
+            output_path=Path("a.mp4"),
+            threads=8,
+            cpu_affinity=tuple(range(8)),
+        )
+
+        assert split_thread_budget(request, 1, 2) == {
+            "threads": 4,
+            "cpu_affinity": (4, 5, 6, 7),
+        }
+
+    def test_more_chunks_than_threads(self) -> None:
+        """Test chunks share the job's CPUs when there are too few."""
+        request = ConversionRequest(
+            input_path=Path("a.mov"),
+            output_path=Path("a.mp4"),
+            threads=2,
+            cpu_affinity=(0, 1),
+        )
+
+        assert split_thread_budget(request, 2, 4) == {"threads": 1, "cpu_affinity": (0, 1)}
+
+
+class TestSegmentedConverter:
+    """Tests for SegmentedConverter class."""
+
+    @staticmethod
+    def _fake_chunk_convert(fail_first: set[int] | None = None):
+        """Create a chunk encoder that writes output and reports progress."""
+        attempts: dict[int, int] = {}
+
+        async def convert(self, request, on_progress=None, on_progress_info=None):
+            index = self.segment.index
+            attempts[index] = attempts.get(index, 0) + 1
+            if fail_first and index in fail_first and attempts[index] == 1:
+                return ConversionResult(success=False, request=request, error_message="boom")
+            if on_progress_info:
+                on_progress_info(ProgressInfo(current_time=self._duration, speed=1.0))
+            request.output_path.write_bytes(b"chunk")
+            return ConversionResult(success=True, request=request)
+
+        return convert, attempts
+
+    @staticmethod
+    def _segmented() -> SegmentedConverter:
+        """Create a segmented converter with stubbed probing and concat."""
+        converter = SegmentedConverter(SoftwareConverter(), segments=3, min_input_duration=600)
+        converter._ffprobe_runner = MagicMock()
+        converter._ffprobe_runner.keyframe_times_async = AsyncMock(
+            return_value=[float(t) for t in range(0, 1800, 2)]
+        )
+
+        async def concat(args, **kwargs):
+            Path(args[-1]).write_bytes(b"joined")
+            return CommandResult(returncode=0, stdout="", stderr="")
+
+        converter._command_runner = MagicMock()
+        converter._command_runner.run_async = AsyncMock(side_effect=concat)
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_short_input_uses_wrapped_converter(self, tmp_path: Path) -> None:
+        """Test inputs below the split threshold are converted whole."""
+        inner = SoftwareConverter()
+        request = make_request(tmp_path, duration=120.0)
+        expected = ConversionResult(success=True, request=request)
+
+        with patch.object(inner, "convert", AsyncMock(return_value=expected)) as convert:
+            result = await SegmentedConverter(inner, segments=4).convert(request)
+
+        assert result is expected
+        convert.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_input_encoded_in_segments(self, tmp_path: Path) -> None:
+        """Test long inputs are split, encoded, joined and cleaned up."""
+        converter = self._segmented()
+        request = make_request(tmp_path, duration=1800.0)
+        fake, attempts = self._fake_chunk_convert()
+        progress: list[ProgressInfo] = []
+
+        with patch.object(_SegmentConverter, "convert", fake):
+            result = await converter.convert(request, on_progress_info=progress.append)
+
+        assert result.success is True
+        assert result.encoder == "libx265"
+        assert result.converted_size == len(b"joined")
+        assert sorted(attempts) == [0, 1, 2]
+        assert progress[-1].current_time == pytest.approx(1800.0)
+
+        concat_args = converter._command_runner.run_async.await_args.args[0]
+        assert concat_args[concat_args.index("-c:v") + 1] == "copy"
+        assert not (request.output_path.parent / ".long_h265.segments").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_is_retried(self, tmp_path: Path) -> None:
+        """Test a failed chunk is encoded again on its own."""
+        converter = self._segmented()
+        request = make_request(tmp_path, duration=1800.0)
+        fake, attempts = self._fake_chunk_convert(fail_first={1})
+
+        with patch.object(_SegmentConverter, "convert", fake):
+            result = await converter.convert(request)
+
+        assert result.success is True
+        assert attempts == {0: 1, 1: 2, 2: 1}
+
+    @pytest.mark.asyncio
+    async def test_segment_failure_fails_conversion(self, tmp_path: Path) -> None:
+        """Test a chunk failing every attempt fails the conversion."""
+        converter = self._segmented()
+        converter.max_attempts = 1
+        request = make_request(tmp_path, duration=1800.0)
+        fake, _ = self._fake_chunk_convert(fail_first={2})
+
+        with patch.object(_SegmentConverter, "convert", fake):
+            result = await converter.convert(request)
+
+        assert result.success is False
+        assert "Segment encode failed" in (result.error_message or "")
+        assert not request.output_path.exists()
+        assert not (request.output_path.parent / ".long_h265.segments").exists()
+        converter._command_runner.run_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_keyframe_probe_failure_falls_back(self, tmp_path: Path) -> None:
+        """Test unreadable keyframes fall back to a whole-file encode."""
+        inner = SoftwareConverter()
+        converter = SegmentedConverter(inner, segments=4)
+        converter._ffprobe_runner = MagicMock()
+        converter._ffprobe_runner.keyframe_times_async = AsyncMock(side_effect=OSError("bad"))
+        request = make_request(tmp_path, duration=3600.0)
+        expected = ConversionResult(success=True, request=request)
+
+        with patch.object(inner, "convert", AsyncMock(return_value=expected)):
+            assert await converter.convert(request) is expected
@@ -6,10 +6,12 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from video_converter.core.session import (
+    JournalSync,
     SessionCorruptedError,
     SessionNotFoundError,
     SessionStateError,
@@ -196,6 +198,31 @@ class TestSessionState:
         assert video.status == ConversionStatus.FAILED
         assert video.error_message == "Encoder error"
 
+    def test_find_pending_video(self) -> None:
+        """Test pending videos are found by path and leave the index when done."""
+        first = VideoEntry(Path("a.mov"), Path("a.mp4"))
+        second = VideoEntry(Path("b.mov"), Path("b.mp4"))
+        session = SessionState(session_id="test123", pending_videos=[first])
+        session.add_pending_videos([second])
+
+        assert session.find_pending_video(Path("b.mov")) is second
+
+        session.mark_video_completed(second)
+
+        assert session.find_pending_video(Path("b.mov")) is None
+        assert session.find_pending_video(Path("a.mov")) is first
+
+    def test_pending_path_added_once(self) -> None:
+        """Test a path that is already pending is not queued again."""
+        first = VideoEntry(Path("a.mov"), Path("a.mp4"))
+        session = SessionState(session_id="test123", pending_videos=[first])
+
+        session.add_pending_videos([VideoEntry(Path("a.mov"), Path("a.mp4"))])
+
+        assert session.pending_videos == [first]
+        assert session.pending_videos[0] is first
+        assert session.total_videos == 1
+
     def test_add_temporary_file(self) -> None:
         """Test adding temporary file tracking."""
         session = SessionState(session_id="test123")
@@ -328,6 +355,28 @@ class TestSessionStateManager:
             with pytest.raises(SessionStateError):
                 manager.create_session(video_paths=[video_path])
 
+    def test_add_videos(self) -> None:
+        """Test appending videos to an active session."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SessionStateManager(state_dir=Path(tmpdir))
+            session = manager.create_session(video_paths=[])
+
+            added = manager.add_videos(
+                [Path(tmpdir) / "video1.mov", Path(tmpdir) / "video2.mov"],
+                output_dir=Path(tmpdir) / "output",
+            )
+
+            assert len(added) == 2
+            assert len(session.pending_videos) == 2
+            assert added[0].output_path == Path(tmpdir) / "output" / "video1_h265.mp4"
+
+    def test_add_videos_no_session(self) -> None:
+        """Test adding videos without an active session."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SessionStateManager(state_dir=Path(tmpdir))
+
+            assert manager.add_videos([Path(tmpdir) / "video.mov"]) == []
+
     def test_save_and_load(self) -> None:
         """Test saving and loading session state."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -604,3 +653,131 @@ class TestSessionStateManager:
             # Load and verify it was marked as interrupted
             session = manager.load_session()
             assert session.status == SessionStatus.INTERRUPTED
+
+
+class TestSessionJournal:
+    """Tests for the append-only session journal."""
+
+    def _create(self, manager: SessionStateManager, tmp_path: Path, count: int) -> SessionState:
+        """Create a session with count videos."""
+        return manager.create_session(
+            video_paths=[tmp_path / f"video{i}.mov" for i in range(count)],
+        )
+
+    def test_completion_appends_without_snapshot(self, tmp_path: Path) -> None:
+        """Test finishing a video writes a journal event, not a snapshot."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 3)
+        snapshot = manager.state_file_path.read_text()
+
+        manager.mark_video_completed(session.pending_videos[0], 1000, 500)
+        manager.mark_video_failed(session.pending_videos[0], "Encoder error")
+
+        assert manager.state_file_path.read_text() == snapshot
+        events = manager.journal_file_path.read_text().splitlines()
+        assert [json.loads(e)["op"] for e in events] == ["completed", "failed"]
+
+    def test_load_replays_journal(self, tmp_path: Path) -> None:
+        """Test a reloaded session includes journaled changes."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 3)
+        manager.mark_video_completed(session.pending_videos[0], 1000, 500)
+        manager.add_videos([tmp_path / "extra.mov"])
+        manager.add_temporary_file(tmp_path / "partial.mp4")
+
+        loaded = SessionStateManager(state_dir=tmp_path).load_session()
+
+        assert len(loaded.completed_videos) == 1
+        assert loaded.completed_videos[0].converted_size == 500
+        assert len(loaded.pending_videos) == 3
+        assert loaded.current_index == 1
+        assert loaded.temporary_files == [tmp_path / "partial.mp4"]
+
+    def test_replay_is_idempotent(self, tmp_path: Path) -> None:
+        """Test events already in the snapshot are not applied twice."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 2)
+        manager.add_videos([tmp_path / "extra.mov"])
+        manager.mark_video_completed(session.pending_videos[0], 1000, 500)
+        journal = manager.journal_file_path.read_text()
+
+        # Simulate a crash after the snapshot was written but before the
+        # journal was removed
+        manager.save(force=True)
+        manager.journal_file_path.write_text(journal)
+
+        loaded = SessionStateManager(state_dir=tmp_path).load_session()
+
+        assert loaded.total_videos == 3
+        assert len(loaded.completed_videos) == 1
+        assert loaded.current_index == 1
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        """Test the journal is folded into the snapshot when it grows."""
+        manager = SessionStateManager(state_dir=tmp_path, compact_threshold=2)
+        session = self._create(manager, tmp_path, 2)
+
+        manager.mark_video_completed(session.pending_videos[0])
+        assert manager.journal_file_path.exists()
+        manager.mark_video_completed(session.pending_videos[0])
+
+        assert not manager.journal_file_path.exists()
+        data = json.loads(manager.state_file_path.read_text())
+        assert len(data["completed_videos"]) == 2
+
+    def test_truncated_event_ignored(self, tmp_path: Path) -> None:
+        """Test a partly written last event does not break loading."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 2)
+        manager.mark_video_completed(session.pending_videos[0])
+        with open(manager.journal_file_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "comp')
+
+        loaded = SessionStateManager(state_dir=tmp_path).load_session()
+
+        assert len(loaded.completed_videos) == 1
+
+    def test_resumable_sessions_count_journal(self, tmp_path: Path) -> None:
+        """Test resumable session progress includes journaled videos."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 2)
+        manager.pause_session()
+        manager.mark_video_completed(session.pending_videos[0])
+
+        sessions = manager.get_resumable_sessions()
+
+        assert sessions[0]["completed_videos"] == 1
+        assert sessions[0]["progress"] == 0.5
+
+    def test_complete_session_removes_journal(self, tmp_path: Path) -> None:
+        """Test the journal is removed with the session file."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 2)
+        manager.mark_video_completed(session.pending_videos[0])
+
+        manager.complete_session()
+
+        assert not manager.journal_file_path.exists()
+
+    def test_sync_always_fsyncs_events(self, tmp_path: Path) -> None:
+        """Test every event is synced with JournalSync.ALWAYS."""
+        manager = SessionStateManager(state_dir=tmp_path, journal_sync=JournalSync.ALWAYS)
+        session = self._create(manager, tmp_path, 2)
+
+        with patch("video_converter.core.session.os.fsync") as mock_fsync:
+            manager.mark_video_completed(session.pending_videos[0])
+
+        mock_fsync.assert_called_once()
+
+    def test_journal_failure_writes_snapshot(self, tmp_path: Path) -> None:
+        """Test a change that cannot be journaled is saved in a snapshot at once."""
+        manager = SessionStateManager(state_dir=tmp_path)
+        session = self._create(manager, tmp_path, 2)
+        manager.journal_file_path.unlink(missing_ok=True)
+        manager.journal_file_path.mkdir()
+
+        manager.mark_video_completed(session.pending_videos[0], 1000, 500)
+
+        snapshot = json.loads(manager.state_file_path.read_text())
+        assert len(snapshot["completed_videos"]) == 1
+        assert len(snapshot["pending_videos"]) == 1
@@ -213,6 +213,25 @@ class TestStatisticsReporter:
             assert "records" in data
             assert len(data["records"]) == 5
 
+    def test_export_json_streams_records(
+        self,
+        sample_stats: HistoryStatistics,
+        sample_records: list[ConversionRecord],
+    ) -> None:
+        """Test JSON export consumes an iterator and counts the records."""
+        reporter = StatisticsReporter()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "stats.json"
+            count = reporter.export_json(sample_stats, output_path, iter(sample_records))
+
+            with open(output_path) as f:
+                data = json.load(f)
+
+            assert count == 5
+            assert [r["id"] for r in data["records"]] == [r.id for r in sample_records]
+            assert data["statistics"]["total_converted"] == 100
+
     def test_export_json_without_records(
         self, sample_stats: HistoryStatistics
     ) -> None:
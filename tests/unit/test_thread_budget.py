@@ -0,0 +1,98 @@
+"""Unit tests for thread budget module."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from video_converter.core.thread_budget import (
+    ThreadAllocation,
+    ThreadBudget,
+    available_cpus,
+)
+
+
+class TestAvailableCpus:
+    """Tests for available_cpus function."""
+
+    def test_returns_cpus(self) -> None:
+        """Test at least one CPU is reported."""
+        cpus = available_cpus()
+        assert len(cpus) >= 1
+        assert cpus == sorted(cpus)
+
+
+class TestThreadBudget:
+    """Tests for ThreadBudget class."""
+
+    def test_default_uses_available_cpus(self) -> None:
+        """Test the default budget covers the process's CPUs."""
+        assert ThreadBudget().total_threads == len(available_cpus())
+
+    def test_divides_free_cores(self) -> None:
+        """Test jobs starting together get equal shares."""
+        budget = ThreadBudget(total_threads=16)
+        allocations = [budget.allocate(expected_jobs=n) for n in (4, 3, 2, 1)]
+
+        assert [a.threads for a in allocations] == [4, 4, 4, 4]
+        assert budget.threads_in_use == 16
+        assert budget.active_jobs == 4
+
+    def test_released_cores_go_to_later_jobs(self) -> None:
+        """Test a job started after others finish gets their cores."""
+        budget = ThreadBudget(total_threads=16)
+        first = [budget.allocate(expected_jobs=n) for n in (4, 3, 2, 1)]
+        for allocation in first[:3]:
+            budget.release(allocation)
+
+        tail = budget.allocate(expected_jobs=1)
+
+        assert tail.threads == 12
+
+    def test_oversubscribed_job_gets_min_threads(self) -> None:
+        """Test a job still runs when no cores are free."""
+        budget = ThreadBudget(total_threads=2, min_threads=1)
+        budget.allocate()
+
+        assert budget.allocate().threads == 1
+
+    def test_release_is_idempotent(self) -> None:
+        """Test releasing twice does not corrupt the budget."""
+        budget = ThreadBudget(total_threads=4)
+        allocation = budget.allocate()
+        budget.release(allocation)
+        budget.release(allocation)
+
+        assert budget.threads_in_use == 0
+
+    def test_pinning_assigns_disjoint_cpus(self) -> None:
+        """Test pinned jobs get separate CPUs that are returned on release."""
+        with (
+            patch("video_converter.core.thread_budget.available_cpus", return_value=list(range(8))),
+            patch("video_converter.core.thread_budget.supports_cpu_affinity", return_value=True),
+        ):
+            budget = ThreadBudget(pin_cpus=True)
+
+        first = budget.allocate(expected_jobs=2)
+        second = budget.allocate(expected_jobs=1)
+
+        assert first.cpus == (0, 1, 2, 3)
+        assert second.cpus == (4, 5, 6, 7)
+
+        budget.release(first)
+        assert budget.allocate(expected_jobs=1).cpus == (0, 1, 2, 3)
+
+    def test_pinning_unsupported(self) -> None:
+        """Test pinning is disabled without CPU affinity support."""
+        with patch("video_converter.core.thread_budget.supports_cpu_affinity", return_value=False):
+            budget = ThreadBudget(total_threads=4, pin_cpus=True)
+
+        assert budget.pin_cpus is False
+        assert budget.allocate().cpus is None
+
+
+class TestThreadAllocation:
+    """Tests for ThreadAllocation dataclass."""
+
+    def test_equality_ignores_id(self) -> None:
+        """Test allocations compare by their threads and CPUs."""
+        assert ThreadAllocation(4, (0, 1), id=1) == ThreadAllocation(4, (0, 1), id=2)
@@ -258,6 +258,29 @@ class TestMetadataVerifier:
         with pytest.raises(FileNotFoundError, match="Converted"):
             verifier.verify(original, Path("/nonexistent.mp4"))
 
+    def test_verify_reads_each_file_once(
+        self,
+        verifier: MetadataVerifier,
+        mock_runner: MagicMock,
+        sample_metadata: dict,
+        tmp_path: Path,
+    ) -> None:
+        """Test all categories share one ExifTool read per file."""
+        original = tmp_path / "original.mp4"
+        converted = tmp_path / "converted.mp4"
+        original.touch()
+        converted.touch()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0,
+            stdout=json.dumps([sample_metadata]),
+            stderr="",
+        )
+
+        verifier.verify(original, converted)
+        verifier.verify(original, converted)
+
+        assert mock_runner.run.call_count == 2
+
 
 class TestMetadataVerifierDates:
     """Tests for date/time verification."""
@@ -408,7 +431,7 @@ class TestMetadataVerifierGPS:
             "Composite:GPSLongitude": -122.4194,
         }
 
-        # All 4 calls return the same metadata (matching GPS)
+        # Both files return the same metadata (matching GPS)
         mock_runner.run.return_value = CommandResult(
             returncode=0,
             stdout=json.dumps([metadata]),